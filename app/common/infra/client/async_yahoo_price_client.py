@@ -0,0 +1,355 @@
+"""
+비동기 야후 가격 클라이언트
+
+YahooPriceClient와 같은 공개 메서드를 asyncio 코루틴으로 제공합니다.
+
+- 프로세스 공유 속도 제한: YAHOO_RATE_LIMITER (동기 병렬 수집과 같은 토큰 버킷)
+- 공유 keep-alive 커넥션 풀: 이벤트 루프마다 aiohttp.ClientSession 하나를 재사용
+- 인스턴스를 여러 개 만들어도 속도 제한과 커넥션 풀은 하나만 사용됩니다.
+
+비동기 라우터나 스케줄러 작업에서 수백 개의 시세 요청을
+스레드 풀 없이 동시에 보낼 때 사용합니다.
+"""
+
+import asyncio
+import random
+import threading
+import time
+import weakref
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+import pandas as pd
+
+from app.common.infra.client.yahoo_price_client import (
+    YAHOO_RATE_LIMITER,
+    YahooPriceClient,
+)
+
+# 이벤트 루프별 공유 세션 (aiohttp 세션은 생성된 루프에서만 사용 가능)
+_shared_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+    weakref.WeakKeyDictionary()
+)
+_shared_sessions_lock = threading.Lock()
+
+# 1분봉 최신가 캐시 (프로세스 공유, 30초)
+_latest_price_cache: Dict[str, Dict[str, float]] = {}
+LATEST_PRICE_CACHE_TTL = 30
+
+# 공유 커넥션 풀 설정
+CONNECTION_LIMIT = 100
+CONNECTION_LIMIT_PER_HOST = 20
+KEEPALIVE_TIMEOUT = 30
+
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """현재 이벤트 루프의 공유 세션 반환 (없거나 닫혔으면 생성)"""
+    loop = asyncio.get_running_loop()
+    with _shared_sessions_lock:
+        session = _shared_sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=CONNECTION_LIMIT,
+                limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=300,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=10, connect=5),
+            )
+            _shared_sessions[loop] = session
+        return session
+
+
+async def close_shared_session():
+    """현재 이벤트 루프의 공유 세션 종료 (루프를 닫기 전에 호출)"""
+    loop = asyncio.get_running_loop()
+    with _shared_sessions_lock:
+        session = _shared_sessions.pop(loop, None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+class AsyncYahooPriceClient:
+    """비동기 야후 차트 API 클라이언트 (YahooPriceClient와 같은 공개 메서드)"""
+
+    BASE_URL = YahooPriceClient.BASE_URL
+
+    def __init__(self, max_retries: int = 3):
+        self.max_retries = max_retries
+
+    def _get_random_headers(self, symbol: str = None) -> Dict[str, str]:
+        """요청마다 랜덤 헤더 생성 (YahooPriceClient와 같은 헤더 풀 사용)"""
+        if symbol:
+            referer = f"https://finance.yahoo.com/quote/{symbol}"
+        else:
+            referer = random.choice(YahooPriceClient.REFERERS)
+
+        return {
+            "User-Agent": random.choice(YahooPriceClient.USER_AGENTS),
+            "Accept": random.choice(YahooPriceClient.ACCEPT_HEADERS),
+            "Accept-Language": random.choice(YahooPriceClient.ACCEPT_LANGUAGES),
+            "Referer": referer,
+        }
+
+    async def _get_json(self, url: str, symbol: str = None) -> Optional[Dict[str, Any]]:
+        """공유 속도 제한/세션으로 GET 요청 후 JSON 반환 (429는 재시도)"""
+        session = await get_shared_session()
+
+        try:
+            for attempt in range(self.max_retries + 1):
+                await YAHOO_RATE_LIMITER.acquire_async()
+
+                async with session.get(
+                    url, headers=self._get_random_headers(symbol)
+                ) as response:
+                    if response.status == 429 and attempt < self.max_retries:
+                        print(
+                            f"⚠️ {symbol} API 제한 감지, {attempt + 1}회 재시도 중..."
+                        )
+                        await asyncio.sleep(random.uniform(2, 5))
+                        continue
+
+                    response.raise_for_status()
+                    return await response.json(content_type=None)
+
+        except Exception as e:
+            print(f"❌ {symbol} 요청 실패: {e}")
+
+        return None
+
+    @staticmethod
+    def _extract_quote(
+        data: Optional[Dict[str, Any]], symbol: str, label: str
+    ) -> Optional[Tuple[List[int], Dict[str, List[Any]]]]:
+        """차트 응답에서 (timestamps, quote) 추출 (데이터 유효성 검사 포함)"""
+        if (
+            not data
+            or not data.get("chart")
+            or not data["chart"].get("result")
+            or not data["chart"]["result"][0].get("indicators")
+        ):
+            print(f"❌ {symbol} {label} 데이터 형식 오류")
+            return None
+
+        result = data["chart"]["result"][0]
+        timestamps = result.get("timestamp")
+        if not timestamps:
+            print(f"❌ {symbol} {label} 데이터 없음")
+            return None
+
+        quote = result["indicators"]["quote"][0]
+        return timestamps, quote
+
+    def _build_ohlcv_frame(
+        self, data: Optional[Dict[str, Any]], symbol: str, label: str
+    ) -> Optional[pd.DataFrame]:
+        """차트 응답을 timestamp/open/high/low/close/volume 데이터프레임으로 변환"""
+        extracted = self._extract_quote(data, symbol, label)
+        if extracted is None:
+            return None
+        timestamps, quotes = extracted
+
+        # 필수 필드 확인
+        required_fields = ["open", "high", "low", "close", "volume"]
+        for field in required_fields:
+            if field not in quotes:
+                print(f"❌ {symbol} {label} 데이터 필드 누락: {field}")
+                return None
+
+        df = pd.DataFrame(
+            {
+                "timestamp": timestamps,
+                "open": quotes["open"],
+                "high": quotes["high"],
+                "low": quotes["low"],
+                "close": quotes["close"],
+                "volume": quotes["volume"],
+            }
+        ).dropna()
+
+        if df.empty:
+            print(f"❌ {symbol} {label} 데이터 없음")
+            return None
+
+        return df
+
+    async def _get_field_frame(
+        self, symbol: str, query: str, field: str, label: str
+    ) -> Optional[pd.DataFrame]:
+        """단일 가격 필드(high/low/close)의 timestamp 데이터프레임 조회"""
+        data = await self._get_json(f"{self.BASE_URL}{symbol}?{query}", symbol)
+        extracted = self._extract_quote(data, symbol, label)
+        if extracted is None:
+            return None
+        timestamps, quotes = extracted
+
+        if field not in quotes:
+            print(f"❌ {symbol} {label} 데이터 없음")
+            return None
+
+        return pd.DataFrame({"timestamp": timestamps, field: quotes[field]}).dropna()
+
+    # =================================================================
+    # 공개 메서드 (YahooPriceClient와 동일한 이름/반환 형식)
+    # =================================================================
+
+    async def get_all_time_high(
+        self, symbol: str
+    ) -> Tuple[Optional[float], Optional[datetime]]:
+        df = await self._get_field_frame(symbol, "range=max&interval=1d", "high", "최고가")
+        if df is None or df.empty:
+            return None, None
+
+        idxmax = df["high"].idxmax()
+        return df.loc[idxmax, "high"], datetime.fromtimestamp(df.loc[idxmax, "timestamp"])
+
+    async def _get_previous_value(
+        self, symbol: str, field: str, label: str
+    ) -> Tuple[Optional[float], Optional[datetime]]:
+        df = await self._get_field_frame(symbol, "range=5d&interval=1d", field, label)
+        if df is None or len(df) < 2:
+            return None, None
+
+        prev_row = df.iloc[-2]
+        return prev_row[field], datetime.fromtimestamp(prev_row["timestamp"])
+
+    async def get_previous_close(
+        self, symbol: str
+    ) -> Tuple[Optional[float], Optional[datetime]]:
+        return await self._get_previous_value(symbol, "close", "전일 종가")
+
+    async def get_previous_low(
+        self, symbol: str
+    ) -> Tuple[Optional[float], Optional[datetime]]:
+        return await self._get_previous_value(symbol, "low", "전일 저점")
+
+    async def get_previous_high(
+        self, symbol: str
+    ) -> Tuple[Optional[float], Optional[datetime]]:
+        return await self._get_previous_value(symbol, "high", "전일 고점")
+
+    async def get_latest_minute_price(
+        self, symbol: str, ignore_cache: bool = False
+    ) -> Optional[float]:
+        cache_key = f"latest_minute_{symbol}"
+
+        # 캐시 무시 플래그가 False일 때만 캐시 확인
+        if not ignore_cache and cache_key in _latest_price_cache:
+            cached_data = _latest_price_cache[cache_key]
+            if (time.time() - cached_data["timestamp"]) < LATEST_PRICE_CACHE_TTL:
+                return cached_data["price"]
+
+        df = await self._get_field_frame(symbol, "range=1d&interval=1m", "close", "1분봉")
+        if df is None or df.empty:
+            return None
+
+        latest = df.iloc[-1]
+        price = latest["close"]
+        print(
+            f"📉 {symbol} 최근 1분봉: {price} @ {datetime.fromtimestamp(latest['timestamp'])}"
+        )
+
+        _latest_price_cache[cache_key] = {"price": price, "timestamp": time.time()}
+        return price
+
+    async def get_latest_minute_prices(
+        self, symbols: List[str], ignore_cache: bool = False
+    ) -> Dict[str, Optional[float]]:
+        """
+        여러 심볼의 최신 1분봉 가격을 동시에 조회
+
+        요청은 모두 한 번에 예약되고, 실제 전송 속도는 공유 토큰 버킷이 조절합니다.
+
+        Returns:
+            {심볼: 가격 또는 None}
+        """
+        results = await asyncio.gather(
+            *(self.get_latest_minute_price(symbol, ignore_cache) for symbol in symbols),
+            return_exceptions=True,
+        )
+        return {
+            symbol: (None if isinstance(result, Exception) else result)
+            for symbol, result in zip(symbols, results)
+        }
+
+    async def get_minute_data(
+        self, symbol: str, period: str = "5d"
+    ) -> Optional[pd.DataFrame]:
+        """1분봉 데이터 수집 (기술적 지표 계산용)"""
+        data = await self._get_json(
+            f"{self.BASE_URL}{symbol}?range={period}&interval=1m", symbol
+        )
+        df = self._build_ohlcv_frame(data, symbol, "1분봉")
+        if df is None:
+            return None
+
+        df["datetime"] = pd.to_datetime(df["timestamp"], unit="s")
+        return df
+
+    async def get_15minute_data(
+        self, symbol: str, period: str = "5d"
+    ) -> Optional[pd.DataFrame]:
+        """15분봉 데이터 수집 (기술적 지표 계산용)"""
+        data = await self._get_json(
+            f"{self.BASE_URL}{symbol}?range={period}&interval=15m", symbol
+        )
+        df = self._build_ohlcv_frame(data, symbol, "15분봉")
+        if df is None:
+            return None
+
+        df["datetime"] = pd.to_datetime(df["timestamp"], unit="s")
+        return df
+
+    async def get_daily_data(
+        self, symbol: str, period: str = "max"
+    ) -> Optional[pd.DataFrame]:
+        """
+        일봉 데이터 수집 (기술적 지표 계산용)
+
+        period="max"이면 2000년부터 연도별 구간을 동시에 요청합니다.
+        """
+        if period == "max":
+            frames = await asyncio.gather(
+                *(
+                    self._get_daily_range(symbol, date(year, 1, 1), date(year, 12, 31))
+                    for year in range(2000, datetime.now().year + 1)
+                )
+            )
+            frames = [frame for frame in frames if frame is not None]
+        else:
+            data = await self._get_json(
+                f"{self.BASE_URL}{symbol}?range={period}&interval=1d", symbol
+            )
+            df = self._build_ohlcv_frame(data, symbol, "일봉")
+            frames = [df] if df is not None else []
+
+        if not frames:
+            return None
+
+        df = pd.concat(frames, ignore_index=True)
+        df = df.drop_duplicates(subset=["timestamp"]).sort_values("timestamp")
+        df["datetime"] = pd.to_datetime(df["timestamp"], unit="s")
+
+        # 인덱스/컬럼명을 YahooPriceClient.get_daily_data와 동일하게 맞춤
+        df.set_index("datetime", inplace=True)
+        df.columns = ["timestamp", "Open", "High", "Low", "Close", "Volume"]
+        return df
+
+    async def _get_daily_range(
+        self, symbol: str, start_date: date, end_date: date
+    ) -> Optional[pd.DataFrame]:
+        """한 구간의 일봉 데이터 조회"""
+        start_timestamp = int(
+            datetime(start_date.year, start_date.month, start_date.day).timestamp()
+        )
+        end_timestamp = int(
+            datetime(end_date.year, end_date.month, end_date.day, 23, 59, 59).timestamp()
+        )
+        data = await self._get_json(
+            f"{self.BASE_URL}{symbol}?period1={start_timestamp}&period2={end_timestamp}&interval=1d",
+            symbol,
+        )
+        return self._build_ohlcv_frame(data, symbol, f"{start_date}~{end_date} 일봉")
@@ -2,8 +2,15 @@ import requests
 import random
 import pandas as pd
 import time
-from typing import Optional, Tuple, Dict, Any
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, Dict, Any, List
+from datetime import date, datetime, timedelta
+
+from app.common.utils.api_client import TokenBucketRateLimiter
+
+# 야후 차트 API 프로세스 공유 속도 제한
+# (과거 일봉 병렬 수집, AsyncYahooPriceClient 등 모든 클라이언트/워커 공용)
+YAHOO_RATE_LIMITER = TokenBucketRateLimiter(rate=5.0, capacity=10)
 
 
 class YahooPriceClient:
@@ -126,11 +133,19 @@ class YahooPriceClient:
         
         self._last_request_time = time.time()
 
-    def _make_request(self, url: str, symbol: str = None) -> Optional[requests.Response]:
+    def _make_request(
+        self,
+        url: str,
+        symbol: str = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+    ) -> Optional[requests.Response]:
         """브라우저 시뮬레이션 요청 수행"""
         try:
-            # 요청 간 지연
-            self._rate_limit_delay()
+            # 요청 간 지연 (공유 limiter가 있으면 토큰 버킷 사용)
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            else:
+                self._rate_limit_delay()
             
             # 랜덤 헤더 설정
             headers = self._get_random_headers(symbol)
@@ -475,12 +490,22 @@ class YahooPriceClient:
             return None
 
     def get_daily_data(
-        self, symbol: str, period: str = "max"
+        self,
+        symbol: str,
+        period: str = "max",
+        concurrent: bool = False,
+        max_workers: int = 4,
     ) -> Optional[pd.DataFrame]:
-        """일봉 데이터 수집 (기술적 지표 계산용)"""
+        """
+        일봉 데이터 수집 (기술적 지표 계산용)
+
+        period="max"이고 concurrent=True이면 연도별 구간을 병렬로 수집합니다.
+        """
 
         # 10년치 데이터를 확실히 받기 위해 기간별로 분할 수집
         if period == "max":
+            if concurrent:
+                return self.get_daily_data_concurrent(symbol, max_workers=max_workers)
             return self._get_historical_daily_data(symbol)
 
         url = f"{self.BASE_URL}{symbol}?range={period}&interval=1d"
@@ -550,74 +575,215 @@ class YahooPriceClient:
 
         # 🚀 2000년부터 현재까지 연도별로 수집 (25년치!)
         for year in range(2000, current_year + 1):
-            try:
-                # 각 연도별로 데이터 수집
-                start_timestamp = int(datetime(year, 1, 1).timestamp())
-                end_timestamp = int(datetime(year, 12, 31, 23, 59, 59).timestamp())
-
-                url = f"{self.BASE_URL}{symbol}?period1={start_timestamp}&period2={end_timestamp}&interval=1d"
-
-                print(f"   📅 {year}년 데이터 수집 중...")
-
-                res = self._make_request(url, symbol)
-                if not res:
-                    continue
-                    
-                res.raise_for_status()
-                data = res.json()
-
-                if not data.get("chart") or not data["chart"].get("result"):
-                    print(f"   ⚠️ {year}년 데이터 없음")
-                    continue
-
-                if not data["chart"]["result"][0].get("indicators"):
-                    print(f"   ⚠️ {year}년 지표 데이터 없음")
-                    continue
-
-                timestamps = data["chart"]["result"][0]["timestamp"]
-                quotes = data["chart"]["result"][0]["indicators"]["quote"][0]
-
-                # 필수 필드 확인
-                required_fields = ["open", "high", "low", "close", "volume"]
-                missing_fields = [
-                    field for field in required_fields if field not in quotes
-                ]
-                if missing_fields:
-                    print(
-                        f"   ⚠️ {year}년 데이터 필드 누락: {', '.join(missing_fields)}"
-                    )
-                    continue
-
-                year_df = pd.DataFrame(
-                    {
-                        "timestamp": timestamps,
-                        "open": quotes["open"],
-                        "high": quotes["high"],
-                        "low": quotes["low"],
-                        "close": quotes["close"],
-                        "volume": quotes["volume"],
-                    }
-                ).dropna()
-
-                if not year_df.empty:
-                    all_dataframes.append(year_df)
-                    print(f"   ✅ {year}년: {len(year_df)}개 데이터 수집")
-                else:
-                    print(f"   ⚠️ {year}년: 데이터 없음")
-
-                # API 호출 제한 방지를 위한 딜레이
-                time.sleep(0.5)
-
-            except Exception as e:
-                print(f"   ❌ {year}년 데이터 수집 실패: {e}")
-                continue
-
-        if not all_dataframes:
-            print(f"❌ {symbol} 모든 연도 데이터 수집 실패")
+            start_date, end_date = self._year_window(year)
+            year_df = self._fetch_daily_range(symbol, start_date, end_date, f"{year}년")
+            if year_df is not None:
+                all_dataframes.append(year_df)
+
+            # API 호출 제한 방지를 위한 딜레이
+            time.sleep(0.5)
+
+        combined_df = self._combine_daily_frames(symbol, all_dataframes)
+        if combined_df is not None:
+            print(
+                f"🎉 {symbol} 전체 데이터 수집 완료: {len(combined_df)}개 (2000~{current_year}) - 25년치!"
+            )
+        return combined_df
+
+    # =================================================================
+    # 병렬 과거 일봉 수집 (공유 토큰 버킷 속도 제한)
+    # =================================================================
+
+    def get_daily_data_concurrent(
+        self,
+        symbol: str,
+        start_year: int = 2000,
+        end_year: Optional[int] = None,
+        max_workers: int = 4,
+    ) -> Optional[pd.DataFrame]:
+        """
+        연도별 구간을 병렬로 수집하여 과거 일봉 데이터 반환
+
+        _get_historical_daily_data와 같은 결과 형식이지만, 연도별 요청을
+        max_workers개 스레드로 동시에 보내고 YAHOO_RATE_LIMITER로
+        전체 호출 속도를 제한합니다.
+
+        Args:
+            symbol: 심볼
+            start_year: 시작 연도 (기본값: 2000)
+            end_year: 종료 연도 (기본값: 올해)
+            max_workers: 동시 요청 수
+
+        Returns:
+            일봉 데이터프레임 (datetime 인덱스, Open/High/Low/Close/Volume) 또는 None
+        """
+        end_year = end_year or datetime.now().year
+        ranges = [self._year_window(year) for year in range(start_year, end_year + 1)]
+
+        print(
+            f"📊 {symbol} {start_year}~{end_year} 과거 데이터 병렬 수집 시작 "
+            f"({len(ranges)}개 구간, 동시 {max_workers}개)..."
+        )
+
+        combined_df = self.get_daily_data_for_ranges(symbol, ranges, max_workers)
+        if combined_df is not None:
+            print(f"🎉 {symbol} 병렬 수집 완료: {len(combined_df)}개")
+        return combined_df
+
+    def get_daily_data_for_ranges(
+        self,
+        symbol: str,
+        ranges: List[Tuple[date, date]],
+        max_workers: int = 4,
+    ) -> Optional[pd.DataFrame]:
+        """
+        지정한 날짜 구간들만 병렬로 수집
+
+        DailyPriceRepository.get_missing_dates 결과를
+        group_missing_dates_into_ranges로 묶어서 전달하면 누락 구간만 받아옵니다.
+
+        Args:
+            symbol: 심볼
+            ranges: [(시작일, 종료일), ...] (양 끝 포함)
+            max_workers: 동시 요청 수
+
+        Returns:
+            일봉 데이터프레임 또는 None
+        """
+        if not ranges:
             return None
 
-        # 모든 연도 데이터 합치기
-        combined_df = pd.concat(all_dataframes, ignore_index=True)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            frames = list(
+                executor.map(
+                    lambda window: self._fetch_daily_range(
+                        symbol,
+                        window[0],
+                        window[1],
+                        f"{window[0]}~{window[1]}",
+                        rate_limiter=YAHOO_RATE_LIMITER,
+                    ),
+                    ranges,
+                )
+            )
+
+        return self._combine_daily_frames(
+            symbol, [frame for frame in frames if frame is not None]
+        )
+
+    @staticmethod
+    def group_missing_dates_into_ranges(
+        missing_dates: List[date], max_gap_days: int = 4
+    ) -> List[Tuple[date, date]]:
+        """
+        누락 날짜 리스트를 연속 구간으로 묶기
+
+        주말/공휴일 때문에 생기는 짧은 간격(max_gap_days 이하)은 같은 구간으로 봅니다.
+
+        Args:
+            missing_dates: 누락 날짜 리스트
+            max_gap_days: 같은 구간으로 합칠 최대 날짜 간격
+
+        Returns:
+            [(시작일, 종료일), ...]
+        """
+        ranges: List[Tuple[date, date]] = []
+        for missing_date in sorted(set(missing_dates)):
+            if ranges and (missing_date - ranges[-1][1]).days <= max_gap_days:
+                ranges[-1] = (ranges[-1][0], missing_date)
+            else:
+                ranges.append((missing_date, missing_date))
+        return ranges
+
+    @staticmethod
+    def _year_window(year: int) -> Tuple[date, date]:
+        """연도의 (1월 1일, 12월 31일) 구간"""
+        return date(year, 1, 1), date(year, 12, 31)
+
+    def _fetch_daily_range(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        label: str,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+    ) -> Optional[pd.DataFrame]:
+        """한 구간의 일봉 데이터를 소문자 컬럼 데이터프레임으로 수집"""
+        try:
+            start_timestamp = int(
+                datetime(start_date.year, start_date.month, start_date.day).timestamp()
+            )
+            end_timestamp = int(
+                datetime(
+                    end_date.year, end_date.month, end_date.day, 23, 59, 59
+                ).timestamp()
+            )
+
+            url = f"{self.BASE_URL}{symbol}?period1={start_timestamp}&period2={end_timestamp}&interval=1d"
+
+            print(f"   📅 {label} 데이터 수집 중...")
+
+            res = self._make_request(url, symbol, rate_limiter=rate_limiter)
+            if not res:
+                return None
+
+            res.raise_for_status()
+            data = res.json()
+
+            if not data.get("chart") or not data["chart"].get("result"):
+                print(f"   ⚠️ {label} 데이터 없음")
+                return None
+
+            if not data["chart"]["result"][0].get("indicators"):
+                print(f"   ⚠️ {label} 지표 데이터 없음")
+                return None
+
+            timestamps = data["chart"]["result"][0].get("timestamp")
+            if not timestamps:
+                print(f"   ⚠️ {label}: 데이터 없음")
+                return None
+
+            quotes = data["chart"]["result"][0]["indicators"]["quote"][0]
+
+            # 필수 필드 확인
+            required_fields = ["open", "high", "low", "close", "volume"]
+            missing_fields = [field for field in required_fields if field not in quotes]
+            if missing_fields:
+                print(f"   ⚠️ {label} 데이터 필드 누락: {', '.join(missing_fields)}")
+                return None
+
+            range_df = pd.DataFrame(
+                {
+                    "timestamp": timestamps,
+                    "open": quotes["open"],
+                    "high": quotes["high"],
+                    "low": quotes["low"],
+                    "close": quotes["close"],
+                    "volume": quotes["volume"],
+                }
+            ).dropna()
+
+            if range_df.empty:
+                print(f"   ⚠️ {label}: 데이터 없음")
+                return None
+
+            print(f"   ✅ {label}: {len(range_df)}개 데이터 수집")
+            return range_df
+
+        except Exception as e:
+            print(f"   ❌ {label} 데이터 수집 실패: {e}")
+            return None
+
+    def _combine_daily_frames(
+        self, symbol: str, frames: List[pd.DataFrame]
+    ) -> Optional[pd.DataFrame]:
+        """구간별 데이터프레임을 합쳐 get_daily_data와 같은 형식으로 변환"""
+        if not frames:
+            print(f"❌ {symbol} 모든 구간 데이터 수집 실패")
+            return None
+
+        # 모든 구간 데이터 합치기
+        combined_df = pd.concat(frames, ignore_index=True)
 
         # 중복 제거 (같은 날짜 데이터가 있을 수 있음)
         combined_df = combined_df.drop_duplicates(subset=["timestamp"])
@@ -634,8 +800,4 @@ class YahooPriceClient:
         # 컬럼명을 대문자로 변경 (기존 코드와 호환성 위해)
         combined_df.columns = ["timestamp", "Open", "High", "Low", "Close", "Volume"]
 
-        print(
-            f"🎉 {symbol} 전체 데이터 수집 완료: {len(combined_df)}개 (2000~{current_year}) - 25년치!"
-        )
-
         return combined_df
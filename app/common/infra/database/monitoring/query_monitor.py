@@ -2,12 +2,20 @@
 데이터베이스 쿼리 모니터링 시스템
 
 이 모듈은 SQLAlchemy 쿼리의 성능을 모니터링하고 슬로우 쿼리를 감지합니다.
+
+주요 기능:
+- 구문 지문 캐시: 원본 SQL 문자열별로 정규화/해시/테이블명 추출 결과를 재사용
+- 스레드별 집계 버퍼: 쿼리마다 공유 잠금을 잡지 않고, merge_interval마다 전역 메트릭에 병합
+- 슬로우 쿼리 백그라운드 큐: DB 저장/알림은 전용 스레드의 이벤트 루프에서 처리
 """
 
+import asyncio
+import hashlib
+import queue
 import time
 import threading
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from collections import defaultdict, deque
 import re
@@ -23,6 +31,34 @@ from app.common.infra.database.services.slow_query_service import slow_query_ser
 
 logger = get_logger(__name__)
 
+# 구문 지문 캐시 최대 크기 (IN 절 길이 등으로 구문 종류가 늘어나도 메모리 제한)
+FINGERPRINT_CACHE_SIZE = 4096
+
+# 슬로우 쿼리 대기열 최대 크기 (가득 차면 버리고 개수만 기록)
+SLOW_QUERY_QUEUE_SIZE = 1000
+
+# 테이블명 추출 패턴 (대문자로 변환한 쿼리에 적용)
+_PRIMARY_TABLE_PATTERNS = [
+    re.compile(r'FROM\s+([`"]?)(\w+)\1'),
+    re.compile(r'INSERT\s+INTO\s+([`"]?)(\w+)\1'),
+    re.compile(r'UPDATE\s+([`"]?)(\w+)\1'),
+    re.compile(r'DELETE\s+FROM\s+([`"]?)(\w+)\1'),
+]
+_TABLE_NAMES_PATTERN = re.compile(r'(?:FROM|JOIN|INTO|UPDATE)\s+([`"]?)(\w+)\1')
+
+_OPERATION_PREFIXES = ("SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "DROP", "ALTER")
+
+
+@dataclass(frozen=True)
+class QueryFingerprint:
+    """원본 SQL 문자열 하나의 정규화 결과 (지문 캐시 값)"""
+
+    query_hash: str
+    query_template: str
+    table_name: str  # 대표 테이블 (Prometheus 라벨)
+    table_names: Tuple[str, ...]
+    operation: str
+
 
 @dataclass
 class QueryMetrics:
@@ -54,11 +90,36 @@ class SlowQuery:
     affected_rows: int = 0
 
 
+class _ThreadQueryBuffer:
+    """
+    스레드별 쿼리 집계 버퍼
+
+    잠금은 소유 스레드와 병합하는 스레드 사이에서만 쓰이므로 평소에는 경합이 없습니다.
+    stats 값: [실행 수, 총 시간, 최소, 최대, 슬로우 수, 영향 행 수, 마지막 실행 시각, 지문]
+    """
+
+    __slots__ = ("lock", "stats", "last_merge", "thread")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats: Dict[str, list] = {}
+        self.last_merge = time.monotonic()
+        self.thread = threading.current_thread()
+
+    def drain(self) -> Dict[str, list]:
+        """쌓인 집계를 꺼내고 버퍼 비우기"""
+        with self.lock:
+            stats, self.stats = self.stats, {}
+            self.last_merge = time.monotonic()
+        return stats
+
+
 class QueryMonitor:
     """데이터베이스 쿼리 모니터링 클래스"""
 
-    def __init__(self, slow_query_threshold: float = 1.0):
+    def __init__(self, slow_query_threshold: float = 1.0, merge_interval: float = 1.0):
         self.slow_query_threshold = slow_query_threshold
+        self.merge_interval = merge_interval  # 스레드 버퍼를 전역 메트릭에 병합하는 주기 (초)
         self.query_metrics: Dict[str, QueryMetrics] = {}
         self.slow_queries: deque = deque(maxlen=1000)  # 최근 1000개 슬로우 쿼리 보관
         self.connection_metrics = {
@@ -69,6 +130,20 @@ class QueryMonitor:
         }
         self._lock = threading.Lock()
 
+        # 원본 SQL -> 지문 캐시 (조회는 잠금 없이, 가득 찼을 때 비우기만 잠금)
+        self._fingerprint_cache: Dict[str, QueryFingerprint] = {}
+        self._fingerprint_cache_lock = threading.Lock()
+
+        # 스레드별 집계 버퍼 (등록/정리만 전역 잠금)
+        self._thread_local = threading.local()
+        self._thread_buffers: List[_ThreadQueryBuffer] = []
+
+        # 슬로우 쿼리 백그라운드 처리
+        self._slow_query_queue: "queue.Queue" = queue.Queue(maxsize=SLOW_QUERY_QUEUE_SIZE)
+        self._slow_query_worker: Optional[threading.Thread] = None
+        self._slow_query_worker_lock = threading.Lock()
+        self.dropped_slow_queries = 0
+
         # 쿼리 패턴 정규화를 위한 정규식
         self.normalization_patterns = [
             (re.compile(r"\b\d+\b"), "?"),  # 숫자를 ?로 치환
@@ -86,8 +161,6 @@ class QueryMonitor:
         ):
             """쿼리 실행 전 이벤트"""
             context._query_start_time = time.time()
-            context._query_statement = statement
-            context._query_parameters = parameters
 
         @event.listens_for(engine, "after_cursor_execute")
         def after_cursor_execute(
@@ -100,32 +173,17 @@ class QueryMonitor:
             duration = time.time() - context._query_start_time
             affected_rows = cursor.rowcount if hasattr(cursor, "rowcount") else 0
 
-            # 쿼리 정규화 및 메트릭 기록
-            self._record_query_metrics(statement, duration, affected_rows, parameters)
+            # 지문 캐시 조회 후 스레드 버퍼에 기록
+            fingerprint = self._get_fingerprint(statement)
+            self._record_query_metrics(statement, duration, affected_rows, parameters, fingerprint)
 
-            # 슬로우 쿼리 감지
+            # 슬로우 쿼리는 대기열에 넘기고 바로 반환 (DB 저장/알림은 백그라운드 스레드)
             if duration > self.slow_query_threshold:
-                # 비동기 함수를 동기적으로 실행
-                import asyncio
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        # 이미 실행 중인 루프가 있으면 백그라운드 태스크로 실행
-                        asyncio.create_task(self._handle_slow_query(statement, duration, parameters, affected_rows))
-                    else:
-                        # 루프가 없으면 새로 실행
-                        loop.run_until_complete(self._handle_slow_query(statement, duration, parameters, affected_rows))
-                except RuntimeError:
-                    # 루프가 없는 경우 새로 생성
-                    asyncio.run(self._handle_slow_query(statement, duration, parameters, affected_rows))
+                self._enqueue_slow_query(fingerprint, statement, duration, parameters, affected_rows)
 
             # Prometheus 메트릭 기록
-            table_name = self._extract_table_name(statement)
-            operation = self._extract_operation(statement)
-            status = "success"
-
             metrics_collector.record_db_operation(
-                operation, table_name, status, duration
+                fingerprint.operation, fingerprint.table_name, "success", duration
             )
 
         @event.listens_for(engine, "connect")
@@ -166,9 +224,54 @@ class QueryMonitor:
             """연결 풀에 연결 체크인 시 이벤트"""
             logger.debug("connection_pool_checkin")
 
+        self.start_slow_query_worker()
+
         logger.info(
             "database_query_monitoring_enabled",
             slow_query_threshold=self.slow_query_threshold,
+            merge_interval=self.merge_interval,
+        )
+
+    # ====================
+    # 구문 지문
+    # ====================
+
+    def _get_fingerprint(self, query: str) -> QueryFingerprint:
+        """원본 SQL의 지문 반환 (같은 문자열이면 정규화 없이 캐시 재사용)"""
+        fingerprint = self._fingerprint_cache.get(query)
+        if fingerprint is not None:
+            return fingerprint
+
+        fingerprint = self._build_fingerprint(query)
+        if len(self._fingerprint_cache) >= FINGERPRINT_CACHE_SIZE:
+            with self._fingerprint_cache_lock:
+                if len(self._fingerprint_cache) >= FINGERPRINT_CACHE_SIZE:
+                    self._fingerprint_cache.clear()
+        self._fingerprint_cache[query] = fingerprint
+        return fingerprint
+
+    def _build_fingerprint(self, query: str) -> QueryFingerprint:
+        """정규화, 해시, 작업 유형, 테이블명 추출을 한 번에 수행"""
+        query_template = self._normalize_query(query)
+        query_upper = query.upper().strip()
+
+        table_name = "unknown"
+        for pattern in _PRIMARY_TABLE_PATTERNS:
+            match = pattern.search(query_upper)
+            if match:
+                table_name = match.group(2).lower()
+                break
+
+        table_names = tuple(
+            {match[1].lower() for match in _TABLE_NAMES_PATTERN.findall(query_upper)}
+        )
+
+        return QueryFingerprint(
+            query_hash=hashlib.md5(query_template.encode()).hexdigest()[:12],
+            query_template=query_template,
+            table_name=table_name,
+            table_names=table_names,
+            operation=self._operation_from_upper(query_upper),
         )
 
     def _normalize_query(self, query: str) -> str:
@@ -182,77 +285,41 @@ class QueryMonitor:
 
     def _generate_query_hash(self, query: str) -> str:
         """쿼리 해시 생성"""
-        import hashlib
-
-        normalized = self._normalize_query(query)
-        return hashlib.md5(normalized.encode()).hexdigest()[:12]
+        return self._get_fingerprint(query).query_hash
 
     def _extract_table_name(self, query: str) -> str:
         """쿼리에서 테이블명 추출"""
-        query_upper = query.upper().strip()
-
-        # FROM 절에서 테이블명 추출
-        from_match = re.search(r'FROM\s+([`"]?)(\w+)\1', query_upper)
-        if from_match:
-            return from_match.group(2).lower()
-
-        # INSERT INTO에서 테이블명 추출
-        insert_match = re.search(r'INSERT\s+INTO\s+([`"]?)(\w+)\1', query_upper)
-        if insert_match:
-            return insert_match.group(2).lower()
-
-        # UPDATE에서 테이블명 추출
-        update_match = re.search(r'UPDATE\s+([`"]?)(\w+)\1', query_upper)
-        if update_match:
-            return update_match.group(2).lower()
-
-        # DELETE FROM에서 테이블명 추출
-        delete_match = re.search(r'DELETE\s+FROM\s+([`"]?)(\w+)\1', query_upper)
-        if delete_match:
-            return delete_match.group(2).lower()
-
-        return "unknown"
+        return self._get_fingerprint(query).table_name
 
     def _extract_operation(self, query: str) -> str:
         """쿼리에서 작업 유형 추출"""
-        query_upper = query.upper().strip()
+        return self._get_fingerprint(query).operation
 
-        if query_upper.startswith("SELECT"):
-            return "select"
-        elif query_upper.startswith("INSERT"):
-            return "insert"
-        elif query_upper.startswith("UPDATE"):
-            return "update"
-        elif query_upper.startswith("DELETE"):
-            return "delete"
-        elif query_upper.startswith("CREATE"):
-            return "create"
-        elif query_upper.startswith("DROP"):
-            return "drop"
-        elif query_upper.startswith("ALTER"):
-            return "alter"
-        else:
-            return "other"
+    @staticmethod
+    def _operation_from_upper(query_upper: str) -> str:
+        """대문자 쿼리의 시작 키워드로 작업 유형 결정"""
+        for prefix in _OPERATION_PREFIXES:
+            if query_upper.startswith(prefix):
+                return prefix.lower()
+        return "other"
 
     def _extract_table_names(self, query: str) -> List[str]:
         """쿼리에서 모든 테이블명 추출"""
-        tables = set()
-        query_upper = query.upper()
-
-        # FROM, JOIN, INTO, UPDATE 등에서 테이블명 추출
-        patterns = [
-            r'FROM\s+([`"]?)(\w+)\1',
-            r'JOIN\s+([`"]?)(\w+)\1',
-            r'INTO\s+([`"]?)(\w+)\1',
-            r'UPDATE\s+([`"]?)(\w+)\1',
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, query_upper)
-            for match in matches:
-                tables.add(match[1].lower())
-
-        return list(tables)
+        return list(self._get_fingerprint(query).table_names)
+
+    # ====================
+    # 스레드별 집계
+    # ====================
+
+    def _get_thread_buffer(self) -> _ThreadQueryBuffer:
+        """현재 스레드의 집계 버퍼 반환 (처음이면 생성 후 등록)"""
+        buffer = getattr(self._thread_local, "buffer", None)
+        if buffer is None:
+            buffer = _ThreadQueryBuffer()
+            self._thread_local.buffer = buffer
+            with self._lock:
+                self._thread_buffers.append(buffer)
+        return buffer
 
     def _record_query_metrics(
         self,
@@ -260,53 +327,172 @@ class QueryMonitor:
         duration: float,
         affected_rows: int,
         parameters: Optional[Dict] = None,
+        fingerprint: Optional[QueryFingerprint] = None,
     ):
-        """쿼리 메트릭 기록"""
-        query_hash = self._generate_query_hash(query)
-        query_template = self._normalize_query(query)
-        table_names = self._extract_table_names(query)
+        """쿼리 메트릭을 현재 스레드 버퍼에 기록 (merge_interval마다 전역 메트릭에 병합)"""
+        if fingerprint is None:
+            fingerprint = self._get_fingerprint(query)
+
+        is_slow = duration > self.slow_query_threshold
+        buffer = self._get_thread_buffer()
+
+        with buffer.lock:
+            entry = buffer.stats.get(fingerprint.query_hash)
+            if entry is None:
+                buffer.stats[fingerprint.query_hash] = [
+                    1, duration, duration, duration, 1 if is_slow else 0,
+                    affected_rows, time.time(), fingerprint,
+                ]
+            else:
+                entry[0] += 1
+                entry[1] += duration
+                if duration < entry[2]:
+                    entry[2] = duration
+                if duration > entry[3]:
+                    entry[3] = duration
+                if is_slow:
+                    entry[4] += 1
+                entry[5] += affected_rows
+                entry[6] = time.time()
+
+        if time.monotonic() - buffer.last_merge >= self.merge_interval:
+            self._merge_buffer(buffer)
+
+    def _merge_buffer(self, buffer: _ThreadQueryBuffer):
+        """스레드 버퍼 하나를 전역 메트릭에 병합"""
+        stats = buffer.drain()
+        if not stats:
+            return
 
         with self._lock:
-            if query_hash in self.query_metrics:
-                metrics = self.query_metrics[query_hash]
-                metrics.execution_count += 1
-                metrics.total_duration += duration
+            for query_hash, (
+                count, total, min_duration, max_duration, slow_count,
+                affected_rows, last_execution, fingerprint,
+            ) in stats.items():
+                last_execution_at = datetime.fromtimestamp(last_execution)
+                metrics = self.query_metrics.get(query_hash)
+                if metrics is None:
+                    self.query_metrics[query_hash] = QueryMetrics(
+                        query_hash=query_hash,
+                        query_template=fingerprint.query_template,
+                        execution_count=count,
+                        total_duration=total,
+                        avg_duration=total / count,
+                        min_duration=min_duration,
+                        max_duration=max_duration,
+                        last_execution=last_execution_at,
+                        slow_query_count=slow_count,
+                        affected_rows=affected_rows,
+                        table_names=list(fingerprint.table_names),
+                    )
+                    continue
+
+                metrics.execution_count += count
+                metrics.total_duration += total
                 metrics.avg_duration = metrics.total_duration / metrics.execution_count
-                metrics.min_duration = min(metrics.min_duration, duration)
-                metrics.max_duration = max(metrics.max_duration, duration)
-                metrics.last_execution = datetime.now()
+                metrics.min_duration = min(metrics.min_duration, min_duration)
+                metrics.max_duration = max(metrics.max_duration, max_duration)
+                metrics.last_execution = max(metrics.last_execution, last_execution_at)
+                metrics.slow_query_count += slow_count
                 metrics.affected_rows += affected_rows
 
-                if duration > self.slow_query_threshold:
-                    metrics.slow_query_count += 1
-            else:
-                self.query_metrics[query_hash] = QueryMetrics(
-                    query_hash=query_hash,
-                    query_template=query_template,
-                    execution_count=1,
-                    total_duration=duration,
-                    avg_duration=duration,
-                    min_duration=duration,
-                    max_duration=duration,
-                    last_execution=datetime.now(),
-                    slow_query_count=1 if duration > self.slow_query_threshold else 0,
-                    affected_rows=affected_rows,
-                    table_names=table_names,
-                )
+    def _merge_all_buffers(self):
+        """모든 스레드 버퍼를 병합하고 종료된 스레드의 버퍼는 등록 해제 (조회 전에 호출)"""
+        with self._lock:
+            buffers = list(self._thread_buffers)
+
+        for buffer in buffers:
+            self._merge_buffer(buffer)
+
+        with self._lock:
+            self._thread_buffers = [
+                buffer
+                for buffer in self._thread_buffers
+                if buffer.thread.is_alive() or buffer.stats
+            ]
+
+    # ====================
+    # 슬로우 쿼리 백그라운드 처리
+    # ====================
+
+    def start_slow_query_worker(self):
+        """슬로우 쿼리 처리 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._slow_query_worker_lock:
+            if self._slow_query_worker and self._slow_query_worker.is_alive():
+                return
+            self._slow_query_worker = threading.Thread(
+                target=self._slow_query_loop, name="slow-query-worker", daemon=True
+            )
+            self._slow_query_worker.start()
+
+    def stop_slow_query_worker(self, timeout: float = 5.0):
+        """대기열을 모두 처리하고 대기 중인 슬로우 쿼리를 저장한 뒤 스레드 종료"""
+        with self._slow_query_worker_lock:
+            worker = self._slow_query_worker
+            self._slow_query_worker = None
+        if worker is None or not worker.is_alive():
+            return
+
+        self._slow_query_queue.put(None)
+        worker.join(timeout)
+
+    def _enqueue_slow_query(
+        self,
+        fingerprint: QueryFingerprint,
+        query: str,
+        duration: float,
+        parameters: Optional[Dict],
+        affected_rows: int,
+    ):
+        """슬로우 쿼리를 대기열에 추가 (가득 차면 버림, DB 호출 스레드를 막지 않음)"""
+        if self._slow_query_worker is None:
+            self.start_slow_query_worker()
+        try:
+            self._slow_query_queue.put_nowait(
+                (fingerprint, query, duration, parameters, affected_rows, datetime.now())
+            )
+        except queue.Full:
+            self.dropped_slow_queries += 1
+
+    def _slow_query_loop(self):
+        """슬로우 쿼리 처리 스레드 (전용 이벤트 루프에서 저장/알림 코루틴 실행)"""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            while True:
+                try:
+                    item = self._slow_query_queue.get(timeout=5.0)
+                except queue.Empty:
+                    # 한동안 새 슬로우 쿼리가 없으면 배치 대기 중인 항목 저장
+                    if slow_query_service.pending_queries:
+                        loop.run_until_complete(slow_query_service.force_flush())
+                    continue
+
+                if item is None:
+                    break
+
+                try:
+                    loop.run_until_complete(self._handle_slow_query(*item))
+                except Exception as e:
+                    logger.error("slow_query_handling_failed", error=str(e))
+
+            loop.run_until_complete(slow_query_service.force_flush())
+        except Exception as e:
+            logger.error("slow_query_worker_failed", error=str(e))
+        finally:
+            loop.close()
 
     async def _handle_slow_query(
         self,
+        fingerprint: QueryFingerprint,
         query: str,
         duration: float,
         parameters: Optional[Dict],
         affected_rows: int,
+        execution_timestamp: datetime,
     ):
         """슬로우 쿼리 처리"""
-        query_hash = self._generate_query_hash(query)
-        query_template = self._normalize_query(query)
-        table_names = self._extract_table_names(query)
-        operation_type = self._extract_operation(query)
-        execution_timestamp = datetime.now()
+        query_hash = fingerprint.query_hash
 
         # 메모리에 슬로우 쿼리 기록 (기존 방식 유지)
         slow_query = SlowQuery(
@@ -324,12 +510,12 @@ class QueryMonitor:
         try:
             await slow_query_service.save_slow_query(
                 query_hash=query_hash,
-                query_template=query_template,
+                query_template=fingerprint.query_template,
                 original_query=query,
                 duration=duration,
                 affected_rows=affected_rows,
-                table_names=table_names,
-                operation_type=operation_type,
+                table_names=list(fingerprint.table_names),
+                operation_type=fingerprint.operation,
                 execution_timestamp=execution_timestamp,
             )
         except Exception as e:
@@ -374,6 +560,7 @@ class QueryMonitor:
 
     def get_query_statistics(self, limit: int = 50) -> List[Dict[str, Any]]:
         """쿼리 통계 조회"""
+        self._merge_all_buffers()
         with self._lock:
             # 평균 실행 시간 기준으로 정렬
             sorted_metrics = sorted(
@@ -406,6 +593,7 @@ class QueryMonitor:
 
     def get_performance_summary(self) -> Dict[str, Any]:
         """성능 요약 정보"""
+        self._merge_all_buffers()
         with self._lock:
             total_queries = sum(m.execution_count for m in self.query_metrics.values())
             total_slow_queries = sum(
@@ -471,6 +659,11 @@ class QueryMonitor:
 
     def reset_metrics(self):
         """메트릭 초기화"""
+        with self._lock:
+            buffers = list(self._thread_buffers)
+        for buffer in buffers:
+            buffer.drain()
+
         with self._lock:
             self.query_metrics.clear()
             self.slow_queries.clear()
@@ -4,6 +4,8 @@ API 호출 최적화 유틸리티
 
 import time
 import random
+import asyncio
+import threading
 import requests
 from functools import wraps
 from typing import Dict, Any, Optional, Callable
@@ -30,6 +32,79 @@ class RateLimiter:
         self.last_call_time = time.time()
 
 
+class TokenBucketRateLimiter:
+    """
+    토큰 버킷 기반 API 호출 속도 제한 (스레드 안전)
+
+    여러 워커 스레드가 하나의 인스턴스를 공유하면 전체 호출 속도가
+    rate(초당 호출 수)를 넘지 않으며, capacity만큼의 순간 버스트를 허용합니다.
+    """
+
+    def __init__(self, rate: float = 2.0, capacity: int = 4):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """경과 시간만큼 토큰 충전 (lock 안에서 호출)"""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._last_refill = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 얻을 때까지 대기
+
+        Returns:
+            실제 대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait_time = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait_time)
+            waited += wait_time
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 미리 차감하고 사용 가능 시점까지 남은 시간을 반환 (대기하지 않음)
+
+        잔량이 음수가 될 수 있으므로, 동시에 예약한 호출들은 도착 순서대로
+        1/rate 간격으로 줄을 서게 됩니다. 비동기 대기(acquire_async)에서 사용합니다.
+
+        Returns:
+            대기해야 할 시간 (초)
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """
+        이벤트 루프를 막지 않고 토큰을 얻을 때까지 대기
+
+        스레드와 이벤트 루프가 달라도 같은 인스턴스를 공유할 수 있습니다.
+
+        Returns:
+            실제 대기한 시간 (초)
+        """
+        wait_time = self.reserve(tokens)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        return wait_time
+
+
 class ApiCache:
     """API 응답 캐싱"""
 
@@ -0,0 +1,106 @@
+"""
+미국 증시 거래일 달력
+
+NYSE 정규 휴장일(대체 휴일 포함)을 계산해 거래일 여부를 판단합니다.
+누락 데이터 보완에서 휴장일을 누락으로 보고 매번 다시 요청하지 않도록 사용합니다.
+
+주요 기능:
+- 연도별 NYSE 휴장일 계산 (부활절 기준 성금요일 포함)
+- 거래일 여부 판단 및 날짜 목록에서 휴장일 제거
+- 기준일 이전의 가장 최근 거래일 조회
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """month월의 n번째 weekday (월요일=0)"""
+    first = date(year, month, 1)
+    offset = (weekday - first.weekday()) % 7
+    return first + timedelta(days=offset + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    """month월의 마지막 weekday (월요일=0)"""
+    next_month = date(year + month // 12, month % 12 + 1, 1)
+    last = next_month - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter_sunday(year: int) -> date:
+    """그레고리력 부활절 (익명 알고리즘)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(holiday: date) -> date:
+    """토요일 휴일은 전날 금요일, 일요일 휴일은 다음 날 월요일에 휴장"""
+    if holiday.weekday() == 5:
+        return holiday - timedelta(days=1)
+    if holiday.weekday() == 6:
+        return holiday + timedelta(days=1)
+    return holiday
+
+
+@lru_cache(maxsize=64)
+def us_market_holidays(year: int) -> FrozenSet[date]:
+    """
+    연도의 NYSE 정규 휴장일
+
+    Args:
+        year: 연도
+
+    Returns:
+        휴장일 집합 (임시 휴장일은 포함하지 않음)
+    """
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),  # 마틴 루터 킹 데이
+        _nth_weekday(year, 2, 0, 3),  # 대통령의 날
+        _easter_sunday(year) - timedelta(days=2),  # 성금요일
+        _last_weekday(year, 5, 0),  # 메모리얼 데이
+        _observed(date(year, 7, 4)),  # 독립기념일
+        _nth_weekday(year, 9, 0, 1),  # 노동절
+        _nth_weekday(year, 11, 3, 4),  # 추수감사절
+        _observed(date(year, 12, 25)),  # 크리스마스
+    }
+
+    # 신정이 토요일이면 전년도 12/31에 휴장하지 않음 (NYSE 규칙)
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # 준틴스
+
+    return frozenset(holidays)
+
+
+def is_trading_day(target_date: date) -> bool:
+    """주말과 NYSE 정규 휴장일이 아니면 거래일"""
+    if target_date.weekday() >= 5:
+        return False
+    return target_date not in us_market_holidays(target_date.year)
+
+
+def filter_trading_days(dates: Iterable[date]) -> List[date]:
+    """날짜 목록에서 휴장일 제거 (순서 유지)"""
+    return [d for d in dates if is_trading_day(d)]
+
+
+def last_trading_day(on_or_before: date) -> date:
+    """on_or_before 당일 또는 그 이전의 가장 최근 거래일"""
+    current = on_or_before
+    while not is_trading_day(current):
+        current -= timedelta(days=1)
+    return current
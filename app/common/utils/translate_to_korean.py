@@ -1,8 +1,19 @@
-from deep_translator import GoogleTranslator
+from app.common.utils.translation_service import get_translation_service
+
 
 def translate_to_korean(text: str) -> str:
+    """한국어 번역 (영구 캐시 + 묶음 요청 번역 서비스 사용, 실패 시 빈 문자열)"""
     try:
-        return GoogleTranslator(source='auto', target='ko').translate(text)
+        return get_translation_service().translate(text) or ""
     except Exception as e:
         print(f"❌ 번역 실패: {e}")
         return ""
+
+
+def translate_many_to_korean(texts: list, max_workers: int | None = None) -> list:
+    """여러 텍스트 한국어 번역 (입력 순서 유지, None은 그대로 반환)"""
+    try:
+        return get_translation_service().translate_many(texts, max_workers=max_workers)
+    except Exception as e:
+        print(f"❌ 번역 실패: {e}")
+        return ["" if text else text for text in texts]
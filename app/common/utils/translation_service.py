@@ -0,0 +1,426 @@
+"""
+번역 서비스
+
+뉴스 제목/요약 번역을 담당합니다. 여러 심볼에 같은 기사가 중복 게재되는 경우가 많아
+텍스트 해시 → 번역 결과를 SQLite 파일에 영구 캐시하고, 캐시에 없는 텍스트만
+여러 개를 묶어 번역 백엔드에 요청합니다.
+
+주요 기능:
+- 텍스트 해시 기반 영구 번역 캐시 (SQLite, 프로세스 간 공유)
+- 다중 텍스트 묶음 요청 (줄바꿈으로 연결해 요청 1회로 번역)
+- 묶음 단위 병렬 요청 (동시 요청 수 제한)
+- 오프라인 테스트용 로컬 백엔드 (TRANSLATION_BACKEND=local)
+- 캐시 적중률/백엔드 호출 통계
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from app.common.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join("data", "translation_cache.sqlite3")
+
+
+# ====================
+# 번역 백엔드
+# ====================
+
+
+class TranslationBackend(ABC):
+    """번역 백엔드 추상 클래스"""
+
+    name: str = "base"
+
+    # 한 번의 요청에 담을 최대 문자 수
+    max_request_chars: int = 4500
+
+    @abstractmethod
+    def translate(self, text: str, target: str) -> str:
+        """
+        단일 텍스트 번역
+
+        Args:
+            text: 원문
+            target: 대상 언어 코드 (예: ko)
+
+        Returns:
+            번역문
+        """
+        pass
+
+    def translate_batch(self, texts: List[str], target: str) -> List[str]:
+        """
+        여러 텍스트를 줄바꿈으로 연결해 요청 1회로 번역
+
+        응답의 줄 수가 원문 개수와 다르면 텍스트별로 다시 번역합니다.
+
+        Args:
+            texts: 원문 목록 (줄바꿈 없는 텍스트)
+            target: 대상 언어 코드
+
+        Returns:
+            texts와 같은 순서의 번역문 목록
+        """
+        if len(texts) == 1:
+            return [self.translate(texts[0], target)]
+
+        translated = self.translate("\n".join(texts), target) or ""
+        lines = translated.split("\n")
+        if len(lines) == len(texts):
+            return [line.strip() for line in lines]
+
+        logger.warning(
+            "translation_batch_split_mismatch",
+            backend=self.name,
+            expected=len(texts),
+            received=len(lines),
+        )
+        return [self._translate_or_empty(text, target) for text in texts]
+
+    def _translate_or_empty(self, text: str, target: str) -> str:
+        try:
+            return self.translate(text, target) or ""
+        except Exception as e:
+            logger.warning("translation_failed", backend=self.name, error=str(e))
+            return ""
+
+
+class GoogleTranslationBackend(TranslationBackend):
+    """deep_translator 기반 Google 번역 백엔드 (스레드별 번역기 재사용)"""
+
+    name = "google"
+
+    def __init__(self):
+        from deep_translator import GoogleTranslator
+
+        self._translator_class = GoogleTranslator
+        self._local = threading.local()
+
+    def translate(self, text: str, target: str) -> str:
+        translators = getattr(self._local, "translators", None)
+        if translators is None:
+            translators = self._local.translators = {}
+
+        translator = translators.get(target)
+        if translator is None:
+            translator = translators[target] = self._translator_class(
+                source="auto", target=target
+            )
+        return translator.translate(text)
+
+
+class LocalTranslationBackend(TranslationBackend):
+    """
+    오프라인 테스트용 로컬 백엔드
+
+    실제 번역 없이 "[ko] 원문" 형태로 반환하며, 요청당 지연 시간을 흉내낼 수 있습니다.
+    """
+
+    name = "local"
+
+    def __init__(self, latency_seconds: float = 0.0):
+        self.latency_seconds = latency_seconds
+
+    def translate(self, text: str, target: str) -> str:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        return "\n".join(f"[{target}] {line}" for line in text.split("\n"))
+
+
+def create_translation_backend(name: Optional[str] = None) -> TranslationBackend:
+    """
+    이름으로 번역 백엔드 생성
+
+    Args:
+        name: google 또는 local (None이면 TRANSLATION_BACKEND 환경 변수, 기본 google)
+    """
+    name = (name or os.getenv("TRANSLATION_BACKEND", "google")).lower()
+    if name == "local":
+        return LocalTranslationBackend(
+            latency_seconds=float(os.getenv("TRANSLATION_LOCAL_LATENCY", "0"))
+        )
+    if name == "google":
+        return GoogleTranslationBackend()
+    raise ValueError(f"지원하지 않는 번역 백엔드: {name}")
+
+
+# ====================
+# 영구 캐시
+# ====================
+
+
+class TranslationCache:
+    """
+    SQLite 기반 번역 캐시
+
+    키는 (원문 SHA-256, 대상 언어)입니다. 여러 크롤러 프로세스가 같은 파일을
+    공유할 수 있도록 WAL 모드를 사용합니다.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS translations (
+                    text_hash TEXT NOT NULL,
+                    target TEXT NOT NULL,
+                    translated TEXT NOT NULL,
+                    backend TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (text_hash, target)
+                )
+                """
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get_many(self, text_hashes: List[str], target: str) -> Dict[str, str]:
+        """
+        캐시된 번역 조회
+
+        Returns:
+            text_hash → 번역문 (캐시에 있는 항목만)
+        """
+        found: Dict[str, str] = {}
+        # SQLite 바인드 변수 제한(기본 999) 이내로 나눠 조회
+        for start in range(0, len(text_hashes), 500):
+            chunk = text_hashes[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT text_hash, translated FROM translations "
+                    f"WHERE target = ? AND text_hash IN ({placeholders})",
+                    [target, *chunk],
+                ).fetchall()
+            found.update(rows)
+        return found
+
+    def put_many(self, translations: Dict[str, str], target: str, backend: str) -> None:
+        """번역 결과 저장 (text_hash → 번역문)"""
+        if not translations:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations "
+                "(text_hash, target, translated, backend, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (text_hash, target, translated, backend, now)
+                    for text_hash, translated in translations.items()
+                ],
+            )
+            self._conn.commit()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ====================
+# 번역 서비스
+# ====================
+
+
+class TranslationService:
+    """
+    캐시 + 묶음 요청 번역 서비스
+
+    translate_many()는 입력 중복 제거 → 캐시 조회 → 캐시에 없는 텍스트만
+    max_request_chars 단위로 묶어 백엔드에 요청 → 결과 캐시 저장 순으로 처리합니다.
+    번역에 실패한 텍스트는 빈 문자열을 반환하고 캐시하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[TranslationBackend] = None,
+        cache: Optional[TranslationCache] = None,
+        target: str = "ko",
+        max_workers: int = 4,
+    ):
+        """
+        번역 서비스 초기화
+
+        Args:
+            backend: 번역 백엔드 (None이면 TRANSLATION_BACKEND 환경 변수 기준)
+            cache: 번역 캐시 (None이면 TRANSLATION_CACHE_PATH 또는 기본 경로)
+            target: 대상 언어 코드
+            max_workers: 동시 백엔드 요청 수
+        """
+        self.backend = backend or create_translation_backend()
+        self.cache = cache or TranslationCache(
+            os.getenv("TRANSLATION_CACHE_PATH", DEFAULT_CACHE_PATH)
+        )
+        self.target = target
+        self.max_workers = max(1, max_workers)
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "requested_texts": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "backend_requests": 0,
+            "backend_chars": 0,
+            "failed_texts": 0,
+        }
+
+    def translate(self, text: str) -> str:
+        """단일 텍스트 번역"""
+        return self.translate_many([text])[0]
+
+    def translate_many(
+        self, texts: List[Optional[str]], max_workers: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """
+        여러 텍스트 번역
+
+        Args:
+            texts: 원문 목록 (None/빈 문자열은 그대로 반환)
+            max_workers: 동시 백엔드 요청 수 (None이면 서비스 기본값)
+
+        Returns:
+            texts와 같은 순서의 번역문 목록
+        """
+        # 1. 정규화 및 중복 제거 (묶음 요청 구분자인 줄바꿈은 공백으로)
+        normalized = [
+            " ".join(text.split()) if text and text.strip() else None for text in texts
+        ]
+        unique_texts = {
+            TranslationCache.hash_text(text): text for text in normalized if text
+        }
+
+        # 2. 캐시 조회
+        translations = self.cache.get_many(list(unique_texts), self.target)
+        misses = {
+            text_hash: text
+            for text_hash, text in unique_texts.items()
+            if text_hash not in translations
+        }
+
+        # 3. 캐시에 없는 텍스트만 묶어서 번역
+        if misses:
+            new_translations = self._translate_misses(
+                misses, max_workers or self.max_workers
+            )
+            self.cache.put_many(new_translations, self.target, self.backend.name)
+            translations.update(new_translations)
+
+        with self._stats_lock:
+            self._stats["requested_texts"] += len(unique_texts)
+            self._stats["cache_hits"] += len(unique_texts) - len(misses)
+            self._stats["cache_misses"] += len(misses)
+
+        return [
+            (translations.get(TranslationCache.hash_text(text), "") if text else original)
+            for original, text in zip(texts, normalized)
+        ]
+
+    def get_stats(self) -> Dict[str, float]:
+        """번역 통계 (캐시 적중률 포함)"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        requested = stats["requested_texts"]
+        stats["hit_rate"] = round(stats["cache_hits"] / requested, 4) if requested else 0.0
+        stats["backend"] = self.backend.name
+        return stats
+
+    # ====================
+    # 내부 헬퍼
+    # ====================
+
+    def _translate_misses(
+        self, misses: Dict[str, str], max_workers: int
+    ) -> Dict[str, str]:
+        """캐시에 없는 텍스트를 묶음 단위로 병렬 번역 (성공한 항목만 반환)"""
+        batches = self._build_batches(list(misses.items()))
+
+        if len(batches) == 1 or max_workers == 1:
+            results = [self._translate_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+                results = list(executor.map(self._translate_batch, batches))
+
+        translated: Dict[str, str] = {}
+        for result in results:
+            translated.update(result)
+        return translated
+
+    def _build_batches(self, items: List[tuple]) -> List[List[tuple]]:
+        """(해시, 원문) 목록을 요청당 최대 문자 수 이내로 묶기"""
+        batches: List[List[tuple]] = []
+        current: List[tuple] = []
+        current_chars = 0
+
+        for text_hash, text in items:
+            if current and current_chars + len(text) + 1 > self.backend.max_request_chars:
+                batches.append(current)
+                current, current_chars = [], 0
+            current.append((text_hash, text))
+            current_chars += len(text) + 1
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def _translate_batch(self, batch: List[tuple]) -> Dict[str, str]:
+        texts = [text for _, text in batch]
+        try:
+            translated = self.backend.translate_batch(texts, self.target)
+        except Exception as e:
+            logger.warning(
+                "translation_batch_failed",
+                backend=self.backend.name,
+                texts=len(texts),
+                error=str(e),
+            )
+            translated = [""] * len(texts)
+
+        result = {
+            text_hash: value
+            for (text_hash, _), value in zip(batch, translated)
+            if value
+        }
+
+        with self._stats_lock:
+            self._stats["backend_requests"] += 1
+            self._stats["backend_chars"] += sum(len(text) for text in texts)
+            self._stats["failed_texts"] += len(batch) - len(result)
+
+        return result
+
+
+# 프로세스 공유 번역 서비스 인스턴스 (첫 사용 시 생성)
+_translation_service: Optional[TranslationService] = None
+_translation_service_lock = threading.Lock()
+
+
+def get_translation_service() -> TranslationService:
+    """프로세스 공유 번역 서비스 조회"""
+    global _translation_service
+    if _translation_service is None:
+        with _translation_service_lock:
+            if _translation_service is None:
+                _translation_service = TranslationService()
+    return _translation_service
@@ -3,27 +3,59 @@ WebSocket 연결 관리 시스템
 
 실시간 데이터 스트리밍을 위한 WebSocket 연결을 효율적으로 관리합니다.
 클라이언트별 구독 관리, 브로드캐스팅, 연결 상태 모니터링을 제공합니다.
+
+브로드캐스트는 메시지를 한 번만 직렬화한 뒤 연결별 송신 큐에 넣고,
+연결마다 하나의 송신 태스크가 큐를 비웁니다. 느린 클라이언트의 큐가 가득 차면
+같은 심볼의 이전 가격/분석 메시지를 최신 값으로 합치고(coalesce),
+그래도 넘치면 가장 오래된 메시지를 버려 다른 클라이언트로의 전송이 막히지 않게 합니다.
+압축 가격 배치 프레임은 변경분만 담으므로 버리지 않고, 대기 중인 프레임에 병합합니다.
 """
 
 import asyncio
+import itertools
 import json
 import time
-from typing import Dict, Set, List, Any, Optional, Callable
+from collections import OrderedDict
+from typing import Dict, Set, List, Any, Optional, Callable, Hashable, Tuple
 from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect
 from enum import Enum
 import uuid
 
+# orjson import (선택적, 없으면 표준 json 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from app.common.utils.logging_config import get_logger
 from app.common.utils.memory_optimizer import memory_monitor
 
 logger = get_logger(__name__)
 
 
+def encode_message(message: Dict[str, Any]) -> str:
+    """
+    WebSocket 메시지 직렬화 (orjson 사용 가능 시 orjson)
+
+    Args:
+        message: 전송할 메시지
+
+    Returns:
+        JSON 문자열
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            message, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    return json.dumps(message, default=str)
+
+
 class MessageType(Enum):
     """WebSocket 메시지 타입"""
 
     PRICE_UPDATE = "price_update"
+    PRICE_BATCH = "price_batch"  # 여러 심볼의 변경분을 압축 배열로 묶은 프레임
     TECHNICAL_ANALYSIS = "technical_analysis"
     ALERT = "alert"
     SYSTEM_STATUS = "system_status"
@@ -41,27 +73,67 @@ class SubscriptionType(Enum):
     ALL = "all"
 
 
+class PriceFormat(Enum):
+    """가격 메시지 형식"""
+
+    FULL = "full"  # 심볼별 price_update 메시지
+    COMPACT = "compact"  # 주기별 price_batch 프레임 (변경된 심볼만)
+
+
+# 큐에서 최신 값으로 합칠 수 있는 메시지 타입 (같은 심볼의 이전 값은 의미 없음)
+COALESCIBLE_MESSAGE_TYPES = {
+    MessageType.PRICE_UPDATE,
+    MessageType.TECHNICAL_ANALYSIS,
+    MessageType.HEARTBEAT,
+}
+
+# 연결별 송신 큐에서 가격 배치 프레임의 키 (연결당 최대 1개만 대기)
+PRICE_BATCH_QUEUE_KEY = (MessageType.PRICE_BATCH, None)
+
+
 class WebSocketConnection:
     """개별 WebSocket 연결 정보"""
 
-    def __init__(self, websocket: WebSocket, client_id: str = None):
+    def __init__(
+        self,
+        websocket: WebSocket,
+        client_id: str = None,
+        max_queue_size: int = 100,
+        on_send_result: Optional[Callable[[str, bool], None]] = None,
+    ):
         self.websocket = websocket
         self.client_id = client_id or str(uuid.uuid4())
         self.connected_at = datetime.now()
         self.last_heartbeat = time.time()
         self.subscriptions: Set[str] = set()
         self.subscription_types: Set[SubscriptionType] = set()
+        self.price_format = PriceFormat.FULL
         self.is_active = True
         self.message_count = 0
         self.error_count = 0
 
+        # 송신 큐 (키 -> 직렬화된 메시지, 삽입 순서대로 전송)
+        self.max_queue_size = max_queue_size
+        self.on_send_result = on_send_result
+        self._send_queue: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._queue_event = asyncio.Event()
+        self._sender_task: Optional[asyncio.Task] = None
+        self._sequence = itertools.count()
+        self._pending_price_batch: Optional[Dict[str, Any]] = None
+        self.coalesced_count = 0
+        self.dropped_count = 0
+
     async def send_message(self, message: Dict[str, Any]) -> bool:
-        """메시지 전송"""
+        """메시지 즉시 전송"""
+        return await self.send_encoded(encode_message(message))
+
+    async def send_encoded(self, payload: str) -> bool:
+        """직렬화된 메시지 즉시 전송"""
         try:
             if not self.is_active:
                 return False
 
-            await self.websocket.send_text(json.dumps(message))
+            await self.websocket.send_text(payload)
             self.message_count += 1
             return True
 
@@ -73,6 +145,127 @@ class WebSocketConnection:
             self.is_active = False
             return False
 
+    def enqueue(
+        self, payload: str, message_type: Optional[MessageType], symbol: str = None
+    ) -> bool:
+        """
+        직렬화된 메시지를 송신 큐에 추가 (대기하지 않음)
+
+        같은 (타입, 심볼)의 합칠 수 있는 메시지가 이미 대기 중이면 최신 값으로 바꾸고,
+        큐가 가득 차면 합칠 수 있는 가장 오래된 메시지(없으면 가장 오래된 메시지)를 버립니다.
+
+        Returns:
+            큐 추가 여부 (비활성 연결이면 False)
+        """
+        if not self.is_active:
+            return False
+
+        if message_type in COALESCIBLE_MESSAGE_TYPES:
+            key = (message_type, symbol)
+            if key in self._send_queue:
+                # 대기 순서는 유지하고 내용만 최신 값으로 교체
+                self._send_queue[key] = payload
+                self.coalesced_count += 1
+                return True
+        else:
+            key = next(self._sequence)
+
+        self._put(key, payload)
+        return True
+
+    def enqueue_price_batch(self, message: Dict[str, Any], payload: str) -> bool:
+        """
+        가격 배치 프레임을 송신 큐에 추가 (대기하지 않음)
+
+        프레임은 변경된 심볼만 담으므로 최신 프레임으로 바꾸면 이전 변경분이 사라집니다.
+        대기 중인 프레임이 있으면 심볼별 최신 값으로 병합해 다시 직렬화하고,
+        큐가 가득 차도 배치 프레임은 버리지 않습니다.
+
+        Args:
+            message: 배치 프레임 메시지 (data: 심볼 -> 값 배열)
+            payload: message를 직렬화한 문자열 (병합이 없으면 그대로 전송)
+
+        Returns:
+            큐 추가 여부 (비활성 연결이면 False)
+        """
+        if not self.is_active:
+            return False
+
+        pending = self._pending_price_batch
+        if pending is not None and PRICE_BATCH_QUEUE_KEY in self._send_queue:
+            # 대기 순서는 유지하고 심볼별 최신 값으로 병합 (fields 순서는 스트리머 고정값)
+            merged = {**message, "data": {**pending["data"], **message["data"]}}
+            self._pending_price_batch = merged
+            self._send_queue[PRICE_BATCH_QUEUE_KEY] = encode_message(merged)
+            self.coalesced_count += 1
+            return True
+
+        self._pending_price_batch = message
+        self._put(PRICE_BATCH_QUEUE_KEY, payload)
+        return True
+
+    def pending_count(self) -> int:
+        """송신 대기 중인 메시지 수"""
+        return len(self._send_queue)
+
+    def close(self):
+        """송신 태스크 정리"""
+        self.is_active = False
+        self._send_queue.clear()
+        if self._sender_task is not None:
+            self._sender_task.cancel()
+            self._sender_task = None
+
+    def _put(self, key: Hashable, payload: str):
+        """큐 용량을 확인해 메시지를 넣고 송신 태스크를 깨움"""
+        if len(self._send_queue) >= self.max_queue_size:
+            self._drop_oldest()
+
+        self._send_queue[key] = payload
+        self._queue_event.set()
+
+        if self._sender_task is None:
+            self._sender_task = asyncio.create_task(self._sender_loop())
+
+    def _drop_oldest(self):
+        """
+        가장 오래된 대기 메시지 제거 (합칠 수 있는 메시지 우선)
+
+        가격 배치 프레임은 버리면 그 변경분을 다시 받을 수 없으므로 제외합니다.
+        """
+        oldest = None
+        for key in self._send_queue:
+            if key == PRICE_BATCH_QUEUE_KEY:
+                continue
+            if isinstance(key, tuple):
+                oldest = key
+                break
+            if oldest is None:
+                oldest = key
+
+        if oldest is None:
+            return
+        del self._send_queue[oldest]
+        self.dropped_count += 1
+
+    async def _sender_loop(self):
+        """송신 큐를 순서대로 비우는 연결별 태스크"""
+        while self.is_active:
+            try:
+                await self._queue_event.wait()
+                self._queue_event.clear()
+
+                while self._send_queue and self.is_active:
+                    key, payload = self._send_queue.popitem(last=False)
+                    if key == PRICE_BATCH_QUEUE_KEY:
+                        self._pending_price_batch = None
+                    success = await self.send_encoded(payload)
+                    if self.on_send_result:
+                        self.on_send_result(self.client_id, success)
+
+            except asyncio.CancelledError:
+                break
+
     def update_heartbeat(self):
         """하트비트 업데이트"""
         self.last_heartbeat = time.time()
@@ -109,8 +302,12 @@ class WebSocketConnection:
             "last_heartbeat": self.last_heartbeat,
             "subscriptions": list(self.subscriptions),
             "subscription_types": [st.value for st in self.subscription_types],
+            "price_format": self.price_format.value,
             "message_count": self.message_count,
             "error_count": self.error_count,
+            "pending_messages": len(self._send_queue),
+            "coalesced_count": self.coalesced_count,
+            "dropped_count": self.dropped_count,
             "is_active": self.is_active,
         }
 
@@ -118,7 +315,8 @@ class WebSocketConnection:
 class WebSocketManager:
     """WebSocket 연결 관리자"""
 
-    def __init__(self):
+    def __init__(self, send_queue_size: int = 100):
+        self.send_queue_size = send_queue_size  # 연결별 송신 큐 최대 크기
         self.connections: Dict[str, WebSocketConnection] = {}
         self.symbol_subscribers: Dict[str, Set[str]] = {}  # symbol -> client_ids
         self.type_subscribers: Dict[SubscriptionType, Set[str]] = {
@@ -136,7 +334,12 @@ class WebSocketManager:
 
     async def connect(self, websocket: WebSocket, client_id: str = None) -> str:
         """새 WebSocket 연결 등록"""
-        connection = WebSocketConnection(websocket, client_id)
+        connection = WebSocketConnection(
+            websocket,
+            client_id,
+            max_queue_size=self.send_queue_size,
+            on_send_result=self._on_send_result,
+        )
 
         async with self._lock:
             self.connections[connection.client_id] = connection
@@ -159,7 +362,7 @@ class WebSocketManager:
         async with self._lock:
             if client_id in self.connections:
                 connection = self.connections[client_id]
-                connection.is_active = False
+                connection.close()
 
                 # 구독 정리
                 await self._cleanup_subscriptions(client_id)
@@ -183,6 +386,7 @@ class WebSocketManager:
         client_id: str,
         subscription_type: SubscriptionType,
         symbols: List[str] = None,
+        price_format: Optional[PriceFormat] = None,
     ) -> bool:
         """구독 등록"""
         async with self._lock:
@@ -191,6 +395,8 @@ class WebSocketManager:
 
             connection = self.connections[client_id]
             connection.subscription_types.add(subscription_type)
+            if price_format is not None:
+                connection.price_format = price_format
 
             # 심볼별 구독 등록
             if symbols:
@@ -209,6 +415,7 @@ class WebSocketManager:
                 client_id=client_id,
                 subscription_type=subscription_type.value,
                 symbols=symbols or [],
+                price_format=connection.price_format.value,
             )
 
             return True
@@ -291,22 +498,99 @@ class WebSocketManager:
         client_ids = list(self.connections.keys())
         await self._send_to_clients(client_ids, message, message_type)
 
+    async def broadcast_price_batch(
+        self, entries: Dict[str, List[Any]], fields: List[str]
+    ):
+        """
+        압축 형식(compact) 구독자에게 가격 변경분 배치 프레임 전송
+
+        구독 심볼 집합이 같은 클라이언트끼리는 같은 프레임을 공유하므로
+        프레임 직렬화는 서로 다른 구독 집합 수만큼만 수행합니다.
+
+        Args:
+            entries: 심볼 -> fields 순서의 값 배열 (이번 주기에 변경된 심볼만)
+            fields: 값 배열의 필드 이름
+        """
+        if not entries:
+            return
+
+        timestamp = datetime.now().isoformat()
+        payload_cache: Dict[Any, Optional[Tuple[Dict[str, Any], str]]] = {}
+        queued_count = 0
+
+        for connection in list(self.connections.values()):
+            if connection.price_format != PriceFormat.COMPACT:
+                continue
+
+            if SubscriptionType.ALL in connection.subscription_types:
+                cache_key = None
+            elif SubscriptionType.PRICES in connection.subscription_types:
+                cache_key = frozenset(connection.subscriptions)
+            else:
+                continue
+
+            if cache_key not in payload_cache:
+                frame_entries = (
+                    entries
+                    if cache_key is None
+                    else {
+                        symbol: values
+                        for symbol, values in entries.items()
+                        if symbol in cache_key
+                    }
+                )
+                frame_message = {
+                    "type": MessageType.PRICE_BATCH.value,
+                    "timestamp": timestamp,
+                    "fields": fields,
+                    "data": frame_entries,
+                }
+                payload_cache[cache_key] = (
+                    (frame_message, encode_message(frame_message))
+                    if frame_entries
+                    else None
+                )
+
+            frame = payload_cache[cache_key]
+            if frame is not None and connection.enqueue_price_batch(*frame):
+                queued_count += 1
+
+        logger.debug(
+            "price_batch_queued",
+            symbols=len(entries),
+            distinct_frames=len(payload_cache),
+            queued_count=queued_count,
+        )
+
     async def send_to_client(self, client_id: str, message: Dict[str, Any]) -> bool:
-        """특정 클라이언트에게 메시지 전송"""
+        """
+        특정 클라이언트에게 메시지 전송 (연결별 송신 큐 경유)
+
+        브로드캐스트와 같은 큐를 거치므로 송신 태스크와 동시에 소켓에 쓰지 않고
+        전송 순서가 유지됩니다. 전송 결과는 송신 태스크에서 집계됩니다.
+
+        Returns:
+            큐 추가 여부 (비활성 연결이면 False)
+        """
         if client_id not in self.connections:
             return False
 
         connection = self.connections[client_id]
-        success = await connection.send_message(message)
+        try:
+            message_type = MessageType(message.get("type"))
+        except ValueError:
+            message_type = None
 
-        if success:
-            self.total_messages_sent += 1
-        else:
+        queued = connection.enqueue(
+            encode_message(message), message_type, message.get("symbol")
+        )
+
+        if not queued:
             self.total_errors += 1
             # 연결이 끊어진 경우 정리
             await self.disconnect(client_id)
 
-        return success
+        return queued
 
     async def _send_to_clients(
         self,
@@ -315,7 +599,7 @@ class WebSocketManager:
         message_type: MessageType,
         symbol: str = None,
     ):
-        """여러 클라이언트에게 메시지 전송"""
+        """여러 클라이언트에게 메시지 전송 (한 번 직렬화 후 연결별 송신 큐에 추가)"""
         if not client_ids:
             return
 
@@ -326,34 +610,50 @@ class WebSocketManager:
             "timestamp": datetime.now().isoformat(),
             "symbol": symbol,
         }
+        payload = encode_message(enhanced_message)
 
-        # 병렬로 메시지 전송
-        tasks = []
+        queued_count = 0
+        inactive_clients = []
         for client_id in client_ids:
-            if client_id in self.connections:
-                connection = self.connections[client_id]
-
-                # 구독 확인
-                if connection.is_subscribed_to(symbol, message_type):
-                    tasks.append(connection.send_message(enhanced_message))
-
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            connection = self.connections.get(client_id)
+            if connection is None:
+                continue
+
+            # 구독 확인 (압축 형식 클라이언트는 가격을 배치 프레임으로만 수신)
+            if not connection.is_subscribed_to(symbol, message_type):
+                continue
+            if (
+                message_type == MessageType.PRICE_UPDATE
+                and connection.price_format == PriceFormat.COMPACT
+            ):
+                continue
+
+            if connection.enqueue(payload, message_type, symbol):
+                queued_count += 1
+            else:
+                inactive_clients.append(client_id)
+
+        for client_id in inactive_clients:
+            await self.disconnect(client_id)
 
-            success_count = sum(1 for r in results if r is True)
-            error_count = len(results) - success_count
+        logger.debug(
+            "broadcast_queued",
+            message_type=message_type.value,
+            symbol=symbol,
+            target_clients=len(client_ids),
+            queued_count=queued_count,
+            payload_bytes=len(payload),
+        )
 
-            self.total_messages_sent += success_count
-            self.total_errors += error_count
+    def _on_send_result(self, client_id: str, success: bool):
+        """연결별 송신 태스크의 전송 결과 집계"""
+        if success:
+            self.total_messages_sent += 1
+            return
 
-            logger.debug(
-                "broadcast_completed",
-                message_type=message_type.value,
-                symbol=symbol,
-                target_clients=len(client_ids),
-                success_count=success_count,
-                error_count=error_count,
-            )
+        self.total_errors += 1
+        # 전송 실패한 연결은 송신 태스크 밖에서 정리
+        asyncio.create_task(self.disconnect(client_id))
 
     async def _cleanup_subscriptions(self, client_id: str):
         """클라이언트의 모든 구독 정리"""
@@ -466,6 +766,15 @@ class WebSocketManager:
             "total_connections": self.total_connections,
             "total_messages_sent": self.total_messages_sent,
             "total_errors": self.total_errors,
+            "pending_messages": sum(
+                connection.pending_count() for connection in self.connections.values()
+            ),
+            "coalesced_messages": sum(
+                connection.coalesced_count for connection in self.connections.values()
+            ),
+            "dropped_messages": sum(
+                connection.dropped_count for connection in self.connections.values()
+            ),
             "subscribed_symbols": len(self.symbol_subscribers),
             "subscription_stats": {
                 sub_type.value: len(subscribers)
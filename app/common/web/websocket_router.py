@@ -15,6 +15,7 @@ from app.common.utils.websocket_manager import (
     websocket_manager,
     MessageType,
     SubscriptionType,
+    PriceFormat,
 )
 from app.market_price.service.realtime_price_streamer import realtime_price_streamer
 from app.common.utils.logging_config import get_logger
@@ -30,6 +31,8 @@ async def websocket_realtime_endpoint(websocket: WebSocket):
 
     클라이언트는 다음과 같은 메시지를 보낼 수 있습니다:
     - {"action": "subscribe", "type": "prices", "symbols": ["AAPL", "GOOGL"]}
+    - {"action": "subscribe", "type": "prices", "symbols": ["AAPL"], "format": "compact"}
+      (compact: 심볼별 메시지 대신 변경된 심볼만 묶은 price_batch 프레임 수신)
     - {"action": "subscribe", "type": "alerts"}
     - {"action": "unsubscribe", "type": "prices", "symbols": ["AAPL"]}
     - {"action": "heartbeat"}
@@ -150,6 +153,7 @@ async def _handle_subscribe(client_id: str, message: Dict[str, Any]) -> Dict[str
     """구독 처리"""
     subscription_type_str = message.get("type")
     symbols = message.get("symbols", [])
+    format_str = message.get("format")
 
     if not subscription_type_str:
         return {
@@ -165,8 +169,20 @@ async def _handle_subscribe(client_id: str, message: Dict[str, Any]) -> Dict[str
             "message": f"잘못된 구독 타입: {subscription_type_str}",
         }
 
+    price_format = None
+    if format_str:
+        try:
+            price_format = PriceFormat(format_str)
+        except ValueError:
+            return {
+                "type": MessageType.ERROR.value,
+                "message": f"잘못된 가격 형식: {format_str} (full, compact)",
+            }
+
     # 구독 등록
-    success = await websocket_manager.subscribe(client_id, subscription_type, symbols)
+    success = await websocket_manager.subscribe(
+        client_id, subscription_type, symbols, price_format=price_format
+    )
 
     if success:
         # 실시간 스트리밍이 시작되지 않았다면 시작
@@ -184,6 +200,7 @@ async def _handle_subscribe(client_id: str, message: Dict[str, Any]) -> Dict[str
             "action": "subscribed",
             "subscription_type": subscription_type_str,
             "symbols": symbols,
+            "format": format_str or PriceFormat.FULL.value,
             "message": f"{subscription_type_str} 구독이 완료되었습니다",
         }
     else:
@@ -55,6 +55,8 @@ from app.technical_analysis.web.route.recovery_router import (
 from app.ml_prediction.web.route.ml_prediction_router import (
     router as ml_prediction_router,
 )
+from app.ml_prediction.ml.model.model_registry import model_registry
+from app.ml_prediction.config.ml_config import ml_settings
 
 # 스케줄러 imports
 from app.scheduler.scheduler_runner import start_scheduler
@@ -359,6 +361,13 @@ async def startup_event():
     except Exception as e:
         logger.error("memory_monitoring_start_failed", error=str(e))
 
+    # 활성 ML 모델 미리 로드 (배포 후 첫 예측 요청의 모델 로드 지연 제거)
+    if ml_settings.prediction.preload_active_models:
+        asyncio.get_running_loop().run_in_executor(
+            None, model_registry.preload_active_models
+        )
+        logger.info("ml_model_preload_scheduled")
+
     # 실시간 가격 스트리밍 시작
     try:
         # 주요 심볼들만 모니터링 (리소스 절약)
@@ -440,9 +449,9 @@ def shutdown_event():
     except Exception as e:
         logger.error("task_queue_system_stop_failed", error=str(e))
 
-    # 대기 중인 슬로우 쿼리 강제 저장
+    # 슬로우 쿼리 대기열 처리 후 대기 중인 슬로우 쿼리 강제 저장
     try:
-        asyncio.create_task(slow_query_service.force_flush())
+        query_monitor.stop_slow_query_worker()
         logger.info("slow_query_service_flushed_on_shutdown")
     except Exception as e:
         logger.error("slow_query_service_flush_failed", error=str(e))
@@ -19,6 +19,8 @@ from app.common.utils.memory_optimizer import memory_monitor
 from app.common.utils.logging_config import get_logger
 from app.common.constants.symbol_names import SYMBOL_PRICE_MAP
 from app.common.constants.thresholds import CATEGORY_THRESHOLDS, SYMBOL_THRESHOLDS
+from app.common.infra.client.yahoo_price_client import YAHOO_RATE_LIMITER
+from app.common.infra.client.async_yahoo_price_client import get_shared_session
 
 logger = get_logger(__name__)
 
@@ -65,13 +67,15 @@ class AsyncPriceService:
         Returns:
             현재 가격 또는 None
         """
-        await self._ensure_session()
+        # 프로세스 공유 커넥션 풀과 속도 제한 사용
+        session = await get_shared_session()
 
         try:
             url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
             params = {"interval": "1m", "range": "1d", "includePrePost": "true"}
 
-            async with self.session.get(url, params=params) as response:
+            await YAHOO_RATE_LIMITER.acquire_async()
+            async with session.get(url, params=params) as response:
                 if response.status == 200:
                     data = await response.json()
 
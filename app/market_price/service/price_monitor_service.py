@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional
 from app.common.infra.client.yahoo_price_client import YahooPriceClient
+from app.common.infra.client.async_yahoo_price_client import AsyncYahooPriceClient
 from app.market_price.service.price_snapshot_service import PriceSnapshotService
 from app.market_price.service.price_high_record_service import PriceHighRecordService
 from app.market_price.service.price_alert_log_service import PriceAlertLogService
@@ -28,6 +29,7 @@ from app.common.utils.websocket_manager import WebSocketManager
 class PriceMonitorService:
     def __init__(self):
         self.client = YahooPriceClient()
+        self.async_client = AsyncYahooPriceClient()
         self.snapshot_service = PriceSnapshotService()
         self.high_service = PriceHighRecordService()
         self.alert_log_service = PriceAlertLogService()
@@ -55,9 +57,16 @@ class PriceMonitorService:
         return None
 
     @async_memory_monitor(threshold_mb=100.0)
-    async def check_price_against_baseline(self, symbol: str):
-        """전일 종가, 상장 후 최고가, 전일 고/저점 기준으로 가격을 모니터링하고 알림 전송"""
-        current_price = self.fetch_latest_price(symbol)
+    async def check_price_against_baseline(
+        self, symbol: str, current_price: Optional[float] = None
+    ):
+        """
+        전일 종가, 상장 후 최고가, 전일 고/저점 기준으로 가격을 모니터링하고 알림 전송
+
+        current_price를 넘기면 (예: 여러 심볼을 미리 한 번에 조회한 경우) 재조회하지 않습니다.
+        """
+        if current_price is None:
+            current_price = await self.async_client.get_latest_minute_price(symbol)
         if current_price is None:
             print(f"⚠️ {symbol} 현재 가격 가져오기 실패")
             return
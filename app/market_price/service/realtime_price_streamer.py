@@ -3,6 +3,10 @@
 
 WebSocket을 통해 실시간 가격 데이터를 클라이언트에게 스트리밍합니다.
 가격 변동 감지, 알림 생성, 브로드캐스팅을 담당합니다.
+
+수신한 틱은 심볼별로 합쳐(coalesce) 두었다가 coalesce_window 주기마다 한 번에 처리하며,
+심볼별 가격 히스토리는 고정 크기 NumPy 링 버퍼에 저장합니다.
+압축 형식(compact)을 선택한 클라이언트에게는 주기마다 변경된 심볼만 묶은 배치 프레임을 전송합니다.
 """
 
 import asyncio
@@ -11,6 +15,8 @@ from typing import Dict, List, Any, Optional, Set
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
+import numpy as np
+
 from app.common.utils.websocket_manager import (
     websocket_manager,
     MessageType,
@@ -53,27 +59,92 @@ class PriceAlert:
     timestamp: datetime
 
 
+class PriceHistoryBuffer:
+    """
+    심볼별 가격 히스토리 링 버퍼
+
+    가격, 변동량, 변동률, 타임스탬프를 고정 크기 NumPy 배열에 순환 저장합니다.
+    값이 없는 변동량/변동률은 NaN으로 저장합니다.
+    """
+
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self._prices = np.empty(capacity, dtype=np.float64)
+        self._change_amounts = np.empty(capacity, dtype=np.float64)
+        self._change_percents = np.empty(capacity, dtype=np.float64)
+        self._timestamps = np.empty(capacity, dtype=np.float64)
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, update: PriceUpdate):
+        """업데이트 추가 (가득 차면 가장 오래된 항목을 덮어씀)"""
+        i = self._next
+        self._prices[i] = update.current_price
+        self._change_amounts[i] = (
+            np.nan if update.change_amount is None else update.change_amount
+        )
+        self._change_percents[i] = (
+            np.nan if update.change_percent is None else update.change_percent
+        )
+        self._timestamps[i] = update.timestamp.timestamp()
+
+        self._next = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def latest(self, limit: int) -> Dict[str, np.ndarray]:
+        """최근 limit개 항목을 오래된 순서로 반환"""
+        count = min(max(limit, 0), self._size)
+        order = (np.arange(self._next - count, self._next)) % self.capacity
+        return {
+            "prices": self._prices[order],
+            "change_amounts": self._change_amounts[order],
+            "change_percents": self._change_percents[order],
+            "timestamps": self._timestamps[order],
+        }
+
+
 class RealtimePriceStreamer:
     """실시간 가격 스트리밍 서비스"""
 
-    def __init__(self, update_interval: int = 300):
+    # 압축 배치 프레임의 심볼별 값 배열 필드 순서
+    BATCH_FIELDS = ["price", "change_amount", "change_percent", "volume"]
+
+    def __init__(
+        self,
+        update_interval: int = 300,
+        coalesce_window: float = 1.0,
+        history_size: int = 100,
+    ):
         self.update_interval = update_interval  # 초
+        self.coalesce_window = coalesce_window  # 틱 병합 주기 (초, 0이면 즉시 처리)
+        self.history_size = history_size
         self.price_service = AsyncPriceService(max_workers=3, max_concurrency=8)
         self.async_executor = AsyncExecutor(max_concurrency=15)
 
         # 가격 데이터 저장
         self.current_prices: Dict[str, float] = {}
         self.previous_prices: Dict[str, float] = {}
-        self.price_history: Dict[str, List[PriceUpdate]] = {}
+        self.price_history: Dict[str, PriceHistoryBuffer] = {}
+
+        # 병합 대기 중인 틱 (심볼 -> 마지막 가격/거래량)
+        self._pending_prices: Dict[str, float] = {}
+        self._pending_volumes: Dict[str, Optional[int]] = {}
+        self._flush_lock = asyncio.Lock()
 
         # 스트리밍 상태
         self.is_streaming = False
         self.streaming_task: Optional[asyncio.Task] = None
+        self.flush_task: Optional[asyncio.Task] = None
         self.monitored_symbols: Set[str] = set()
 
         # 통계
         self.total_updates_sent = 0
         self.total_alerts_sent = 0
+        self.total_ticks_received = 0
+        self.total_ticks_coalesced = 0
         self.last_update_time: Optional[datetime] = None
 
     async def start_streaming(self, symbols: List[str] = None):
@@ -90,11 +161,14 @@ class RealtimePriceStreamer:
 
         self.is_streaming = True
         self.streaming_task = asyncio.create_task(self._streaming_loop())
+        if self.coalesce_window > 0:
+            self.flush_task = asyncio.create_task(self._flush_loop())
 
         logger.info(
             "realtime_streaming_started",
             symbol_count=len(self.monitored_symbols),
             update_interval=self.update_interval,
+            coalesce_window=self.coalesce_window,
         )
 
     async def stop_streaming(self):
@@ -104,13 +178,18 @@ class RealtimePriceStreamer:
 
         self.is_streaming = False
 
-        if self.streaming_task:
-            self.streaming_task.cancel()
-            try:
-                await self.streaming_task
-            except asyncio.CancelledError:
-                pass
-            self.streaming_task = None
+        for task in (self.streaming_task, self.flush_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self.streaming_task = None
+        self.flush_task = None
+
+        # 남은 틱 처리
+        await self._flush_pending()
 
         # 리소스 정리
         await self.price_service._close_session()
@@ -130,6 +209,8 @@ class RealtimePriceStreamer:
         self.current_prices.pop(symbol, None)
         self.previous_prices.pop(symbol, None)
         self.price_history.pop(symbol, None)
+        self._pending_prices.pop(symbol, None)
+        self._pending_volumes.pop(symbol, None)
 
         logger.info("symbol_removed_from_streaming", symbol=symbol)
 
@@ -155,35 +236,20 @@ class RealtimePriceStreamer:
                     logger.error("price_fetch_failed_in_streaming", error=str(e))
                     current_prices = {}  # 빈 딕셔너리로 계속 진행
 
-                # 가격 업데이트 처리 (빈 딕셔너리 처리)
+                # 틱 병합 대기열에 추가 (병합 주기가 없으면 즉시 처리)
                 if current_prices:
-                    updates = await self._process_price_updates(current_prices)
-                    # 알림 생성
-                    alerts = await self._generate_alerts(updates)
+                    self.submit_ticks(current_prices)
                 else:
-                    updates = []
-                    alerts = []
                     logger.debug("no_price_data_received_skipping_updates")
 
-                # WebSocket으로 브로드캐스트
-                try:
-                    await self._broadcast_updates(updates)
-                    await self._broadcast_alerts(alerts)
-                except Exception as e:
-                    logger.error("broadcast_failed_in_streaming", error=str(e))
-
-                # 통계 업데이트
-                self.total_updates_sent += len(updates)
-                self.total_alerts_sent += len(alerts)
-                self.last_update_time = datetime.now()
+                if self.coalesce_window <= 0:
+                    await self._flush_pending()
 
                 # 실행 시간 로깅
                 execution_time = time.time() - start_time
                 logger.debug(
                     "streaming_cycle_completed",
                     symbols_processed=len(current_prices),
-                    updates_sent=len(updates),
-                    alerts_sent=len(alerts),
                     execution_time=execution_time,
                 )
 
@@ -200,8 +266,76 @@ class RealtimePriceStreamer:
 
         logger.info("streaming_loop_ended")
 
+    def submit_ticks(
+        self,
+        prices: Dict[str, Optional[float]],
+        volumes: Optional[Dict[str, Optional[int]]] = None,
+    ):
+        """
+        가격 틱 제출 (다음 병합 주기에 심볼별 마지막 값만 처리)
+
+        Args:
+            prices: 심볼 -> 가격
+            volumes: 심볼 -> 거래량
+        """
+        for symbol, price in prices.items():
+            if price is None:
+                continue
+
+            self.total_ticks_received += 1
+            if symbol in self._pending_prices:
+                self.total_ticks_coalesced += 1
+
+            self._pending_prices[symbol] = price
+            if volumes and symbol in volumes:
+                self._pending_volumes[symbol] = volumes[symbol]
+
+    async def _flush_loop(self):
+        """병합 주기마다 대기 중인 틱 처리"""
+        while self.is_streaming:
+            try:
+                await asyncio.sleep(self.coalesce_window)
+                await self._flush_pending()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("tick_flush_loop_error", error=str(e))
+
+    async def _flush_pending(self):
+        """대기 중인 틱으로 가격 업데이트/알림 생성 후 브로드캐스트"""
+        async with self._flush_lock:
+            if not self._pending_prices:
+                return
+
+            pending_prices, self._pending_prices = self._pending_prices, {}
+            pending_volumes, self._pending_volumes = self._pending_volumes, {}
+
+            updates = await self._process_price_updates(pending_prices, pending_volumes)
+            alerts = await self._generate_alerts(updates)
+
+            # WebSocket으로 브로드캐스트
+            try:
+                await self._broadcast_updates(updates)
+                await self._broadcast_alerts(alerts)
+            except Exception as e:
+                logger.error("broadcast_failed_in_streaming", error=str(e))
+
+            # 통계 업데이트
+            self.total_updates_sent += len(updates)
+            self.total_alerts_sent += len(alerts)
+            self.last_update_time = datetime.now()
+
+            logger.debug(
+                "pending_ticks_flushed",
+                symbols=len(pending_prices),
+                updates_sent=len(updates),
+                alerts_sent=len(alerts),
+            )
+
     async def _process_price_updates(
-        self, current_prices: Dict[str, Optional[float]]
+        self,
+        current_prices: Dict[str, Optional[float]],
+        volumes: Optional[Dict[str, Optional[int]]] = None,
     ) -> List[PriceUpdate]:
         """가격 업데이트 처리"""
         updates = []
@@ -231,7 +365,7 @@ class RealtimePriceStreamer:
                     previous_price=previous_price,
                     change_amount=change_amount,
                     change_percent=change_percent,
-                    volume=None,  # 볼륨 정보는 별도 API에서
+                    volume=(volumes or {}).get(symbol),  # 볼륨 정보는 별도 API에서
                     timestamp=datetime.now(),
                     market_status=self._get_market_status(),
                 )
@@ -311,7 +445,27 @@ class RealtimePriceStreamer:
         return alerts
 
     async def _broadcast_updates(self, updates: List[PriceUpdate]):
-        """가격 업데이트 브로드캐스트"""
+        """가격 업데이트 브로드캐스트 (심볼별 메시지 + 압축 배치 프레임)"""
+        if not updates:
+            return
+
+        await websocket_manager.broadcast_price_batch(
+            {
+                update.symbol: [
+                    update.current_price,
+                    update.change_amount,
+                    (
+                        round(update.change_percent, 4)
+                        if update.change_percent is not None
+                        else None
+                    ),
+                    update.volume,
+                ]
+                for update in updates
+            },
+            self.BATCH_FIELDS,
+        )
+
         for update in updates:
             message = {
                 "symbol": update.symbol,
@@ -348,14 +502,12 @@ class RealtimePriceStreamer:
 
     def _update_price_history(self, symbol: str, update: PriceUpdate):
         """가격 히스토리 업데이트"""
-        if symbol not in self.price_history:
-            self.price_history[symbol] = []
+        history = self.price_history.get(symbol)
+        if history is None:
+            history = PriceHistoryBuffer(self.history_size)
+            self.price_history[symbol] = history
 
-        self.price_history[symbol].append(update)
-
-        # 최근 100개 기록만 유지
-        if len(self.price_history[symbol]) > 100:
-            self.price_history[symbol] = self.price_history[symbol][-100:]
+        history.append(update)
 
     def _get_symbol_thresholds(self, symbol: str) -> Dict[str, float]:
         """심볼별 임계값 조회"""
@@ -398,17 +550,22 @@ class RealtimePriceStreamer:
         if symbol not in self.price_history:
             return []
 
-        history = self.price_history[symbol][-limit:]
+        history = self.price_history[symbol].latest(limit)
 
         return [
             {
-                "symbol": update.symbol,
-                "price": update.current_price,
-                "change_amount": update.change_amount,
-                "change_percent": update.change_percent,
-                "timestamp": update.timestamp.isoformat(),
+                "symbol": symbol,
+                "price": float(price),
+                "change_amount": None if np.isnan(amount) else float(amount),
+                "change_percent": None if np.isnan(percent) else float(percent),
+                "timestamp": datetime.fromtimestamp(ts).isoformat(),
             }
-            for update in history
+            for price, amount, percent, ts in zip(
+                history["prices"],
+                history["change_amounts"],
+                history["change_percents"],
+                history["timestamps"],
+            )
         ]
 
     def get_stats(self) -> Dict[str, Any]:
@@ -420,6 +577,10 @@ class RealtimePriceStreamer:
             "symbols_with_prices": len(self.current_prices),
             "total_updates_sent": self.total_updates_sent,
             "total_alerts_sent": self.total_alerts_sent,
+            "total_ticks_received": self.total_ticks_received,
+            "total_ticks_coalesced": self.total_ticks_coalesced,
+            "pending_ticks": len(self._pending_prices),
+            "coalesce_window_seconds": self.coalesce_window,
             "last_update_time": (
                 self.last_update_time.isoformat() if self.last_update_time else None
             ),
@@ -111,6 +111,10 @@ class TrainingConfig:
     reduce_lr_factor: float = 0.5  # 학습률 감소 비율
     min_lr: float = 1e-7  # 최소 학습률
 
+    # 다중 심볼 병렬 훈련 (프로세스 풀)
+    parallel_workers: int = 0  # 동시 훈련 프로세스 수 (0이면 CPU 코어 수 / 프로세스당 스레드 수)
+    threads_per_worker: int = 2  # 프로세스당 TensorFlow/BLAS 스레드 수
+
 
 @dataclass
 class PredictionConfig:
@@ -130,6 +134,12 @@ class PredictionConfig:
     # 배치 예측 설정
     max_batch_size: int = 1000  # 최대 배치 예측 크기
 
+    # 모델 레지스트리 (프로세스 공유 모델 캐시) 설정
+    model_cache_size: int = 20  # 메모리에 유지할 최대 모델 수
+    model_cache_max_memory_mb: int = 2048  # 로드된 모델 가중치 합계 상한 (MB)
+    model_version_check_seconds: int = 60  # 활성 모델 버전 재확인 주기 (초)
+    preload_active_models: bool = True  # 서버 시작 시 활성 모델 미리 로드
+
     # 결과 저장 설정
     save_predictions: bool = True  # 예측 결과 데이터베이스 저장 여부
     save_features: bool = True  # 사용된 특성 정보 저장 여부
@@ -203,6 +213,22 @@ class MLSettings:
         if os.getenv("ML_LEARNING_RATE"):
             self.training.learning_rate = float(os.getenv("ML_LEARNING_RATE"))
 
+        if os.getenv("ML_TRAINING_WORKERS"):
+            self.training.parallel_workers = int(os.getenv("ML_TRAINING_WORKERS"))
+
+        if os.getenv("ML_TRAINING_THREADS_PER_WORKER"):
+            self.training.threads_per_worker = int(
+                os.getenv("ML_TRAINING_THREADS_PER_WORKER")
+            )
+
+        if os.getenv("ML_MODEL_CACHE_SIZE"):
+            self.prediction.model_cache_size = int(os.getenv("ML_MODEL_CACHE_SIZE"))
+
+        if os.getenv("ML_PRELOAD_ACTIVE_MODELS"):
+            self.prediction.preload_active_models = (
+                os.getenv("ML_PRELOAD_ACTIVE_MODELS").lower() == "true"
+            )
+
         # 저장 경로 오버라이드
         if os.getenv("ML_MODEL_PATH"):
             self.storage.base_model_path = os.getenv("ML_MODEL_PATH")
@@ -211,6 +211,29 @@ class MLModelRepository:
 
         return query.first()
 
+    def find_active_models(self, model_type: str) -> List[MLModel]:
+        """
+        타입별 활성 모델 전체 조회 (심볼당 하나)
+
+        Args:
+            model_type: 모델 타입
+
+        Returns:
+            활성 모델 목록
+        """
+        return (
+            self.session.query(MLModel)
+            .filter(
+                and_(
+                    MLModel.model_type == model_type,
+                    MLModel.is_active == True,
+                    MLModel.status == "active",
+                )
+            )
+            .order_by(asc(MLModel.symbol))
+            .all()
+        )
+
     def find_all_versions(
         self, model_name: str, order_desc: bool = True
     ) -> List[MLModel]:
@@ -16,6 +16,7 @@ from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_, desc, asc
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 
 from app.ml_prediction.infra.model.entity.ml_prediction import MLPrediction
 from app.common.utils.logging_config import get_logger
@@ -124,6 +125,97 @@ class MLPredictionRepository:
             )
             raise
 
+    # 다중 행 INSERT 대상 컬럼 (id, 실제 결과 컬럼, created_at/updated_at 기본값 제외)
+    BULK_INSERT_COLUMNS = [
+        "symbol",
+        "prediction_date",
+        "prediction_timeframe",
+        "target_date",
+        "batch_id",
+        "current_price",
+        "predicted_price",
+        "predicted_direction",
+        "price_change_percent",
+        "confidence_score",
+        "model_version",
+        "model_type",
+        "features_used",
+        "feature_count",
+    ]
+
+    def insert_bulk(
+        self, predictions: List[MLPrediction], chunk_size: int = 1000
+    ) -> Dict[str, int]:
+        """
+        예측 결과 청크 단위 대량 INSERT
+
+        청크마다 다중 행 INSERT 1회만 수행하며, 이미 존재하는
+        (symbol, prediction_date, prediction_timeframe)은 건너뜁니다 (save()와 동일).
+
+        Args:
+            predictions: 저장할 예측 결과 목록
+            chunk_size: 한 번의 INSERT에 담을 행 수
+
+        Returns:
+            {'saved': 신규 저장, 'duplicates': 건너뛴 행, 'errors': 실패, 'total': 입력 행 수}
+        """
+        rows = [
+            {column: getattr(prediction, column) for column in self.BULK_INSERT_COLUMNS}
+            for prediction in predictions
+        ]
+
+        saved_count = 0
+        error_count = 0
+
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            try:
+                result = self.session.execute(self._build_insert_ignore_statement(chunk))
+                self.session.commit()
+                saved_count += max(result.rowcount or 0, 0)
+            except Exception as e:
+                self.session.rollback()
+                error_count += len(chunk)
+                logger.error(
+                    "ml_prediction_bulk_insert_failed", count=len(chunk), error=str(e)
+                )
+
+        logger.info(
+            "ml_prediction_bulk_inserted",
+            saved=saved_count,
+            total=len(rows),
+            errors=error_count,
+        )
+
+        return {
+            "saved": saved_count,
+            "duplicates": len(rows) - saved_count - error_count,
+            "errors": error_count,
+            "total": len(rows),
+        }
+
+    def _build_insert_ignore_statement(self, chunk: List[Dict[str, Any]]):
+        """DB 종류에 맞는 중복 무시 다중 행 INSERT 구문 생성"""
+        table = MLPrediction.__table__
+        dialect = self.session.get_bind().dialect.name
+
+        if dialect in ("mysql", "mariadb"):
+            # 기존 행은 그대로 두기 (no-op update)
+            stmt = mysql.insert(table).values(chunk)
+            return stmt.on_duplicate_key_update(id=table.c.id)
+
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            return (
+                insert(table)
+                .values(chunk)
+                .on_conflict_do_nothing(
+                    index_elements=["symbol", "prediction_date", "prediction_timeframe"]
+                )
+            )
+
+        raise ValueError(f"지원하지 않는 DB 방언입니다: {dialect}")
+
     def find_by_id(self, prediction_id: int) -> Optional[MLPrediction]:
         """
         ID로 예측 결과 조회
@@ -96,6 +96,7 @@ class FeatureEngineer:
         target_column: str = "close",
         include_features: bool = True,
         symbol: Optional[str] = None,
+        materialize: bool = True,
     ) -> Tuple[np.ndarray, Dict[str, np.ndarray], List[str]]:
         """
         멀티 타임프레임 시계열 시퀀스 생성
@@ -105,6 +106,7 @@ class FeatureEngineer:
             target_column: 타겟 컬럼명
             include_features: 추가 특성 포함 여부
             symbol: 심볼 (감정분석 데이터 필터링용)
+            materialize: False면 X를 원본 행을 공유하는 읽기 전용 윈도우 뷰로 반환
 
         Returns:
             (X: 특성 시퀀스, y: 타겟 딕셔너리, feature_names: 특성 이름 목록)
@@ -134,7 +136,9 @@ class FeatureEngineer:
         self.original_feature_count = len(self.feature_columns)
 
         # 시계열 시퀀스 생성
-        X, y_dict = self._create_sequences_and_targets(feature_data, target_column)
+        X, y_dict = self._create_sequences_and_targets(
+            feature_data, target_column, materialize=materialize
+        )
 
         logger.info(
             "multi_target_sequences_created",
@@ -421,39 +425,149 @@ class FeatureEngineer:
         return data
 
     def _create_sequences_and_targets(
-        self, feature_data: pd.DataFrame, target_column: str
+        self,
+        feature_data: pd.DataFrame,
+        target_column: str,
+        materialize: bool = True,
     ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
         """
         시계열 시퀀스와 멀티 타겟 생성
 
+        하나의 연속된 float32 배열 위에 슬라이딩 윈도우 뷰를 만들고,
+        타겟은 타겟 컬럼을 예측 일수만큼 이동한 벡터 슬라이스로 계산합니다.
+
         Args:
             feature_data: 특성 데이터
             target_column: 타겟 컬럼명
+            materialize: True면 (샘플, 윈도우, 특성) 배열을 복사해 반환,
+                False면 원본 행을 공유하는 읽기 전용 뷰 반환 (메모리 window_size배 절약)
 
         Returns:
             (X: 특성 시퀀스, y_dict: 타겟 딕셔너리)
         """
-        X = []
-        y_dict = {f"{days}d": [] for days in self.target_days}
+        rows = np.ascontiguousarray(feature_data.to_numpy(dtype=np.float32))
+        target_values = feature_data[target_column].to_numpy(dtype=np.float64)
+
+        return self._sequences_from_rows(rows, target_values, materialize)
+
+    def create_sequences_from_rows(
+        self,
+        rows: np.ndarray,
+        feature_columns: List[str],
+        target_column: str = "close",
+        materialize: bool = False,
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray], List[str]]:
+        """
+        이미 엔지니어링된 특성 행렬로부터 멀티 타임프레임 시퀀스 생성
+
+        특성 저장소의 메모리 맵 슬라이스처럼 연속된 (행, 특성) 배열을 받으면
+        복사 없이 윈도우 뷰를 만듭니다.
+
+        Args:
+            rows: (행, 특성) 특성 행렬
+            feature_columns: 특성 컬럼명 목록
+            target_column: 타겟 컬럼명
+            materialize: True면 X를 연속 배열로 복사
+
+        Returns:
+            (X: 특성 시퀀스, y: 타겟 딕셔너리, feature_names: 특성 이름 목록)
+        """
+        if len(rows) < self.window_size + max(self.target_days):
+            raise ValueError(
+                f"Insufficient data: need at least {self.window_size + max(self.target_days)} records, "
+                f"got {len(rows)}"
+            )
+
+        self.feature_columns = list(feature_columns)
+        self.original_feature_count = len(self.feature_columns)
+        self.engineered_feature_count = len(self.feature_columns)
+
+        rows = np.ascontiguousarray(rows, dtype=np.float32)
+        target_values = rows[:, self.feature_columns.index(target_column)].astype(
+            np.float64
+        )
+        X, y_dict = self._sequences_from_rows(rows, target_values, materialize)
+
+        logger.info(
+            "multi_target_sequences_created_from_rows",
+            X_shape=X.shape,
+            feature_count=len(self.feature_columns),
+        )
+
+        return X, y_dict, self.feature_columns
 
+    def _sequences_from_rows(
+        self, rows: np.ndarray, target_values: np.ndarray, materialize: bool
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """연속 float32 행렬 위의 윈도우 뷰와 이동된 타겟 슬라이스 생성"""
         # 최대 예측 일수만큼 여유를 둠
         max_target_days = max(self.target_days)
+        n_samples = max(len(rows) - self.window_size - max_target_days, 0)
+
+        X = self._sliding_windows(rows, self.window_size, n_samples)
+        if materialize:
+            X = np.ascontiguousarray(X)
+
+        # 샘플 k의 기준 시점은 window_size + k, 타겟은 그로부터 days일 후
+        y_dict = {
+            f"{days}d": target_values[
+                self.window_size + days : self.window_size + days + n_samples
+            ].copy()
+            for days in self.target_days
+        }
 
-        for i in range(self.window_size, len(feature_data) - max_target_days):
-            # 특성 시퀀스 (과거 window_size일)
-            X.append(feature_data.iloc[i - self.window_size : i].values)
+        return X, y_dict
 
-            # 각 타임프레임별 타겟
-            for days in self.target_days:
-                future_price = feature_data.iloc[i + days][target_column]
-                y_dict[f"{days}d"].append(future_price)
+    def rolling_windows(self, rows: np.ndarray) -> np.ndarray:
+        """
+        특성 행렬의 모든 예측 윈도우를 읽기 전용 뷰로 생성 (윈도우 k는 행 k ~ k + window_size - 1)
 
-        # numpy 배열로 변환
-        X = np.array(X)
-        for key in y_dict:
-            y_dict[key] = np.array(y_dict[key])
+        Args:
+            rows: (행, 특성) 특성 행렬
 
-        return X, y_dict
+        Returns:
+            (행 수 - window_size + 1, window_size, 특성) 뷰
+        """
+        rows = np.ascontiguousarray(rows, dtype=np.float32)
+        n_windows = max(len(rows) - self.window_size + 1, 0)
+        return self._sliding_windows(rows, self.window_size, n_windows)
+
+    @staticmethod
+    def _sliding_windows(
+        rows: np.ndarray, window_size: int, n_windows: int
+    ) -> np.ndarray:
+        """
+        (행, 특성) 배열 위의 (윈도우 수, window_size, 특성) 읽기 전용 스트라이드 뷰 생성
+
+        Args:
+            rows: C 연속 2D 배열
+            window_size: 윈도우 크기
+            n_windows: 생성할 윈도우 수
+
+        Returns:
+            rows와 메모리를 공유하는 3D 뷰
+        """
+        row_stride, col_stride = rows.strides
+        return np.lib.stride_tricks.as_strided(
+            rows,
+            shape=(n_windows, window_size, rows.shape[1]),
+            strides=(row_stride, row_stride, col_stride),
+            writeable=False,
+        )
+
+    @staticmethod
+    def window_source_rows(X: np.ndarray) -> Optional[np.ndarray]:
+        """
+        슬라이딩 윈도우 뷰라면 윈도우들이 덮는 고유 행 (윈도우 수 + window_size - 1개) 반환
+
+        윈도우 축과 시간 축의 stride가 같으면 연속된 윈도우가 한 행씩 겹친 뷰입니다.
+        물리화된 배열이나 단일 윈도우(예측용)는 None을 반환합니다.
+        """
+        if X.ndim != 3 or len(X) < 2 or X.shape[1] < 2:
+            return None
+        if X.strides[0] != X.strides[1]:
+            return None
+        return np.concatenate([X[:, 0, :], X[-1, 1:, :]], axis=0)
 
     def normalize_features(self, X: np.ndarray, fit_scaler: bool = True) -> np.ndarray:
         """
@@ -466,6 +580,9 @@ class FeatureEngineer:
         Returns:
             정규화된 특성 데이터
         """
+        # 슬라이딩 윈도우 뷰는 고유 행만 변환한 뒤 다시 윈도우 뷰로 감쌈
+        source_rows = self.window_source_rows(X)
+
         if fit_scaler or self.feature_scaler is None:
             # 스케일러 생성
             if self.normalization_method == "minmax":
@@ -481,6 +598,21 @@ class FeatureEngineer:
                     f"Unknown normalization method: {self.normalization_method}"
                 )
 
+            if source_rows is not None:
+                # 윈도우 전체로 학습했을 때와 같은 스케일러가 되도록 학습
+                self._fit_scaler_on_windows(X, source_rows)
+                normalized_rows = self.feature_scaler.transform(source_rows)
+                logger.info(
+                    "feature_scaler_fitted",
+                    normalization_method=self.normalization_method,
+                    input_shape=X.shape,
+                    unique_rows=len(source_rows),
+                    feature_range=getattr(self.feature_scaler, "feature_range", "N/A"),
+                )
+                return self._sliding_windows(
+                    np.ascontiguousarray(normalized_rows), X.shape[1], len(X)
+                )
+
             # 3D 데이터를 2D로 변환하여 스케일러 학습
             original_shape = X.shape
             X_2d = X.reshape(-1, X.shape[-1])
@@ -497,6 +629,11 @@ class FeatureEngineer:
                 input_shape=original_shape,
                 feature_range=getattr(self.feature_scaler, "feature_range", "N/A"),
             )
+        elif source_rows is not None:
+            normalized_rows = self.feature_scaler.transform(source_rows)
+            return self._sliding_windows(
+                np.ascontiguousarray(normalized_rows), X.shape[1], len(X)
+            )
         else:
             # 기존 스케일러로 변환만
             original_shape = X.shape
@@ -506,6 +643,28 @@ class FeatureEngineer:
 
         return X_normalized
 
+    def _fit_scaler_on_windows(self, X: np.ndarray, source_rows: np.ndarray) -> None:
+        """
+        슬라이딩 윈도우 뷰를 물리화하지 않고 feature_scaler 학습
+
+        minmax는 고유 행의 최소/최대가 전체 윈도우와 같고, standard는 각 행이
+        등장하는 윈도우 수를 가중치로 주면 평균/분산이 같습니다.
+        robust의 분위수는 가중치를 지원하지 않아 기존처럼 전체 윈도우로 학습합니다.
+        """
+        if self.normalization_method == "minmax":
+            self.feature_scaler.fit(source_rows)
+        elif self.normalization_method == "standard":
+            window_size, n_windows = X.shape[1], len(X)
+            positions = np.arange(len(source_rows))
+            window_counts = (
+                np.minimum(positions, n_windows - 1)
+                - np.maximum(positions - window_size + 1, 0)
+                + 1
+            )
+            self.feature_scaler.fit(source_rows, sample_weight=window_counts)
+        else:
+            self.feature_scaler.fit(X.reshape(-1, X.shape[-1]))
+
     def normalize_targets(
         self, y_dict: Dict[str, np.ndarray], fit_scalers: bool = True
     ) -> Dict[str, np.ndarray]:
@@ -634,9 +793,10 @@ class FeatureEngineer:
             train_end = int(n_samples * train_ratio)
             val_end = int(n_samples * (train_ratio + val_ratio))
 
-            train_indices = np.arange(0, train_end)
-            val_indices = np.arange(train_end, val_end)
-            test_indices = np.arange(val_end, n_samples)
+            # 슬라이스는 뷰를 유지하므로 윈도우 뷰가 복사되지 않음
+            train_indices = slice(0, train_end)
+            val_indices = slice(train_end, val_end)
+            test_indices = slice(val_end, n_samples)
 
         # X 분할
         X_splits = {
@@ -657,9 +817,9 @@ class FeatureEngineer:
         logger.info(
             "data_split_completed",
             total_samples=n_samples,
-            train_samples=len(train_indices),
-            val_samples=len(val_indices),
-            test_samples=len(test_indices),
+            train_samples=len(X_splits["train"]),
+            val_samples=len(X_splits["val"]),
+            test_samples=len(X_splits["test"]),
             shuffle=shuffle,
         )
 
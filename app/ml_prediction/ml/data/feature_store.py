@@ -0,0 +1,410 @@
+"""
+특성 저장소 (메모리 맵 기반)
+
+이 파일은 심볼별로 엔지니어링된 특성 행렬을 메모리 맵 가능한 npy 파일로 보관합니다.
+날짜 범위 전체를 피클로 저장하던 캐시와 달리, 날짜 커버리지와 특성 설정을
+매니페스트로 관리하고 새 거래일은 기존 파일 뒤에 이어 붙입니다.
+
+주요 기능:
+- 심볼별 float32 특성 행렬 / 날짜 배열 저장 (np.load mmap_mode="r"로 복사 없이 조회)
+- 매니페스트(JSON)로 날짜 커버리지, 특성 컬럼, 특성 설정 관리
+- 새 거래일 추가 시 임시 파일에 쓰고 os.replace로 원자적 교체 (리더와 충돌 없음)
+- 심볼별 잠금 파일로 프로세스 간 쓰기 직렬화
+- 날짜 범위 슬라이스 조회
+"""
+
+from typing import List, Dict, Any, Iterator, Optional
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime
+import fcntl
+import json
+import os
+import re
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from app.common.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class FeatureSlice:
+    """특성 저장소 조회 결과 (values는 메모리 맵 뷰일 수 있음)"""
+
+    symbol: str
+    dates: np.ndarray  # datetime64[D]
+    values: np.ndarray  # (행, 특성) float32
+    feature_columns: List[str]
+    manifest: Dict[str, Any] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def column(self, name: str) -> np.ndarray:
+        """특성 컬럼 하나를 뷰로 반환"""
+        return self.values[:, self.feature_columns.index(name)]
+
+    def date_at(self, position: int) -> date:
+        """위치의 날짜를 date로 반환"""
+        return self.dates[position].astype(object)
+
+    @classmethod
+    def from_frame(
+        cls,
+        symbol: str,
+        frame: pd.DataFrame,
+        manifest: Optional[Dict[str, Any]] = None,
+    ) -> "FeatureSlice":
+        """메모리상의 특성 DataFrame으로부터 생성 (저장소 미사용 시)"""
+        return cls(
+            symbol=symbol,
+            dates=FeatureStore.to_day_array(frame.index),
+            values=np.ascontiguousarray(frame.to_numpy(dtype=np.float32)),
+            feature_columns=frame.columns.tolist(),
+            manifest=manifest or {},
+        )
+
+
+class FeatureStore:
+    """
+    메모리 맵 기반 특성 저장소
+
+    심볼마다 디렉토리 하나에 features.npy, dates.npy, manifest.json을 둡니다.
+    파일은 항상 새로 쓴 뒤 교체하므로 리더가 들고 있는 메모리 맵은 바뀌지 않고,
+    쓰기는 심볼별 잠금 파일로 프로세스 간 직렬화합니다.
+    """
+
+    MANIFEST_FILE = "manifest.json"
+    VALUES_FILE = "features.npy"
+    DATES_FILE = "dates.npy"
+    LOCK_FILE = ".lock"
+    MANIFEST_VERSION = 1
+
+    def __init__(self, base_dir: str):
+        """
+        특성 저장소 초기화
+
+        Args:
+            base_dir: 저장소 루트 디렉토리
+        """
+        self.base_dir = base_dir
+        os.makedirs(self.base_dir, exist_ok=True)
+
+    # ====================
+    # 조회
+    # ====================
+
+    def load_manifest(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """매니페스트 로드 (없거나 손상되었으면 None)"""
+        manifest_path = os.path.join(self._symbol_dir(symbol), self.MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            return None
+
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("feature_store_manifest_unreadable", symbol=symbol, error=str(e))
+            return None
+
+        if manifest.get("version") != self.MANIFEST_VERSION:
+            return None
+        return manifest
+
+    @staticmethod
+    def is_compatible(manifest: Dict[str, Any], config: Dict[str, Any]) -> bool:
+        """저장된 특성 설정이 현재 설정과 같은지 확인"""
+        return manifest.get("config") == config
+
+    def read(
+        self,
+        symbol: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Optional[FeatureSlice]:
+        """
+        날짜 범위 슬라이스 조회 (복사 없이 메모리 맵 뷰 반환)
+
+        Args:
+            symbol: 심볼
+            start_date: 시작 날짜 (포함, None이면 처음부터)
+            end_date: 종료 날짜 (포함, None이면 끝까지)
+
+        Returns:
+            FeatureSlice 또는 저장된 데이터가 없으면 None
+        """
+        manifest = self.load_manifest(symbol)
+        if manifest is None or manifest["rows"] == 0:
+            return None
+
+        symbol_dir = self._symbol_dir(symbol)
+        rows = manifest["rows"]
+        dates = np.load(os.path.join(symbol_dir, self.DATES_FILE), mmap_mode="r")
+        values = np.load(os.path.join(symbol_dir, self.VALUES_FILE), mmap_mode="r")
+
+        if (
+            len(dates) < rows
+            or len(values) < rows
+            or values.shape[1] != len(manifest["feature_columns"])
+        ):
+            # 교체 도중의 매니페스트/배열 불일치 → 저장 데이터 없음으로 처리
+            logger.warning("feature_store_inconsistent", symbol=symbol)
+            return None
+        dates, values = dates[:rows], values[:rows]
+
+        lo = 0 if start_date is None else int(
+            np.searchsorted(dates, np.datetime64(start_date, "D"), side="left")
+        )
+        hi = rows if end_date is None else int(
+            np.searchsorted(dates, np.datetime64(end_date, "D"), side="right")
+        )
+
+        return FeatureSlice(
+            symbol=symbol,
+            dates=dates[lo:hi],
+            values=values[lo:hi],
+            feature_columns=manifest["feature_columns"],
+            manifest=manifest,
+        )
+
+    # ====================
+    # 저장
+    # ====================
+
+    def write(
+        self,
+        symbol: str,
+        frame: pd.DataFrame,
+        config: Dict[str, Any],
+        requested_start: date,
+        requested_end: date,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        심볼의 특성 행렬 전체 교체
+
+        Args:
+            symbol: 심볼
+            frame: 날짜 인덱스 특성 DataFrame
+            config: 특성 설정 (호환성 판단용)
+            requested_start: 데이터를 요청한 시작 날짜
+            requested_end: 데이터를 요청한 종료 날짜
+            extra: 매니페스트에 함께 기록할 정보
+
+        Returns:
+            저장된 매니페스트
+        """
+        dates = self.to_day_array(frame.index)
+        values = frame.to_numpy(dtype=np.float32)
+
+        manifest = {
+            "version": self.MANIFEST_VERSION,
+            "symbol": symbol,
+            "feature_columns": frame.columns.tolist(),
+            "config": config,
+            "rows": len(values),
+            "requested_start": requested_start.isoformat(),
+            "requested_end": requested_end.isoformat(),
+            **(extra or {}),
+        }
+
+        with self._write_lock(symbol):
+            self._write_arrays(symbol, dates, values)
+            self._write_manifest(symbol, manifest, dates)
+
+        logger.info(
+            "feature_store_written",
+            symbol=symbol,
+            rows=len(values),
+            features=values.shape[1] if values.ndim == 2 else 0,
+        )
+        return manifest
+
+    def append(
+        self,
+        symbol: str,
+        frame: pd.DataFrame,
+        requested_end: date,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        새 거래일 특성 추가
+
+        frame의 첫 날짜 이후로 저장된 행은 다시 계산된 값으로 덮어씁니다
+        (장중에 저장된 마지막 날 보정). 읽는 쪽이 복사 없는 뷰를 들고 있을 수 있어
+        파일은 제자리에서 수정하지 않고 임시 파일에 쓴 뒤 교체합니다.
+
+        Args:
+            symbol: 심볼
+            frame: 추가할 날짜 인덱스 특성 DataFrame
+            requested_end: 데이터를 요청한 종료 날짜
+            extra: 매니페스트에 갱신할 정보
+
+        Returns:
+            추가 성공 여부 (저장소가 없거나 특성 컬럼이 다르면 False → 전체 재생성 필요)
+        """
+        with self._write_lock(symbol):
+            return self._append_locked(symbol, frame, requested_end, extra)
+
+    # ====================
+    # 관리
+    # ====================
+
+    def clear(self, symbol: Optional[str] = None) -> int:
+        """
+        저장소 정리
+
+        Args:
+            symbol: 특정 심볼만 정리 (None이면 전체)
+
+        Returns:
+            삭제된 심볼 수
+        """
+        if symbol is not None:
+            symbol_dir = self._symbol_dir(symbol)
+            if not os.path.isdir(symbol_dir):
+                return 0
+            shutil.rmtree(symbol_dir)
+            return 1
+
+        cleared = 0
+        for name in os.listdir(self.base_dir):
+            path = os.path.join(self.base_dir, name)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+                cleared += 1
+        return cleared
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장소 통계"""
+        symbols = 0
+        total_size = 0
+        for name in os.listdir(self.base_dir):
+            path = os.path.join(self.base_dir, name)
+            if not os.path.isdir(path):
+                continue
+            symbols += 1
+            for filename in os.listdir(path):
+                total_size += os.path.getsize(os.path.join(path, filename))
+
+        return {
+            "symbols": symbols,
+            "size_mb": round(total_size / (1024 * 1024), 2),
+        }
+
+    @staticmethod
+    def to_day_array(index) -> np.ndarray:
+        """날짜 인덱스를 datetime64[D] 배열로 변환"""
+        return pd.to_datetime(pd.Index(index)).values.astype("datetime64[D]")
+
+    # ====================
+    # 내부 헬퍼
+    # ====================
+
+    def _symbol_dir(self, symbol: str) -> str:
+        """심볼 디렉토리 경로 ('^GSPC' 같은 특수문자 치환)"""
+        return os.path.join(self.base_dir, re.sub(r"[^A-Za-z0-9_.-]", "_", symbol))
+
+    def _append_locked(
+        self,
+        symbol: str,
+        frame: pd.DataFrame,
+        requested_end: date,
+        extra: Optional[Dict[str, Any]],
+    ) -> bool:
+        """쓰기 잠금을 잡은 상태에서 append 수행"""
+        manifest = self.load_manifest(symbol)
+        if manifest is None or manifest["feature_columns"] != frame.columns.tolist():
+            return False
+
+        symbol_dir = self._symbol_dir(symbol)
+        rows = manifest["rows"]
+        new_dates = self.to_day_array(frame.index)
+        new_values = frame.to_numpy(dtype=np.float32)
+
+        stored_dates = np.load(os.path.join(symbol_dir, self.DATES_FILE), mmap_mode="r")
+        position = (
+            int(np.searchsorted(stored_dates[:rows], new_dates[0], side="left"))
+            if len(new_dates)
+            else rows
+        )
+        total_rows = position + len(new_values)
+
+        if len(new_values):
+            # 다른 프로세스가 기존 파일을 메모리 맵으로 읽고 있을 수 있으므로
+            # 제자리 수정 대신 새 파일에 복사 후 교체 (기존 리더는 이전 inode 유지)
+            stored_values = np.load(os.path.join(symbol_dir, self.VALUES_FILE), mmap_mode="r")
+            self._write_arrays(
+                symbol,
+                np.concatenate([stored_dates[:position], new_dates]),
+                np.concatenate([stored_values[:position], new_values]),
+            )
+            del stored_values
+        del stored_dates
+
+        manifest["rows"] = total_rows
+        manifest["requested_end"] = max(
+            date.fromisoformat(manifest["requested_end"]), requested_end
+        ).isoformat()
+        manifest.update(extra or {})
+        self._write_manifest(symbol, manifest, None)
+
+        logger.info(
+            "feature_store_appended",
+            symbol=symbol,
+            appended_rows=len(new_values),
+            overwritten_rows=rows - position,
+            total_rows=total_rows,
+        )
+        return True
+
+    @contextmanager
+    def _write_lock(self, symbol: str) -> Iterator[None]:
+        """심볼별 잠금 파일로 프로세스 간 쓰기 직렬화 (리더는 잠그지 않음)"""
+        symbol_dir = self._symbol_dir(symbol)
+        os.makedirs(symbol_dir, exist_ok=True)
+        with open(os.path.join(symbol_dir, self.LOCK_FILE), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write_arrays(
+        self, symbol: str, dates: np.ndarray, values: np.ndarray
+    ) -> None:
+        """npy 파일을 임시 경로에 쓰고 원자적으로 교체"""
+        symbol_dir = self._symbol_dir(symbol)
+        os.makedirs(symbol_dir, exist_ok=True)
+
+        for filename, array in ((self.DATES_FILE, dates), (self.VALUES_FILE, values)):
+            final_path = os.path.join(symbol_dir, filename)
+            tmp_path = f"{final_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, np.ascontiguousarray(array), allow_pickle=False)
+            # 기존 파일을 매핑 중인 리더는 교체 전 inode를 계속 사용
+            os.replace(tmp_path, final_path)
+
+    def _write_manifest(
+        self, symbol: str, manifest: Dict[str, Any], dates: Optional[np.ndarray]
+    ) -> None:
+        """커버리지를 갱신하고 매니페스트를 원자적으로 기록"""
+        symbol_dir = self._symbol_dir(symbol)
+
+        if dates is None:
+            stored = np.load(os.path.join(symbol_dir, self.DATES_FILE), mmap_mode="r")
+            dates = stored[: manifest["rows"]]
+
+        manifest["start_date"] = str(dates[0]) if len(dates) else None
+        manifest["end_date"] = str(dates[-1]) if len(dates) else None
+        manifest["updated_at"] = datetime.now().isoformat()
+
+        manifest_path = os.path.join(symbol_dir, self.MANIFEST_FILE)
+        tmp_path = f"{manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, manifest_path)
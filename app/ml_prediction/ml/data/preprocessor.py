@@ -16,12 +16,11 @@ from datetime import date, datetime, timedelta
 import pandas as pd
 import numpy as np
 import time
-import hashlib
-import pickle
 import os
 
 from app.ml_prediction.ml.data.source_manager import DataSourceManager
 from app.ml_prediction.ml.data.feature_engineer import FeatureEngineer
+from app.ml_prediction.ml.data.feature_store import FeatureSlice, FeatureStore
 from app.ml_prediction.ml.data.quality_validator import (
     DataQualityValidator,
     ValidationSeverity,
@@ -29,6 +28,7 @@ from app.ml_prediction.ml.data.quality_validator import (
 from app.ml_prediction.ml.data.fallback_handler import DataSourceFallbackHandler
 from app.ml_prediction.config.ml_config import ml_settings
 from app.common.utils.logging_config import get_logger
+from app.common.utils.market_calendar import last_trading_day
 
 logger = get_logger(__name__)
 
@@ -40,6 +40,9 @@ class MLDataPreprocessor:
     데이터 수집부터 모델 입력 준비까지의 전체 파이프라인을 관리합니다.
     """
 
+    # 증분 추가 시 롤링/EWM 특성이 안정되도록 마지막 저장일 이전부터 다시 계산할 기간
+    FEATURE_WARMUP_DAYS = 250
+
     def __init__(
         self,
         cache_dir: Optional[str] = None,
@@ -66,9 +69,13 @@ class MLDataPreprocessor:
         self.quality_validator = DataQualityValidator(strict_mode=strict_validation)
         self.fallback_handler = DataSourceFallbackHandler()
 
-        # 캐시 디렉토리 생성
+        # 특성 저장소 (심볼별 메모리 맵 특성 행렬)
+        self.feature_store = None
         if self.enable_caching:
             os.makedirs(self.cache_dir, exist_ok=True)
+            self.feature_store = FeatureStore(
+                os.path.join(self.cache_dir, "feature_store")
+            )
 
         logger.info(
             "ml_data_preprocessor_initialized",
@@ -85,6 +92,7 @@ class MLDataPreprocessor:
         target_column: str = "close",
         force_refresh: bool = False,
         use_sentiment: bool = False,
+        reuse_stored: bool = False,
     ) -> Tuple[Dict[str, np.ndarray], Dict[str, Dict[str, np.ndarray]], Dict[str, Any]]:
         """
         훈련 데이터 준비
@@ -94,7 +102,9 @@ class MLDataPreprocessor:
             start_date: 시작 날짜
             end_date: 종료 날짜
             target_column: 타겟 컬럼명
-            force_refresh: 캐시 무시하고 새로 생성
+            force_refresh: 특성 저장소 무시하고 새로 생성
+            reuse_stored: 저장소가 요청 범위를 덮으면 최신화 없이 그대로 사용
+                (warm_feature_store로 미리 준비한 병렬 훈련 작업자용)
 
         Returns:
             (X_splits, y_splits, metadata) 튜플
@@ -109,34 +119,26 @@ class MLDataPreprocessor:
             target_column=target_column,
         )
 
-        # 1. 캐시 확인
-        if self.enable_caching and not force_refresh:
-            cached_data = self._load_from_cache(
-                symbol, start_date, end_date, "training"
-            )
-            if cached_data is not None:
-                logger.info("training_data_loaded_from_cache")
-                return cached_data
-
-        # 2. 원시 데이터 수집
-        raw_data = self._collect_raw_data(symbol, start_date, end_date)
-
-        # 3. 데이터 품질 검증
-        validation_passed, validation_results, quality_score = (
-            self._validate_data_quality(raw_data, symbol, (start_date, end_date))
-        )
-
-        if not validation_passed:
-            raise ValueError(f"Data quality validation failed for {symbol}")
-
-        # 4. 특성 엔지니어링
         # 감정 특성 사용 설정
         if use_sentiment:
             self.feature_engineer.use_sentiment_features = True
             logger.info("sentiment_features_enabled_for_training", symbol=symbol)
-        
-        X, y_dict, feature_names = self.feature_engineer.create_multi_target_sequences(
-            raw_data, target_column=target_column, symbol=symbol
+
+        # 1~3. 특성 행렬 조회 (저장소에 없는 구간만 수집, 검증, 특성 엔지니어링)
+        feature_slice = self._load_feature_slice(
+            symbol,
+            start_date,
+            end_date,
+            validate=True,
+            force_refresh=force_refresh,
+            reuse_stored=reuse_stored,
+        )
+
+        # 4. 시퀀스 생성 (저장소 메모리 맵 위의 윈도우 뷰)
+        X, y_dict, feature_names = self.feature_engineer.create_sequences_from_rows(
+            feature_slice.values,
+            feature_slice.feature_columns,
+            target_column=target_column,
         )
 
         # 5. 정규화
@@ -152,21 +154,9 @@ class MLDataPreprocessor:
 
         # 7. 메타데이터 생성
         metadata = self._create_metadata(
-            symbol,
-            start_date,
-            end_date,
-            raw_data,
-            validation_results,
-            quality_score,
-            feature_names,
+            symbol, start_date, end_date, feature_slice, feature_names
         )
 
-        # 8. 캐시 저장
-        if self.enable_caching:
-            self._save_to_cache(
-                (X_splits, y_splits, metadata), symbol, start_date, end_date, "training"
-            )
-
         elapsed_time = time.time() - start_time
 
         logger.info(
@@ -177,13 +167,18 @@ class MLDataPreprocessor:
             val_samples=len(X_splits["val"]),
             test_samples=len(X_splits["test"]),
             features=len(feature_names),
-            quality_score=quality_score.overall_score,
+            quality_score=metadata["data_quality"].get("overall_score"),
         )
 
         return X_splits, y_splits, metadata
 
     def prepare_prediction_data(
-        self, symbol: str, end_date: date, lookback_days: int = None, use_sentiment: bool = False
+        self,
+        symbol: str,
+        end_date: date,
+        lookback_days: int = None,
+        use_sentiment: bool = False,
+        normalize: bool = True,
     ) -> Tuple[np.ndarray, Dict[str, Any]]:
         """
         예측용 데이터 준비
@@ -193,6 +188,7 @@ class MLDataPreprocessor:
             end_date: 마지막 날짜
             lookback_days: 과거 며칠 데이터 사용
             use_sentiment: 감정분석 특성 사용 여부
+            normalize: False면 정규화 전 윈도우 반환 (호출자가 모델별 스케일러로 정규화)
 
         Returns:
             (X: 예측용 특성, metadata: 메타데이터) 튜플
@@ -208,27 +204,28 @@ class MLDataPreprocessor:
             use_sentiment=use_sentiment,
         )
 
-        # 1. 원시 데이터 수집
-        raw_data = self._collect_raw_data(symbol, start_date, end_date)
-
-        # 2. 특성 엔지니어링 (타겟 없이, 심볼 정보 전달)
-        feature_data = self.feature_engineer._prepare_features(raw_data, symbol=symbol)
+        # 1~2. 특성 행렬 조회 (저장소에 없는 최근 구간만 수집, 특성 엔지니어링)
+        feature_slice = self._load_feature_slice(
+            symbol, start_date, end_date, validate=False
+        )
 
         # 최근 window_size만큼의 데이터로 시퀀스 생성
-        if len(feature_data) < self.feature_engineer.window_size:
+        if len(feature_slice) < self.feature_engineer.window_size:
             raise ValueError(
                 f"Insufficient data for prediction: need {self.feature_engineer.window_size} records, "
-                f"got {len(feature_data)}"
+                f"got {len(feature_slice)}"
             )
 
-        # 마지막 윈도우 추출
-        X = feature_data.iloc[-self.feature_engineer.window_size :].values
+        # 마지막 윈도우 추출 (메모리 맵 뷰)
+        X = feature_slice.values[-self.feature_engineer.window_size :]
         X = X.reshape(
             1, self.feature_engineer.window_size, -1
         )  # (1, window_size, features)
 
         # 4. 정규화 (기존 스케일러 사용)
-        if self.feature_engineer.feature_scaler is None:
+        if not normalize:
+            X_normalized = X
+        elif self.feature_engineer.feature_scaler is None:
             # 스케일러가 로드되지 않은 경우, 모델에서 스케일러를 로드
             logger.warning("feature_scaler_not_loaded_trying_to_load_from_model", symbol=symbol)
             
@@ -260,19 +257,20 @@ class MLDataPreprocessor:
                 logger.error("failed_to_load_scaler_from_model", symbol=symbol, error=str(e))
                 raise ValueError(f"Feature scaler not fitted and failed to load from model. Train model first. Error: {str(e)}")
 
-        X_normalized = self.feature_engineer.normalize_features(X, fit_scaler=False)
+        if normalize:
+            X_normalized = self.feature_engineer.normalize_features(X, fit_scaler=False)
 
         # 5. 메타데이터
         metadata = {
             "symbol": symbol,
             "end_date": end_date.isoformat(),
             "lookback_days": lookback_days,
-            "data_points": len(raw_data),
+            "data_points": len(feature_slice),
             "feature_count": X.shape[-1],
-            "last_price": float(raw_data["close"].iloc[-1]),
+            "last_price": float(feature_slice.column("close")[-1]),
             "data_date_range": {
-                "start": str(raw_data.index.min()),
-                "end": str(raw_data.index.max()),
+                "start": str(feature_slice.date_at(0)),
+                "end": str(feature_slice.date_at(-1)),
             },
             "sentiment_features_enabled": self.feature_engineer.use_sentiment_features,
         }
@@ -287,6 +285,252 @@ class MLDataPreprocessor:
 
         return X_normalized, metadata
 
+    # ====================
+    # 특성 저장소
+    # ====================
+
+    def warm_feature_store(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        use_sentiment: bool = False,
+        force_refresh: bool = False,
+    ) -> int:
+        """
+        훈련 범위의 특성 행렬을 저장소에 미리 준비 (검증 포함)
+
+        병렬 훈련 전에 부모 프로세스에서 호출하면 작업자는 reuse_stored=True로
+        DB 조회 없이 저장소만 읽습니다.
+
+        Args:
+            symbol: 심볼
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            use_sentiment: 감정 특성 사용 여부
+            force_refresh: 저장소 무시하고 새로 생성
+
+        Returns:
+            준비된 특성 행 수
+        """
+        if use_sentiment:
+            self.feature_engineer.use_sentiment_features = True
+
+        feature_slice = self._load_feature_slice(
+            symbol,
+            start_date,
+            end_date,
+            validate=True,
+            force_refresh=force_refresh,
+        )
+        return len(feature_slice)
+
+    def get_feature_slice(
+        self, symbol: str, start_date: date, end_date: date
+    ) -> FeatureSlice:
+        """
+        날짜 범위의 엔지니어링된 특성 행렬 조회 (예측/백테스트용, 품질 검증 없음)
+
+        저장소가 범위를 덮으면 메모리 맵 슬라이스를 그대로 반환하고,
+        부족한 구간만 계산해 저장소에 반영합니다.
+
+        Args:
+            symbol: 심볼
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+
+        Returns:
+            FeatureSlice (values는 읽기 전용 뷰일 수 있음)
+        """
+        return self._load_feature_slice(symbol, start_date, end_date, validate=False)
+
+    def _feature_store_config(self) -> Dict[str, Any]:
+        """저장된 특성 행렬의 호환성을 결정하는 특성 설정"""
+        return {
+            "use_time_features": ml_settings.data.use_time_features,
+            "use_sentiment_features": self.feature_engineer.use_sentiment_features,
+        }
+
+    def _load_feature_slice(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        validate: bool,
+        force_refresh: bool = False,
+        reuse_stored: bool = False,
+    ) -> FeatureSlice:
+        """
+        날짜 범위의 특성 행렬 조회
+
+        저장소가 범위를 덮으면 메모리 맵 슬라이스를 그대로 반환하고,
+        종료일만 부족하면 새 거래일만 계산해 이어 붙이며,
+        그 외에는 기존 커버리지를 포함하는 범위로 다시 생성합니다.
+
+        Args:
+            symbol: 심볼
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            validate: 새로 수집한 원시 데이터의 품질 검증 여부
+            force_refresh: 저장소 무시하고 새로 생성
+            reuse_stored: 요청 범위가 저장된 범위 안이면 최신화 없이 읽기
+
+        Returns:
+            FeatureSlice
+        """
+        if self.feature_store is None:
+            feature_data, extra = self._build_feature_frame(
+                symbol, start_date, end_date, validate
+            )
+            return FeatureSlice.from_frame(symbol, feature_data, extra)
+
+        config = self._feature_store_config()
+        manifest = None if force_refresh else self.feature_store.load_manifest(symbol)
+
+        if manifest is not None and not self.feature_store.is_compatible(
+            manifest, config
+        ):
+            logger.info("feature_store_config_changed", symbol=symbol)
+            manifest = None
+
+        if manifest is not None and validate and not manifest.get("data_quality"):
+            # 예측 경로에서 검증 없이 만든 저장소는 학습 전에 검증 포함해 재생성
+            manifest = None
+
+        if (
+            reuse_stored
+            and manifest is not None
+            and date.fromisoformat(manifest["requested_start"]) <= start_date
+            and end_date <= date.fromisoformat(manifest["requested_end"])
+        ):
+            feature_slice = self.feature_store.read(symbol, start_date, end_date)
+            if feature_slice is not None and len(feature_slice) > 0:
+                return feature_slice
+
+        if (
+            manifest is not None
+            and date.fromisoformat(manifest["requested_start"]) <= start_date
+        ):
+            if self._is_store_fresh(manifest, end_date) or self._extend_feature_store(
+                symbol, manifest, end_date, validate
+            ):
+                feature_slice = self.feature_store.read(symbol, start_date, end_date)
+                if feature_slice is not None and len(feature_slice) > 0:
+                    logger.debug(
+                        "feature_slice_loaded_from_store",
+                        symbol=symbol,
+                        rows=len(feature_slice),
+                    )
+                    return feature_slice
+
+        # 전체 재생성 (기존 커버리지도 유지)
+        build_start, build_end = start_date, end_date
+        if manifest is not None:
+            build_start = min(build_start, date.fromisoformat(manifest["requested_start"]))
+            build_end = max(build_end, date.fromisoformat(manifest["requested_end"]))
+
+        feature_data, extra = self._build_feature_frame(
+            symbol, build_start, build_end, validate
+        )
+        self.feature_store.write(
+            symbol, feature_data, config, build_start, build_end, extra
+        )
+
+        return self.feature_store.read(symbol, start_date, end_date)
+
+    @staticmethod
+    def _is_store_fresh(manifest: Dict[str, Any], end_date: date) -> bool:
+        """
+        저장소가 end_date까지의 확정 데이터를 모두 담고 있는지 확인
+
+        오늘 데이터는 장중에 바뀔 수 있으므로 어제까지만 확정된 것으로 간주하고,
+        그 이전 마지막 거래일이 저장되어 있으면 최신으로 봅니다.
+        """
+        yesterday = date.today() - timedelta(days=1)
+        if end_date <= min(date.fromisoformat(manifest["requested_end"]), yesterday):
+            return True
+
+        if not manifest.get("end_date"):
+            return False
+
+        last_session = last_trading_day(min(end_date, yesterday))
+        return date.fromisoformat(manifest["end_date"]) >= last_session
+
+    def _extend_feature_store(
+        self, symbol: str, manifest: Dict[str, Any], end_date: date, validate: bool
+    ) -> bool:
+        """
+        저장소 마지막 날짜 이후의 특성만 계산해 추가
+
+        지표 계산을 위해 워밍업 구간부터 수집하지만, 저장소에는 새 거래일
+        (그리고 장중에 저장되었을 수 있는 마지막 날)만 기록합니다.
+
+        Returns:
+            추가 성공 여부 (False면 전체 재생성 필요)
+        """
+        if not manifest.get("end_date"):
+            return False
+
+        last_date = date.fromisoformat(manifest["end_date"])
+        fetch_start = last_date - timedelta(days=self.FEATURE_WARMUP_DAYS)
+
+        feature_data, extra = self._build_feature_frame(
+            symbol, fetch_start, end_date, validate
+        )
+
+        # 마지막 저장일 당일 이전에 갱신된 저장소라면 그 날 값은 장중 값일 수 있어 다시 기록
+        updated_on = (manifest.get("updated_at") or "")[:10]
+        rewrite_last = updated_on <= last_date.isoformat()
+
+        day_index = FeatureStore.to_day_array(feature_data.index)
+        last_day = np.datetime64(last_date, "D")
+        new_rows = feature_data[
+            day_index >= last_day if rewrite_last else day_index > last_day
+        ]
+
+        if new_rows.empty:
+            # 새 거래일이 아직 없음 → 저장소는 그대로 두고 요청 범위만 갱신
+            return self.feature_store.append(symbol, new_rows, end_date)
+
+        return self.feature_store.append(
+            symbol,
+            new_rows,
+            end_date,
+            {key: value for key, value in extra.items() if value is not None},
+        )
+
+    def _build_feature_frame(
+        self, symbol: str, start_date: date, end_date: date, validate: bool
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        원시 데이터 수집, 품질 검증, 특성 엔지니어링
+
+        Returns:
+            (특성 DataFrame, 매니페스트에 기록할 원시 데이터/품질 정보)
+        """
+        raw_data = self._collect_raw_data(symbol, start_date, end_date)
+        extra = {"raw_columns": len(raw_data.columns), "data_quality": None}
+
+        if validate:
+            validation_passed, validation_results, quality_score = (
+                self._validate_data_quality(raw_data, symbol, (start_date, end_date))
+            )
+
+            if not validation_passed:
+                raise ValueError(f"Data quality validation failed for {symbol}")
+
+            extra["data_quality"] = {
+                "overall_score": float(quality_score.overall_score),
+                "completeness_score": float(quality_score.completeness_score),
+                "consistency_score": float(quality_score.consistency_score),
+                "accuracy_score": float(quality_score.accuracy_score),
+                "validation_summary": self.quality_validator.get_validation_summary(),
+            }
+
+        feature_data = self.feature_engineer._prepare_features(raw_data, symbol=symbol)
+
+        return feature_data, extra
+
     def _collect_raw_data(
         self, symbol: str, start_date: date, end_date: date
     ) -> pd.DataFrame:
@@ -376,9 +620,7 @@ class MLDataPreprocessor:
         symbol: str,
         start_date: date,
         end_date: date,
-        raw_data: pd.DataFrame,
-        validation_results: List,
-        quality_score: Any,
+        feature_slice: FeatureSlice,
         feature_names: List[str],
     ) -> Dict[str, Any]:
         """메타데이터 생성"""
@@ -390,11 +632,11 @@ class MLDataPreprocessor:
                 "end": end_date.isoformat(),
             },
             "raw_data_info": {
-                "records": len(raw_data),
-                "columns": len(raw_data.columns),
+                "records": len(feature_slice),
+                "columns": feature_slice.manifest.get("raw_columns"),
                 "date_range": {
-                    "start": str(raw_data.index.min()),
-                    "end": str(raw_data.index.max()),
+                    "start": str(feature_slice.date_at(0)),
+                    "end": str(feature_slice.date_at(-1)),
                 },
             },
             "feature_engineering": {
@@ -404,13 +646,7 @@ class MLDataPreprocessor:
                 "feature_names": feature_names,
                 "normalization_method": self.feature_engineer.normalization_method,
             },
-            "data_quality": {
-                "overall_score": quality_score.overall_score,
-                "completeness_score": quality_score.completeness_score,
-                "consistency_score": quality_score.consistency_score,
-                "accuracy_score": quality_score.accuracy_score,
-                "validation_summary": self.quality_validator.get_validation_summary(),
-            },
+            "data_quality": feature_slice.manifest.get("data_quality") or {},
             "preprocessing_config": {
                 "cache_enabled": self.enable_caching,
                 "strict_validation": self.strict_validation,
@@ -418,103 +654,6 @@ class MLDataPreprocessor:
             "created_at": datetime.now().isoformat(),
         }
 
-    def _generate_cache_key(
-        self, symbol: str, start_date: date, end_date: date, data_type: str
-    ) -> str:
-        """캐시 키 생성"""
-        key_data = f"{symbol}:{start_date}:{end_date}:{data_type}:{self.feature_engineer.window_size}"
-        return hashlib.md5(key_data.encode()).hexdigest()
-
-    def _save_to_cache(
-        self, data: Any, symbol: str, start_date: date, end_date: date, data_type: str
-    ) -> None:
-        """캐시에 데이터 저장"""
-        if not self.enable_caching:
-            return
-
-        try:
-            cache_key = self._generate_cache_key(
-                symbol, start_date, end_date, data_type
-            )
-            cache_file = os.path.join(self.cache_dir, f"{cache_key}.pkl")
-
-            cache_data = {
-                "data": data,
-                "metadata": {
-                    "symbol": symbol,
-                    "start_date": start_date.isoformat(),
-                    "end_date": end_date.isoformat(),
-                    "data_type": data_type,
-                    "created_at": datetime.now().isoformat(),
-                    "feature_engineer_config": self.feature_engineer.get_feature_info(),
-                },
-            }
-
-            with open(cache_file, "wb") as f:
-                pickle.dump(cache_data, f)
-
-            logger.debug(
-                "data_cached", symbol=symbol, data_type=data_type, cache_file=cache_file
-            )
-
-        except Exception as e:
-            logger.error(
-                "cache_save_failed", symbol=symbol, data_type=data_type, error=str(e)
-            )
-
-    def _load_from_cache(
-        self, symbol: str, start_date: date, end_date: date, data_type: str
-    ) -> Optional[Any]:
-        """캐시에서 데이터 로드"""
-        if not self.enable_caching:
-            return None
-
-        try:
-            cache_key = self._generate_cache_key(
-                symbol, start_date, end_date, data_type
-            )
-            cache_file = os.path.join(self.cache_dir, f"{cache_key}.pkl")
-
-            if not os.path.exists(cache_file):
-                return None
-
-            # 캐시 파일 나이 확인
-            file_age = datetime.now() - datetime.fromtimestamp(
-                os.path.getmtime(cache_file)
-            )
-            if file_age > timedelta(hours=24):  # 24시간 이상 된 캐시는 무효
-                os.remove(cache_file)
-                logger.debug("expired_cache_removed", cache_file=cache_file)
-                return None
-
-            with open(cache_file, "rb") as f:
-                cache_data = pickle.load(f)
-
-            # 설정 호환성 확인
-            cached_config = cache_data["metadata"].get("feature_engineer_config", {})
-            current_config = self.feature_engineer.get_feature_info()
-
-            if cached_config.get("window_size") != current_config.get(
-                "window_size"
-            ) or cached_config.get("target_days") != current_config.get("target_days"):
-                logger.debug("cache_config_mismatch", cache_file=cache_file)
-                return None
-
-            logger.debug(
-                "data_loaded_from_cache",
-                symbol=symbol,
-                data_type=data_type,
-                cache_file=cache_file,
-            )
-
-            return cache_data["data"]
-
-        except Exception as e:
-            logger.error(
-                "cache_load_failed", symbol=symbol, data_type=data_type, error=str(e)
-            )
-            return None
-
     def clear_cache(self, symbol: Optional[str] = None) -> int:
         """
         캐시 정리
@@ -523,35 +662,22 @@ class MLDataPreprocessor:
             symbol: 특정 심볼의 캐시만 정리 (None이면 전체)
 
         Returns:
-            정리된 파일 수
+            정리된 심볼 수 (전체 정리 시 이전 형식 .pkl 파일 수 포함)
         """
-        if not self.enable_caching or not os.path.exists(self.cache_dir):
+        if self.feature_store is None:
             return 0
 
         cleared_count = 0
 
         try:
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith(".pkl"):
-                    filepath = os.path.join(self.cache_dir, filename)
+            cleared_count = self.feature_store.clear(symbol)
 
-                    if symbol is None:
-                        # 전체 캐시 정리
-                        os.remove(filepath)
+            if symbol is None:
+                # 이전 버전의 피클 캐시 파일 정리
+                for filename in os.listdir(self.cache_dir):
+                    if filename.endswith(".pkl"):
+                        os.remove(os.path.join(self.cache_dir, filename))
                         cleared_count += 1
-                    else:
-                        # 특정 심볼 캐시만 정리 (파일명에서 확인)
-                        try:
-                            with open(filepath, "rb") as f:
-                                cache_data = pickle.load(f)
-
-                            if cache_data["metadata"].get("symbol") == symbol:
-                                os.remove(filepath)
-                                cleared_count += 1
-                        except:
-                            # 손상된 캐시 파일은 삭제
-                            os.remove(filepath)
-                            cleared_count += 1
 
             logger.info(
                 "cache_cleared", symbol=symbol or "all", cleared_files=cleared_count
@@ -565,19 +691,10 @@ class MLDataPreprocessor:
     def get_preprocessing_stats(self) -> Dict[str, Any]:
         """전처리 통계 정보 반환"""
 
-        cache_stats = {"enabled": False, "files": 0, "size_mb": 0}
-
-        if self.enable_caching and os.path.exists(self.cache_dir):
-            cache_files = [f for f in os.listdir(self.cache_dir) if f.endswith(".pkl")]
-            cache_stats["enabled"] = True
-            cache_stats["files"] = len(cache_files)
+        cache_stats = {"enabled": False, "symbols": 0, "size_mb": 0}
 
-            # 캐시 크기 계산
-            total_size = 0
-            for filename in cache_files:
-                filepath = os.path.join(self.cache_dir, filename)
-                total_size += os.path.getsize(filepath)
-            cache_stats["size_mb"] = round(total_size / (1024 * 1024), 2)
+        if self.feature_store is not None:
+            cache_stats = {"enabled": True, **self.feature_store.get_stats()}
 
         return {
             "data_source_manager": self.data_source_manager.health_check(),
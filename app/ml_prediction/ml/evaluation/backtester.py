@@ -18,10 +18,8 @@ import pandas as pd
 from dataclasses import dataclass
 
 from app.ml_prediction.ml.model.lstm_model import MultiOutputLSTMPredictor
+from app.ml_prediction.ml.model.model_registry import model_registry
 from app.ml_prediction.ml.data.preprocessor import MLDataPreprocessor
-from app.ml_prediction.infra.model.repository.ml_model_repository import (
-    MLModelRepository,
-)
 from app.technical_analysis.infra.model.repository.daily_price_repository import (
     DailyPriceRepository,
 )
@@ -96,6 +94,7 @@ class Backtester:
         start_date: date,
         end_date: date,
         strategy: str = "direction_based",
+        batched: bool = True,
     ) -> Dict[str, Any]:
         """
         백테스트 실행
@@ -106,6 +105,8 @@ class Backtester:
             start_date: 백테스트 시작 날짜
             end_date: 백테스트 종료 날짜
             strategy: 거래 전략
+            batched: True면 이력을 한 번 로드해 모든 윈도우를 일괄 예측,
+                False면 날짜별로 예측 데이터를 다시 준비 (기존 방식)
 
         Returns:
             백테스트 결과
@@ -117,6 +118,7 @@ class Backtester:
             start_date=start_date,
             end_date=end_date,
             strategy=strategy,
+            batched=batched,
         )
 
         try:
@@ -127,9 +129,14 @@ class Backtester:
             price_data = self._prepare_backtest_data(symbol, start_date, end_date)
 
             # 3. 예측 시뮬레이션
-            predictions = self._simulate_predictions(
-                model_predictor, symbol, price_data, start_date, end_date
-            )
+            if batched:
+                predictions = self._simulate_predictions_batched(
+                    model_predictor, symbol, price_data, start_date, end_date
+                )
+            else:
+                predictions = self._simulate_predictions(
+                    model_predictor, symbol, price_data, start_date, end_date
+                )
 
             # 4. 거래 시뮬레이션
             trades = self._simulate_trades(predictions, price_data, strategy)
@@ -202,42 +209,11 @@ class Backtester:
     def _load_model(
         self, symbol: str, model_version: str
     ) -> Tuple[MultiOutputLSTMPredictor, Any]:
-        """모델 로드"""
-        session = SessionLocal()
-        model_repo = MLModelRepository(session)
-
-        try:
-            model_name = f"{symbol.replace('^', '')}_lstm"
-            model_entity = model_repo.find_by_name_and_version(
-                model_name, model_version
-            )
-
-            if not model_entity:
-                raise ValueError(
-                    f"Model {model_name} version {model_version} not found"
-                )
-
-            # 모델 로드
-            model_predictor = MultiOutputLSTMPredictor(
-                input_shape=(60, 0),  # 실제 크기는 로드 시 결정
-                model_name=model_entity.model_name,
-            )
-
-            model_predictor.load_model(model_entity.model_path)
+        """모델 로드 (프로세스 공유 레지스트리 활용)"""
+        entry = model_registry.get(symbol, model_version)
+        entry.apply_scalers(self.preprocessor.feature_engineer)
 
-            # 스케일러 로드
-            import os
-
-            scaler_dir = os.path.join(
-                os.path.dirname(model_entity.model_path), "scalers"
-            )
-            if os.path.exists(scaler_dir):
-                self.preprocessor.feature_engineer.load_scalers(scaler_dir)
-
-            return model_predictor, model_entity
-
-        finally:
-            session.close()
+        return entry.model_predictor, entry.model_entity
 
     def _prepare_backtest_data(
         self, symbol: str, start_date: date, end_date: date
@@ -366,6 +342,116 @@ class Backtester:
 
         return predictions
 
+    def _simulate_predictions_batched(
+        self,
+        model_predictor: MultiOutputLSTMPredictor,
+        symbol: str,
+        price_data: pd.DataFrame,
+        start_date: date,
+        end_date: date,
+    ) -> List[Dict[str, Any]]:
+        """
+        일괄 예측 시뮬레이션
+
+        특성 행렬을 한 번만 조회하고 (특성 저장소가 덮는 구간은 재계산 없음),
+        백테스트 기간의 모든 예측 윈도우를 하나의 텐서로 만들어 한 번에 예측합니다.
+        """
+        feature_engineer = self.preprocessor.feature_engineer
+        window_size = feature_engineer.window_size
+
+        # 백테스트 구간으로 스케일러를 학습하면 미래 정보가 섞이므로 학습 시 저장된 스케일러만 사용
+        if feature_engineer.feature_scaler is None:
+            raise ValueError(
+                f"No fitted feature scaler saved for {symbol} model; "
+                "retrain the model before running a backtest"
+            )
+
+        # 첫 백테스트 날짜에도 롤링 특성이 충분히 채워지도록 여유 있게 로드
+        history_start = start_date - timedelta(days=window_size * 2 + 30)
+        feature_slice = self.preprocessor.get_feature_slice(
+            symbol, history_start, end_date
+        )
+        if feature_slice is None:
+            raise ValueError(f"No feature data available for {symbol}")
+
+        # 윈도우 k는 행 k ~ k + window_size - 1을 덮으므로 마지막 행 날짜로 식별
+        window_end_dates = feature_slice.dates[window_size - 1 :].astype(object).tolist()
+        in_range = np.array(
+            [
+                start_date <= d <= end_date and d in price_data.index
+                for d in window_end_dates
+            ],
+            dtype=bool,
+        )
+
+        if not in_range.any():
+            logger.warning(
+                "batched_prediction_no_windows",
+                symbol=symbol,
+                rows=len(feature_slice),
+                window_size=window_size,
+            )
+            return []
+
+        # 기간 내 윈도우는 연속 구간이므로 슬라이스로 뷰를 유지
+        window_indices = np.flatnonzero(in_range)
+        first, last = window_indices[0], window_indices[-1]
+        X_all = feature_engineer.rolling_windows(feature_slice.values)
+        X = feature_engineer.normalize_features(X_all[first : last + 1], fit_scaler=False)
+
+        raw_predictions = model_predictor.predict(np.ascontiguousarray(X))
+        denormalized_predictions = feature_engineer.denormalize_predictions(
+            raw_predictions
+        )
+
+        # 거래일이 아닌 윈도우 (다른 소스만 있는 날짜) 제외
+        keep = window_indices - first
+        prediction_dates = [window_end_dates[i] for i in window_indices]
+        current_prices = (
+            price_data["close"].reindex(prediction_dates).to_numpy(dtype=np.float64)
+        )
+
+        timeframe_results = []
+        for timeframe, predicted in denormalized_predictions.items():
+            days = int(timeframe.replace("d", ""))
+            predicted_prices = np.asarray(predicted, dtype=np.float64)[keep]
+            price_change_pct = (predicted_prices - current_prices) / current_prices * 100
+            directions = np.select(
+                [price_change_pct > 0.5, price_change_pct < -0.5],
+                ["up", "down"],
+                default="neutral",
+            )
+            timeframe_results.append(
+                (timeframe, days, predicted_prices, price_change_pct, directions)
+            )
+
+        # 기존 방식과 같은 순서 (날짜 → 타임프레임)로 결과 구성
+        predictions = [
+            {
+                "prediction_date": prediction_date,
+                "target_date": prediction_date + timedelta(days=days),
+                "timeframe": timeframe,
+                "current_price": float(current_prices[i]),
+                "predicted_price": float(predicted_prices[i]),
+                "predicted_direction": str(directions[i]),
+                "price_change_pct": float(price_change_pct[i]),
+                "confidence_score": 0.7,  # 간단화된 신뢰도
+            }
+            for i, prediction_date in enumerate(prediction_dates)
+            for timeframe, days, predicted_prices, price_change_pct, directions in (
+                timeframe_results
+            )
+        ]
+
+        logger.info(
+            "batched_prediction_simulation_completed",
+            symbol=symbol,
+            windows=len(X),
+            predictions_generated=len(predictions),
+        )
+
+        return predictions
+
     def _simulate_trades(
         self, predictions: List[Dict[str, Any]], price_data: pd.DataFrame, strategy: str
     ) -> List[Trade]:
@@ -24,6 +24,7 @@ import json
 from datetime import datetime
 
 from app.ml_prediction.config.ml_config import ml_settings, ModelConfig
+from app.ml_prediction.ml.data.feature_engineer import FeatureEngineer
 from app.common.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -286,10 +287,17 @@ class MultiOutputLSTMPredictor:
         # y_train을 리스트 형태로 변환 (모델 출력 순서에 맞춤)
         y_train_list = [y_train[f"{days}d"] for days in self.target_days]
 
+        # 슬라이딩 윈도우 뷰는 배치마다 고유 행에서 윈도우를 모아 공급 (윈도우 물리화 없음)
+        train_dataset = self._window_dataset(
+            X_train, y_train_list, batch_size, shuffle=True
+        )
+
         validation_data = None
         if X_val is not None and y_val is not None:
             y_val_list = [y_val[f"{days}d"] for days in self.target_days]
-            validation_data = (X_val, y_val_list)
+            validation_data = self._window_dataset(
+                X_val, y_val_list, batch_size, shuffle=False
+            ) or (X_val, y_val_list)
 
         # 기본 콜백 설정
         if callbacks_list is None:
@@ -309,16 +317,25 @@ class MultiOutputLSTMPredictor:
 
         try:
             # 모델 훈련
-            history = self.model.fit(
-                X_train,
-                y_train_list,
-                validation_data=validation_data,
-                epochs=epochs,
-                batch_size=batch_size,
-                callbacks=callbacks_list,
-                verbose=verbose,
-                shuffle=True,  # 시계열이지만 윈도우 단위로는 셔플 가능
-            )
+            if train_dataset is not None:
+                history = self.model.fit(
+                    train_dataset,
+                    validation_data=validation_data,
+                    epochs=epochs,
+                    callbacks=callbacks_list,
+                    verbose=verbose,
+                )
+            else:
+                history = self.model.fit(
+                    X_train,
+                    y_train_list,
+                    validation_data=validation_data,
+                    epochs=epochs,
+                    batch_size=batch_size,
+                    callbacks=callbacks_list,
+                    verbose=verbose,
+                    shuffle=True,  # 시계열이지만 윈도우 단위로는 셔플 가능
+                )
 
             self.training_history = history
 
@@ -542,6 +559,51 @@ class MultiOutputLSTMPredictor:
             logger.error("model_load_failed", filepath=filepath, error=str(e))
             raise
 
+    @staticmethod
+    def _window_dataset(
+        X: np.ndarray,
+        y_list: List[np.ndarray],
+        batch_size: int,
+        shuffle: bool,
+    ) -> Optional[tf.data.Dataset]:
+        """
+        슬라이딩 윈도우 뷰를 tf.data 파이프라인으로 변환
+
+        고유 행 (윈도우 수 + window_size - 1개)만 텐서로 올리고, 배치마다
+        윈도우 시작 인덱스로 행을 모아 (배치, window_size, 특성) 입력을 만듭니다.
+        물리화된 배열이면 None을 반환합니다 (기존 fit 경로 사용).
+
+        Args:
+            X: (윈도우 수, window_size, 특성) 특성 데이터
+            y_list: 모델 출력 순서의 타겟 배열 목록
+            batch_size: 배치 크기
+            shuffle: 에포크마다 윈도우 순서 셔플 여부
+
+        Returns:
+            (입력, 타겟 튜플) 배치 데이터셋 또는 None
+        """
+        source_rows = FeatureEngineer.window_source_rows(X)
+        if source_rows is None:
+            return None
+
+        rows = tf.constant(source_rows, dtype=tf.float32)
+        targets = tuple(tf.constant(y, dtype=tf.float32) for y in y_list)
+        offsets = tf.range(X.shape[1], dtype=tf.int64)
+
+        def gather_windows(window_starts):
+            windows = tf.gather(rows, window_starts[:, None] + offsets[None, :])
+            return windows, tuple(tf.gather(y, window_starts) for y in targets)
+
+        dataset = tf.data.Dataset.range(len(X))
+        if shuffle:
+            dataset = dataset.shuffle(len(X), reshuffle_each_iteration=True)
+
+        return (
+            dataset.batch(batch_size)
+            .map(gather_windows, num_parallel_calls=tf.data.AUTOTUNE)
+            .prefetch(tf.data.AUTOTUNE)
+        )
+
     def _create_default_callbacks(self) -> List[callbacks.Callback]:
         """기본 콜백 생성"""
         callback_list = []
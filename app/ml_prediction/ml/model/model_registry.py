@@ -0,0 +1,390 @@
+"""
+모델 레지스트리
+
+이 파일은 프로세스 전체에서 공유하는 로드된 모델 캐시를 구현합니다.
+예측기 인스턴스마다 모델을 따로 로드하던 방식 대신, 한 프로세스에서
+심볼/버전별 모델과 스케일러를 한 번만 로드해 재사용합니다.
+
+주요 기능:
+- LRU + 메모리 크기 기반 모델 제거
+- 활성 모델 버전 변경 감지 (MLModelRepository.find_active_model 주기적 재확인)
+- 같은 모델 동시 로드 방지 (키별 잠금)
+- 서버 시작 시 활성 모델 미리 로드
+"""
+
+from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+import os
+import threading
+import time
+
+from app.ml_prediction.ml.model.lstm_model import MultiOutputLSTMPredictor
+from app.ml_prediction.ml.data.feature_engineer import FeatureEngineer
+from app.ml_prediction.infra.model.entity.ml_model import MLModel
+from app.ml_prediction.infra.model.repository.ml_model_repository import (
+    MLModelRepository,
+)
+from app.ml_prediction.config.ml_config import ml_settings
+from app.common.infra.database.config.database_config import SessionLocal
+from app.common.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class RegisteredModel:
+    """레지스트리에 로드된 모델 (모델 + 해당 모델의 스케일러)"""
+
+    model_predictor: MultiOutputLSTMPredictor
+    model_entity: MLModel
+    feature_scaler: Any = None
+    target_scalers: Dict[str, Any] = field(default_factory=dict)
+    size_bytes: int = 0
+    loaded_at: datetime = field(default_factory=datetime.now)
+    last_checked_at: float = field(default_factory=time.monotonic)
+
+    def apply_scalers(self, feature_engineer: FeatureEngineer) -> None:
+        """
+        모델 학습 시 저장된 스케일러를 특성 엔지니어에 적용
+
+        특성 엔지니어는 여러 심볼이 공유하므로, 저장된 스케일러가 없어도
+        이전 모델의 스케일러가 남지 않도록 항상 덮어씁니다.
+        """
+        if self.feature_scaler is None or not self.target_scalers:
+            logger.warning(
+                "model_scalers_missing",
+                symbol=self.model_entity.symbol,
+                model_version=self.model_entity.model_version,
+                feature_scaler=self.feature_scaler is not None,
+                target_scalers=len(self.target_scalers),
+            )
+        feature_engineer.feature_scaler = self.feature_scaler
+        feature_engineer.target_scalers = dict(self.target_scalers)
+
+
+class ModelRegistry:
+    """
+    프로세스 공유 모델 레지스트리
+
+    캐시 키는 "{symbol}:{version}"이며, 버전을 지정하지 않은 요청은 "{symbol}:active"로
+    활성 모델을 가리킵니다. 활성 모델 항목은 model_version_check_seconds마다
+    DB의 활성 모델과 비교해 버전이 바뀌었으면 다시 로드합니다.
+    """
+
+    def __init__(
+        self,
+        max_models: int = None,
+        max_memory_mb: int = None,
+        version_check_seconds: int = None,
+        model_type: str = "lstm",
+    ):
+        """
+        레지스트리 초기화
+
+        Args:
+            max_models: 유지할 최대 모델 수
+            max_memory_mb: 로드된 모델 가중치 합계 상한 (MB)
+            version_check_seconds: 활성 모델 버전 재확인 주기 (초)
+            model_type: 조회할 모델 타입
+        """
+        self.max_models = max_models or ml_settings.prediction.model_cache_size
+        self.max_memory_bytes = (
+            max_memory_mb or ml_settings.prediction.model_cache_max_memory_mb
+        ) * 1024 * 1024
+        self.version_check_seconds = (
+            version_check_seconds
+            if version_check_seconds is not None
+            else ml_settings.prediction.model_version_check_seconds
+        )
+        self.model_type = model_type
+
+        self._entries: "OrderedDict[str, RegisteredModel]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    # ====================
+    # 조회
+    # ====================
+
+    def get(
+        self, symbol: str, model_version: Optional[str] = None
+    ) -> RegisteredModel:
+        """
+        모델 조회 (없으면 로드)
+
+        Args:
+            symbol: 심볼
+            model_version: 모델 버전 (None이면 활성 모델)
+
+        Returns:
+            RegisteredModel
+        """
+        cache_key = self._cache_key(symbol, model_version)
+
+        entry = self._get_valid_entry(symbol, model_version, cache_key)
+        if entry is not None:
+            return entry
+
+        # 같은 모델을 여러 스레드가 동시에 로드하지 않도록 키별 잠금
+        with self._lock:
+            load_lock = self._load_locks.setdefault(cache_key, threading.Lock())
+
+        with load_lock:
+            entry = self._get_valid_entry(symbol, model_version, cache_key)
+            if entry is not None:
+                return entry
+
+            with self._lock:
+                self._stats["misses"] += 1
+
+            entry = self._load(symbol, model_version)
+            self._put(cache_key, entry)
+            return entry
+
+    def preload_active_models(
+        self, symbols: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        활성 모델 미리 로드 (서버 시작 시 첫 예측 요청의 로드 지연 제거)
+
+        Args:
+            symbols: 로드할 심볼 목록 (None이면 모든 활성 모델, 최대 max_models개)
+
+        Returns:
+            로드 결과 요약
+        """
+        start_time = time.time()
+
+        session = SessionLocal()
+        try:
+            active_models = MLModelRepository(session).find_active_models(
+                self.model_type
+            )
+        except Exception as e:
+            logger.error("active_models_query_failed", error=str(e))
+            return {"loaded": [], "failed": {}, "error": str(e)}
+        finally:
+            session.close()
+
+        if symbols is not None:
+            active_models = [m for m in active_models if m.symbol in symbols]
+        active_models = active_models[: self.max_models]
+
+        loaded, failed = [], {}
+        for model_entity in active_models:
+            try:
+                entry = self._load_entity(model_entity)
+                self._put(self._cache_key(model_entity.symbol, None), entry)
+                loaded.append(model_entity.symbol)
+            except Exception as e:
+                failed[model_entity.symbol] = str(e)
+                logger.warning(
+                    "model_preload_failed", symbol=model_entity.symbol, error=str(e)
+                )
+
+        summary = {
+            "loaded": loaded,
+            "failed": failed,
+            "elapsed_seconds": round(time.time() - start_time, 2),
+        }
+        logger.info("active_models_preloaded", **summary)
+        return summary
+
+    # ====================
+    # 관리
+    # ====================
+
+    def invalidate(self, symbol: Optional[str] = None) -> int:
+        """
+        캐시 항목 무효화
+
+        Args:
+            symbol: 특정 심볼만 무효화 (None이면 전체)
+
+        Returns:
+            제거된 항목 수
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if symbol is None or key.split(":", 1)[0] == symbol
+            ]
+            for key in keys:
+                del self._entries[key]
+            self._stats["invalidations"] += len(keys)
+
+        logger.info("model_registry_invalidated", symbol=symbol or "all", removed=len(keys))
+        return len(keys)
+
+    def clear(self) -> None:
+        """전체 캐시 초기화"""
+        self.invalidate()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """레지스트리 통계"""
+        with self._lock:
+            return {
+                "loaded_models_count": len(self._entries),
+                "loaded_models": list(self._entries.keys()),
+                "memory_mb": round(self._total_bytes() / (1024 * 1024), 2),
+                "max_models": self.max_models,
+                "max_memory_mb": round(self.max_memory_bytes / (1024 * 1024), 2),
+                **self._stats,
+            }
+
+    # ====================
+    # 내부 헬퍼
+    # ====================
+
+    @staticmethod
+    def _cache_key(symbol: str, model_version: Optional[str]) -> str:
+        return f"{symbol}:{model_version or 'active'}"
+
+    def _get_valid_entry(
+        self, symbol: str, model_version: Optional[str], cache_key: str
+    ) -> Optional[RegisteredModel]:
+        """캐시 항목 조회 (활성 모델은 버전 변경 여부 재확인)"""
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(cache_key)
+
+        if model_version is None and self._needs_version_check(entry):
+            if not self._is_still_active(symbol, entry):
+                with self._lock:
+                    if self._entries.get(cache_key) is entry:
+                        del self._entries[cache_key]
+                    self._stats["invalidations"] += 1
+                logger.info(
+                    "active_model_version_changed",
+                    symbol=symbol,
+                    cached_version=entry.model_entity.model_version,
+                )
+                return None
+
+        with self._lock:
+            self._stats["hits"] += 1
+        return entry
+
+    def _needs_version_check(self, entry: RegisteredModel) -> bool:
+        return time.monotonic() - entry.last_checked_at >= self.version_check_seconds
+
+    def _is_still_active(self, symbol: str, entry: RegisteredModel) -> bool:
+        """DB의 활성 모델이 캐시된 모델과 같은지 확인"""
+        session = SessionLocal()
+        try:
+            active = MLModelRepository(session).find_active_model(
+                self.model_type, symbol
+            )
+        except Exception as e:
+            # DB 오류 시 캐시된 모델을 계속 사용
+            logger.warning("active_model_check_failed", symbol=symbol, error=str(e))
+            return True
+        finally:
+            session.close()
+
+        entry.last_checked_at = time.monotonic()
+
+        if active is None:
+            return False
+        return (active.id, active.model_version) == (
+            entry.model_entity.id,
+            entry.model_entity.model_version,
+        )
+
+    def _load(self, symbol: str, model_version: Optional[str]) -> RegisteredModel:
+        """DB에서 모델 정보를 조회하고 모델 파일과 스케일러 로드"""
+        session = SessionLocal()
+        model_repository = MLModelRepository(session)
+
+        try:
+            if model_version:
+                model_entity = model_repository.find_by_name_and_version(
+                    f"{symbol.replace('^', '')}_{self.model_type}", model_version
+                )
+            else:
+                model_entity = model_repository.find_active_model(
+                    self.model_type, symbol
+                )
+        finally:
+            session.close()
+
+        if not model_entity:
+            raise ValueError(f"No suitable model found for {symbol}")
+
+        return self._load_entity(model_entity)
+
+    def _load_entity(self, model_entity: MLModel) -> RegisteredModel:
+        """모델 엔티티로부터 모델 파일과 스케일러 로드"""
+        model_predictor = MultiOutputLSTMPredictor(
+            input_shape=(ml_settings.model.window_size, 0),  # 실제 크기는 로드 시 결정
+            config=ml_settings.model,
+            model_name=model_entity.model_name,
+        )
+        model_predictor.load_model(
+            filepath=model_entity.model_path,
+            load_format=ml_settings.storage.model_format,
+        )
+
+        # 모델별 스케일러 로드 (공유 전처리기의 스케일러를 덮어쓰지 않도록 별도 보관)
+        scaler_holder = FeatureEngineer()
+        scaler_dir = os.path.join(os.path.dirname(model_entity.model_path), "scalers")
+        if os.path.exists(scaler_dir):
+            scaler_holder.load_scalers(scaler_dir)
+
+        entry = RegisteredModel(
+            model_predictor=model_predictor,
+            model_entity=model_entity,
+            feature_scaler=scaler_holder.feature_scaler,
+            target_scalers=dict(scaler_holder.target_scalers),
+            size_bytes=self._estimate_size(model_predictor),
+        )
+
+        logger.info(
+            "model_registry_loaded",
+            symbol=model_entity.symbol,
+            model_name=model_entity.model_name,
+            model_version=model_entity.model_version,
+            size_mb=round(entry.size_bytes / (1024 * 1024), 2),
+        )
+        return entry
+
+    @staticmethod
+    def _estimate_size(model_predictor: MultiOutputLSTMPredictor) -> int:
+        """모델 가중치 크기 추정 (float32 파라미터 수 x 4바이트)"""
+        try:
+            return int(model_predictor.model.count_params()) * 4
+        except Exception:
+            return 0
+
+    def _put(self, cache_key: str, entry: RegisteredModel) -> None:
+        """항목 저장 후 개수/메모리 상한을 넘으면 가장 오래 사용되지 않은 항목 제거"""
+        with self._lock:
+            self._entries[cache_key] = entry
+            self._entries.move_to_end(cache_key)
+
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_models
+                or self._total_bytes() > self.max_memory_bytes
+            ):
+                evicted_key, _ = self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+                logger.info("model_registry_evicted", cache_key=evicted_key)
+
+    def _total_bytes(self) -> int:
+        return sum(entry.size_bytes for entry in self._entries.values())
+
+
+# 프로세스 공유 레지스트리 인스턴스
+model_registry = ModelRegistry()
@@ -12,22 +12,20 @@
 """
 
 from typing import List, Dict, Any, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timedelta
 import numpy as np
 import pandas as pd
 import uuid
-import os
 
 from app.ml_prediction.ml.model.lstm_model import MultiOutputLSTMPredictor
+from app.ml_prediction.ml.model.model_registry import ModelRegistry, model_registry
 from app.ml_prediction.ml.data.preprocessor import MLDataPreprocessor
 from app.ml_prediction.infra.model.entity.ml_prediction import MLPrediction
 from app.ml_prediction.infra.model.entity.ml_model import MLModel
 from app.ml_prediction.infra.model.repository.ml_prediction_repository import (
     MLPredictionRepository,
 )
-from app.ml_prediction.infra.model.repository.ml_model_repository import (
-    MLModelRepository,
-)
 from app.ml_prediction.config.ml_config import ml_settings
 from app.common.infra.database.config.database_config import SessionLocal
 from app.common.utils.logging_config import get_logger
@@ -46,6 +44,7 @@ class MultiTimeframePredictor:
         self,
         preprocessor: Optional[MLDataPreprocessor] = None,
         confidence_method: str = None,
+        registry: Optional[ModelRegistry] = None,
     ):
         """
         예측기 초기화
@@ -53,14 +52,15 @@ class MultiTimeframePredictor:
         Args:
             preprocessor: 데이터 전처리기
             confidence_method: 신뢰도 계산 방법
+            registry: 모델 레지스트리 (기본값: 프로세스 공유 레지스트리)
         """
         self.preprocessor = preprocessor or MLDataPreprocessor()
         self.confidence_method = (
             confidence_method or ml_settings.prediction.confidence_method
         )
 
-        # 로드된 모델들 캐시
-        self.loaded_models: Dict[str, Tuple[MultiOutputLSTMPredictor, MLModel]] = {}
+        # 로드된 모델 캐시 (프로세스 공유)
+        self.model_registry = registry or model_registry
 
         # 예측 세션 정보
         self.current_predictions = {}
@@ -179,64 +179,21 @@ class MultiTimeframePredictor:
                 )
                 raise
 
-            # 7. 예측 결과 구성
-            current_price = data_metadata.get("last_price", 0.0)
-            prediction_results = []
-
-            for timeframe, predicted_price in denormalized_predictions.items():
-                days = int(timeframe.replace("d", ""))
-                target_date = prediction_date + timedelta(days=days)
-
-                # 가격 변화율 계산
-                price_change_percent = (
-                    (predicted_price[0] - current_price) / current_price
-                ) * 100
-
-                # 예측 방향 결정
-                if price_change_percent > 0.5:
-                    predicted_direction = "up"
-                elif price_change_percent < -0.5:
-                    predicted_direction = "down"
-                else:
-                    predicted_direction = "neutral"
-
-                prediction_result = {
-                    "timeframe": timeframe,
-                    "target_date": target_date,
-                    "predicted_price": float(predicted_price[0]),
-                    "predicted_direction": predicted_direction,
-                    "price_change_percent": float(price_change_percent),
-                    "confidence_score": confidence_scores.get(timeframe, 0.5),
-                }
-
-                prediction_results.append(prediction_result)
-
-            # 8. 예측 일관성 검증
-            consistency_score = self._calculate_consistency_score(prediction_results)
-
-            # 9. 최종 예측 결과
-            final_result = {
-                "status": "success",
-                "batch_id": batch_id,
-                "symbol": symbol,
-                "prediction_date": prediction_date,
-                "current_price": current_price,
-                "model_id": getattr(model_entity, "id", None) if model_entity else None,
-                "model_version": (
-                    getattr(model_entity, "model_version", "unknown")
-                    if model_entity
-                    else "unknown"
-                ),
-                "model_type": (
-                    getattr(model_entity, "model_type", "lstm")
-                    if model_entity
-                    else "lstm"
-                ),
-                "predictions": prediction_results,
-                "consistency_score": consistency_score,
-                "data_metadata": data_metadata,
-                "created_at": datetime.now().isoformat(),
-            }
+            # 7~9. 예측 결과 구성, 일관성 검증, 최종 결과
+            final_result = self._build_prediction_result(
+                symbol=symbol,
+                prediction_date=prediction_date,
+                batch_id=batch_id,
+                model_entity=model_entity,
+                data_metadata=data_metadata,
+                predicted_prices={
+                    timeframe: float(predicted_price[0])
+                    for timeframe, predicted_price in denormalized_predictions.items()
+                },
+                confidence_scores=confidence_scores,
+            )
+            prediction_results = final_result["predictions"]
+            consistency_score = final_result["consistency_score"]
 
             # 10. 예측 결과 저장 (predictor 레벨에서는 비활성화, 서비스 레벨에서 처리)
             # if save_prediction:
@@ -277,138 +234,292 @@ class MultiTimeframePredictor:
         symbols: List[str],
         prediction_date: date = None,
         save_predictions: bool = True,
+        use_sentiment: bool = False,
+        max_workers: Optional[int] = None,
     ) -> Dict[str, Dict[str, Any]]:
         """
         여러 심볼에 대한 배치 예측
 
+        심볼별 예측용 데이터를 병렬로 준비하고, 같은 모델 파일을 쓰는 심볼의 윈도우를
+        쌓아 앙상블 신뢰도 샘플까지 한 번의 forward pass로 추론한 뒤,
+        전체 예측 행을 한 번의 대량 INSERT로 저장합니다.
+
         Args:
             symbols: 심볼 목록
             prediction_date: 예측 기준 날짜
             save_predictions: 예측 결과 저장 여부
+            use_sentiment: 감정분석 특성 사용 여부
+            max_workers: 데이터 준비 스레드 수 (기본값: 심볼 수, 최대 8)
 
         Returns:
             심볼별 예측 결과 딕셔너리
         """
         prediction_date = prediction_date or date.today()
+        start_time = datetime.now()
 
         logger.info(
             "batch_prediction_started", symbols=symbols, prediction_date=prediction_date
         )
 
-        results = {}
+        results: Dict[str, Dict[str, Any]] = {}
+        feature_engineer = self.preprocessor.feature_engineer
+        feature_engineer.use_sentiment_features = use_sentiment
 
+        # 1. 모델 조회 (프로세스 공유 레지스트리)
+        entries = {}
         for symbol in symbols:
             try:
-                result = self.predict_price(
-                    symbol=symbol,
-                    prediction_date=prediction_date,
-                    save_prediction=save_predictions,
+                entries[symbol] = self.model_registry.get(symbol)
+            except Exception as e:
+                logger.error(
+                    "batch_prediction_failed_for_symbol", symbol=symbol, error=str(e)
                 )
-                results[symbol] = result
+                results[symbol] = {"error": str(e), "status": "failed"}
 
-                logger.debug(
-                    "batch_prediction_completed_for_symbol",
-                    symbol=symbol,
-                    batch_id=result["batch_id"],
+        # 2. 예측용 데이터 병렬 준비 (정규화는 모델별 스케일러로 아래에서 수행)
+        prepared: Dict[str, Tuple[np.ndarray, Dict[str, Any]]] = {}
+        if entries:
+            workers = max_workers or min(8, len(entries))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(
+                        self.preprocessor.prepare_prediction_data,
+                        symbol=symbol,
+                        end_date=prediction_date,
+                        use_sentiment=use_sentiment,
+                        normalize=False,
+                    ): symbol
+                    for symbol in entries
+                }
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    try:
+                        prepared[symbol] = future.result()
+                    except Exception as e:
+                        logger.error(
+                            "batch_prediction_failed_for_symbol",
+                            symbol=symbol,
+                            error=str(e),
+                        )
+                        results[symbol] = {"error": str(e), "status": "failed"}
+
+        # 3. 같은 모델 파일을 쓰는 심볼끼리 묶어 한 번에 추론
+        groups: Dict[str, List[str]] = {}
+        for symbol in symbols:
+            if symbol in prepared:
+                groups.setdefault(entries[symbol].model_entity.model_path, []).append(
+                    symbol
+                )
+
+        forward_passes = 0
+        for group_symbols in groups.values():
+            entry = entries[group_symbols[0]]
+            try:
+                entry.apply_scalers(feature_engineer)
+                X_group = np.concatenate(
+                    [
+                        feature_engineer.normalize_features(
+                            prepared[symbol][0], fit_scaler=False
+                        )
+                        for symbol in group_symbols
+                    ]
                 )
 
+                raw_predictions, confidence_scores = self._predict_stacked(
+                    entry.model_predictor, X_group
+                )
+                forward_passes += 1
+                denormalized_predictions = feature_engineer.denormalize_predictions(
+                    raw_predictions
+                )
             except Exception as e:
                 logger.error(
-                    "batch_prediction_failed_for_symbol", symbol=symbol, error=str(e)
+                    "batch_prediction_group_failed",
+                    symbols=group_symbols,
+                    error=str(e),
                 )
-                results[symbol] = {"error": str(e), "status": "failed"}
+                for symbol in group_symbols:
+                    results[symbol] = {"error": str(e), "status": "failed"}
+                continue
+
+            for i, symbol in enumerate(group_symbols):
+                final_result = self._build_prediction_result(
+                    symbol=symbol,
+                    prediction_date=prediction_date,
+                    batch_id=str(uuid.uuid4()),
+                    model_entity=entry.model_entity,
+                    data_metadata=prepared[symbol][1],
+                    predicted_prices={
+                        timeframe: float(values[i])
+                        for timeframe, values in denormalized_predictions.items()
+                    },
+                    confidence_scores={
+                        timeframe: float(values[i])
+                        for timeframe, values in confidence_scores.items()
+                    },
+                )
+                self.current_predictions[final_result["batch_id"]] = final_result
+                results[symbol] = final_result
 
-        successful_predictions = len([r for r in results.values() if "error" not in r])
+        # 4. 전체 예측 행 한 번에 저장
+        successful_results = [r for r in results.values() if "error" not in r]
+        if save_predictions and successful_results:
+            self._save_predictions_bulk(successful_results)
 
         logger.info(
             "batch_prediction_completed",
             total_symbols=len(symbols),
-            successful=successful_predictions,
-            failed=len(symbols) - successful_predictions,
+            successful=len(successful_results),
+            failed=len(symbols) - len(successful_results),
+            model_groups=len(groups),
+            forward_passes=forward_passes,
+            elapsed_seconds=round((datetime.now() - start_time).total_seconds(), 2),
         )
 
-        return results
+        return {symbol: results[symbol] for symbol in symbols if symbol in results}
 
-    def _load_model(
-        self, symbol: str, model_version: Optional[str] = None
-    ) -> Tuple[MultiOutputLSTMPredictor, MLModel]:
+    def _predict_stacked(
+        self, model_predictor: MultiOutputLSTMPredictor, X: np.ndarray
+    ) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
         """
-        모델 로드 (캐시 활용)
+        여러 윈도우를 한 번의 forward pass로 예측하고 신뢰도 계산
+
+        앙상블 방식이면 각 윈도우를 confidence_samples번 반복해 같은 호출에 포함시키므로
+        샘플마다 predict를 다시 호출하던 방식과 같은 결과를 한 번에 얻습니다.
 
         Args:
-            symbol: 심볼
-            model_version: 모델 버전
+            model_predictor: 모델 예측기
+            X: (윈도우 수, window_size, 특성) 정규화된 입력
 
         Returns:
-            (모델 예측기, 모델 엔티티) 튜플
+            (타임프레임별 예측 (윈도우 수,), 타임프레임별 신뢰도 (윈도우 수,))
         """
-        cache_key = f"{symbol}_{model_version or 'active'}"
+        n_windows = len(X)
+        repeats = (
+            ml_settings.prediction.confidence_samples
+            if self.confidence_method == "ensemble"
+            else 1
+        )
 
-        # 캐시에서 확인
-        if cache_key in self.loaded_models:
-            logger.debug("model_loaded_from_cache", cache_key=cache_key)
-            return self.loaded_models[cache_key]
+        outputs = model_predictor.predict(np.repeat(X, repeats, axis=0), verbose=0)
 
-        # 데이터베이스에서 모델 정보 조회
-        session = SessionLocal()
-        model_repository = MLModelRepository(session)
+        predictions = {}
+        confidence_scores = {}
+        for timeframe, values in outputs.items():
+            samples = np.asarray(values, dtype=np.float64).reshape(n_windows, repeats)
+            predictions[timeframe] = samples[:, 0]
+
+            if self.confidence_method == "ensemble":
+                # 상대적 표준편차를 신뢰도로 변환 (0.1~0.9, 평균 0이면 0.5)
+                mean_pred = samples.mean(axis=1)
+                std = samples.std(axis=1)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    confidence = np.clip(1.0 - std / np.abs(mean_pred), 0.1, 0.9)
+                confidence_scores[timeframe] = np.where(mean_pred != 0, confidence, 0.5)
+            elif self.confidence_method == "dropout":
+                confidence_scores[timeframe] = np.full(n_windows, 0.65)
+            else:
+                confidence_scores[timeframe] = np.full(n_windows, 0.7)
 
-        try:
-            if model_version:
-                # 특정 버전 모델 조회
-                model_entity = model_repository.find_by_name_and_version(
-                    f"{symbol.replace('^', '')}_lstm", model_version
-                )
+        return predictions, confidence_scores
+
+    def _build_prediction_result(
+        self,
+        symbol: str,
+        prediction_date: date,
+        batch_id: str,
+        model_entity: Optional[MLModel],
+        data_metadata: Dict[str, Any],
+        predicted_prices: Dict[str, float],
+        confidence_scores: Dict[str, float],
+    ) -> Dict[str, Any]:
+        """
+        타임프레임별 예측 가격으로 최종 예측 결과 구성
+
+        Args:
+            symbol: 심볼
+            prediction_date: 예측 기준 날짜
+            batch_id: 배치 ID
+            model_entity: 모델 엔티티
+            data_metadata: 예측용 데이터 메타데이터
+            predicted_prices: 타임프레임별 역정규화된 예측 가격
+            confidence_scores: 타임프레임별 신뢰도
+
+        Returns:
+            최종 예측 결과
+        """
+        current_price = data_metadata.get("last_price", 0.0)
+        prediction_results = []
+
+        for timeframe, predicted_price in predicted_prices.items():
+            days = int(timeframe.replace("d", ""))
+            target_date = prediction_date + timedelta(days=days)
+
+            # 가격 변화율 계산
+            price_change_percent = (
+                (predicted_price - current_price) / current_price
+            ) * 100
+
+            # 예측 방향 결정
+            if price_change_percent > 0.5:
+                predicted_direction = "up"
+            elif price_change_percent < -0.5:
+                predicted_direction = "down"
             else:
-                # 활성 모델 조회
-                model_entity = model_repository.find_active_model("lstm", symbol)
-
-            if not model_entity:
-                raise ValueError(f"No suitable model found for {symbol}")
-
-            # 모델 파일 로드
-            model_predictor = MultiOutputLSTMPredictor(
-                input_shape=(
-                    ml_settings.model.window_size,
-                    0,
-                ),  # 실제 크기는 로드 시 결정
-                config=ml_settings.model,
-                model_name=model_entity.model_name,
-            )
+                predicted_direction = "neutral"
 
-            model_predictor.load_model(
-                filepath=model_entity.model_path,
-                load_format=ml_settings.storage.model_format,
+            prediction_results.append(
+                {
+                    "timeframe": timeframe,
+                    "target_date": target_date,
+                    "predicted_price": float(predicted_price),
+                    "predicted_direction": predicted_direction,
+                    "price_change_percent": float(price_change_percent),
+                    "confidence_score": confidence_scores.get(timeframe, 0.5),
+                }
             )
 
-            # 스케일러 로드
-            scaler_dir = os.path.join(
-                os.path.dirname(model_entity.model_path), "scalers"
-            )
-            if os.path.exists(scaler_dir):
-                self.preprocessor.feature_engineer.load_scalers(scaler_dir)
+        # 예측 일관성 검증
+        consistency_score = self._calculate_consistency_score(prediction_results)
 
-            # 캐시에 저장
-            self.loaded_models[cache_key] = (model_predictor, model_entity)
+        return {
+            "status": "success",
+            "batch_id": batch_id,
+            "symbol": symbol,
+            "prediction_date": prediction_date,
+            "current_price": current_price,
+            "model_id": getattr(model_entity, "id", None) if model_entity else None,
+            "model_version": (
+                getattr(model_entity, "model_version", "unknown")
+                if model_entity
+                else "unknown"
+            ),
+            "model_type": (
+                getattr(model_entity, "model_type", "lstm") if model_entity else "lstm"
+            ),
+            "predictions": prediction_results,
+            "consistency_score": consistency_score,
+            "data_metadata": data_metadata,
+            "created_at": datetime.now().isoformat(),
+        }
 
-            logger.info(
-                "model_loaded",
-                symbol=symbol,
-                model_name=(
-                    getattr(model_entity, "model_name", "unknown")
-                    if model_entity
-                    else "unknown"
-                ),
-                model_version=(
-                    getattr(model_entity, "model_version", "unknown")
-                    if model_entity
-                    else "unknown"
-                ),
-                cache_key=cache_key,
-            )
+    def _load_model(
+        self, symbol: str, model_version: Optional[str] = None
+    ) -> Tuple[MultiOutputLSTMPredictor, MLModel]:
+        """
+        모델 로드 (프로세스 공유 레지스트리 활용)
 
-            return model_predictor, model_entity
+        캐시에서 가져온 경우에도 해당 모델의 스케일러를 전처리기에 다시 적용합니다.
+
+        Args:
+            symbol: 심볼
+            model_version: 모델 버전
 
+        Returns:
+            (모델 예측기, 모델 엔티티) 튜플
+        """
+        try:
+            entry = self.model_registry.get(symbol, model_version)
         except Exception as e:
             logger.error(
                 "model_load_failed",
@@ -417,8 +528,16 @@ class MultiTimeframePredictor:
                 error=str(e),
             )
             raise
-        finally:
-            session.close()
+
+        entry.apply_scalers(self.preprocessor.feature_engineer)
+
+        logger.debug(
+            "model_resolved",
+            symbol=symbol,
+            model_version=entry.model_entity.model_version,
+        )
+
+        return entry.model_predictor, entry.model_entity
 
     def _calculate_confidence_scores(
         self,
@@ -655,6 +774,59 @@ class MultiTimeframePredictor:
         finally:
             session.close()
 
+    def _save_predictions_bulk(
+        self, prediction_results: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """
+        여러 심볼의 예측 결과를 한 번의 대량 INSERT로 저장
+
+        Args:
+            prediction_results: 심볼별 최종 예측 결과 목록
+
+        Returns:
+            저장 결과 통계
+        """
+        prediction_entities = [
+            MLPrediction.create_prediction(
+                symbol=result["symbol"],
+                prediction_date=result["prediction_date"],
+                timeframe=pred["timeframe"],
+                target_date=pred["target_date"],
+                batch_id=result["batch_id"],
+                current_price=result["current_price"],
+                predicted_price=pred["predicted_price"],
+                confidence_score=pred["confidence_score"],
+                model_version=result.get("model_version") or "unknown",
+                model_type=result.get("model_type") or "lstm",
+                features_used=result["data_metadata"].get("feature_names", []),
+            )
+            for result in prediction_results
+            for pred in result["predictions"]
+        ]
+
+        session = SessionLocal()
+        try:
+            save_stats = MLPredictionRepository(session).insert_bulk(
+                prediction_entities
+            )
+            logger.info(
+                "batch_predictions_saved_to_database",
+                symbols=len(prediction_results),
+                **save_stats,
+            )
+            return save_stats
+
+        except Exception as e:
+            logger.error("batch_prediction_save_failed", error=str(e))
+            return {
+                "saved": 0,
+                "duplicates": 0,
+                "errors": len(prediction_entities),
+                "total": len(prediction_entities),
+            }
+        finally:
+            session.close()
+
     def get_recent_predictions(
         self, symbol: str, days: int = 7
     ) -> List[Dict[str, Any]]:
@@ -708,14 +880,16 @@ class MultiTimeframePredictor:
 
     def clear_model_cache(self) -> None:
         """모델 캐시 초기화"""
-        self.loaded_models.clear()
+        self.model_registry.clear()
         logger.info("model_cache_cleared")
 
     def get_predictor_stats(self) -> Dict[str, Any]:
         """예측기 통계 정보 반환"""
+        registry_stats = self.model_registry.get_stats()
         return {
-            "loaded_models_count": len(self.loaded_models),
-            "loaded_models": list(self.loaded_models.keys()),
+            "loaded_models_count": registry_stats["loaded_models_count"],
+            "loaded_models": registry_stats["loaded_models"],
+            "model_registry": registry_stats,
             "current_predictions_count": len(self.current_predictions),
             "confidence_method": self.confidence_method,
             "config": {
@@ -11,7 +11,7 @@
 - 모델 성능 평가 및 저장
 """
 
-from typing import List, Dict, Any, Optional, Tuple, Union
+from typing import List, Dict, Any, Optional, Tuple, Union, Callable
 from datetime import date, datetime, timedelta
 import numpy as np
 import pandas as pd
@@ -22,6 +22,9 @@ from dataclasses import asdict
 
 from app.ml_prediction.ml.model.lstm_model import MultiOutputLSTMPredictor
 from app.ml_prediction.ml.data.preprocessor import MLDataPreprocessor
+from app.ml_prediction.ml.model.training_orchestrator import (
+    ParallelTrainingOrchestrator,
+)
 from app.ml_prediction.infra.model.entity.ml_model import MLModel
 from app.ml_prediction.infra.model.repository.ml_model_repository import (
     MLModelRepository,
@@ -92,6 +95,7 @@ class ModelTrainer:
         save_model: bool = True,
         force_retrain: bool = False,
         use_sentiment: bool = False,
+        reuse_stored: bool = False,
     ) -> Dict[str, Any]:
         """
         모델 훈련 실행
@@ -104,6 +108,7 @@ class ModelTrainer:
             model_version: 모델 버전
             save_model: 모델 저장 여부
             force_retrain: 강제 재훈련 여부
+            reuse_stored: 미리 준비된 특성 저장소를 최신화 없이 사용 (병렬 훈련 작업자)
 
         Returns:
             훈련 결과 딕셔너리
@@ -139,6 +144,7 @@ class ModelTrainer:
                 end_date=end_date,
                 force_refresh=force_retrain,
                 use_sentiment=use_sentiment,
+                reuse_stored=reuse_stored,
             )
 
             # 2. 모델 생성 및 구성
@@ -268,27 +274,63 @@ class ModelTrainer:
         start_date: date,
         end_date: date,
         base_model_name: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        threads_per_worker: Optional[int] = None,
+        use_sentiment: bool = False,
+        progress_callback: Optional[
+            Callable[[str, Dict[str, Any], int, int], None]
+        ] = None,
     ) -> Dict[str, Dict[str, Any]]:
         """
         여러 심볼에 대해 모델 훈련
 
+        작업자 수가 2 이상이면 심볼별 훈련을 프로세스 풀에서 병렬로 실행하고,
+        1이면 현재 프로세스에서 순차로 실행합니다.
+
         Args:
             symbols: 심볼 목록
             start_date: 시작 날짜
             end_date: 종료 날짜
             base_model_name: 기본 모델 이름
+            max_workers: 동시 훈련 프로세스 수 (None이면 설정값, 0이면 자동)
+            threads_per_worker: 프로세스당 스레드 수 (None이면 설정값)
+            use_sentiment: 감정 특성 사용 여부
+            progress_callback: 심볼 완료 시 호출 (symbol, result, completed, total)
 
         Returns:
             심볼별 훈련 결과 딕셔너리
         """
         results = {}
 
+        orchestrator = ParallelTrainingOrchestrator(
+            preprocessor=self.preprocessor,
+            model_config=self.model_config,
+            training_config=self.training_config,
+            max_workers=max_workers,
+            threads_per_worker=threads_per_worker,
+        )
+
         logger.info(
             "multiple_model_training_started",
             symbols=symbols,
             date_range_days=(end_date - start_date).days,
+            max_workers=orchestrator.max_workers,
         )
 
+        if orchestrator.max_workers > 1 and len(symbols) > 1:
+            results = orchestrator.run(
+                symbols,
+                start_date,
+                end_date,
+                base_model_name=base_model_name,
+                use_sentiment=use_sentiment,
+                progress_callback=progress_callback,
+            )
+            for result in results.values():
+                if result.get("session_id"):
+                    self.training_results[result["session_id"]] = result
+            return results
+
         for symbol in symbols:
             try:
                 model_name = base_model_name or f"{symbol.replace('^', '')}_lstm"
@@ -303,6 +345,7 @@ class ModelTrainer:
                     end_date=end_date,
                     model_name=model_name,
                     save_model=True,
+                    use_sentiment=use_sentiment,
                 )
 
                 results[symbol] = result
@@ -319,6 +362,10 @@ class ModelTrainer:
                 )
                 results[symbol] = {"error": str(e), "status": "failed"}
 
+            orchestrator.report_progress(
+                symbol, results[symbol], results, len(symbols), progress_callback
+            )
+
         logger.info(
             "multiple_model_training_completed",
             total_symbols=len(symbols),
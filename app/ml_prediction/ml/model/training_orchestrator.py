@@ -0,0 +1,337 @@
+"""
+병렬 훈련 오케스트레이터
+
+이 파일은 여러 심볼의 모델을 프로세스 풀에서 동시에 훈련하는 오케스트레이터를 구현합니다.
+CPU 환경에서 작은 LSTM 하나는 코어를 모두 쓰지 못하므로, 프로세스당 스레드 수를
+제한하고 여러 심볼을 병렬로 훈련해 전체 재훈련 시간을 줄입니다.
+
+주요 기능:
+- 부모 프로세스에서 특성 저장소를 미리 준비 (작업자는 DB 조회 없이 메모리 맵만 읽음)
+- 작업자 프로세스별 TensorFlow/BLAS 스레드 수 제한
+- 완료 순서대로 진행 상황 집계 및 심볼별 결과 수집
+"""
+
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+import multiprocessing
+import os
+import time
+
+from app.ml_prediction.ml.data.preprocessor import MLDataPreprocessor
+from app.ml_prediction.config.ml_config import ml_settings, ModelConfig, TrainingConfig
+from app.common.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+# ====================
+# 작업자 프로세스
+# ====================
+
+
+def _init_training_worker(threads_per_worker: int) -> None:
+    """
+    작업자 프로세스 초기화 (TensorFlow 런타임 생성 전에 스레드 수 제한)
+
+    Args:
+        threads_per_worker: 프로세스당 연산 스레드 수
+    """
+    threads = str(threads_per_worker)
+    for env_name in (
+        "OMP_NUM_THREADS",
+        "MKL_NUM_THREADS",
+        "OPENBLAS_NUM_THREADS",
+        "TF_NUM_INTRAOP_THREADS",
+    ):
+        os.environ[env_name] = threads
+    os.environ["TF_NUM_INTEROP_THREADS"] = str(min(2, threads_per_worker))
+
+    import tensorflow as tf
+
+    try:
+        tf.config.threading.set_intra_op_parallelism_threads(threads_per_worker)
+        tf.config.threading.set_inter_op_parallelism_threads(
+            min(2, threads_per_worker)
+        )
+    except RuntimeError as e:
+        # 런타임이 이미 초기화된 경우 환경 변수 설정만 적용됨
+        logger.warning("training_worker_thread_config_failed", error=str(e))
+
+
+def _train_symbol_in_worker(task: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """
+    작업자 프로세스에서 한 심볼의 모델 훈련
+
+    Args:
+        task: 훈련 작업 정보 (심볼, 기간, 설정, 특성 저장소 경로)
+
+    Returns:
+        (심볼, 훈련 결과) 튜플
+    """
+    # TensorFlow는 스레드 설정 이후에 로드되도록 작업자 안에서 임포트
+    from app.ml_prediction.ml.model.trainer import ModelTrainer
+
+    symbol = task["symbol"]
+
+    try:
+        preprocessor = MLDataPreprocessor(
+            cache_dir=task["cache_dir"], enable_caching=task["cache_dir"] is not None
+        )
+        trainer = ModelTrainer(
+            model_config=task["model_config"],
+            training_config=task["training_config"],
+            preprocessor=preprocessor,
+        )
+        result = trainer.train_model(
+            symbol=symbol,
+            start_date=task["start_date"],
+            end_date=task["end_date"],
+            model_name=task["model_name"],
+            save_model=True,
+            use_sentiment=task["use_sentiment"],
+            reuse_stored=task["reuse_stored"],
+        )
+        result["worker_pid"] = os.getpid()
+        return symbol, result
+
+    except Exception as e:
+        return symbol, {"error": str(e), "status": "failed"}
+
+
+# ====================
+# 오케스트레이터
+# ====================
+
+
+class ParallelTrainingOrchestrator:
+    """
+    다중 심볼 병렬 훈련 오케스트레이터
+
+    심볼마다 독립적인 훈련을 ProcessPoolExecutor(spawn)로 실행합니다.
+    동시 프로세스 수 x 프로세스당 스레드 수가 CPU 코어 수를 넘지 않도록 기본값을 정합니다.
+    """
+
+    def __init__(
+        self,
+        preprocessor: MLDataPreprocessor,
+        model_config: Optional[ModelConfig] = None,
+        training_config: Optional[TrainingConfig] = None,
+        max_workers: Optional[int] = None,
+        threads_per_worker: Optional[int] = None,
+        worker_fn: Callable[[Dict[str, Any]], Tuple[str, Dict[str, Any]]] = _train_symbol_in_worker,
+        worker_initializer: Optional[Callable[[int], None]] = _init_training_worker,
+    ):
+        """
+        오케스트레이터 초기화
+
+        Args:
+            preprocessor: 특성 저장소를 준비할 부모 프로세스의 전처리기
+            model_config: 모델 설정
+            training_config: 훈련 설정
+            max_workers: 동시 훈련 프로세스 수 (None이면 설정값, 0이면 자동)
+            threads_per_worker: 프로세스당 스레드 수 (None이면 설정값)
+            worker_fn: 작업자에서 실행할 훈련 함수 (모듈 수준 함수여야 spawn으로 전달 가능)
+            worker_initializer: 작업자 초기화 함수 (threads_per_worker를 인자로 받음)
+        """
+        self.preprocessor = preprocessor
+        self.worker_fn = worker_fn
+        self.worker_initializer = worker_initializer
+        self.model_config = model_config or ml_settings.model
+        self.training_config = training_config or ml_settings.training
+
+        self.threads_per_worker = max(
+            1, threads_per_worker or self.training_config.threads_per_worker
+        )
+        self.max_workers = self.resolve_worker_count(
+            max_workers
+            if max_workers is not None
+            else self.training_config.parallel_workers,
+            self.threads_per_worker,
+        )
+
+    @staticmethod
+    def resolve_worker_count(max_workers: int, threads_per_worker: int) -> int:
+        """
+        동시 훈련 프로세스 수 결정
+
+        Args:
+            max_workers: 요청한 프로세스 수 (0 이하면 자동)
+            threads_per_worker: 프로세스당 스레드 수
+
+        Returns:
+            프로세스 수 (최소 1)
+        """
+        if max_workers and max_workers > 0:
+            return max_workers
+        return max(1, (os.cpu_count() or 1) // max(1, threads_per_worker))
+
+    def run(
+        self,
+        symbols: List[str],
+        start_date: date,
+        end_date: date,
+        base_model_name: Optional[str] = None,
+        use_sentiment: bool = False,
+        force_refresh: bool = False,
+        progress_callback: Optional[
+            Callable[[str, Dict[str, Any], int, int], None]
+        ] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 심볼 병렬 훈련
+
+        Args:
+            symbols: 심볼 목록
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            base_model_name: 기본 모델 이름
+            use_sentiment: 감정 특성 사용 여부
+            force_refresh: 특성 저장소 무시하고 새로 생성
+            progress_callback: 심볼 완료 시 호출 (symbol, result, completed, total)
+
+        Returns:
+            심볼별 훈련 결과 딕셔너리
+        """
+        start_time = time.time()
+        total = len(symbols)
+        results: Dict[str, Dict[str, Any]] = {}
+
+        logger.info(
+            "parallel_training_started",
+            symbols=symbols,
+            max_workers=self.max_workers,
+            threads_per_worker=self.threads_per_worker,
+        )
+
+        # 1. 특성 저장소 준비 (DB 조회는 부모 프로세스에서 심볼당 한 번만)
+        #    저장소가 비활성화된 경우 작업자가 각자 데이터를 수집
+        use_store = self.preprocessor.feature_store is not None
+        tasks = []
+        for symbol in symbols:
+            if use_store:
+                try:
+                    rows = self.preprocessor.warm_feature_store(
+                        symbol,
+                        start_date,
+                        end_date,
+                        use_sentiment=use_sentiment,
+                        force_refresh=force_refresh,
+                    )
+                    logger.info("training_features_prepared", symbol=symbol, rows=rows)
+                except Exception as e:
+                    logger.error(
+                        "training_features_preparation_failed",
+                        symbol=symbol,
+                        error=str(e),
+                    )
+                    results[symbol] = {"error": str(e), "status": "failed"}
+                    self.report_progress(
+                        symbol, results[symbol], results, total, progress_callback
+                    )
+                    continue
+
+            tasks.append(
+                self._build_task(
+                    symbol, start_date, end_date, base_model_name, use_sentiment
+                )
+            )
+
+        # 2. 프로세스 풀에서 훈련 (TensorFlow는 fork 안전하지 않으므로 spawn 사용)
+        if tasks:
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(tasks)),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self.worker_initializer,
+                initargs=(self.threads_per_worker,) if self.worker_initializer else (),
+            ) as executor:
+                futures = {
+                    executor.submit(self.worker_fn, task): task["symbol"]
+                    for task in tasks
+                }
+
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    try:
+                        _, result = future.result()
+                    except Exception as e:
+                        # 작업자 프로세스 비정상 종료 등
+                        result = {"error": str(e), "status": "failed"}
+
+                    results[symbol] = result
+                    self.report_progress(
+                        symbol, result, results, total, progress_callback
+                    )
+
+        # 3. 결과 집계
+        elapsed_seconds = time.time() - start_time
+        successful = [s for s, r in results.items() if "error" not in r]
+        training_seconds = sum(
+            results[s].get("training_metadata", {}).get("training_duration_seconds", 0)
+            for s in successful
+        )
+
+        logger.info(
+            "parallel_training_completed",
+            total_symbols=total,
+            successful=len(successful),
+            failed=total - len(successful),
+            elapsed_seconds=round(elapsed_seconds, 2),
+            total_training_seconds=round(training_seconds, 2),
+            speedup=(
+                round(training_seconds / elapsed_seconds, 2) if elapsed_seconds else None
+            ),
+        )
+
+        # 입력 순서대로 반환
+        return {symbol: results[symbol] for symbol in symbols if symbol in results}
+
+    @staticmethod
+    def report_progress(
+        symbol: str,
+        result: Dict[str, Any],
+        results: Dict[str, Dict[str, Any]],
+        total: int,
+        progress_callback: Optional[Callable[[str, Dict[str, Any], int, int], None]],
+    ) -> None:
+        """심볼 완료 시 진행 상황 로깅 및 콜백 호출 (순차 훈련 경로에서도 사용)"""
+        completed = len(results)
+        logger.info(
+            "parallel_training_progress",
+            symbol=symbol,
+            status=result.get("status"),
+            completed=completed,
+            total=total,
+        )
+
+        if progress_callback:
+            try:
+                progress_callback(symbol, result, completed, total)
+            except Exception as e:
+                logger.warning("training_progress_callback_failed", error=str(e))
+
+    # ====================
+    # 내부 헬퍼
+    # ====================
+
+    def _build_task(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        base_model_name: Optional[str],
+        use_sentiment: bool,
+    ) -> Dict[str, Any]:
+        """작업자에 전달할 훈련 작업 생성 (피클 가능한 값만 포함)"""
+        feature_store = self.preprocessor.feature_store
+        return {
+            "symbol": symbol,
+            "start_date": start_date,
+            "end_date": end_date,
+            "model_name": base_model_name or f"{symbol.replace('^', '')}_lstm",
+            "use_sentiment": use_sentiment,
+            "model_config": self.model_config,
+            "training_config": self.training_config,
+            "cache_dir": self.preprocessor.cache_dir if feature_store else None,
+            "reuse_stored": feature_store is not None,
+        }
@@ -1,5 +1,7 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.news_crawler.infra.model.entity.content import Content
+from app.news_crawler.infra.model.entity.content_sentiments import ContentSentiment
 
 
 class ContentRepository:
@@ -24,6 +26,49 @@ class ContentRepository:
             is not None
         )
 
+    def find_existing_hashes(self, content_hashes: list[str]) -> set[str]:
+        """이미 저장된 content_hash 집합 (배치 중복 체크를 쿼리 1회로)"""
+        if not content_hashes:
+            return set()
+        rows = (
+            self.session.query(Content.content_hash)
+            .filter(Content.content_hash.in_(content_hashes))
+            .all()
+        )
+        return {row.content_hash for row in rows}
+
+    def bulk_insert(self, rows: list[dict]) -> dict[str, int]:
+        """
+        콘텐츠 다중 행 INSERT 후 content_hash → id 매핑 반환 (commit은 호출 측에서)
+
+        content_hash가 유니크이므로 할당된 ID는 해시로 한 번에 조회합니다.
+        """
+        if not rows:
+            return {}
+        self.session.execute(insert(Content.__table__), rows)
+        inserted = (
+            self.session.query(Content.id, Content.content_hash)
+            .filter(Content.content_hash.in_([row["content_hash"] for row in rows]))
+            .all()
+        )
+        return {row.content_hash: row.id for row in inserted}
+
+    def find_without_sentiment(self, after_id: int, limit: int) -> list:
+        """
+        감정분석 결과가 없는 콘텐츠를 id 순으로 조회 (키셋 페이지네이션)
+
+        OFFSET 없이 마지막으로 읽은 id 이후만 조회하므로 뒤쪽 페이지도 비용이 같습니다.
+        감정분석에 필요한 (id, title, summary)만 가져옵니다.
+        """
+        return (
+            self.session.query(Content.id, Content.title, Content.summary)
+            .outerjoin(ContentSentiment, ContentSentiment.content_id == Content.id)
+            .filter(Content.id > after_id, ContentSentiment.id.is_(None))
+            .order_by(Content.id)
+            .limit(limit)
+            .all()
+        )
+
     def get_by_symbol(self, symbol: str, limit: int = 50) -> list[Content]:
         return (
             self.session.query(Content)
@@ -1,3 +1,4 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.news_crawler.infra.model.entity.content_sentiments import ContentSentiment
 
@@ -16,6 +17,12 @@ class ContentSentimentRepository:
         """감정분석 결과 저장"""
         self.session.add(sentiment)
 
+    def bulk_insert(self, rows: list[dict]) -> int:
+        """감정분석 결과 다중 행 INSERT (commit은 호출 측에서)"""
+        if rows:
+            self.session.execute(insert(ContentSentiment.__table__), rows)
+        return len(rows)
+
     def get_by_content_id(self, content_id: int) -> ContentSentiment | None:
         """콘텐츠 ID로 감정분석 결과 조회"""
         return (
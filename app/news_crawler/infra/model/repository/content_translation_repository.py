@@ -1,3 +1,4 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.news_crawler.infra.model.entity.content_translations import ContentTranslation
 
@@ -8,6 +9,12 @@ class ContentTranslationRepository:
     def save(self, translation: ContentTranslation):
         self.session.add(translation)
 
+    def bulk_insert(self, rows: list[dict]) -> int:
+        """번역 다중 행 INSERT (commit은 호출 측에서)"""
+        if rows:
+            self.session.execute(insert(ContentTranslation.__table__), rows)
+        return len(rows)
+
     def get_by_content_id(self, content_id: int) -> list[ContentTranslation]:
         return (
             self.session.query(ContentTranslation)
@@ -0,0 +1,460 @@
+"""
+비동기 뉴스 크롤링 엔진
+
+Yahoo/Investing RSS 피드를 스레드 풀 없이 하나의 이벤트 루프에서 동시에 수집합니다.
+YahooNewsCrawler/InvestingNewsCrawler와 같은 형식의 뉴스 딕셔너리를 만들고,
+한 주기에 수집한 기사를 NewsProcessor 배치 하나로 저장합니다.
+
+주요 기능:
+- 공유 keep-alive 커넥션 풀: async_yahoo_price_client의 이벤트 루프별 공유 세션 재사용
+- 호스트별 토큰 버킷 속도 제한 (프로세스 공유, 스케줄러 작업이 동시에 돌아도 호스트당 속도 유지)
+- 조건부 요청 (ETag / If-Modified-Since): 304 응답이면 본문 없이 종료
+- 증분 파싱: XMLPullParser로 받는 즉시 파싱하고, 이미 본 기사나 max_items에 도달하면 파싱 중단
+- 피드 상태(ETag, 최근 기사 해시)는 저장이 성공한 뒤에만 갱신 (실패 시 다음 주기에 다시 수집)
+"""
+
+import asyncio
+import random
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import aiohttp
+from dateutil import parser as date_parser
+
+from app.common.constants.investing_config import INVESTING_RSS_FEEDS
+from app.common.infra.client.async_yahoo_price_client import get_shared_session
+from app.common.utils.api_client import TokenBucketRateLimiter
+from app.common.utils.logging_config import get_logger
+from app.news_crawler.service.base import BaseCrawler
+from app.news_crawler.service.investing_news_crawler import InvestingNewsCrawler
+from app.news_crawler.service.news_processor import NewsProcessor
+from app.news_crawler.service.yahoo_news_crawler import YahooNewsCrawler
+
+logger = get_logger(__name__)
+
+# 호스트별 속도 제한 (초당 요청 수, 버스트 용량) - 기존 크롤러의 요청 간 1~3초 지연을 호스트 단위로 적용
+HOST_RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "feeds.finance.yahoo.com": (2.0, 4),
+    "www.investing.com": (1.0, 2),
+}
+DEFAULT_HOST_RATE_LIMIT: Tuple[float, int] = (1.0, 2)
+
+# 피드별로 기억할 최근 기사 해시 수 (피드는 최신순이므로 이미 본 기사에서 파싱 중단)
+SEEN_HASH_LIMIT = 50
+
+# 파싱을 일찍 끝낸 뒤 커넥션 재사용을 위해 남은 본문을 읽어 버릴 최대 크기
+DRAIN_LIMIT_BYTES = 256 * 1024
+READ_CHUNK_BYTES = 8 * 1024
+
+# 피드 요청 타임아웃 (공유 세션 기본값 10초 대신 기존 크롤러와 같은 15초)
+FEED_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5)
+
+
+# ====================
+# 피드 정의
+# ====================
+
+
+@dataclass(frozen=True)
+class NewsFeed:
+    """크롤링할 RSS 피드 하나"""
+
+    symbol: str
+    url: str
+    source: str  # 저장 시 source 컬럼 값 ("yahoo.com" / "investing.com")
+    crawler_class: type  # 헤더 풀(User-Agent 등)을 가져올 크롤러 클래스
+    referer: Optional[str] = None  # None이면 크롤러의 REFERERS에서 랜덤 선택
+
+    @property
+    def host(self) -> str:
+        return urlparse(self.url).netloc
+
+
+def yahoo_feed(symbol: str) -> NewsFeed:
+    """Yahoo Finance 심볼 헤드라인 피드"""
+    return NewsFeed(
+        symbol=symbol,
+        url=YahooNewsCrawler.build_rss_url(symbol),
+        source="yahoo.com",
+        crawler_class=YahooNewsCrawler,
+        referer=f"https://finance.yahoo.com/quote/{symbol}",
+    )
+
+
+def investing_feed(symbol: str) -> Optional[NewsFeed]:
+    """Investing.com RSS 피드 (설정에 없는 심볼이면 None)"""
+    url = INVESTING_RSS_FEEDS.get(symbol)
+    if not url:
+        return None
+    return NewsFeed(
+        symbol=symbol,
+        url=url,
+        source="investing.com",
+        crawler_class=InvestingNewsCrawler,
+    )
+
+
+def build_feeds(
+    yahoo_symbols: Iterable[str] = (), investing_symbols: Iterable[str] = ()
+) -> List[NewsFeed]:
+    """Yahoo/Investing 심볼 목록으로 피드 목록 생성"""
+    feeds = [yahoo_feed(symbol) for symbol in yahoo_symbols]
+    for symbol in investing_symbols:
+        feed = investing_feed(symbol)
+        if feed is None:
+            logger.warning("investing_feed_not_configured", symbol=symbol)
+            continue
+        feeds.append(feed)
+    return feeds
+
+
+# ====================
+# 프로세스 공유 상태
+# ====================
+
+
+@dataclass
+class FeedState:
+    """피드별 조건부 요청 검증자와 최근 기사 해시"""
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    seen_hashes: Deque[str] = field(default_factory=lambda: deque(maxlen=SEEN_HASH_LIMIT))
+
+
+_feed_states: Dict[str, FeedState] = {}
+_feed_states_lock = threading.Lock()
+
+_host_limiters: Dict[str, TokenBucketRateLimiter] = {}
+_host_limiters_lock = threading.Lock()
+
+
+def get_host_rate_limiter(host: str) -> TokenBucketRateLimiter:
+    """호스트별 공유 토큰 버킷 반환 (없으면 생성)"""
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None:
+            rate, capacity = HOST_RATE_LIMITS.get(host, DEFAULT_HOST_RATE_LIMIT)
+            limiter = TokenBucketRateLimiter(rate=rate, capacity=capacity)
+            _host_limiters[host] = limiter
+        return limiter
+
+
+def _get_feed_state(url: str) -> FeedState:
+    with _feed_states_lock:
+        return _feed_states.setdefault(url, FeedState())
+
+
+def reset_feed_states():
+    """피드 상태 초기화 (다음 주기에 모든 피드를 조건 없이 다시 수집)"""
+    with _feed_states_lock:
+        _feed_states.clear()
+
+
+# ====================
+# 수집 결과
+# ====================
+
+
+@dataclass
+class FeedResult:
+    """피드 하나의 수집 결과"""
+
+    feed: NewsFeed
+    status: str  # "new" / "unchanged" / "not_modified" / "failed"
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    bytes_read: int = 0
+
+
+# ====================
+# 크롤링 엔진
+# ====================
+
+
+class AsyncNewsCrawlEngine:
+    """RSS 피드 비동기 수집 및 일괄 저장"""
+
+    def __init__(
+        self,
+        max_items_per_feed: int = 1,
+        max_concurrency: int = 20,
+        max_retries: int = 3,
+    ):
+        """
+        크롤링 엔진 초기화
+
+        Args:
+            max_items_per_feed: 피드당 수집할 최신 기사 수 (기존 크롤러와 같은 1이 기본값)
+            max_concurrency: 동시에 진행할 피드 요청 수
+            max_retries: 429 응답 시 재시도 횟수
+        """
+        self.max_items_per_feed = max(1, max_items_per_feed)
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+
+    async def crawl(self, feeds: List[NewsFeed]) -> List[FeedResult]:
+        """
+        피드 목록 동시 수집 (피드 상태는 갱신하지 않음)
+
+        Args:
+            feeds: 수집할 피드 목록
+
+        Returns:
+            입력 순서대로의 피드별 수집 결과
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch_with_limit(feed: NewsFeed) -> FeedResult:
+            async with semaphore:
+                return await self.fetch_feed(feed)
+
+        return list(await asyncio.gather(*(fetch_with_limit(feed) for feed in feeds)))
+
+    async def crawl_and_process(
+        self, feeds: List[NewsFeed], telegram_enabled: bool = False
+    ) -> Dict[str, Any]:
+        """
+        피드 수집 후 새 기사를 NewsProcessor 배치 하나로 저장
+
+        저장이 성공하면 피드 상태(ETag/Last-Modified/최근 기사 해시)를 갱신합니다.
+
+        Args:
+            feeds: 수집할 피드 목록
+            telegram_enabled: 새 기사 텔레그램 알림 여부
+
+        Returns:
+            수집/저장 결과 요약
+        """
+        start_time = time.time()
+        results = await self.crawl(feeds)
+
+        items = [item for result in results for item in result.items]
+        summary: Dict[str, Any] = {
+            "feeds": len(feeds),
+            "new": sum(1 for r in results if r.status == "new"),
+            "unchanged": sum(1 for r in results if r.status == "unchanged"),
+            "not_modified": sum(1 for r in results if r.status == "not_modified"),
+            "failed": sum(1 for r in results if r.status == "failed"),
+            "items": len(items),
+            "saved": 0,
+            "duplicates": 0,
+            "bytes_read": sum(r.bytes_read for r in results),
+        }
+        crawl_seconds = time.time() - start_time
+
+        process_ok = True
+        if items:
+            # DB 저장/번역은 동기 코드이므로 이벤트 루프 밖 스레드에서 실행
+            processor = NewsProcessor(items, telegram_enabled=telegram_enabled)
+            process_summary = await asyncio.to_thread(processor.run)
+            summary["saved"] = process_summary.get("saved", 0)
+            summary["duplicates"] = process_summary.get("duplicates", 0)
+            process_ok = "error" not in process_summary
+
+        if process_ok:
+            self.commit_feed_states(results)
+
+        summary["crawl_seconds"] = round(crawl_seconds, 2)
+        summary["elapsed_seconds"] = round(time.time() - start_time, 2)
+        logger.info("news_crawl_cycle_completed", **summary)
+        return summary
+
+    @staticmethod
+    def commit_feed_states(results: List[FeedResult]):
+        """수집 결과를 피드 상태에 반영 (저장 성공 후 호출)"""
+        for result in results:
+            if result.status not in ("new", "unchanged"):
+                continue
+            state = _get_feed_state(result.feed.url)
+            with _feed_states_lock:
+                if result.etag or result.last_modified:
+                    state.etag = result.etag
+                    state.last_modified = result.last_modified
+                for item in reversed(result.items):
+                    if item["content_hash"] not in state.seen_hashes:
+                        state.seen_hashes.appendleft(item["content_hash"])
+
+    async def fetch_feed(self, feed: NewsFeed) -> FeedResult:
+        """
+        피드 하나를 조건부 요청으로 가져와 증분 파싱
+
+        Args:
+            feed: 수집할 피드
+
+        Returns:
+            피드 수집 결과 (실패해도 예외 대신 status="failed")
+        """
+        state = _get_feed_state(feed.url)
+        with _feed_states_lock:
+            conditional_headers = {}
+            if state.etag:
+                conditional_headers["If-None-Match"] = state.etag
+            if state.last_modified:
+                conditional_headers["If-Modified-Since"] = state.last_modified
+            seen_hashes = set(state.seen_hashes)
+
+        session = await get_shared_session()
+        limiter = get_host_rate_limiter(feed.host)
+
+        try:
+            for attempt in range(self.max_retries + 1):
+                await limiter.acquire_async()
+
+                headers = self._get_random_headers(feed)
+                headers.update(conditional_headers)
+
+                async with session.get(
+                    feed.url,
+                    headers=headers,
+                    timeout=FEED_REQUEST_TIMEOUT,
+                ) as response:
+                    if response.status == 429 and attempt < self.max_retries:
+                        print(
+                            f"⚠️ {feed.symbol} 뉴스 API 제한 감지, {attempt + 1}회 재시도 중..."
+                        )
+                        await asyncio.sleep(random.uniform(3, 8))
+                        continue
+
+                    if response.status == 304:
+                        return FeedResult(feed=feed, status="not_modified")
+
+                    if response.status != 200:
+                        print(f"❌ {feed.symbol} 요청 실패: status {response.status}")
+                        return FeedResult(feed=feed, status="failed")
+
+                    items, bytes_read = await self._parse_incrementally(
+                        response, feed, seen_hashes
+                    )
+                    return FeedResult(
+                        feed=feed,
+                        status="new" if items else "unchanged",
+                        items=items,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                        bytes_read=bytes_read,
+                    )
+
+        except Exception as e:
+            print(f"❌ {feed.symbol} 뉴스 요청 실패: {e}")
+
+        return FeedResult(feed=feed, status="failed")
+
+    # ====================
+    # 내부 헬퍼
+    # ====================
+
+    @staticmethod
+    def _get_random_headers(feed: NewsFeed) -> Dict[str, str]:
+        """요청마다 랜덤 헤더 생성 (피드 출처 크롤러와 같은 헤더 풀 사용)"""
+        crawler_class = feed.crawler_class
+        return {
+            "User-Agent": random.choice(crawler_class.USER_AGENTS),
+            "Accept": random.choice(crawler_class.ACCEPT_HEADERS),
+            "Accept-Language": random.choice(crawler_class.ACCEPT_LANGUAGES),
+            # aiohttp가 해제할 수 있는 인코딩만 요청 (br은 brotli 패키지 필요)
+            "Accept-Encoding": "gzip, deflate",
+            "Referer": feed.referer or random.choice(crawler_class.REFERERS),
+        }
+
+    async def _parse_incrementally(
+        self, response, feed: NewsFeed, seen_hashes: set
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        응답 본문을 받는 대로 파싱해 새 기사 추출
+
+        피드는 최신순이므로 이미 본 기사나 max_items_per_feed에 도달하면 파싱을 멈추고,
+        커넥션을 풀에 돌려주기 위해 남은 본문은 파싱 없이 읽어 버립니다.
+
+        Returns:
+            (새 기사 목록, 파싱한 바이트 수)
+        """
+        parser = ET.XMLPullParser(events=("end",))
+        items: List[Dict[str, Any]] = []
+        bytes_read = 0
+        done = False
+
+        async for chunk in response.content.iter_chunked(READ_CHUNK_BYTES):
+            bytes_read += len(chunk)
+            parser.feed(chunk)
+
+            for _, element in parser.read_events():
+                if element.tag != "item":
+                    continue
+
+                item = self._build_news_item(element, feed)
+                element.clear()
+                if item is None:
+                    continue
+                if item["content_hash"] in seen_hashes:
+                    done = True
+                    break
+
+                items.append(item)
+                if len(items) >= self.max_items_per_feed:
+                    done = True
+                    break
+
+            if done:
+                break
+
+        if done:
+            await self._drain(response)
+        return items, bytes_read
+
+    @staticmethod
+    async def _drain(response):
+        """남은 본문을 DRAIN_LIMIT_BYTES까지 읽어 버림 (넘으면 커넥션을 닫고 종료)"""
+        remaining = DRAIN_LIMIT_BYTES
+        while remaining > 0:
+            chunk = await response.content.read(min(remaining, 64 * 1024))
+            if not chunk:
+                return
+            remaining -= len(chunk)
+
+    @staticmethod
+    def _build_news_item(element: ET.Element, feed: NewsFeed) -> Optional[Dict[str, Any]]:
+        """RSS <item>을 기존 크롤러와 같은 뉴스 딕셔너리로 변환 (제목/링크 없으면 None)"""
+        title = element.findtext("title")
+        url = element.findtext("link")
+        summary = element.findtext("description")
+        pub_date = element.findtext("pubDate")
+
+        if not title or not url:
+            return None
+
+        return {
+            "title": title.strip(),
+            "url": url.strip(),
+            "source": feed.source,
+            "summary": summary.strip() if summary else None,
+            "html": "",
+            "symbol": feed.symbol,
+            "content_hash": BaseCrawler.generate_hash(title),
+            "crawled_at": BaseCrawler.get_crawled_at(),
+            "published_at": _parse_pub_date(pub_date),
+        }
+
+
+def _parse_pub_date(pub_date: Optional[str]) -> Optional[datetime]:
+    """pubDate를 naive datetime으로 변환 (RFC 822 우선, 실패하면 dateutil)"""
+    if not pub_date:
+        return None
+    try:
+        published_at = parsedate_to_datetime(pub_date)
+    except (TypeError, ValueError):
+        try:
+            published_at = date_parser.parse(pub_date)
+        except (ValueError, OverflowError):
+            return None
+    if published_at.tzinfo:
+        published_at = published_at.replace(tzinfo=None)
+    return published_at
@@ -1,9 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from app.common.infra.database.config.database_config import SessionLocal
-from app.common.utils.translate_to_korean import translate_to_korean
+from app.common.utils.translate_to_korean import translate_many_to_korean
+from app.common.utils.translation_service import get_translation_service
 from app.common.utils.telegram_notifier import send_news_telegram_message
-from app.news_crawler.infra.model.entity.content import Content
-from app.news_crawler.infra.model.entity.content_translations import ContentTranslation
-from app.news_crawler.infra.model.entity.content_sentiments import ContentSentiment
 from app.news_crawler.infra.model.repository.content_repository import ContentRepository
 from app.news_crawler.infra.model.repository.content_translation_repository import (
     ContentTranslationRepository,
@@ -15,7 +15,22 @@ from app.news_crawler.service.sentiment_analyzer import SentimentAnalyzer
 
 
 class NewsProcessor:
-    def __init__(self, news_items: list[dict], telegram_enabled: bool = False):
+    """
+    뉴스 배치 저장 파이프라인
+
+    1. 중복 제거 - 배치 전체를 content_hash IN (...) 쿼리 1회로 확인
+    2. 번역 - 번역 캐시 조회 후 캐시에 없는 텍스트만 묶어서 동시 요청 (translation_workers개 제한)
+    3. 감정분석 - 번역을 기다리는 동안 메인 스레드에서 수행 (DB 접근 없음)
+    4. 저장 - 콘텐츠/번역/감정분석을 다중 행 INSERT로 한 트랜잭션에 저장
+    5. 알림 - commit 이후 세션을 닫고 전송
+    """
+
+    def __init__(
+        self,
+        news_items: list[dict],
+        telegram_enabled: bool = False,
+        translation_workers: int = 8,
+    ):
         self.news_items = news_items
         self.session = None
         self.content_repo = None
@@ -23,6 +38,7 @@ class NewsProcessor:
         self.sentiment_repo = None
         self.sentiment_analyzer = SentimentAnalyzer()
         self.telegram_enabled = telegram_enabled  # 텔레그램 알림 선택적 활성화
+        self.translation_workers = max(1, translation_workers)
 
     def _get_session_and_repos(self):
         """세션과 리포지토리 지연 초기화"""
@@ -38,127 +54,161 @@ class NewsProcessor:
         if self.session:
             self.session.close()
 
-    def run(self):
+    def run(self) -> dict:
         """뉴스 데이터베이스 저장 및 감정분석 수행"""
+        summary = {"total": len(self.news_items), "saved": 0, "duplicates": 0}
+
         try:
-            session, content_repo, translation_repo, sentiment_repo = self._get_session_and_repos()
-
-            for item in self.news_items:
-                try:
-                    if self._is_duplicate(item):
-                        continue
-
-                    content = self._save_content(item)
-                    title_ko, summary_ko, symbol = self._save_translation(content)
-                    self._save_sentiment(content)
-                    
-                    # 텔레그램 전송 (선택적)
-                    if self.telegram_enabled:
-                        try:
-                            self._send_notification(content, title_ko, summary_ko, symbol)
-                        except Exception as telegram_error:
-                            print(f"⚠️ 텔레그램 전송 실패 (저장은 성공): {telegram_error}")
-                            # 텔레그램 실패해도 저장은 계속 진행
-                except Exception as item_error:
-                    print(f"❌ 개별 뉴스 처리 실패: {item_error}")
-                    continue  # 개별 뉴스 실패해도 계속 진행
-
-            session.commit()
+            # 1. 중복 제거
+            items = self._filter_new_items()
+            summary["duplicates"] = len(self.news_items) - len(items)
+            if not items:
+                return summary
+
+            # 2~3. 번역은 별도 스레드에서, 감정분석은 그동안 메인 스레드에서
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                translation_future = executor.submit(self._translate_items, items)
+                sentiments = self._analyze_sentiments(items)
+                translations = translation_future.result()
+
+            # 4. 한 트랜잭션으로 일괄 저장
+            summary["saved"] = self._save_batch(items, translations, sentiments)
         except Exception as e:
             if self.session:
                 self.session.rollback()
             print(f"❌ 처리 중 예외 발생: {e}")
+            summary["error"] = str(e)
+            return summary
         finally:
             if self.session:
                 self.session.close()
 
-    def _is_duplicate(self, item: dict) -> bool:
-        session, content_repo, translation_repo, sentiment_repo = self._get_session_and_repos()
-        if content_repo.exists_by_hash(item["content_hash"]):
-            print(f"🔁 중복 스킵: {item['title']}")
-            return True
-        return False
+        # 5. 텔레그램 전송 (선택적, 저장 완료 후)
+        if self.telegram_enabled and summary["saved"]:
+            for item, (title_ko, summary_ko) in zip(items, translations):
+                self._send_notification(item, title_ko, summary_ko)
 
-    def _save_content(self, item: dict) -> Content:
-        session, content_repo, translation_repo, sentiment_repo = self._get_session_and_repos()
-        content = Content(
-            symbol=item["symbol"],
-            title=item["title"],
-            summary=item["summary"],
-            url=item["url"],
-            html=item["html"],
-            source=item["source"],
-            crawled_at=item["crawled_at"],
-            published_at=item["published_at"],
-            content_hash=item["content_hash"],
-        )
-        content_repo.save(content)
-        session.flush()
-        return content
+        return summary
 
-    def _save_translation(self, content: Content) -> tuple[str, str | None, str]:
+    def _filter_new_items(self) -> list[dict]:
+        """배치 내 중복과 이미 저장된 뉴스 제거"""
         session, content_repo, translation_repo, sentiment_repo = self._get_session_and_repos()
-        title_ko = translate_to_korean(content.title)
-        summary_ko = translate_to_korean(content.summary) if content.summary else None
-        symbol = content.symbol
-        translation = ContentTranslation(
-            content_id=content.id,
-            language="ko",
-            title_translated=title_ko,
-            summary_translated=summary_ko,
-            translator="google",
-            published_at=content.published_at,
-        )
-        translation_repo.save(translation)
-        session.flush()
-        print(f"✅ 번역 완료: {content.title} → {title_ko}")
-        return title_ko, summary_ko, symbol
 
-    def _save_sentiment(self, content: Content):
-        """뉴스 콘텐츠의 감정분석 결과 저장"""
-        session, content_repo, translation_repo, sentiment_repo = self._get_session_and_repos()
-        
-        # 이미 감정분석이 완료된 경우 스킵
-        if sentiment_repo.exists_by_content_id(content.id):
-            print(f"🔁 감정분석 중복 스킵: {content.title}")
-            return
-        
+        unique_items = {}
+        for item in self.news_items:
+            unique_items.setdefault(item["content_hash"], item)
+
+        existing_hashes = content_repo.find_existing_hashes(list(unique_items))
+
+        new_items = []
+        for content_hash, item in unique_items.items():
+            if content_hash in existing_hashes:
+                print(f"🔁 중복 스킵: {item['title']}")
+                continue
+            new_items.append(item)
+        return new_items
+
+    def _translate_items(self, items: list[dict]) -> list[tuple[str, str | None]]:
+        """제목/요약을 한 번에 번역 (DB 접근 없음, 요약이 없으면 None)"""
+        texts = []
+        for item in items:
+            texts.append(item["title"])
+            texts.append(item.get("summary") or None)
+
+        translated = translate_many_to_korean(texts, max_workers=self.translation_workers)
+
+        translations = []
+        for index, item in enumerate(items):
+            title_ko, summary_ko = translated[2 * index], translated[2 * index + 1]
+            print(f"✅ 번역 완료: {item['title']} → {title_ko}")
+            translations.append((title_ko, summary_ko))
+        return translations
+
+    def _analyze_sentiments(self, items: list[dict]) -> list[dict | None]:
+        """제목과 요약을 결합하여 배치 감정분석 수행 (실패 시 None)"""
+        texts = [
+            item["title"] + (" " + item["summary"] if item.get("summary") else "")
+            for item in items
+        ]
         try:
-            # 제목과 요약을 결합하여 감정분석 수행
-            text_for_analysis = content.title
-            if content.summary:
-                text_for_analysis += " " + content.summary
-            
-            # 감정분석 수행
-            sentiment_result = self.sentiment_analyzer.analyze_sentiment(text_for_analysis)
-            
-            # 감정분석 결과 저장
-            sentiment = ContentSentiment(
-                content_id=content.id,
-                sentiment_score=sentiment_result['sentiment_score'],
-                sentiment_label=sentiment_result['sentiment_label'],
-                confidence=sentiment_result['confidence'],
-                positive_score=sentiment_result['positive_score'],
-                negative_score=sentiment_result['negative_score'],
-                neutral_score=sentiment_result['neutral_score'],
-                compound_score=sentiment_result['compound_score'],
-                market_impact_score=sentiment_result['market_impact_score'],
-                is_market_sensitive=sentiment_result['is_market_sensitive'],
-                analyzer_type="vader"
-            )
-            
-            sentiment_repo.save(sentiment)
-            session.flush()
-            
-            print(f"✅ 감정분석 완료: {content.title} → {sentiment_result['sentiment_label']} ({sentiment_result['sentiment_score']:.3f})")
-            
+            sentiment_results = self.sentiment_analyzer.analyze_batch(texts)
         except Exception as e:
-            print(f"❌ 감정분석 실패: {content.title} - {str(e)}")
+            print(f"❌ 감정분석 실패: {str(e)}")
             # 감정분석 실패해도 다른 처리는 계속 진행
+            return [None] * len(items)
 
-    def _send_notification(
-        self, content: Content, title_ko: str, summary_ko: str, symbol: str
-    ):
+        for item, sentiment_result in zip(items, sentiment_results):
+            print(f"✅ 감정분석 완료: {item['title']} → {sentiment_result['sentiment_label']} ({sentiment_result['sentiment_score']:.3f})")
+        return sentiment_results
+
+    def _save_batch(
+        self,
+        items: list[dict],
+        translations: list[tuple[str, str | None]],
+        sentiments: list[dict | None],
+    ) -> int:
+        """콘텐츠, 번역, 감정분석 결과를 다중 행 INSERT 후 한 번만 commit"""
+        session, content_repo, translation_repo, sentiment_repo = self._get_session_and_repos()
+
+        content_ids = content_repo.bulk_insert(
+            [
+                {
+                    "symbol": item["symbol"],
+                    "title": item["title"],
+                    "summary": item["summary"],
+                    "url": item["url"],
+                    "html": item["html"],
+                    "source": item["source"],
+                    "crawled_at": item["crawled_at"],
+                    "published_at": item["published_at"],
+                    "content_hash": item["content_hash"],
+                }
+                for item in items
+            ]
+        )
+
+        translator = get_translation_service().backend.name
+        translation_rows = []
+        sentiment_rows = []
+        for item, (title_ko, summary_ko), sentiment_result in zip(
+            items, translations, sentiments
+        ):
+            content_id = content_ids[item["content_hash"]]
+            translation_rows.append(
+                {
+                    "content_id": content_id,
+                    "language": "ko",
+                    "title_translated": title_ko,
+                    "summary_translated": summary_ko,
+                    "translator": translator,
+                    "published_at": item["published_at"],
+                }
+            )
+            if sentiment_result:
+                sentiment_rows.append(
+                    {
+                        "content_id": content_id,
+                        "sentiment_score": sentiment_result['sentiment_score'],
+                        "sentiment_label": sentiment_result['sentiment_label'],
+                        "confidence": sentiment_result['confidence'],
+                        "positive_score": sentiment_result['positive_score'],
+                        "negative_score": sentiment_result['negative_score'],
+                        "neutral_score": sentiment_result['neutral_score'],
+                        "compound_score": sentiment_result['compound_score'],
+                        "market_impact_score": sentiment_result['market_impact_score'],
+                        "is_market_sensitive": sentiment_result['is_market_sensitive'],
+                        "analyzer_type": "vader",
+                    }
+                )
+
+        translation_repo.bulk_insert(translation_rows)
+        sentiment_repo.bulk_insert(sentiment_rows)
+        session.commit()
+
+        print(f"✅ 뉴스 일괄 저장 완료: 콘텐츠 {len(content_ids)}개, 번역 {len(translation_rows)}개, 감정분석 {len(sentiment_rows)}개")
+        return len(content_ids)
+
+    def _send_notification(self, item: dict, title_ko: str, summary_ko: str | None):
         # telegram_enabled 속성이 없으면 기본값으로 True 사용
         telegram_enabled = getattr(self, "telegram_enabled", True)
 
@@ -169,9 +219,9 @@ class NewsProcessor:
             send_news_telegram_message(
                 title=title_ko,
                 summary=summary_ko,
-                url=content.url,
-                published_at=content.published_at,
-                symbol=symbol,
+                url=item["url"],
+                published_at=item["published_at"],
+                symbol=item["symbol"],
             )
         except Exception as e:
             print(f"❌ 텔레그램 전송 실패: {e}")
@@ -1,4 +1,6 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import re
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from app.common.utils.logging_config import get_logger
@@ -6,6 +8,39 @@ from app.common.utils.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+# 시장 영향도 키워드 (그룹별로 하나의 정규식으로 합쳐 텍스트당 1회만 스캔)
+URGENCY_KEYWORDS = (
+    "urgent", "breaking", "exclusive", "flash", "alert",
+    "crisis", "emergency", "warning",
+    "immediate", "instant", "sudden",
+)
+FINANCIAL_KEYWORDS = (
+    "earnings", "revenue", "profit", "loss",
+    "stock", "market", "trading", "price",
+    "quarterly", "annual", "report",
+)
+MARKET_KEYWORD_PATTERN = re.compile(
+    r"\b(?:(?P<urgency>{})|(?P<financial>{}))\b".format(
+        "|".join(URGENCY_KEYWORDS), "|".join(FINANCIAL_KEYWORDS)
+    ),
+    re.IGNORECASE,
+)
+
+# 작업자 프로세스별 분석기 (프로세스 풀 initializer에서 생성)
+_worker_analyzer: Optional["SentimentAnalyzer"] = None
+
+
+def _init_sentiment_worker() -> None:
+    """작업자 프로세스 초기화 (Lexicon 설정은 프로세스당 1회)"""
+    global _worker_analyzer
+    _worker_analyzer = SentimentAnalyzer()
+
+
+def _analyze_chunk_in_worker(texts: List[str]) -> List[Dict[str, Any]]:
+    """작업자 프로세스에서 텍스트 묶음 감정분석"""
+    return _worker_analyzer.analyze_batch(texts)
+
+
 class SentimentAnalyzer:
     """
     VADER Lexicon 기반 감정분석 서비스
@@ -66,36 +101,14 @@ class SentimentAnalyzer:
             return self._get_neutral_result()
         
         try:
-            # VADER 감정분석 수행
-            scores = self.analyzer.polarity_scores(text)
-            
-            # 감정 라벨 결정
-            sentiment_label = self._determine_sentiment_label(scores['compound'])
-            
-            # 시장 영향도 계산
-            market_impact_score = self._calculate_market_impact(text, scores)
-            
-            # 신뢰도 계산
-            confidence = self._calculate_confidence(scores)
-            
-            result = {
-                'sentiment_score': scores['compound'],
-                'sentiment_label': sentiment_label,
-                'confidence': confidence,
-                'positive_score': scores['pos'],
-                'negative_score': scores['neg'],
-                'neutral_score': scores['neu'],
-                'compound_score': scores['compound'],
-                'market_impact_score': market_impact_score,
-                'is_market_sensitive': abs(market_impact_score) > 0.5
-            }
+            result = self._score_text(text)
             
             logger.debug(
                 "sentiment_analysis_completed",
                 text_length=len(text),
-                sentiment_label=sentiment_label,
-                sentiment_score=scores['compound'],
-                market_impact=market_impact_score
+                sentiment_label=result['sentiment_label'],
+                sentiment_score=result['sentiment_score'],
+                market_impact=result['market_impact_score']
             )
             
             return result
@@ -104,6 +117,97 @@ class SentimentAnalyzer:
             logger.error("sentiment_analysis_failed", error=str(e), text_preview=text[:100])
             return self._get_neutral_result()
 
+    def analyze_batch(self, texts: List[Optional[str]]) -> List[Dict[str, Any]]:
+        """
+        여러 텍스트의 감정분석을 한 번에 수행 (텍스트별 로깅 없음)
+        
+        Args:
+            texts: 분석할 텍스트 목록
+            
+        Returns:
+            texts와 같은 순서의 감정분석 결과 목록
+        """
+        results = []
+        failed = 0
+        
+        for text in texts:
+            if not text or not text.strip():
+                results.append(self._get_neutral_result())
+                continue
+            try:
+                results.append(self._score_text(text))
+            except Exception:
+                failed += 1
+                results.append(self._get_neutral_result())
+        
+        if failed:
+            logger.warning("sentiment_batch_partial_failure", total=len(texts), failed=failed)
+        
+        return results
+
+    @staticmethod
+    def create_process_pool(processes: int) -> ProcessPoolExecutor:
+        """
+        대량 분석용 프로세스 풀 생성 (작업자마다 분석기를 1회만 초기화)
+        
+        Args:
+            processes: 작업자 프로세스 수
+        """
+        return ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_sentiment_worker,
+        )
+
+    def analyze_batch_in_pool(
+        self,
+        executor: ProcessPoolExecutor,
+        texts: List[Optional[str]],
+        chunk_size: int = 500,
+    ) -> List[Dict[str, Any]]:
+        """
+        프로세스 풀에서 텍스트를 chunk_size개씩 나눠 감정분석
+        
+        Args:
+            executor: create_process_pool()로 만든 프로세스 풀
+            texts: 분석할 텍스트 목록
+            chunk_size: 작업자 1회 호출당 텍스트 수
+            
+        Returns:
+            texts와 같은 순서의 감정분석 결과 목록
+        """
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        results = []
+        for chunk_result in executor.map(_analyze_chunk_in_worker, chunks):
+            results.extend(chunk_result)
+        return results
+
+    def _score_text(self, text: str) -> Dict[str, Any]:
+        """VADER 점수, 라벨, 시장 영향도, 신뢰도 계산"""
+        # VADER 감정분석 수행
+        scores = self.analyzer.polarity_scores(text)
+        
+        # 감정 라벨 결정
+        sentiment_label = self._determine_sentiment_label(scores['compound'])
+        
+        # 시장 영향도 계산
+        market_impact_score = self._calculate_market_impact(text, scores)
+        
+        # 신뢰도 계산
+        confidence = self._calculate_confidence(scores)
+        
+        return {
+            'sentiment_score': scores['compound'],
+            'sentiment_label': sentiment_label,
+            'confidence': confidence,
+            'positive_score': scores['pos'],
+            'negative_score': scores['neg'],
+            'neutral_score': scores['neu'],
+            'compound_score': scores['compound'],
+            'market_impact_score': market_impact_score,
+            'is_market_sensitive': abs(market_impact_score) > 0.5
+        }
+
     def _determine_sentiment_label(self, compound_score: float) -> str:
         """복합 점수로 감정 라벨 결정"""
         if compound_score >= 0.05:
@@ -118,31 +222,19 @@ class SentimentAnalyzer:
         # 기본 감정 점수
         base_impact = scores['compound']
         
-        # 긴급도 키워드 확인
-        urgency_multiplier = 1.0
-        urgency_patterns = [
-            r'\b(urgent|breaking|exclusive|flash|alert)\b',
-            r'\b(crisis|emergency|warning)\b',
-            r'\b(immediate|instant|sudden)\b'
-        ]
-        
-        for pattern in urgency_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                urgency_multiplier = 1.3
+        # 긴급도/금융 키워드 확인 (합친 정규식으로 1회 스캔, 두 그룹 모두 찾으면 중단)
+        has_urgency = False
+        has_financial = False
+        for match in MARKET_KEYWORD_PATTERN.finditer(text):
+            if match.lastgroup == "urgency":
+                has_urgency = True
+            else:
+                has_financial = True
+            if has_urgency and has_financial:
                 break
         
-        # 금융 키워드 확인
-        financial_multiplier = 1.0
-        financial_patterns = [
-            r'\b(earnings|revenue|profit|loss)\b',
-            r'\b(stock|market|trading|price)\b',
-            r'\b(quarterly|annual|report)\b'
-        ]
-        
-        for pattern in financial_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                financial_multiplier = 1.2
-                break
+        urgency_multiplier = 1.3 if has_urgency else 1.0
+        financial_multiplier = 1.2 if has_financial else 1.0
         
         return base_impact * urgency_multiplier * financial_multiplier
 
@@ -0,0 +1,159 @@
+"""
+감정분석 백필 서비스
+
+감정분석 결과가 없는 과거 뉴스 콘텐츠를 일괄 분석해 저장합니다.
+
+주요 기능:
+- 키셋 페이지네이션으로 미분석 콘텐츠를 청크 단위 스트리밍 (전체를 메모리에 올리지 않음)
+- SentimentAnalyzer.analyze_batch()로 청크 일괄 분석 (대량이면 프로세스 풀 사용)
+- 청크마다 다중 행 INSERT 후 commit (중단되어도 다음 실행에서 이어서 처리)
+"""
+
+import os
+import time
+from typing import Any, Dict, Optional
+
+from app.common.infra.database.config.database_config import SessionLocal
+from app.common.utils.logging_config import get_logger
+from app.news_crawler.infra.model.repository.content_repository import ContentRepository
+from app.news_crawler.infra.model.repository.content_sentiment_repository import (
+    ContentSentimentRepository,
+)
+from app.news_crawler.service.sentiment_analyzer import SentimentAnalyzer
+
+logger = get_logger(__name__)
+
+
+class SentimentBackfillService:
+    """미분석 뉴스 콘텐츠 감정분석 백필"""
+
+    def __init__(
+        self,
+        chunk_size: int = 2000,
+        processes: Optional[int] = None,
+        worker_chunk_size: int = 500,
+    ):
+        """
+        백필 서비스 초기화
+
+        Args:
+            chunk_size: DB에서 한 번에 읽고 저장할 콘텐츠 수
+            processes: 감정분석 작업자 프로세스 수 (None이면 CPU 수 - 1, 1이면 현재 프로세스에서 분석)
+            worker_chunk_size: 작업자 1회 호출당 텍스트 수
+        """
+        self.chunk_size = chunk_size
+        self.processes = (
+            processes if processes is not None else max(1, (os.cpu_count() or 2) - 1)
+        )
+        self.worker_chunk_size = worker_chunk_size
+        self.sentiment_analyzer = SentimentAnalyzer()
+
+    def run(self, max_contents: Optional[int] = None) -> Dict[str, Any]:
+        """
+        미분석 콘텐츠 감정분석 백필 실행
+
+        Args:
+            max_contents: 이번 실행에서 처리할 최대 콘텐츠 수 (None이면 전체)
+
+        Returns:
+            처리 결과 요약
+        """
+        start_time = time.time()
+        summary = {"processed": 0, "chunks": 0, "last_content_id": 0}
+
+        use_pool = self.processes > 1
+        executor = (
+            SentimentAnalyzer.create_process_pool(self.processes) if use_pool else None
+        )
+
+        logger.info(
+            "sentiment_backfill_started",
+            chunk_size=self.chunk_size,
+            processes=self.processes,
+            max_contents=max_contents,
+        )
+
+        try:
+            while max_contents is None or summary["processed"] < max_contents:
+                limit = self.chunk_size
+                if max_contents is not None:
+                    limit = min(limit, max_contents - summary["processed"])
+
+                processed, last_id = self._process_chunk(
+                    summary["last_content_id"], limit, executor
+                )
+                if not processed:
+                    break
+
+                summary["processed"] += processed
+                summary["chunks"] += 1
+                summary["last_content_id"] = last_id
+
+                logger.info(
+                    "sentiment_backfill_chunk_saved",
+                    chunk=summary["chunks"],
+                    processed=summary["processed"],
+                    last_content_id=last_id,
+                )
+        finally:
+            if executor:
+                executor.shutdown()
+
+        elapsed_seconds = time.time() - start_time
+        summary["elapsed_seconds"] = round(elapsed_seconds, 2)
+        summary["contents_per_second"] = (
+            round(summary["processed"] / elapsed_seconds, 1) if elapsed_seconds else 0.0
+        )
+
+        logger.info("sentiment_backfill_completed", **summary)
+        return summary
+
+    def _process_chunk(self, after_id: int, limit: int, executor) -> tuple[int, int]:
+        """
+        미분석 콘텐츠 한 청크 분석 및 저장
+
+        Returns:
+            (처리한 콘텐츠 수, 청크의 마지막 콘텐츠 id)
+        """
+        session = SessionLocal()
+        try:
+            rows = ContentRepository(session).find_without_sentiment(after_id, limit)
+            if not rows:
+                return 0, after_id
+
+            texts = [
+                row.title + (" " + row.summary if row.summary else "") for row in rows
+            ]
+            if executor and len(texts) > self.worker_chunk_size:
+                results = self.sentiment_analyzer.analyze_batch_in_pool(
+                    executor, texts, chunk_size=self.worker_chunk_size
+                )
+            else:
+                results = self.sentiment_analyzer.analyze_batch(texts)
+
+            ContentSentimentRepository(session).bulk_insert(
+                [
+                    {
+                        "content_id": row.id,
+                        "sentiment_score": result["sentiment_score"],
+                        "sentiment_label": result["sentiment_label"],
+                        "confidence": result["confidence"],
+                        "positive_score": result["positive_score"],
+                        "negative_score": result["negative_score"],
+                        "neutral_score": result["neutral_score"],
+                        "compound_score": result["compound_score"],
+                        "market_impact_score": result["market_impact_score"],
+                        "is_market_sensitive": result["is_market_sensitive"],
+                        "analyzer_type": "vader",
+                    }
+                    for row, result in zip(rows, results)
+                ]
+            )
+            session.commit()
+            return len(rows), rows[-1].id
+
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
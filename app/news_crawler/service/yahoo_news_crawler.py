@@ -69,14 +69,19 @@ class YahooNewsCrawler(BaseCrawler):
 
     def __init__(self, symbol: str):
         self.symbol = symbol
-        self.base_url = (
-            "https://feeds.finance.yahoo.com/rss/2.0/headline"
-            f"?s={quote(self.symbol)}&region=US&lang=en-US"
-        )
+        self.base_url = self.build_rss_url(symbol)
         self.session = requests.Session()
         self._last_request_time = 0
         self._setup_session()
 
+    @staticmethod
+    def build_rss_url(symbol: str) -> str:
+        """심볼 헤드라인 RSS 피드 URL"""
+        return (
+            "https://feeds.finance.yahoo.com/rss/2.0/headline"
+            f"?s={quote(symbol)}&region=US&lang=en-US"
+        )
+
     def _setup_session(self):
         """세션을 브라우저처럼 설정"""
         # 랜덤 User-Agent 설정
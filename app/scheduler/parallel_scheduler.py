@@ -30,15 +30,25 @@ from app.common.constants.investing_config import (
 )
 
 # 서비스 imports
-from app.news_crawler.service.investing_news_crawler import InvestingNewsCrawler
-from app.news_crawler.service.yahoo_news_crawler import YahooNewsCrawler
+from app.news_crawler.service.async_news_crawl_engine import (
+    AsyncNewsCrawlEngine,
+    build_feeds,
+)
+from app.news_crawler.service.sentiment_backfill_service import (
+    SentimentBackfillService,
+)
 from app.market_price.service.price_high_record_service import PriceHighRecordService
 from app.market_price.service.price_snapshot_service import PriceSnapshotService
 from app.market_price.service.price_monitor_service import PriceMonitorService
-from app.technical_analysis.service.async_technical_indicator_service import (
-    AsyncTechnicalIndicatorService,
+from app.technical_analysis.service.indicator_panel_service import (
+    IndicatorPanel,
+    IndicatorPanelService,
 )
 from app.market_price.service.async_price_service import AsyncPriceService
+from app.common.infra.client.async_yahoo_price_client import (
+    AsyncYahooPriceClient,
+    close_shared_session,
+)
 from app.technical_analysis.service.daily_comprehensive_report_service import (
     DailyComprehensiveReportService,
 )
@@ -61,65 +71,67 @@ logger = get_logger("parallel_scheduler")
 # 병렬 실행기 인스턴스 생성 (max_workers 감소로 DB 연결 부하 감소)
 executor = ParallelExecutor(max_workers=2)  # 3 → 2로 더 감소
 
+# 뉴스 RSS 비동기 크롤링 엔진 (피드 상태/호스트별 속도 제한은 프로세스 공유)
+news_crawl_engine = AsyncNewsCrawlEngine()
 
-@measure_execution_time
-@handle_scheduler_errors(reraise=False, return_on_error=None)
-@auto_memory_optimization(threshold_percent=80.0)
-@memory_monitor()
-def run_integrated_news_crawling_parallel():
-    """통합 뉴스 크롤링 (경제 뉴스 + 지수 뉴스)"""
-    logger.info(
-        "integrated_news_crawling_started",
-        sources=["investing_economic", "yahoo_index"],
-    )
 
-    # 1. Investing 경제 뉴스 크롤링
-    def process_investing_symbol(symbol):
-        logger.debug("processing_symbol", source="investing_economic", symbol=symbol)
-        crawler = InvestingNewsCrawler(symbol)
-        result = crawler.process_all()
-        return result
+def _run_news_crawl_cycle(
+    source: str,
+    yahoo_symbols=(),
+    investing_symbols=(),
+    telegram_enabled: bool = False,
+) -> dict:
+    """
+    RSS 피드를 비동기 크롤링 엔진으로 한 번에 수집/저장
 
-    investing_results = executor.run_symbol_tasks_parallel(
-        process_investing_symbol, INVESTING_ECONOMIC_SYMBOLS, delay=0.5
-    )
+    심볼마다 크롤러 객체와 스레드를 만들지 않고, 이벤트 루프 하나에서
+    공유 커넥션 풀/호스트별 속도 제한/조건부 요청으로 모든 피드를 동시에 가져옵니다.
+    """
+    feeds = build_feeds(yahoo_symbols, investing_symbols)
+
+    async def crawl_and_process():
+        try:
+            return await news_crawl_engine.crawl_and_process(
+                feeds, telegram_enabled=telegram_enabled
+            )
+        finally:
+            await close_shared_session()
 
-    investing_success = sum(1 for r in investing_results if r is not None)
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        summary = loop.run_until_complete(crawl_and_process())
+    finally:
+        loop.close()
+
+    success_count = summary["feeds"] - summary["failed"]
     logger.info(
         "news_crawling_completed",
-        source="investing_economic",
-        success_count=investing_success,
-        total_count=len(INVESTING_ECONOMIC_SYMBOLS),
-        success_rate=investing_success / len(INVESTING_ECONOMIC_SYMBOLS),
+        source=source,
+        success_count=success_count,
+        total_count=summary["feeds"],
+        success_rate=success_count / summary["feeds"] if summary["feeds"] else 0.0,
+        not_modified=summary["not_modified"],
+        saved=summary["saved"],
     )
+    return summary
 
-    # 2. Yahoo 지수 뉴스 크롤링
-    def process_yahoo_symbol(symbol):
-        logger.debug("processing_symbol", source="yahoo_index", symbol=symbol)
-        crawler = YahooNewsCrawler(symbol)
-        result = crawler.process_all()
-        return result
 
-    yahoo_results = executor.run_symbol_tasks_parallel(
-        process_yahoo_symbol, INDEX_SYMBOLS, delay=0.5
-    )
-
-    yahoo_success = sum(1 for r in yahoo_results if r is not None)
+@measure_execution_time
+@handle_scheduler_errors(reraise=False, return_on_error=None)
+@auto_memory_optimization(threshold_percent=80.0)
+@memory_monitor()
+def run_integrated_news_crawling_parallel():
+    """통합 뉴스 크롤링 (경제 뉴스 + 지수 뉴스)"""
     logger.info(
-        "news_crawling_completed",
-        source="yahoo_index",
-        success_count=yahoo_success,
-        total_count=len(INDEX_SYMBOLS),
-        success_rate=yahoo_success / len(INDEX_SYMBOLS),
+        "integrated_news_crawling_started",
+        sources=["investing_economic", "yahoo_index"],
     )
 
-    total_success = investing_success + yahoo_success
-    total_symbols = len(INVESTING_ECONOMIC_SYMBOLS) + len(INDEX_SYMBOLS)
-    logger.info(
-        "integrated_news_crawling_completed",
-        total_success=total_success,
-        total_symbols=total_symbols,
-        overall_success_rate=total_success / total_symbols,
+    _run_news_crawl_cycle(
+        "integrated",
+        yahoo_symbols=INDEX_SYMBOLS,
+        investing_symbols=INVESTING_ECONOMIC_SYMBOLS,
     )
 
 
@@ -127,56 +139,20 @@ def run_integrated_news_crawling_parallel():
 @handle_scheduler_errors(reraise=False, return_on_error=None)
 @memory_monitor()
 def run_investing_market_news_parallel():
-    """Investing 시장 뉴스 크롤링 (병렬)"""
+    """Investing 시장 뉴스 크롤링 (비동기)"""
     logger.info("news_crawling_started", source="investing_market")
 
-    def process_symbol(symbol):
-        logger.debug("processing_symbol", source="investing_market", symbol=symbol)
-        crawler = InvestingNewsCrawler(symbol)
-        result = crawler.process_all()
-        return result
-
-    # 병렬 실행 (API 제한 고려하여 약간의 지연 추가)
-    results = executor.run_symbol_tasks_parallel(
-        process_symbol, INVESTING_MARKET_SYMBOLS, delay=0.5
-    )
-
-    success_count = sum(1 for r in results if r is not None)
-    logger.info(
-        "news_crawling_completed",
-        source="investing_market",
-        success_count=success_count,
-        total_count=len(INVESTING_MARKET_SYMBOLS),
-        success_rate=success_count / len(INVESTING_MARKET_SYMBOLS),
-    )
+    _run_news_crawl_cycle("investing_market", investing_symbols=INVESTING_MARKET_SYMBOLS)
 
 
 @measure_execution_time
 @handle_scheduler_errors(reraise=False, return_on_error=None)
 @memory_monitor()
 def run_yahoo_futures_news_parallel():
-    """Yahoo 선물 뉴스 크롤링 (병렬)"""
+    """Yahoo 선물 뉴스 크롤링 (비동기)"""
     logger.info("news_crawling_started", source="yahoo_futures")
 
-    def process_symbol(symbol):
-        logger.debug("processing_symbol", source="yahoo_futures", symbol=symbol)
-        crawler = YahooNewsCrawler(symbol)
-        result = crawler.process_all()
-        return result
-
-    # 병렬 실행 (API 제한 고려하여 약간의 지연 추가)
-    results = executor.run_symbol_tasks_parallel(
-        process_symbol, FUTURES_SYMBOLS, delay=0.5
-    )
-
-    success_count = sum(1 for r in results if r is not None)
-    logger.info(
-        "news_crawling_completed",
-        source="yahoo_futures",
-        success_count=success_count,
-        total_count=len(FUTURES_SYMBOLS),
-        success_rate=success_count / len(FUTURES_SYMBOLS),
-    )
+    _run_news_crawl_cycle("yahoo_futures", yahoo_symbols=FUTURES_SYMBOLS)
 
 
 # 기존 개별 뉴스 크롤링 함수들은 통합 함수로 대체됨
@@ -188,56 +164,25 @@ def run_yahoo_futures_news_parallel():
 @handle_scheduler_errors(reraise=False, return_on_error=None)
 @memory_monitor()
 def run_yahoo_stock_news_parallel():
-    """Yahoo 종목 뉴스 크롤링 (병렬)"""
+    """Yahoo 종목 뉴스 크롤링 (비동기)"""
     logger.info("news_crawling_started", source="yahoo_stocks")
 
-    def process_symbol(symbol):
-        logger.debug("processing_symbol", source="yahoo_stocks", symbol=symbol)
-        crawler = YahooNewsCrawler(symbol)
-        result = crawler.process_all()
-        return result
-
-    # 병렬 실행 (API 제한 고려하여 약간의 지연 추가)
-    results = executor.run_symbol_tasks_parallel(
-        process_symbol, STOCK_SYMBOLS, delay=0.5
-    )
-
-    success_count = sum(1 for r in results if r is not None)
-    logger.info(
-        "news_crawling_completed",
-        source="yahoo_stocks",
-        success_count=success_count,
-        total_count=len(STOCK_SYMBOLS),
-        success_rate=success_count / len(STOCK_SYMBOLS),
-    )
+    _run_news_crawl_cycle("yahoo_stocks", yahoo_symbols=STOCK_SYMBOLS)
 
 
 @measure_execution_time
 @handle_scheduler_errors(reraise=False, return_on_error=None)
 @memory_monitor()
 def run_yahoo_macro_news_parallel():
-    """Yahoo 거시경제 지표 뉴스 크롤링 (병렬)"""
+    """Yahoo 거시경제 지표 뉴스 크롤링 (비동기)"""
     logger.info("news_crawling_started", source="yahoo_macro")
 
-    def process_symbol(symbol):
-        logger.debug("processing_symbol", source="yahoo_macro", symbol=symbol)
-        crawler = YahooNewsCrawler(symbol)
-        result = crawler.process_all(telegram_enabled=True)  # 텔레그램 활성화
-        return result
-
-    # 병렬 실행 (API 제한 고려하여 약간의 지연 추가)
     from app.common.constants.symbol_names import YAHOO_NEWS_SYMBOLS
-    results = executor.run_symbol_tasks_parallel(
-        process_symbol, list(YAHOO_NEWS_SYMBOLS.keys()), delay=0.5
-    )
 
-    success_count = sum(1 for r in results if r is not None)
-    logger.info(
-        "news_crawling_completed",
-        source="yahoo_macro",
-        success_count=success_count,
-        total_count=len(YAHOO_NEWS_SYMBOLS),
-        success_rate=success_count / len(YAHOO_NEWS_SYMBOLS),
+    _run_news_crawl_cycle(
+        "yahoo_macro",
+        yahoo_symbols=YAHOO_NEWS_SYMBOLS,
+        telegram_enabled=True,  # 텔레그램 활성화
     )
 
 
@@ -245,34 +190,18 @@ def run_yahoo_macro_news_parallel():
 @handle_scheduler_errors(reraise=False, return_on_error=None)
 @memory_monitor()
 def run_investing_macro_news_parallel():
-    """Investing.com 거시경제 특화 뉴스 크롤링 (병렬)"""
+    """Investing.com 거시경제 특화 뉴스 크롤링 (비동기)"""
     logger.info("news_crawling_started", source="investing_macro")
 
-    def process_symbol(symbol):
-        logger.debug("processing_symbol", source="investing_macro", symbol=symbol)
-        crawler = InvestingNewsCrawler(symbol)
-        result = crawler.process_all(telegram_enabled=True)  # 텔레그램 활성화
-        return result
-
-    # 병렬 실행 (API 제한 고려하여 약간의 지연 추가)
     from app.common.constants.investing_config import INVESTING_MACRO_SYMBOLS
-    results = executor.run_symbol_tasks_parallel(
-        process_symbol, INVESTING_MACRO_SYMBOLS, delay=0.5
-    )
 
-    success_count = sum(1 for r in results if r is not None)
-    logger.info(
-        "news_crawling_completed",
-        source="investing_macro",
-        success_count=success_count,
-        total_count=len(INVESTING_MACRO_SYMBOLS),
-        success_rate=success_count / len(INVESTING_MACRO_SYMBOLS),
+    _run_news_crawl_cycle(
+        "investing_macro",
+        investing_symbols=INVESTING_MACRO_SYMBOLS,
+        telegram_enabled=True,  # 텔레그램 활성화
     )
 
 
-
-
-
 @measure_execution_time
 @handle_scheduler_errors(reraise=False, return_on_error=None)
 @memory_monitor()
@@ -398,37 +327,43 @@ def run_realtime_price_monitor_job_parallel():
 
     async def run_async_price_monitoring():
         """비동기 가격 모니터링 실행"""
-        import asyncio
+        symbols = list(SYMBOL_PRICE_MAP.keys())
+
+        # 1. 모든 심볼 현재가를 공유 커넥션 풀/속도 제한으로 한 번에 조회
+        client = AsyncYahooPriceClient()
+        try:
+            prices = await client.get_latest_minute_prices(symbols)
+        finally:
+            await close_shared_session()
 
         async def check_price_async(symbol):
+            if prices.get(symbol) is None:
+                logger.warning("price_fetch_failed", symbol=symbol)
+                return None
             try:
                 with session_scope() as session:
                     service = PriceMonitorService()
                     if hasattr(service, "set_session"):
                         service.set_session(session)
 
-                    result = await service.check_price_against_baseline(symbol)
-                    return result
+                    result = await service.check_price_against_baseline(
+                        symbol, current_price=prices[symbol]
+                    )
+                    return result if result is not None else prices[symbol]
             except Exception as e:
                 logger.error(f"price_monitoring_failed", symbol=symbol, error=str(e))
                 return None
 
-        # 심볼들을 배치로 나누어 처리 (동시성 제한)
-        symbols = list(SYMBOL_PRICE_MAP.keys())
-        batch_size = 5  # 동시 처리할 심볼 수 제한
+        # 2. 기준가 비교/알림은 DB 작업이므로 배치로 나누어 처리 (DB 연결 수 제한)
+        batch_size = 5
         results = []
 
         for i in range(0, len(symbols), batch_size):
             batch = symbols[i : i + batch_size]
-
-            # 배치 내 심볼들을 동시에 처리
             batch_tasks = [check_price_async(symbol) for symbol in batch]
             batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
             results.extend(batch_results)
 
-            # 배치 간 지연 (API 제한 고려)
-            await asyncio.sleep(1.0)
-
         return results
 
     # 비동기 함수 실행
@@ -637,6 +572,9 @@ def start_parallel_scheduler():
     # ML 모델 훈련용 데이터 수집 작업도 3분마다
     scheduler.add_job(run_ml_training_data_collection_parallel, "interval", minutes=3)
 
+    # 미분석 뉴스 감정분석 백필 (1시간마다, 청크 단위로 이어서 처리)
+    scheduler.add_job(run_sentiment_backfill_job, "interval", hours=1)
+
     logger.info("parallel_scheduler_started")
     scheduler.start()
 
@@ -706,63 +644,30 @@ def run_async_technical_analysis_job():
                 "AMZN",
             ]
 
-            technical_service = AsyncTechnicalIndicatorService(max_workers=3)
             price_service = AsyncPriceService(max_workers=4, max_concurrency=8)
+            panel_service = IndicatorPanelService()
 
-            try:
-                async with price_service:
-                    # 가격 히스토리 조회
-                    price_histories = (
-                        await price_service.fetch_multiple_histories_async(
-                            major_symbols, period="1mo", interval="1d"
-                        )
-                    )
+            async with price_service:
+                # 가격 히스토리 조회
+                price_histories = await price_service.fetch_multiple_histories_async(
+                    major_symbols, period="1mo", interval="1d"
+                )
 
-                    # DataFrame 변환
-                    import pandas as pd
-
-                    symbol_data_map = {}
-                    for symbol, history in price_histories.items():
-                        if history and history.get("timestamps"):
-                            df = pd.DataFrame(
-                                {
-                                    "timestamp": pd.to_datetime(
-                                        history["timestamps"], unit="s"
-                                    ),
-                                    "open": history["open"],
-                                    "high": history["high"],
-                                    "low": history["low"],
-                                    "close": history["close"],
-                                    "volume": history["volume"],
-                                }
-                            ).dropna()
-
-                            if not df.empty:
-                                symbol_data_map[symbol] = df
-
-                    # 비동기 기술적 분석 실행
-                    if symbol_data_map:
-                        analysis_results = (
-                            await technical_service.analyze_multiple_symbols_async(
-                                symbol_data_map, batch_size=3
-                            )
-                        )
+            # (날짜 x 심볼) 패널로 정렬 후 전체 심볼 지표를 한 번에 계산
+            panel = IndicatorPanel.from_histories(price_histories)
+            if not panel.symbols:
+                logger.warning("no_valid_price_data_for_analysis")
+                return {}
 
-                        logger.info(
-                            "async_technical_analysis_completed",
-                            analyzed_symbols=len(analysis_results),
-                            total_symbols=len(major_symbols),
-                        )
+            analysis_results = panel_service.analyze_panel(panel)
 
-                        return analysis_results
-                    else:
-                        logger.warning("no_valid_price_data_for_analysis")
-                        return {}
+            logger.info(
+                "async_technical_analysis_completed",
+                analyzed_symbols=len(analysis_results),
+                total_symbols=len(major_symbols),
+            )
 
-            finally:
-                # 리소스 정리
-                if hasattr(technical_service, "__del__"):
-                    technical_service.__del__()
+            return analysis_results
 
         # 비동기 작업 실행
         loop = asyncio.new_event_loop()
@@ -814,6 +719,25 @@ def run_daily_comprehensive_report():
         )
 
 
+@measure_execution_time
+@handle_scheduler_errors(reraise=False, return_on_error=None)
+def run_sentiment_backfill_job():
+    """
+    미분석 뉴스 감정분석 백필
+    - 감정분석 결과가 없는 콘텐츠를 id 순 청크로 읽어 일괄 분석
+    - 대량이면 프로세스 풀에서 분석, 청크마다 일괄 저장
+    """
+    logger.info("sentiment_backfill_job_started")
+
+    result = SentimentBackfillService().run()
+
+    logger.info(
+        "sentiment_backfill_job_completed",
+        processed=result.get("processed", 0),
+        elapsed_seconds=result.get("elapsed_seconds", 0),
+    )
+
+
 @memory_monitor()
 def cleanup_scheduler_memory():
     """
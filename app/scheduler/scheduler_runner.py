@@ -403,7 +403,7 @@ def run_outcome_tracking_update():
     """
     logger.info("outcome_tracking_update_started")
     service = OutcomeTrackingService()
-    result = service.update_outcomes(hours_old=1)
+    result = service.update_outcomes_batch(hours_old=1)
 
     if "error" in result:
         logger.error("outcome_tracking_update_failed", error=result["error"])
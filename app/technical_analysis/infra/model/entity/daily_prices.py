@@ -17,6 +17,7 @@
 from sqlalchemy import (
     Column,
     BigInteger,
+    Integer,
     String,
     DECIMAL,
     Date,
@@ -43,7 +44,11 @@ class DailyPrice(Base):
     # =================================================================
 
     id = Column(
-        BigInteger, primary_key=True, autoincrement=True, comment="일봉 데이터 고유 ID"
+        # SQLite는 INTEGER PRIMARY KEY만 자동 증가하므로 로컬 테스트용 variant 지정
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+        comment="일봉 데이터 고유 ID",
     )
 
     symbol = Column(
@@ -5,17 +5,19 @@
 
 주요 기능:
 - 일봉 데이터 저장 (중복 체크 포함)
+- 청크 단위 대량 upsert (MySQL: ON DUPLICATE KEY UPDATE, SQLite/PostgreSQL: ON CONFLICT)
 - 심볼별, 날짜별 데이터 조회
 - 기간별 데이터 조회 (백테스팅용)
 - 최신 데이터 조회
 - 데이터 존재 여부 확인
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc, asc, func
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from app.technical_analysis.infra.model.entity.daily_prices import DailyPrice
 
 
@@ -53,10 +55,42 @@ class DailyPriceRepository:
             print(f"❌ 데이터 저장 실패: {e}")
             return None
 
+    # upsert 대상 컬럼 (id, created_at 제외)
+    UPSERT_COLUMNS = [
+        "symbol",
+        "date",
+        "open_price",
+        "high_price",
+        "low_price",
+        "close_price",
+        "volume",
+        "price_change",
+        "price_change_percent",
+    ]
+
     def save_bulk(self, daily_prices: List[DailyPrice]) -> Dict[str, int]:
         """
         일봉 데이터 대량 저장
 
+        이미 존재하는 (symbol, date)는 건너뜁니다 (기존 동작과 동일).
+        내부적으로 upsert_bulk(update_existing=False)를 사용하여
+        행마다 INSERT/COUNT를 보내지 않고 청크 단위로 처리합니다.
+
+        Args:
+            daily_prices: 저장할 일봉 데이터 리스트
+
+        Returns:
+            저장 결과 통계
+        """
+        return self.upsert_bulk(daily_prices, update_existing=False)
+
+    def save_bulk_row_by_row(self, daily_prices: List[DailyPrice]) -> Dict[str, int]:
+        """
+        일봉 데이터 행 단위 저장 (기존 방식)
+
+        행마다 save()를 호출하고, 실패 시 exists_by_symbol_and_date로
+        중복 여부를 다시 확인합니다. 벤치마크 비교용으로 남겨둡니다.
+
         Args:
             daily_prices: 저장할 일봉 데이터 리스트
 
@@ -79,10 +113,136 @@ class DailyPriceRepository:
         return {
             "saved": saved_count,
             "duplicates": duplicate_count,
+            "updated": 0,
+            "errors": error_count,
+            "total": len(daily_prices),
+        }
+
+    def upsert_bulk(
+        self,
+        daily_prices: List[Union[DailyPrice, Dict[str, Any]]],
+        chunk_size: int = 1000,
+        update_existing: bool = True,
+    ) -> Dict[str, int]:
+        """
+        일봉 데이터 청크 단위 대량 upsert
+
+        청크마다 기존 (symbol, date) 조회 1회 + 다중 행 INSERT 1회만 수행합니다.
+        - MySQL: INSERT ... ON DUPLICATE KEY UPDATE
+        - SQLite/PostgreSQL: INSERT ... ON CONFLICT (symbol, date) DO UPDATE/NOTHING
+
+        Args:
+            daily_prices: DailyPrice 엔티티 또는 컬럼명 딕셔너리 리스트
+            chunk_size: 한 번의 INSERT에 담을 행 수
+            update_existing: True면 기존 행의 가격을 덮어쓰고, False면 건너뜀
+
+        Returns:
+            {'saved': 신규 저장, 'duplicates': 기존에 있던 행,
+             'updated': 덮어쓴 행, 'errors': 실패, 'total': 입력 행 수}
+        """
+        # 입력 내 중복 (symbol, date)는 마지막 값 기준으로 하나만 남김
+        rows_by_key: Dict[tuple, Dict[str, Any]] = {}
+        for item in daily_prices:
+            row = self._to_upsert_row(item)
+            rows_by_key[(row["symbol"], row["date"])] = row
+        rows = list(rows_by_key.values())
+
+        saved_count = 0
+        duplicate_count = len(daily_prices) - len(rows)
+        updated_count = 0
+        error_count = 0
+
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            try:
+                existing_count = self._count_existing_keys(chunk)
+                self.session.execute(self._build_upsert_statement(chunk, update_existing))
+                self.session.commit()
+
+                saved_count += len(chunk) - existing_count
+                duplicate_count += existing_count
+                if update_existing:
+                    updated_count += existing_count
+            except Exception as e:
+                self.session.rollback()
+                error_count += len(chunk)
+                print(f"❌ 일봉 데이터 대량 저장 실패 ({len(chunk)}개): {e}")
+
+        return {
+            "saved": saved_count,
+            "duplicates": duplicate_count,
+            "updated": updated_count,
             "errors": error_count,
             "total": len(daily_prices),
         }
 
+    def _to_upsert_row(
+        self, item: Union[DailyPrice, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """DailyPrice 엔티티/딕셔너리를 INSERT용 딕셔너리로 변환"""
+        if isinstance(item, dict):
+            row = {column: item.get(column) for column in self.UPSERT_COLUMNS}
+        else:
+            row = {column: getattr(item, column) for column in self.UPSERT_COLUMNS}
+
+        if isinstance(row["date"], datetime):
+            row["date"] = row["date"].date()
+        return row
+
+    def _count_existing_keys(self, chunk: List[Dict[str, Any]]) -> int:
+        """청크 내 (symbol, date) 중 이미 저장된 개수 (쿼리 1회)"""
+        symbols = {row["symbol"] for row in chunk}
+        dates = [row["date"] for row in chunk]
+
+        existing = (
+            self.session.query(DailyPrice.symbol, DailyPrice.date)
+            .filter(
+                and_(
+                    DailyPrice.symbol.in_(symbols),
+                    DailyPrice.date >= min(dates),
+                    DailyPrice.date <= max(dates),
+                )
+            )
+            .all()
+        )
+        existing_keys = {(row.symbol, row.date) for row in existing}
+        return sum(1 for row in chunk if (row["symbol"], row["date"]) in existing_keys)
+
+    def _build_upsert_statement(
+        self, chunk: List[Dict[str, Any]], update_existing: bool
+    ):
+        """DB 종류에 맞는 다중 행 upsert 구문 생성"""
+        table = DailyPrice.__table__
+        dialect = self.session.get_bind().dialect.name
+        update_columns = [
+            column
+            for column in self.UPSERT_COLUMNS
+            if column not in ("symbol", "date")
+        ]
+
+        if dialect in ("mysql", "mariadb"):
+            stmt = mysql.insert(table).values(chunk)
+            if update_existing:
+                set_ = {column: stmt.inserted[column] for column in update_columns}
+                set_["updated_at"] = func.now()
+            else:
+                # 기존 행은 그대로 두기 (no-op update)
+                set_ = {"id": table.c.id}
+            return stmt.on_duplicate_key_update(**set_)
+
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            stmt = insert(table).values(chunk)
+            if not update_existing:
+                return stmt.on_conflict_do_nothing(index_elements=["symbol", "date"])
+            set_ = {column: stmt.excluded[column] for column in update_columns}
+            set_["updated_at"] = func.now()
+            return stmt.on_conflict_do_update(
+                index_elements=["symbol", "date"], set_=set_
+            )
+
+        raise ValueError(f"지원하지 않는 DB 방언입니다: {dialect}")
+
     def find_by_id(self, id: int) -> Optional[DailyPrice]:
         """ID로 일봉 데이터 조회"""
         return self.session.query(DailyPrice).filter(DailyPrice.id == id).first()
@@ -172,6 +332,33 @@ class DailyPriceRepository:
 
         return query.all()
 
+    def find_closes_by_date_range(
+        self, symbol: str, start_date: date, end_date: date
+    ) -> Dict[date, float]:
+        """
+        기간 내 날짜별 종가만 조회 (엔티티 로드 없이)
+
+        Args:
+            symbol: 심볼
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+
+        Returns:
+            {날짜: 종가} 딕셔너리
+        """
+        rows = (
+            self.session.query(DailyPrice.date, DailyPrice.close_price)
+            .filter(
+                and_(
+                    DailyPrice.symbol == symbol,
+                    DailyPrice.date >= start_date,
+                    DailyPrice.date <= end_date,
+                )
+            )
+            .all()
+        )
+        return {row.date: float(row.close_price) for row in rows}
+
     # =================================================================
     # 최신 데이터 조회
     # =================================================================
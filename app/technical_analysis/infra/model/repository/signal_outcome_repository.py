@@ -26,7 +26,7 @@
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, desc, asc
+from sqlalchemy import and_, or_, func, desc, asc, insert
 from app.technical_analysis.infra.model.entity.signal_outcomes import SignalOutcome
 from app.technical_analysis.infra.model.entity.technical_signals import TechnicalSignal
 
@@ -120,6 +120,36 @@ class SignalOutcomeRepository:
 
         return outcome
 
+    def bulk_create_outcome_records(self, signal_ids: List[int]) -> int:
+        """
+        여러 신호의 빈 결과 레코드를 다중 행 INSERT로 생성
+
+        방금 저장한 신호들에 대해 호출하므로 신호 존재/기존 레코드 확인은 생략합니다.
+        필드 초기값은 create_outcome_record()와 동일합니다. (commit은 서비스에서)
+
+        Args:
+            signal_ids: 결과 추적을 시작할 신호 ID 목록
+
+        Returns:
+            생성된 결과 레코드 수
+        """
+        if not signal_ids:
+            return 0
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "signal_id": signal_id,
+                "is_complete": False,
+                "created_at": now,
+                "last_updated_at": now,
+            }
+            for signal_id in signal_ids
+        ]
+
+        self.session.execute(insert(SignalOutcome), rows)
+        return len(rows)
+
     def find_by_id(self, outcome_id: int) -> Optional[SignalOutcome]:
         """
         ID로 결과 레코드 조회
@@ -200,6 +230,89 @@ class SignalOutcomeRepository:
             .all()
         )
 
+    def find_incomplete_outcomes_with_signals(
+        self, hours_old: int = 1, max_age_hours: int = 45 * 24
+    ) -> List[Tuple[SignalOutcome, TechnicalSignal]]:
+        """
+        미완료 결과 레코드와 원본 신호를 한 번의 조인 쿼리로 조회
+
+        find_incomplete_outcomes와 같은 조건을 사용하지만, 결과마다
+        find_by_id로 신호를 다시 조회하지 않도록 (결과, 신호) 쌍을 함께 반환합니다.
+        배치 업데이트(update_outcomes_batch)에서 사용합니다.
+
+        Args:
+            hours_old: 몇 시간 이상 된 것만 조회 (너무 최근 것은 제외)
+            max_age_hours: 최대 추적 기간 (기본: 45일, 이보다 오래된 것은 제외)
+
+        Returns:
+            (결과 레코드, 원본 신호) 튜플 리스트
+        """
+        cutoff_time = datetime.utcnow() - timedelta(hours=hours_old)
+        max_age_time = datetime.utcnow() - timedelta(hours=max_age_hours)
+
+        return (
+            self.session.query(SignalOutcome, TechnicalSignal)
+            .join(TechnicalSignal, SignalOutcome.signal_id == TechnicalSignal.id)
+            .filter(
+                and_(
+                    SignalOutcome.is_complete == False,
+                    TechnicalSignal.triggered_at <= cutoff_time,
+                    TechnicalSignal.triggered_at >= max_age_time,
+                    or_(
+                        SignalOutcome.price_1h_after == None,
+                        SignalOutcome.price_4h_after == None,
+                        SignalOutcome.price_1d_after == None,
+                        SignalOutcome.price_1w_after == None,
+                        SignalOutcome.price_1m_after == None,
+                    ),
+                )
+            )
+            .order_by(asc(SignalOutcome.created_at))
+            .all()
+        )
+
+    def find_signal_returns(
+        self,
+        signal_types: List[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[Tuple[int, datetime, str, str, float, float]]:
+        """
+        기간 내 신호와 1일 수익률을 한 번의 조인 쿼리로 조회 (백테스팅용)
+
+        신호마다 find_by_signal_id를 호출하지 않도록 필요한 컬럼만
+        시간순으로 반환합니다. 1일 수익률이 없는 신호는 제외됩니다.
+
+        Args:
+            signal_types: 조회할 신호 타입 리스트
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+
+        Returns:
+            (신호 ID, 발생 시점, 신호 타입, 심볼, 진입 가격, 1일 수익률%) 튜플 리스트
+        """
+        return (
+            self.session.query(
+                TechnicalSignal.id,
+                TechnicalSignal.triggered_at,
+                TechnicalSignal.signal_type,
+                TechnicalSignal.symbol,
+                TechnicalSignal.current_price,
+                SignalOutcome.return_1d,
+            )
+            .join(SignalOutcome, SignalOutcome.signal_id == TechnicalSignal.id)
+            .filter(
+                and_(
+                    TechnicalSignal.signal_type.in_(signal_types),
+                    TechnicalSignal.triggered_at >= start_date,
+                    TechnicalSignal.triggered_at <= end_date,
+                    SignalOutcome.return_1d.isnot(None),
+                )
+            )
+            .order_by(asc(TechnicalSignal.triggered_at), asc(TechnicalSignal.id))
+            .all()
+        )
+
     # =================================================================
     # 가격 및 수익률 업데이트
     # =================================================================
@@ -282,100 +395,116 @@ class SignalOutcomeRepository:
             if not outcome or not outcome.signal:
                 return False
 
-            original_price = float(outcome.signal.current_price)
-            signal_type = outcome.signal.signal_type.lower()
-
-            # 2. 신호 방향 판정 (상승 신호인지 하락 신호인지)
-            is_bullish_signal = any(
-                keyword in signal_type
-                for keyword in [
-                    "breakout_up",
-                    "golden_cross",
-                    "oversold",
-                    "bullish",
-                    "touch_lower",
-                ]
+            # 2. 시간대별 수익률, 성공 여부, 최대/최소 수익률 계산
+            update_fields = self.build_return_fields(
+                original_price=float(outcome.signal.current_price),
+                signal_type=outcome.signal.signal_type,
+                prices={
+                    "1h": outcome.price_1h_after,
+                    "4h": outcome.price_4h_after,
+                    "1d": outcome.price_1d_after,
+                    "1w": outcome.price_1w_after,
+                    "1m": outcome.price_1m_after,
+                },
             )
+            update_fields["last_updated_at"] = datetime.utcnow()
 
-            # 3. 업데이트할 필드들 준비
-            update_fields = {SignalOutcome.last_updated_at: datetime.utcnow()}
+            # 3. 업데이트 실행
+            rows_updated = (
+                self.session.query(SignalOutcome)
+                .filter(SignalOutcome.id == outcome_id)
+                .update(update_fields)
+            )
 
-            returns = []  # 최대/최소 수익률 계산용
-
-            # 4. 각 시간대별 수익률 계산
-            if outcome.price_1h_after is not None:
-                return_1h = (
-                    (float(outcome.price_1h_after) - original_price) / original_price
-                ) * 100
-                update_fields[SignalOutcome.return_1h] = return_1h
-                returns.append(return_1h)
-
-            if outcome.price_4h_after is not None:
-                return_4h = (
-                    (float(outcome.price_4h_after) - original_price) / original_price
-                ) * 100
-                update_fields[SignalOutcome.return_4h] = return_4h
-                returns.append(return_4h)
-
-            if outcome.price_1d_after is not None:
-                return_1d = (
-                    (float(outcome.price_1d_after) - original_price) / original_price
-                ) * 100
-                update_fields[SignalOutcome.return_1d] = return_1d
-                returns.append(return_1d)
-
-                # 1일 후 성공 여부 판정
-                if is_bullish_signal:
-                    update_fields[SignalOutcome.is_successful_1d] = return_1d > 0
-                else:
-                    update_fields[SignalOutcome.is_successful_1d] = return_1d < 0
+            return rows_updated > 0
 
-            if outcome.price_1w_after is not None:
-                return_1w = (
-                    (float(outcome.price_1w_after) - original_price) / original_price
-                ) * 100
-                update_fields[SignalOutcome.return_1w] = return_1w
-                returns.append(return_1w)
+        except Exception as e:
+            print(f"❌ 수익률 계산 실패: {e}")
+            return False
 
-                # 1주 후 성공 여부 판정
-                if is_bullish_signal:
-                    update_fields[SignalOutcome.is_successful_1w] = return_1w > 0
-                else:
-                    update_fields[SignalOutcome.is_successful_1w] = return_1w < 0
+    @staticmethod
+    def build_return_fields(
+        original_price: float,
+        signal_type: str,
+        prices: Dict[str, Optional[float]],
+    ) -> Dict[str, Any]:
+        """
+        시간대별 가격으로부터 수익률 관련 필드 계산 (DB 접근 없음)
+
+        calculate_and_update_returns와 배치 업데이트가 같은 계산 규칙을
+        공유하도록 분리한 순수 함수입니다.
+
+        Args:
+            original_price: 신호 발생 시점 가격
+            signal_type: 신호 타입 (상승/하락 방향 판정용)
+            prices: {"1h": 가격, "4h": 가격, "1d": 가격, "1w": 가격, "1m": 가격}
+                    (값이 None이면 해당 시간대는 건너뜀)
 
-            if outcome.price_1m_after is not None:
-                return_1m = (
-                    (float(outcome.price_1m_after) - original_price) / original_price
-                ) * 100
-                update_fields[SignalOutcome.return_1m] = return_1m
-                returns.append(return_1m)
+        Returns:
+            SignalOutcome 속성명을 키로 하는 업데이트 필드 딕셔너리
+        """
+        signal_type = signal_type.lower()
+
+        # 신호 방향 판정 (상승 신호인지 하락 신호인지)
+        is_bullish_signal = any(
+            keyword in signal_type
+            for keyword in [
+                "breakout_up",
+                "golden_cross",
+                "oversold",
+                "bullish",
+                "touch_lower",
+            ]
+        )
 
-                # 1개월 후 성공 여부 판정
+        update_fields: Dict[str, Any] = {}
+        returns = []  # 최대/최소 수익률 계산용
+
+        for timeframe in ["1h", "4h", "1d", "1w", "1m"]:
+            price = prices.get(timeframe)
+            if price is None:
+                continue
+
+            return_value = ((float(price) - original_price) / original_price) * 100
+            update_fields[f"return_{timeframe}"] = return_value
+            returns.append(return_value)
+
+            # 1일/1주/1개월 후 성공 여부 판정
+            if timeframe in ("1d", "1w", "1m"):
                 if is_bullish_signal:
-                    update_fields[SignalOutcome.is_successful_1m] = return_1m > 0
+                    update_fields[f"is_successful_{timeframe}"] = return_value > 0
                 else:
-                    update_fields[SignalOutcome.is_successful_1m] = return_1m < 0
+                    update_fields[f"is_successful_{timeframe}"] = return_value < 0
 
-                # 1개월까지 완료되면 추적 완료 표시
-                update_fields[SignalOutcome.is_complete] = True
+        # 1개월까지 완료되면 추적 완료 표시
+        if prices.get("1m") is not None:
+            update_fields["is_complete"] = True
 
-            # 5. 최대/최소 수익률 계산
-            if returns:
-                update_fields[SignalOutcome.max_return] = max(returns)
-                update_fields[SignalOutcome.min_return] = min(returns)
+        # 최대/최소 수익률 계산
+        if returns:
+            update_fields["max_return"] = max(returns)
+            update_fields["min_return"] = min(returns)
 
-            # 6. 업데이트 실행
-            rows_updated = (
-                self.session.query(SignalOutcome)
-                .filter(SignalOutcome.id == outcome_id)
-                .update(update_fields)
-            )
+        return update_fields
 
-            return rows_updated > 0
+    def bulk_update_outcomes(self, update_mappings: List[Dict[str, Any]]) -> int:
+        """
+        여러 결과 레코드의 가격/수익률을 한 번에 업데이트
 
-        except Exception as e:
-            print(f"❌ 수익률 계산 실패: {e}")
-            return False
+        각 딕셔너리는 "id"와 변경할 SignalOutcome 속성들을 포함해야 합니다.
+        커밋은 호출자가 담당합니다.
+
+        Args:
+            update_mappings: [{"id": 1, "price_1h_after": 101.2, ...}, ...]
+
+        Returns:
+            업데이트 요청된 레코드 수
+        """
+        if not update_mappings:
+            return 0
+
+        self.session.bulk_update_mappings(SignalOutcome, update_mappings)
+        return len(update_mappings)
 
     # =================================================================
     # 성과 통계 및 분석 쿼리
@@ -830,6 +959,33 @@ class SignalOutcomeRepository:
             self.session.rollback()
             return False
 
+    def mark_as_complete_bulk(self, outcome_ids: List[int]) -> int:
+        """
+        여러 결과 추적을 한 번의 UPDATE로 완료 상태로 표시
+
+        mark_as_complete와 달리 커밋하지 않으며, 호출자가 트랜잭션을 관리합니다.
+
+        Args:
+            outcome_ids: 완료 처리할 결과 ID 리스트
+
+        Returns:
+            완료 처리된 레코드 수
+        """
+        if not outcome_ids:
+            return 0
+
+        return (
+            self.session.query(SignalOutcome)
+            .filter(SignalOutcome.id.in_(outcome_ids))
+            .update(
+                {
+                    SignalOutcome.is_complete: True,
+                    SignalOutcome.last_updated_at: datetime.utcnow(),
+                },
+                synchronize_session=False,
+            )
+        )
+
     def count_outcomes_with_price_1h(self) -> int:
         """
         1시간 후 가격이 기록된 결과 개수 조회
@@ -16,10 +16,10 @@
 - 데이터베이스 변경시 영향 최소화
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, desc, asc
+from sqlalchemy import and_, or_, func, desc, asc, insert, tuple_
 from app.technical_analysis.infra.model.entity.technical_signals import TechnicalSignal
 
 
@@ -87,6 +87,86 @@ class TechnicalSignalRepository:
             self.session.rollback()
             raise Exception(f"신호 일괄 저장 실패: {e}")
 
+    def bulk_insert(
+        self, rows: List[Dict[str, Any]], chunk_size: int = 1000
+    ) -> List[int]:
+        """
+        여러 신호를 다중 행 INSERT로 저장하고 할당된 ID 반환 (commit은 서비스에서)
+
+        ORM flush는 자동 증가 ID를 받기 위해 MySQL에서 행마다 INSERT를 실행하므로,
+        청크 단위로 저장합니다. RETURNING을 지원하는 DB는 INSERT 결과로 ID를 받고,
+        MySQL처럼 지원하지 않으면 유니크 키 (심볼, 신호 타입, 시간대, 발생 시점)로
+        저장한 행을 다시 조회해 매칭합니다. (동시 저장이 있어도 다른 행과 섞이지 않음)
+
+        Args:
+            rows: TechnicalSignal 컬럼 값 딕셔너리 목록
+            chunk_size: 한 번의 INSERT에 담을 행 수
+
+        Returns:
+            rows와 같은 순서의 신호 ID 목록
+        """
+        if not rows:
+            return []
+
+        use_returning = self.session.get_bind().dialect.insert_executemany_returning
+
+        try:
+            ids: List[int] = []
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start : start + chunk_size]
+                if use_returning:
+                    result = self.session.execute(
+                        insert(TechnicalSignal).returning(
+                            TechnicalSignal.id, sort_by_parameter_order=True
+                        ),
+                        chunk,
+                    )
+                    ids.extend(result.scalars().all())
+                else:
+                    # DATETIME(초 단위)에 저장된 값과 키가 일치하도록 마이크로초 제거
+                    chunk = [
+                        {**row, "triggered_at": row["triggered_at"].replace(microsecond=0)}
+                        for row in chunk
+                    ]
+                    self.session.execute(insert(TechnicalSignal), chunk)
+                    ids.extend(self._find_ids_by_unique_key(chunk))
+        except Exception as e:
+            self.session.rollback()
+            raise Exception(f"신호 일괄 저장 실패: {e}")
+
+        return ids
+
+    def _find_ids_by_unique_key(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """uq_signal_unique 키로 저장된 신호 ID를 rows 순서대로 조회"""
+        key_columns = (
+            TechnicalSignal.symbol,
+            TechnicalSignal.signal_type,
+            TechnicalSignal.timeframe,
+            TechnicalSignal.triggered_at,
+        )
+        keys = [
+            (row["symbol"], row["signal_type"], row["timeframe"], row["triggered_at"])
+            for row in rows
+        ]
+
+        inserted = (
+            self.session.query(TechnicalSignal.id, *key_columns)
+            .filter(tuple_(*key_columns).in_(keys))
+            .all()
+        )
+        id_by_key = {
+            (row.symbol, row.signal_type, row.timeframe, row.triggered_at): row.id
+            for row in inserted
+        }
+
+        ids = []
+        for key in keys:
+            signal_id = id_by_key.get(key)
+            if signal_id is None:
+                raise Exception(f"저장된 신호 ID를 찾을 수 없습니다: {key}")
+            ids.append(signal_id)
+        return ids
+
     # =================================================================
     # READ 작업 (신호 조회)
     # =================================================================
@@ -404,3 +484,45 @@ class TechnicalSignalRepository:
         )
 
         return count > 0
+
+    def find_signal_times(
+        self,
+        symbols: List[str],
+        signal_types: List[str],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> List[Tuple[str, str, datetime]]:
+        """
+        여러 심볼/신호 타입의 발생 시점을 한 번에 조회
+        (일괄 저장 시 중복 체크용 - exists_recent_signal()을 신호마다 호출하지 않기 위함)
+
+        Args:
+            symbols: 심볼 목록
+            signal_types: 신호 타입 목록
+            start_time: 조회 시작 시점
+            end_time: 조회 종료 시점
+
+        Returns:
+            (심볼, 신호 타입, 발생 시점) 튜플 리스트
+        """
+        if not symbols or not signal_types:
+            return []
+
+        rows = (
+            self.session.query(
+                TechnicalSignal.symbol,
+                TechnicalSignal.signal_type,
+                TechnicalSignal.triggered_at,
+            )
+            .filter(
+                and_(
+                    TechnicalSignal.symbol.in_(symbols),
+                    TechnicalSignal.signal_type.in_(signal_types),
+                    TechnicalSignal.triggered_at >= start_time,
+                    TechnicalSignal.triggered_at <= end_time,
+                )
+            )
+            .all()
+        )
+
+        return [(row.symbol, row.signal_type, row.triggered_at) for row in rows]
@@ -17,6 +17,7 @@ Phase 3의 핵심 기능으로, 머신러닝과 통계 기법을 활용한 고
 - 통계적 유의성 검정 - 패턴의 신뢰도 검증
 """
 
+import json
 import random
 import numpy as np
 import pandas as pd
@@ -30,8 +31,12 @@ from app.technical_analysis.infra.model.repository.signal_pattern_repository imp
 from app.technical_analysis.infra.model.repository.technical_signal_repository import (
     TechnicalSignalRepository,
 )
+from app.technical_analysis.infra.model.repository.pattern_cluster_repository import (
+    PatternClusterRepository,
+)
 from app.technical_analysis.infra.model.entity.signal_patterns import SignalPattern
 from app.technical_analysis.infra.model.entity.technical_signals import TechnicalSignal
+from app.technical_analysis.infra.model.entity.pattern_clusters import PatternCluster
 
 
 class AdvancedPatternService:
@@ -59,18 +64,36 @@ class AdvancedPatternService:
     # 패턴 유사도 분석
     # =================================================================
 
+    # 시장 상황 방향성 분류 키워드 (_calculate_market_condition_similarity 와 동일)
+    BULLISH_CONDITIONS = ["bullish", "bull", "up", "positive"]
+    BEARISH_CONDITIONS = ["bearish", "bear", "down", "negative"]
+
+    # 유사도 계산 가중치 (이름, 지속시간, 시장상황, 시간적 근접성)
+    SIMILARITY_WEIGHTS = (0.3, 0.2, 0.2, 0.3)
+
     def calculate_pattern_similarity_matrix(
-        self, symbol: str, pattern_type: str = "sequential"
+        self,
+        symbol: str,
+        pattern_type: str = "sequential",
+        top_k: Optional[int] = None,
+        block_size: int = 512,
     ) -> Dict[str, Any]:
         """
         패턴 간 유사도 매트릭스 계산
 
+        패턴 특성을 한 번만 NumPy 배열로 추출한 뒤 행 블록 단위로 벡터화 계산합니다.
+        유사도는 대칭이므로 상삼각 블록만 계산하고 하삼각은 복사합니다.
+        top_k 를 지정하면 N×N 매트릭스 대신 패턴별 최근접 이웃만 반환하여
+        메모리 사용량을 block_size × N 수준으로 제한합니다.
+
         Args:
             symbol: 분석할 심볼
             pattern_type: 패턴 타입
+            top_k: 패턴별 최근접 이웃 개수 (None이면 전체 매트릭스 반환)
+            block_size: 한 번에 계산할 행 블록 크기
 
         Returns:
-            유사도 매트릭스와 분석 결과
+            유사도 매트릭스(또는 최근접 이웃)와 분석 결과
         """
         session, pattern_repo, signal_repo = self._get_session_and_repositories()
 
@@ -91,69 +114,314 @@ class AdvancedPatternService:
                     "pattern_count": len(patterns),
                 }
 
-            # 유사도 매트릭스 계산
-            similarity_matrix = []
-            pattern_info = []
-
-            for i, pattern1 in enumerate(patterns):
-                pattern_info.append(
-                    {
-                        "id": pattern1.id,
-                        "name": pattern1.pattern_name,
-                        "start": pattern1.pattern_start.isoformat(),
-                        "duration": (
-                            float(pattern1.pattern_duration_hours)
-                            if pattern1.pattern_duration_hours
-                            else 0.0
-                        ),
-                    }
-                )
+            pattern_info = [
+                {
+                    "id": pattern.id,
+                    "name": pattern.pattern_name,
+                    "start": pattern.pattern_start.isoformat(),
+                    "duration": (
+                        float(pattern.pattern_duration_hours)
+                        if pattern.pattern_duration_hours
+                        else 0.0
+                    ),
+                }
+                for pattern in patterns
+            ]
 
-                similarity_row = []
-                for j, pattern2 in enumerate(patterns):
-                    if i == j:
-                        similarity = 1.0
-                    else:
-                        similarity = self._calculate_advanced_similarity(
-                            pattern1, pattern2
-                        )
-                    similarity_row.append(round(similarity, 3))
-
-                similarity_matrix.append(similarity_row)
-
-            # 가장 유사한 패턴 쌍 찾기
-            most_similar_pairs = []
-            for i in range(len(patterns)):
-                for j in range(i + 1, len(patterns)):
-                    similarity = similarity_matrix[i][j]
-                    if similarity > 0.7:  # 70% 이상 유사한 경우
-                        most_similar_pairs.append(
-                            {
-                                "pattern1": pattern_info[i],
-                                "pattern2": pattern_info[j],
-                                "similarity": similarity,
-                            }
-                        )
-
-            # 유사도 순으로 정렬
-            most_similar_pairs.sort(key=lambda x: x["similarity"], reverse=True)
+            result = self._compute_similarity_results(
+                patterns, top_k=top_k, block_size=block_size
+            )
 
-            return {
+            response = {
                 "symbol": symbol,
                 "pattern_type": pattern_type,
                 "total_patterns": len(patterns),
-                "similarity_matrix": similarity_matrix,
                 "pattern_info": pattern_info,
-                "most_similar_pairs": most_similar_pairs[:10],  # 상위 10개만
+                "most_similar_pairs": [
+                    {
+                        "pattern1": pattern_info[i],
+                        "pattern2": pattern_info[j],
+                        "similarity": similarity,
+                    }
+                    for i, j, similarity in result["top_pairs"]
+                ],
                 "analysis_timestamp": datetime.utcnow().isoformat(),
             }
 
+            if top_k is None:
+                response["similarity_matrix"] = result["matrix"]
+            else:
+                response["top_k"] = top_k
+                response["nearest_neighbors"] = [
+                    {
+                        "id": pattern_info[i]["id"],
+                        "neighbors": [
+                            {"id": pattern_info[j]["id"], "similarity": similarity}
+                            for j, similarity in neighbors
+                        ],
+                    }
+                    for i, neighbors in enumerate(result["neighbors"])
+                ]
+
+            return response
+
         except Exception as e:
             print(f"❌ 패턴 유사도 분석 실패: {e}")
             return {"error": str(e)}
         finally:
             session.close()
 
+    def _compute_similarity_results(
+        self,
+        patterns: List[SignalPattern],
+        top_k: Optional[int] = None,
+        block_size: int = 512,
+        pair_threshold: float = 0.7,
+        max_pairs: int = 10,
+    ) -> Dict[str, Any]:
+        """
+        행 블록 단위 벡터화 유사도 계산
+
+        Args:
+            patterns: 분석할 패턴 목록
+            top_k: 패턴별 최근접 이웃 개수 (None이면 전체 매트릭스 생성)
+            block_size: 행 블록 크기
+            pair_threshold: 유사 패턴 쌍으로 판단할 최소 유사도
+            max_pairs: 반환할 최대 유사 패턴 쌍 개수
+
+        Returns:
+            matrix(전체 매트릭스 또는 None), neighbors(최근접 이웃 또는 None),
+            top_pairs((i, j, similarity) 목록)
+        """
+        n = len(patterns)
+        block_size = max(1, int(block_size))
+        features = self._extract_similarity_features(patterns)
+
+        matrix = np.empty((n, n), dtype=np.float64) if top_k is None else None
+        k = min(int(top_k), n - 1) if top_k is not None else 0
+        neighbors: List[List[Tuple[int, float]]] = []
+
+        pair_i: List[np.ndarray] = []
+        pair_j: List[np.ndarray] = []
+        pair_s: List[np.ndarray] = []
+
+        for start in range(0, n, block_size):
+            rows = np.arange(start, min(start + block_size, n))
+
+            if matrix is not None:
+                # 상삼각 블록만 계산 후 대칭 복사
+                cols = np.arange(start, n)
+                block = self._similarity_block(features, rows, cols)
+                block[:, : len(rows)][np.diag_indices(len(rows))] = 1.0
+                matrix[start : rows[-1] + 1, start:] = block
+                matrix[start:, start : rows[-1] + 1] = block.T
+            else:
+                # 이웃 탐색은 전체 열이 필요하지만 블록 크기만큼만 메모리 사용
+                cols = np.arange(n)
+                full_block = self._similarity_block(features, rows, cols)
+                full_block[np.arange(len(rows)), rows] = -np.inf
+                if k > 0:
+                    candidates = np.argpartition(-full_block, k - 1, axis=1)[:, :k]
+                    candidate_scores = np.take_along_axis(full_block, candidates, 1)
+                    order = np.argsort(-candidate_scores, axis=1, kind="stable")
+                    candidates = np.take_along_axis(candidates, order, 1)
+                    candidate_scores = np.take_along_axis(candidate_scores, order, 1)
+                    neighbors.extend(
+                        [
+                            (int(j), round(float(s), 3))
+                            for j, s in zip(row_idx, row_scores)
+                        ]
+                        for row_idx, row_scores in zip(candidates, candidate_scores)
+                    )
+                else:
+                    neighbors.extend([] for _ in rows)
+                block = full_block[:, start:]
+                cols = cols[start:]
+
+            # 유사 패턴 쌍 후보 (상삼각, 임계값 초과)
+            upper = cols[None, :] > rows[:, None]
+            local_i, local_j = np.nonzero(upper & (block > pair_threshold))
+            if len(local_i):
+                scores = block[local_i, local_j]
+                if len(scores) > max_pairs:
+                    keep = np.argpartition(-scores, max_pairs - 1)[:max_pairs]
+                    local_i, local_j, scores = local_i[keep], local_j[keep], scores[keep]
+                pair_i.append(rows[local_i])
+                pair_j.append(cols[local_j])
+                pair_s.append(scores)
+
+        top_pairs: List[Tuple[int, int, float]] = []
+        if pair_s:
+            all_i = np.concatenate(pair_i)
+            all_j = np.concatenate(pair_j)
+            all_s = np.concatenate(pair_s)
+            order = np.argsort(-all_s, kind="stable")[:max_pairs]
+            top_pairs = [
+                (int(all_i[idx]), int(all_j[idx]), round(float(all_s[idx]), 3))
+                for idx in order
+            ]
+
+        return {
+            "matrix": (
+                np.round(matrix, 3).tolist()
+                if matrix is not None
+                else None
+            ),
+            "neighbors": neighbors if matrix is None else None,
+            "top_pairs": top_pairs,
+        }
+
+    def _extract_similarity_features(
+        self, patterns: List[SignalPattern]
+    ) -> Dict[str, np.ndarray]:
+        """
+        유사도 계산에 필요한 패턴 특성을 NumPy 배열로 한 번에 추출
+
+        Args:
+            patterns: 패턴 목록
+
+        Returns:
+            이름 토큰 행렬, 지속시간, 시장 상황 코드, 시작 시각 배열
+        """
+        n = len(patterns)
+
+        # 1. 이름 토큰 이진 행렬 (Jaccard 유사도를 행렬곱으로 계산)
+        vocabulary: Dict[str, int] = {}
+        token_rows: List[List[int]] = []
+        for pattern in patterns:
+            name = pattern.pattern_name
+            tokens = set(name.lower().split("_")) if name else set()
+            token_rows.append(
+                [vocabulary.setdefault(token, len(vocabulary)) for token in tokens]
+            )
+
+        tokens = np.zeros((n, max(len(vocabulary), 1)), dtype=np.float64)
+        for i, token_ids in enumerate(token_rows):
+            tokens[i, token_ids] = 1.0
+
+        # 2. 지속 시간 (None은 NaN)
+        durations = np.array(
+            [
+                (
+                    float(p.pattern_duration_hours)
+                    if p.pattern_duration_hours is not None
+                    else np.nan
+                )
+                for p in patterns
+            ],
+            dtype=np.float64,
+        )
+
+        # 3. 시장 상황 (라벨 코드 + 방향성 플래그, 빈 값은 -1)
+        condition_codes: Dict[str, int] = {}
+        conditions = np.full(n, -1, dtype=np.int64)
+        bullish = np.zeros(n, dtype=bool)
+        bearish = np.zeros(n, dtype=bool)
+        for i, pattern in enumerate(patterns):
+            if not pattern.market_condition:
+                continue
+            label = pattern.market_condition.lower()
+            conditions[i] = condition_codes.setdefault(label, len(condition_codes))
+            bullish[i] = any(term in label for term in self.BULLISH_CONDITIONS)
+            bearish[i] = any(term in label for term in self.BEARISH_CONDITIONS)
+
+        # 4. 시작 시각 (기준 시각 대비 초 단위, None은 NaN)
+        reference = next((p.pattern_start for p in patterns if p.pattern_start), None)
+        starts = np.array(
+            [
+                (
+                    (p.pattern_start - reference).total_seconds()
+                    if p.pattern_start
+                    else np.nan
+                )
+                for p in patterns
+            ],
+            dtype=np.float64,
+        )
+
+        return {
+            "tokens": tokens,
+            "token_counts": tokens.sum(axis=1),
+            "durations": durations,
+            "conditions": conditions,
+            "bullish": bullish,
+            "bearish": bearish,
+            "starts": starts,
+        }
+
+    def _similarity_block(
+        self, features: Dict[str, np.ndarray], rows: np.ndarray, cols: np.ndarray
+    ) -> np.ndarray:
+        """
+        행/열 인덱스 블록에 대한 벡터화 유사도 계산
+
+        _calculate_advanced_similarity 와 동일한 가중치와 규칙을 사용합니다.
+
+        Args:
+            features: _extract_similarity_features 결과
+            rows: 행 패턴 인덱스
+            cols: 열 패턴 인덱스
+
+        Returns:
+            (len(rows), len(cols)) 유사도 행렬
+        """
+        w_name, w_duration, w_market, w_temporal = self.SIMILARITY_WEIGHTS
+
+        # 1. 이름 Jaccard 유사도
+        intersection = features["tokens"][rows] @ features["tokens"][cols].T
+        union = (
+            features["token_counts"][rows][:, None]
+            + features["token_counts"][cols][None, :]
+            - intersection
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            name_sim = np.where(union > 0, intersection / union, 0.0)
+
+        # 2. 지속 시간 유사도
+        d1 = features["durations"][rows][:, None]
+        d2 = features["durations"][cols][None, :]
+        max_duration = np.maximum(d1, d2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            duration_sim = np.where(
+                max_duration == 0,
+                1.0,
+                np.maximum(0.0, 1.0 - np.abs(d1 - d2) / max_duration),
+            )
+        duration_sim = np.where(np.isnan(d1) | np.isnan(d2), 0.5, duration_sim)
+
+        # 3. 시장 상황 유사도
+        c1 = features["conditions"][rows][:, None]
+        c2 = features["conditions"][cols][None, :]
+        bull1 = features["bullish"][rows][:, None]
+        bull2 = features["bullish"][cols][None, :]
+        bear1 = features["bearish"][rows][:, None]
+        bear2 = features["bearish"][cols][None, :]
+        same_direction = (bull1 & bull2) | (bear1 & bear2)
+        opposite_direction = (bull1 & bear2) | (bear1 & bull2)
+        market_sim = np.select(
+            [(c1 < 0) | (c2 < 0), c1 == c2, same_direction, opposite_direction],
+            [0.5, 1.0, 0.7, 0.1],
+            default=0.5,
+        )
+
+        # 4. 시간적 근접성 (일 단위)
+        s1 = features["starts"][rows][:, None]
+        s2 = features["starts"][cols][None, :]
+        time_diff = np.floor(np.abs(s1 - s2) / 86400.0)
+        temporal_sim = np.select(
+            [np.isnan(time_diff), time_diff <= 7, time_diff <= 30],
+            [0.5, 1.0, 1.0 - (time_diff - 7) / 23 * 0.5],
+            default=np.maximum(0.1, 1.0 - time_diff / 365),
+        )
+
+        total = (
+            name_sim * w_name
+            + duration_sim * w_duration
+            + market_sim * w_market
+            + temporal_sim * w_temporal
+        )
+        return np.clip(total, 0.0, 1.0)
+
     def _calculate_advanced_similarity(
         self, pattern1: SignalPattern, pattern2: SignalPattern
     ) -> float:
@@ -188,7 +456,7 @@ class AdvancedPatternService:
         similarity_scores.append(market_similarity * 0.2)  # 20% 가중치
 
         # 4. 시간적 근접성 (발생 시점이 비슷한지)
-        temporal_similarity = self._calculate_temporal_similarity(
+        temporal_similarity = self._calculate_start_time_similarity(
             pattern1.pattern_start, pattern2.pattern_start
         )
         similarity_scores.append(temporal_similarity * 0.3)  # 30% 가중치
@@ -244,8 +512,8 @@ class AdvancedPatternService:
             return 1.0
 
         # 유사한 시장 상황 그룹화
-        bullish_conditions = ["bullish", "bull", "up", "positive"]
-        bearish_conditions = ["bearish", "bear", "down", "negative"]
+        bullish_conditions = self.BULLISH_CONDITIONS
+        bearish_conditions = self.BEARISH_CONDITIONS
 
         c1_lower = condition1.lower()
         c2_lower = condition2.lower()
@@ -262,13 +530,13 @@ class AdvancedPatternService:
         else:
             return 0.5  # 중립
 
-    def _calculate_temporal_similarity(self, time1: datetime, time2: datetime) -> float:
+    def _calculate_start_time_similarity(self, time1: datetime, time2: datetime) -> float:
         """시간적 근접성 계산"""
         if not time1 or not time2:
             return 0.5
 
         # 시간 차이 계산 (일 단위)
-        time_diff = abs((time1 - time2).days)
+        time_diff = abs(time1 - time2).days
 
         # 30일 이내면 높은 유사도, 그 이후로는 감소
         if time_diff <= 7:
@@ -278,376 +546,6 @@ class AdvancedPatternService:
         else:
             return max(0.1, 1.0 - time_diff / 365)  # 1년 기준으로 감소
 
-    # =================================================================
-    # 패턴 클러스터링
-    # =================================================================
-
-    def cluster_patterns(
-        self, symbol: str, n_clusters: int = 5, min_patterns: int = 10
-    ) -> Dict[str, Any]:
-        """
-        패턴 클러스터링을 통한 그룹화
-
-        Args:
-            symbol: 분석할 심볼
-            n_clusters: 생성할 클러스터 개수
-            min_patterns: 클러스터링에 필요한 최소 패턴 개수
-
-        Returns:
-            클러스터링 결과
-        """
-        session, pattern_repo, signal_repo = self._get_session_and_repositories()
-
-        try:
-            print(f"🔍 {symbol} 패턴 클러스터링 시작 (클러스터: {n_clusters}개)")
-
-            # 해당 심볼의 모든 패턴 조회
-            patterns = (
-                session.query(SignalPattern)
-                .filter(SignalPattern.symbol == symbol)
-                .all()
-            )
-
-            if len(patterns) < min_patterns:
-                return {
-                    "message": f"클러스터링을 위한 패턴이 부족합니다 (최소 {min_patterns}개 필요, 현재 {len(patterns)}개)",
-                    "pattern_count": len(patterns),
-                }
-
-            # 패턴 특성 벡터 생성
-            feature_vectors = []
-            pattern_info = []
-
-            for pattern in patterns:
-                # 각 패턴을 수치 벡터로 변환
-                features = self._extract_pattern_features(pattern)
-                if features:
-                    feature_vectors.append(features)
-                    pattern_info.append(
-                        {
-                            "id": pattern.id,
-                            "name": pattern.pattern_name,
-                            "start": pattern.pattern_start.isoformat(),
-                            "duration": (
-                                float(pattern.pattern_duration_hours)
-                                if pattern.pattern_duration_hours
-                                else 0.0
-                            ),
-                            "market_condition": pattern.market_condition,
-                        }
-                    )
-
-            if len(feature_vectors) < n_clusters:
-                n_clusters = max(2, len(feature_vectors) // 2)  # 클러스터 수 조정
-
-            # 간단한 K-means 클러스터링 구현
-            clusters = self._simple_kmeans_clustering(feature_vectors, n_clusters)
-
-            # 클러스터별 분석
-            cluster_analysis = []
-            for i, cluster_indices in enumerate(clusters):
-                if not cluster_indices:
-                    continue
-
-                cluster_patterns = [pattern_info[idx] for idx in cluster_indices]
-                cluster_features = [feature_vectors[idx] for idx in cluster_indices]
-
-                # 클러스터 특성 분석
-                cluster_stats = self._analyze_cluster_characteristics(
-                    cluster_patterns, cluster_features
-                )
-
-                cluster_analysis.append(
-                    {
-                        "cluster_id": i,
-                        "cluster_name": self._generate_cluster_name(cluster_stats),
-                        "pattern_count": len(cluster_patterns),
-                        "patterns": cluster_patterns[:5],  # 상위 5개만
-                        "characteristics": cluster_stats,
-                        "avg_success_rate": cluster_stats.get("avg_success_rate", 0.5),
-                    }
-                )
-
-            return {
-                "symbol": symbol,
-                "total_patterns": len(patterns),
-                "clustered_patterns": len(feature_vectors),
-                "n_clusters": len(cluster_analysis),
-                "clusters": cluster_analysis,
-                "analysis_quality": self._assess_clustering_quality(
-                    clusters, feature_vectors
-                ),
-                "analysis_timestamp": datetime.utcnow().isoformat(),
-            }
-
-        except Exception as e:
-            print(f"❌ 패턴 클러스터링 실패: {e}")
-            return {"error": str(e)}
-        finally:
-            session.close()
-
-    def _extract_pattern_features(
-        self, pattern: SignalPattern
-    ) -> Optional[List[float]]:
-        """패턴에서 수치 특성 추출"""
-        try:
-            features = []
-
-            # 1. 지속 시간 (정규화)
-            duration = (
-                float(pattern.pattern_duration_hours)
-                if pattern.pattern_duration_hours
-                else 0.0
-            )
-            features.append(min(duration / 24.0, 10.0))  # 최대 10일로 정규화
-
-            # 2. 패턴 이름 기반 특성
-            name = pattern.pattern_name.lower() if pattern.pattern_name else ""
-
-            # 신호 타입별 원-핫 인코딩
-            signal_types = ["rsi", "ma", "bb", "macd", "cross", "volume"]
-            for signal_type in signal_types:
-                features.append(1.0 if signal_type in name else 0.0)
-
-            # 방향성 (상승/하락)
-            bullish_terms = ["up", "bull", "breakout", "golden", "oversold"]
-            bearish_terms = ["down", "bear", "breakdown", "dead", "overbought"]
-
-            bullish_score = sum(1 for term in bullish_terms if term in name)
-            bearish_score = sum(1 for term in bearish_terms if term in name)
-
-            features.append(bullish_score / max(len(bullish_terms), 1))
-            features.append(bearish_score / max(len(bearish_terms), 1))
-
-            # 3. 시장 상황
-            market_condition = (
-                pattern.market_condition.lower() if pattern.market_condition else ""
-            )
-            features.append(1.0 if "bull" in market_condition else 0.0)
-            features.append(1.0 if "bear" in market_condition else 0.0)
-
-            # 4. 시간적 특성 (요일, 월)
-            if pattern.pattern_start:
-                features.append(
-                    pattern.pattern_start.weekday() / 6.0
-                )  # 0-6을 0-1로 정규화
-                features.append(
-                    pattern.pattern_start.month / 12.0
-                )  # 1-12를 0-1로 정규화
-            else:
-                features.extend([0.5, 0.5])  # 중립값
-
-            return features
-
-        except Exception as e:
-            print(f"⚠️ 패턴 특성 추출 실패: {e}")
-            return None
-
-    def _simple_kmeans_clustering(
-        self, feature_vectors: List[List[float]], n_clusters: int
-    ) -> List[List[int]]:
-        """간단한 K-means 클러스터링 구현"""
-        if not feature_vectors or n_clusters <= 0:
-            return []
-
-        n_features = len(feature_vectors[0])
-        n_points = len(feature_vectors)
-
-        # 초기 중심점 랜덤 선택
-        import random
-
-        random.seed(42)  # 재현 가능한 결과를 위해
-
-        centroids = []
-        for _ in range(n_clusters):
-            centroid = [random.random() for _ in range(n_features)]
-            centroids.append(centroid)
-
-        # K-means 반복
-        max_iterations = 50
-        for iteration in range(max_iterations):
-            # 각 점을 가장 가까운 중심점에 할당
-            clusters = [[] for _ in range(n_clusters)]
-
-            for i, point in enumerate(feature_vectors):
-                distances = []
-                for centroid in centroids:
-                    # 유클리드 거리 계산
-                    distance = sum((p - c) ** 2 for p, c in zip(point, centroid)) ** 0.5
-                    distances.append(distance)
-
-                closest_cluster = distances.index(min(distances))
-                clusters[closest_cluster].append(i)
-
-            # 새로운 중심점 계산
-            new_centroids = []
-            for cluster_indices in clusters:
-                if cluster_indices:
-                    # 클러스터 내 점들의 평균
-                    cluster_points = [feature_vectors[i] for i in cluster_indices]
-                    centroid = []
-                    for j in range(n_features):
-                        avg = sum(point[j] for point in cluster_points) / len(
-                            cluster_points
-                        )
-                        centroid.append(avg)
-                    new_centroids.append(centroid)
-                else:
-                    # 빈 클러스터는 랜덤 중심점 유지
-                    new_centroids.append(centroids[len(new_centroids)])
-
-            # 수렴 체크 (중심점 변화가 작으면 종료)
-            converged = True
-            for old, new in zip(centroids, new_centroids):
-                distance = sum((o - n) ** 2 for o, n in zip(old, new)) ** 0.5
-                if distance > 0.001:  # 임계값
-                    converged = False
-                    break
-
-            centroids = new_centroids
-
-            if converged:
-                break
-
-        return clusters
-
-    def _analyze_cluster_characteristics(
-        self, cluster_patterns: List[Dict], cluster_features: List[List[float]]
-    ) -> Dict[str, Any]:
-        """클러스터 특성 분석"""
-        if not cluster_patterns:
-            return {}
-
-        # 평균 지속 시간
-        durations = [p["duration"] for p in cluster_patterns if p["duration"] > 0]
-        avg_duration = sum(durations) / len(durations) if durations else 0
-
-        # 시장 상황 분포
-        market_conditions = [
-            p["market_condition"] for p in cluster_patterns if p["market_condition"]
-        ]
-        market_dist = {}
-        for condition in market_conditions:
-            market_dist[condition] = market_dist.get(condition, 0) + 1
-
-        # 패턴 이름 분석
-        pattern_names = [p["name"] for p in cluster_patterns if p["name"]]
-        common_terms = self._find_common_terms(pattern_names)
-
-        # 성공률 추정 (간단한 휴리스틱)
-        success_rate = self._estimate_cluster_success_rate(
-            cluster_patterns, cluster_features
-        )
-
-        return {
-            "avg_duration_hours": avg_duration,
-            "market_condition_distribution": market_dist,
-            "common_terms": common_terms,
-            "avg_success_rate": success_rate,
-            "pattern_count": len(cluster_patterns),
-        }
-
-    def _find_common_terms(self, pattern_names: List[str]) -> List[str]:
-        """패턴 이름에서 공통 용어 찾기"""
-        if not pattern_names:
-            return []
-
-        # 모든 패턴 이름에서 단어 추출
-        all_terms = []
-        for name in pattern_names:
-            terms = name.lower().split("_")
-            all_terms.extend(terms)
-
-        # 빈도 계산
-        term_counts = {}
-        for term in all_terms:
-            term_counts[term] = term_counts.get(term, 0) + 1
-
-        # 빈도가 높은 상위 3개 용어 반환
-        sorted_terms = sorted(term_counts.items(), key=lambda x: x[1], reverse=True)
-        return [term for term, count in sorted_terms[:3] if count > 1]
-
-    def _estimate_cluster_success_rate(
-        self, cluster_patterns: List[Dict], cluster_features: List[List[float]]
-    ) -> float:
-        """클러스터 성공률 추정 (휴리스틱)"""
-        if not cluster_features:
-            return 0.5
-
-        # 특성 기반 성공률 추정
-        avg_features = []
-        n_features = len(cluster_features[0])
-
-        for i in range(n_features):
-            avg = sum(features[i] for features in cluster_features) / len(
-                cluster_features
-            )
-            avg_features.append(avg)
-
-        # 간단한 휴리스틱: 특정 특성 조합이 높은 성공률을 가진다고 가정
-        success_score = 0.5  # 기본값
-
-        # 상승 패턴 특성이 강하면 성공률 증가
-        if len(avg_features) > 7:  # bullish_score 인덱스
-            success_score += avg_features[7] * 0.2
-
-        # 지속 시간이 적절하면 성공률 증가 (너무 짧거나 길지 않게)
-        if len(avg_features) > 0:
-            duration_score = avg_features[0]
-            if 0.1 <= duration_score <= 0.5:  # 적절한 지속 시간
-                success_score += 0.1
-
-        return min(max(success_score, 0.1), 0.9)  # 0.1~0.9 범위로 제한
-
-    def _generate_cluster_name(self, cluster_stats: Dict[str, Any]) -> str:
-        """클러스터 이름 생성"""
-        common_terms = cluster_stats.get("common_terms", [])
-        avg_success_rate = cluster_stats.get("avg_success_rate", 0.5)
-
-        if common_terms:
-            base_name = "_".join(common_terms[:2])
-        else:
-            base_name = "mixed_pattern"
-
-        # 성공률에 따른 접두사
-        if avg_success_rate >= 0.7:
-            prefix = "high_success"
-        elif avg_success_rate >= 0.6:
-            prefix = "good"
-        elif avg_success_rate <= 0.4:
-            prefix = "low_success"
-        else:
-            prefix = "moderate"
-
-        return f"{prefix}_{base_name}_cluster"
-
-    def _assess_clustering_quality(
-        self, clusters: List[List[int]], feature_vectors: List[List[float]]
-    ) -> str:
-        """클러스터링 품질 평가"""
-        if not clusters or not feature_vectors:
-            return "Poor"
-
-        # 클러스터 크기 균형 체크
-        cluster_sizes = [len(cluster) for cluster in clusters if cluster]
-        if not cluster_sizes:
-            return "Poor"
-
-        avg_size = sum(cluster_sizes) / len(cluster_sizes)
-        size_variance = sum((size - avg_size) ** 2 for size in cluster_sizes) / len(
-            cluster_sizes
-        )
-
-        # 클러스터 간 분리도 체크 (간단한 버전)
-        non_empty_clusters = [cluster for cluster in clusters if cluster]
-
-        if len(non_empty_clusters) < 2:
-            return "Poor"
-        elif size_variance < avg_size * 0.5:  # 크기가 비교적 균등
-            return "Good"
-        else:
-            return "Fair"
-
     # =================================================================
     # 시계열 패턴 분석
     # =================================================================
@@ -1003,23 +901,55 @@ class AdvancedPatternService:
     # 클러스터링 기반 패턴 그룹화
     # =================================================================
 
+    # 클러스터링 결과 저장 시간대 (PatternClusterRepository 기본값과 동일)
+    CLUSTER_TIMEFRAME = "1day"
+
+    # 이 개수 이상의 패턴은 미니배치 K-means 로 학습
+    MINI_BATCH_THRESHOLD = 5000
+
+    # _extract_pattern_features 특성 벡터 내 시장 상황(bullish/bearish) 인덱스
+    BULLISH_FEATURE_INDEX = 7
+    BEARISH_FEATURE_INDEX = 8
+
     def cluster_patterns(
-        self, symbol: str, n_clusters: int = 5, min_patterns: int = 10
+        self,
+        symbol: str,
+        n_clusters: int = 5,
+        min_patterns: int = 10,
+        full_refit: bool = False,
+        mini_batch: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """
         패턴 클러스터링을 통한 그룹화
 
+        저장된 클러스터가 있으면 이후 새로 생성된 패턴만 기존 중심점에 할당하고,
+        full_refit=True 이거나 저장된 결과가 없을 때만 전체 재학습합니다.
+
         Args:
             symbol: 분석할 심볼
             n_clusters: 클러스터 개수
             min_patterns: 최소 패턴 개수
+            full_refit: 기존 클러스터를 무시하고 전체 재학습할지 여부
+            mini_batch: 미니배치 학습 여부 (None이면 패턴 수로 자동 결정)
 
         Returns:
             클러스터링 결과
         """
         session, pattern_repo, signal_repo = self._get_session_and_repositories()
+        cluster_repo = PatternClusterRepository(session)
 
         try:
+            if not full_refit:
+                existing_clusters = cluster_repo.find_latest_by_symbol(
+                    symbol, self.CLUSTER_TIMEFRAME
+                )
+                if existing_clusters:
+                    result = self._assign_new_patterns_to_clusters(
+                        session, symbol, existing_clusters
+                    )
+                    if result is not None:
+                        return result
+
             # 패턴 데이터 수집
             patterns = (
                 session.query(SignalPattern)
@@ -1033,65 +963,277 @@ class AdvancedPatternService:
                     "pattern_count": len(patterns),
                 }
 
-            # 특성 벡터 생성
+            # 특성 행렬 생성
             feature_vectors = []
-            pattern_info = []
+            clustered = []
 
             for pattern in patterns:
                 features = self._extract_pattern_features(pattern)
                 if features is not None:
                     feature_vectors.append(features)
-                    pattern_info.append(
-                        {
-                            "id": pattern.id,
-                            "name": pattern.pattern_name,
-                            "start": pattern.pattern_start.isoformat(),
-                            "duration": (
-                                float(pattern.pattern_duration_hours)
-                                if pattern.pattern_duration_hours
-                                else 0.0
-                            ),
-                        }
-                    )
+                    clustered.append(pattern)
 
-            if len(feature_vectors) < n_clusters:
-                n_clusters = len(feature_vectors)
+            data = np.asarray(feature_vectors, dtype=np.float64)
+            pattern_info = [self._cluster_pattern_info(p) for p in clustered]
 
-            # 간단한 K-means 클러스터링 구현 (numpy 기반)
-            clusters = self._simple_kmeans_clustering(feature_vectors, n_clusters)
+            if len(data) < n_clusters:
+                n_clusters = len(data)
 
-            # 클러스터별 패턴 그룹화
-            clustered_patterns = {}
-            for i, cluster_id in enumerate(clusters):
-                if cluster_id not in clustered_patterns:
-                    clustered_patterns[cluster_id] = []
-                clustered_patterns[cluster_id].append(pattern_info[i])
+            if mini_batch is None:
+                mini_batch = len(data) >= self.MINI_BATCH_THRESHOLD
+
+            labels, centroids, inertia = self._kmeans_clustering(
+                data, n_clusters, mini_batch=mini_batch
+            )
 
-            # 클러스터 특성 분석
+            # 클러스터별 패턴 그룹화
+            patterns_by_id = {p.id: p for p in clustered}
             cluster_analysis = {}
-            for cluster_id, cluster_patterns in clustered_patterns.items():
+            for cluster_id in range(n_clusters):
+                member_indices = np.flatnonzero(labels == cluster_id)
+                if len(member_indices) == 0:
+                    continue
+
+                cluster_patterns = [pattern_info[i] for i in member_indices]
                 cluster_analysis[cluster_id] = {
                     "pattern_count": len(cluster_patterns),
                     "patterns": cluster_patterns,
                     "characteristics": self._analyze_cluster_characteristics(
-                        cluster_patterns, patterns
+                        cluster_patterns, patterns_by_id
                     ),
                 }
 
+            saved_clusters = self._save_cluster_results(
+                cluster_repo,
+                symbol,
+                clustered,
+                data,
+                labels,
+                centroids,
+                cluster_analysis,
+                inertia,
+                algorithm="minibatch_kmeans" if mini_batch else "kmeans",
+            )
+
             return {
                 "symbol": symbol,
+                "mode": "full_refit",
+                "algorithm": "minibatch_kmeans" if mini_batch else "kmeans",
                 "total_patterns": len(patterns),
+                "patterns_clustered": len(clustered),
                 "n_clusters": n_clusters,
                 "clusters": cluster_analysis,
+                "inertia": round(float(inertia), 4),
+                "persisted_clusters": len(saved_clusters),
                 "analysis_timestamp": datetime.utcnow().isoformat(),
             }
 
         except Exception as e:
+            session.rollback()
             print(f"❌ 패턴 클러스터링 실패: {e}")
             return {"error": str(e)}
         finally:
             session.close()
 
+    def _cluster_pattern_info(self, pattern: SignalPattern) -> Dict[str, Any]:
+        """클러스터 결과에 포함할 패턴 요약 정보"""
+        return {
+            "id": pattern.id,
+            "name": pattern.pattern_name,
+            "start": pattern.pattern_start.isoformat(),
+            "duration": (
+                float(pattern.pattern_duration_hours)
+                if pattern.pattern_duration_hours
+                else 0.0
+            ),
+        }
+
+    def _assign_new_patterns_to_clusters(
+        self,
+        session: Session,
+        symbol: str,
+        existing_clusters: List[PatternCluster],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        기존 클러스터 이후 생성된 패턴만 가장 가까운 중심점에 할당
+
+        중심점과 통계는 누적 평균으로 갱신합니다.
+
+        Args:
+            session: DB 세션
+            symbol: 심볼
+            existing_clusters: 최신 클러스터링 결과
+
+        Returns:
+            증분 클러스터링 결과 (중심점을 사용할 수 없으면 None → 전체 재학습)
+        """
+        centers = [c.get_cluster_center_vector() for c in existing_clusters]
+        if not centers or any(len(c) != len(centers[0]) for c in centers):
+            return None
+        centroids = np.asarray(centers, dtype=np.float64)
+
+        watermark = max(c.updated_at or c.clustered_at for c in existing_clusters)
+        new_patterns = (
+            session.query(SignalPattern)
+            .filter(
+                SignalPattern.symbol == symbol,
+                SignalPattern.created_at > watermark,
+            )
+            .all()
+        )
+
+        feature_vectors = []
+        assigned = []
+        for pattern in new_patterns:
+            features = self._extract_pattern_features(pattern)
+            if features is not None:
+                feature_vectors.append(features)
+                assigned.append(pattern)
+
+        if feature_vectors and len(feature_vectors[0]) != centroids.shape[1]:
+            return None  # 특성 구성이 바뀐 경우 전체 재학습
+
+        clusters: Dict[int, Dict[str, Any]] = {}
+        if assigned:
+            data = np.asarray(feature_vectors, dtype=np.float64)
+            labels = self._squared_distances(data, centroids).argmin(axis=1)
+
+            for position, cluster in enumerate(existing_clusters):
+                member_indices = np.flatnonzero(labels == position)
+                if len(member_indices) == 0:
+                    continue
+
+                members = [assigned[i] for i in member_indices]
+                old_count = cluster.pattern_count or 0
+                new_count = old_count + len(members)
+
+                # 누적 평균으로 중심점 갱신
+                center = (
+                    centroids[position] * old_count + data[member_indices].sum(axis=0)
+                ) / new_count
+                centroids[position] = center
+
+                durations = [
+                    float(p.pattern_duration_hours)
+                    for p in members
+                    if p.pattern_duration_hours
+                ]
+                if durations:
+                    old_avg = float(cluster.avg_duration_hours or 0.0)
+                    cluster.avg_duration_hours = round(
+                        (old_avg * old_count + sum(durations))
+                        / (old_count + len(durations)),
+                        2,
+                    )
+
+                cluster.pattern_count = new_count
+                cluster.cluster_center = json.dumps(
+                    [round(float(v), 6) for v in center]
+                )
+                cluster.bullish_tendency = round(
+                    float(center[self.BULLISH_FEATURE_INDEX]), 2
+                )
+                cluster.bearish_tendency = round(
+                    float(center[self.BEARISH_FEATURE_INDEX]), 2
+                )
+
+                clusters[cluster.cluster_id] = {
+                    "cluster_name": cluster.cluster_name,
+                    "pattern_count": new_count,
+                    "new_patterns": [self._cluster_pattern_info(p) for p in members],
+                }
+
+            session.commit()
+
+        return {
+            "symbol": symbol,
+            "mode": "incremental",
+            "algorithm": existing_clusters[0].clustering_algorithm,
+            "new_patterns": len(assigned),
+            "patterns_clustered": len(assigned),
+            "n_clusters": len(existing_clusters),
+            "clusters": clusters,
+            "clustered_at": existing_clusters[0].clustered_at.isoformat(),
+            "analysis_timestamp": datetime.utcnow().isoformat(),
+        }
+
+    def _save_cluster_results(
+        self,
+        cluster_repo: PatternClusterRepository,
+        symbol: str,
+        patterns: List[SignalPattern],
+        data: np.ndarray,
+        labels: np.ndarray,
+        centroids: np.ndarray,
+        cluster_analysis: Dict[int, Dict[str, Any]],
+        inertia: float,
+        algorithm: str,
+    ) -> List[PatternCluster]:
+        """전체 재학습 결과를 PatternCluster 로 저장"""
+        clustered_at = datetime.utcnow()
+
+        # 품질 점수: 전체 분산 대비 설명된 분산 비율 (0~100)
+        total_ss = float(((data - data.mean(axis=0)) ** 2).sum())
+        quality = 100.0 * (1.0 - inertia / total_ss) if total_ss > 0 else 0.0
+
+        entities = []
+        for cluster_id, analysis in cluster_analysis.items():
+            member_indices = np.flatnonzero(labels == cluster_id)
+            members = [patterns[i] for i in member_indices]
+            center = centroids[cluster_id]
+            distances = np.sqrt(
+                self._squared_distances(data[member_indices], center[None, :])[:, 0]
+            )
+
+            success_flags = [
+                p.is_successful_1d for p in members if p.is_successful_1d is not None
+            ]
+            confidences = [
+                float(p.confidence_score)
+                for p in members
+                if p.confidence_score is not None
+            ]
+            characteristics = analysis["characteristics"]
+            base_name = characteristics.get("most_common_pattern") or "mixed"
+
+            entities.append(
+                PatternCluster(
+                    symbol=symbol,
+                    cluster_id=int(cluster_id),
+                    cluster_name=f"{base_name}_cluster_{cluster_id}"[:100],
+                    timeframe=self.CLUSTER_TIMEFRAME,
+                    pattern_count=len(members),
+                    avg_success_rate=(
+                        round(100.0 * sum(success_flags) / len(success_flags), 2)
+                        if success_flags
+                        else None
+                    ),
+                    avg_confidence_score=(
+                        round(sum(confidences) / len(confidences), 2)
+                        if confidences
+                        else None
+                    ),
+                    avg_duration_hours=round(characteristics["avg_duration"], 2),
+                    bullish_tendency=round(
+                        float(center[self.BULLISH_FEATURE_INDEX]), 2
+                    ),
+                    bearish_tendency=round(
+                        float(center[self.BEARISH_FEATURE_INDEX]), 2
+                    ),
+                    cluster_center=json.dumps([round(float(v), 6) for v in center]),
+                    cluster_radius=round(float(distances.mean()), 4),
+                    representative_patterns=json.dumps(
+                        [members[i].id for i in np.argsort(distances)[:5]]
+                    ),
+                    clustering_algorithm=algorithm,
+                    n_clusters_total=len(cluster_analysis),
+                    clustering_quality_score=round(max(quality, 0.0), 2),
+                    clustered_at=clustered_at,
+                )
+            )
+
+        return cluster_repo.save_all(entities)
+
     def _extract_pattern_features(
         self, pattern: SignalPattern
     ) -> Optional[List[float]]:
@@ -1131,49 +1273,127 @@ class AdvancedPatternService:
             print(f"⚠️ 특성 추출 실패: {e}")
             return None
 
-    def _simple_kmeans_clustering(
-        self, feature_vectors: List[List[float]], n_clusters: int
-    ) -> List[int]:
-        """간단한 K-means 클러스터링 구현"""
-        if not feature_vectors or n_clusters <= 0:
-            return []
-
-        # numpy 배열로 변환
-        data = np.array(feature_vectors)
-        n_samples, n_features = data.shape
-
-        # 초기 중심점 랜덤 선택
-        np.random.seed(42)  # 재현 가능한 결과를 위해
-        centroids = data[np.random.choice(n_samples, n_clusters, replace=False)]
-
-        # K-means 반복
-        max_iterations = 100
-        for iteration in range(max_iterations):
-            # 각 점을 가장 가까운 중심점에 할당
-            distances = np.sqrt(((data - centroids[:, np.newaxis]) ** 2).sum(axis=2))
-            clusters = np.argmin(distances, axis=0)
-
-            # 새로운 중심점 계산 (빈 클러스터 처리)
-            new_centroids = []
-            for i in range(n_clusters):
-                cluster_data = data[clusters == i]
-                if len(cluster_data) > 0:
-                    new_centroids.append(cluster_data.mean(axis=0))
-                else:
-                    # 빈 클러스터는 기존 중심점 유지
-                    new_centroids.append(centroids[i])
-            new_centroids = np.array(new_centroids)
+    def _squared_distances(self, data: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """점-중심점 간 유클리드 거리 제곱 (n_samples, n_clusters)"""
+        distances = (
+            (data**2).sum(axis=1)[:, None]
+            - 2.0 * data @ centroids.T
+            + (centroids**2).sum(axis=1)[None, :]
+        )
+        return np.maximum(distances, 0.0)
+
+    def _kmeans_plus_plus_init(
+        self, data: np.ndarray, n_clusters: int, rng: np.random.Generator
+    ) -> np.ndarray:
+        """K-means++ 방식 초기 중심점 선택"""
+        n_samples = len(data)
+        centroids = np.empty((n_clusters, data.shape[1]), dtype=np.float64)
+        centroids[0] = data[rng.integers(n_samples)]
+        closest = self._squared_distances(data, centroids[:1])[:, 0]
+
+        for k in range(1, n_clusters):
+            total = closest.sum()
+            if total <= 0:
+                # 모든 점이 이미 중심점과 일치하면 무작위 선택
+                index = rng.integers(n_samples)
+            else:
+                index = rng.choice(n_samples, p=closest / total)
+            centroids[k] = data[index]
+            closest = np.minimum(
+                closest, self._squared_distances(data, centroids[k : k + 1])[:, 0]
+            )
 
-            # 수렴 체크
-            if np.allclose(centroids, new_centroids):
-                break
+        return centroids
+
+    def _kmeans_clustering(
+        self,
+        data: np.ndarray,
+        n_clusters: int,
+        mini_batch: bool = False,
+        max_iterations: int = 100,
+        tol: float = 1e-4,
+        batch_size: int = 1024,
+        random_state: int = 42,
+    ) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        벡터화 K-means 클러스터링 (K-means++ 초기화, 조기 종료, 미니배치 지원)
 
-            centroids = new_centroids
+        Args:
+            data: 특성 행렬 (n_samples, n_features)
+            n_clusters: 클러스터 개수
+            mini_batch: 미니배치 방식으로 중심점을 갱신할지 여부
+            max_iterations: 최대 반복 횟수
+            tol: 중심점 이동량이 이 값 이하이면 조기 종료
+            batch_size: 미니배치 크기
+            random_state: 재현 가능한 결과를 위한 시드
 
-        return clusters.tolist()
+        Returns:
+            (클러스터 라벨, 중심점, inertia)
+        """
+        n_samples = len(data)
+        if n_samples == 0 or n_clusters <= 0:
+            return np.empty(0, dtype=np.int64), np.empty((0, data.shape[-1])), 0.0
+
+        n_clusters = min(n_clusters, n_samples)
+        rng = np.random.default_rng(random_state)
+        centroids = self._kmeans_plus_plus_init(data, n_clusters, rng)
+
+        if mini_batch:
+            counts = np.zeros(n_clusters, dtype=np.float64)
+            batch_size = min(batch_size, n_samples)
+            for _ in range(max_iterations):
+                batch = data[rng.choice(n_samples, batch_size, replace=False)]
+                batch_labels = self._squared_distances(batch, centroids).argmin(axis=1)
+
+                # 중심점별 학습률 1/count 로 누적 갱신
+                previous = centroids.copy()
+                batch_counts = np.bincount(batch_labels, minlength=n_clusters)
+                batch_sums = np.zeros_like(centroids)
+                np.add.at(batch_sums, batch_labels, batch)
+                updated = batch_counts > 0
+                counts[updated] += batch_counts[updated]
+                centroids[updated] += (
+                    batch_sums[updated]
+                    - batch_counts[updated, None] * centroids[updated]
+                ) / counts[updated, None]
+
+                if np.abs(centroids - previous).max() <= tol:
+                    break
+        else:
+            labels = None
+            for _ in range(max_iterations):
+                distances = self._squared_distances(data, centroids)
+                new_labels = distances.argmin(axis=1)
+                if labels is not None and np.array_equal(labels, new_labels):
+                    break
+                labels = new_labels
+
+                counts = np.bincount(labels, minlength=n_clusters)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, labels, data)
+
+                # 빈 클러스터는 현재 가장 멀리 떨어진 점으로 재배치
+                empty = np.flatnonzero(counts == 0)
+                if len(empty):
+                    farthest = np.argsort(distances[np.arange(n_samples), labels])[
+                        ::-1
+                    ][: len(empty)]
+                    sums[empty] = data[farthest]
+                    counts[empty] = 1
+
+                new_centroids = sums / counts[:, None]
+                shift = np.abs(new_centroids - centroids).max()
+                centroids = new_centroids
+                if shift <= tol:
+                    break
+
+        distances = self._squared_distances(data, centroids)
+        labels = distances.argmin(axis=1)
+        inertia = float(distances[np.arange(n_samples), labels].sum())
+        return labels, centroids, inertia
 
     def _analyze_cluster_characteristics(
-        self, cluster_patterns: List[Dict], all_patterns: List[SignalPattern]
+        self, cluster_patterns: List[Dict], patterns_by_id: Dict[int, SignalPattern]
     ) -> Dict[str, Any]:
         """클러스터 특성 분석"""
         if not cluster_patterns:
@@ -1185,9 +1405,7 @@ class AdvancedPatternService:
 
         for pattern_info in cluster_patterns:
             # 실제 패턴 객체 찾기
-            pattern = next(
-                (p for p in all_patterns if p.id == pattern_info["id"]), None
-            )
+            pattern = patterns_by_id.get(pattern_info["id"])
             if pattern:
                 name = pattern.pattern_name
                 pattern_names[name] = pattern_names.get(name, 0) + 1
@@ -23,6 +23,8 @@
 - 포트폴리오 구성: 다양한 신호의 조합으로 리스크 분산
 """
 
+import numpy as np
+import pandas as pd
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
@@ -230,6 +232,58 @@ class BacktestingService:
     # 매매 전략 시뮬레이션
     # =================================================================
 
+    # 백테스트 프레임 컬럼 (find_signal_returns 조회 순서와 동일)
+    BACKTEST_FRAME_COLUMNS = [
+        "signal_id",
+        "triggered_at",
+        "signal_type",
+        "symbol",
+        "entry_price",
+        "signal_return",
+    ]
+
+    def load_backtest_frame(
+        self,
+        signal_types: List[str],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        신호와 1일 수익률을 한 번의 조인으로 읽어 시간순 DataFrame 으로 반환
+
+        반환된 프레임은 simulate_trading_strategy(frame=...) 에 그대로 넘겨
+        position_size / stop_loss / take_profit 만 바꿔가며 재사용할 수 있습니다.
+
+        Args:
+            signal_types: 사용할 신호 타입 리스트
+            start_date: 시작 날짜 (기본: 3개월 전)
+            end_date: 종료 날짜 (기본: 현재)
+
+        Returns:
+            신호별 진입 정보와 수익률(소수)이 담긴 DataFrame
+        """
+        session, outcome_repo, signal_repo = self._get_session_and_repositories()
+
+        if not start_date:
+            start_date = datetime.utcnow() - timedelta(days=90)  # 기본 3개월
+        if not end_date:
+            end_date = datetime.utcnow()
+
+        try:
+            rows = outcome_repo.find_signal_returns(
+                signal_types=signal_types, start_date=start_date, end_date=end_date
+            )
+        finally:
+            session.close()
+
+        frame = pd.DataFrame(rows, columns=self.BACKTEST_FRAME_COLUMNS)
+        frame["entry_price"] = frame["entry_price"].astype(float)
+        frame["signal_return"] = frame["signal_return"].astype(float) / 100.0
+        frame.attrs["signal_types"] = list(signal_types)
+        frame.attrs["start_date"] = start_date
+        frame.attrs["end_date"] = end_date
+        return frame
+
     def simulate_trading_strategy(
         self,
         signal_types: List[str],
@@ -239,6 +293,7 @@ class BacktestingService:
         take_profit: Optional[float] = None,  # +10% take profit
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        frame: Optional[pd.DataFrame] = None,
     ) -> Dict[str, Any]:
         """
         매매 전략 시뮬레이션
@@ -251,99 +306,46 @@ class BacktestingService:
             take_profit: 익절매 비율 (예: 0.10 = +10%)
             start_date: 시뮬레이션 시작 날짜
             end_date: 시뮬레이션 종료 날짜
+            frame: load_backtest_frame 결과 (지정 시 DB 조회 생략)
 
         Returns:
             시뮬레이션 결과
         """
-        session, outcome_repo, signal_repo = self._get_session_and_repositories()
-
         try:
-            # 1. 해당 기간의 신호들 조회
-            if not start_date:
-                start_date = datetime.utcnow() - timedelta(days=90)  # 기본 3개월
-            if not end_date:
-                end_date = datetime.utcnow()
-
-            all_signals = []
-            for signal_type in signal_types:
-                signals = signal_repo.find_by_date_range(
-                    start_date=start_date, end_date=end_date, signal_type=signal_type
-                )
-                all_signals.extend(signals)
-
-            # 시간순 정렬
-            all_signals.sort(key=lambda x: x.triggered_at)
-
-            # 2. 매매 시뮬레이션 실행
-            trades = []
-            current_capital = initial_capital
-            max_capital = initial_capital
-            max_drawdown = 0.0
-
-            for signal in all_signals:
-                # 해당 신호의 결과 조회
-                outcome = outcome_repo.find_by_signal_id(signal.id)
-                if not outcome or outcome.return_1d is None:
-                    continue
-
-                # 포지션 크기 계산
-                trade_amount = current_capital * position_size
-
-                # 수익률 적용 (stop loss, take profit 고려)
-                signal_return = float(outcome.return_1d) / 100.0  # % to decimal
-
-                # Stop loss / Take profit 적용
-                if stop_loss and signal_return < stop_loss:
-                    actual_return = stop_loss
-                elif take_profit and signal_return > take_profit:
-                    actual_return = take_profit
-                else:
-                    actual_return = signal_return
-
-                # 손익 계산
-                profit_loss = trade_amount * actual_return
-                current_capital += profit_loss
-
-                # 최대 자본금 및 최대 손실 추적
-                max_capital = max(max_capital, current_capital)
-                drawdown = (max_capital - current_capital) / max_capital
-                max_drawdown = max(max_drawdown, drawdown)
-
-                # 거래 기록
-                trades.append(
-                    {
-                        "date": signal.triggered_at.isoformat(),
-                        "signal_type": signal.signal_type,
-                        "symbol": signal.symbol,
-                        "entry_price": float(signal.current_price),
-                        "signal_return": signal_return,
-                        "actual_return": actual_return,
-                        "trade_amount": trade_amount,
-                        "profit_loss": profit_loss,
-                        "capital_after": current_capital,
-                    }
-                )
-
-            # 3. 성과 지표 계산
-            total_return = (current_capital - initial_capital) / initial_capital
-            total_return_pct = total_return * 100
-
-            winning_trades = [t for t in trades if t["profit_loss"] > 0]
-            losing_trades = [t for t in trades if t["profit_loss"] < 0]
-
-            win_rate = len(winning_trades) / len(trades) if trades else 0
-            avg_win = (
-                sum(t["profit_loss"] for t in winning_trades) / len(winning_trades)
-                if winning_trades
-                else 0
-            )
-            avg_loss = (
-                sum(t["profit_loss"] for t in losing_trades) / len(losing_trades)
-                if losing_trades
-                else 0
+            # 1. 해당 기간의 신호/결과 조회 (한 번의 조인)
+            if frame is None:
+                frame = self.load_backtest_frame(signal_types, start_date, end_date)
+            start_date = frame.attrs.get("start_date", start_date)
+            end_date = frame.attrs.get("end_date", end_date)
+
+            # 2. 매매 시뮬레이션 실행 (벡터화)
+            simulation = self._simulate_on_frame(
+                frame, initial_capital, position_size, stop_loss, take_profit
             )
-
-            profit_factor = abs(avg_win / avg_loss) if avg_loss != 0 else float("inf")
+            performance = simulation["performance"]
+
+            # 최근 20개 거래만 반환
+            recent = frame.iloc[-20:]
+            trades = [
+                {
+                    "date": row.triggered_at.isoformat(),
+                    "signal_type": row.signal_type,
+                    "symbol": row.symbol,
+                    "entry_price": row.entry_price,
+                    "signal_return": row.signal_return,
+                    "actual_return": float(actual),
+                    "trade_amount": float(amount),
+                    "profit_loss": float(profit),
+                    "capital_after": float(capital),
+                }
+                for row, actual, amount, profit, capital in zip(
+                    recent.itertuples(index=False),
+                    simulation["actual_returns"][-20:],
+                    simulation["trade_amounts"][-20:],
+                    simulation["profit_loss"][-20:],
+                    simulation["equity_curve"][-20:],
+                )
+            ]
 
             return {
                 "strategy_config": {
@@ -357,28 +359,288 @@ class BacktestingService:
                         "end": end_date.isoformat(),
                     },
                 },
-                "performance": {
-                    "total_trades": len(trades),
+                "performance": performance,
+                "trades": trades,
+                "analysis_timestamp": datetime.utcnow().isoformat(),
+            }
+
+        except Exception as e:
+            print(f"❌ 매매 전략 시뮬레이션 실패: {e}")
+            return {"error": str(e)}
+
+    def _simulate_on_frame(
+        self,
+        frame: pd.DataFrame,
+        initial_capital: float,
+        position_size: float,
+        stop_loss: Optional[float],
+        take_profit: Optional[float],
+    ) -> Dict[str, Any]:
+        """
+        백테스트 프레임 위에서 복리 매매를 벡터화 계산
+
+        매 거래마다 현재 자본의 position_size 만큼 투자하므로
+        자본 곡선은 initial_capital * cumprod(1 + position_size * 수익률) 입니다.
+
+        Args:
+            frame: load_backtest_frame 결과
+            initial_capital: 초기 자본금
+            position_size: 포지션 크기 (자본금 대비 비율)
+            stop_loss: 손절매 비율
+            take_profit: 익절매 비율
+
+        Returns:
+            성과 지표와 거래별 배열 (적용 수익률, 투자금, 손익, 자본 곡선)
+        """
+        signal_returns = frame["signal_return"].to_numpy(dtype=np.float64)
+
+        # Stop loss / Take profit 적용 (손절매 우선)
+        actual_returns = signal_returns
+        if take_profit:
+            actual_returns = np.where(
+                actual_returns > take_profit, take_profit, actual_returns
+            )
+        if stop_loss:
+            actual_returns = np.where(
+                signal_returns < stop_loss, stop_loss, actual_returns
+            )
+
+        # 자본 곡선 및 거래별 손익
+        equity_curve = initial_capital * np.cumprod(
+            1.0 + position_size * actual_returns
+        )
+        capital_before = np.concatenate(([initial_capital], equity_curve[:-1]))
+        trade_amounts = capital_before * position_size
+        profit_loss = trade_amounts * actual_returns
+
+        # 최대 자본금 대비 최대 손실폭
+        running_max = np.maximum.accumulate(np.maximum(equity_curve, initial_capital))
+        drawdowns = (running_max - equity_curve) / running_max
+        max_drawdown = float(drawdowns.max()) if len(drawdowns) else 0.0
+
+        # 성과 지표 계산
+        final_capital = (
+            float(equity_curve[-1]) if len(equity_curve) else initial_capital
+        )
+        total_return_pct = (final_capital - initial_capital) / initial_capital * 100
+
+        wins = profit_loss[profit_loss > 0]
+        losses = profit_loss[profit_loss < 0]
+        total_trades = len(profit_loss)
+
+        win_rate = len(wins) / total_trades if total_trades else 0
+        avg_win = float(wins.mean()) if len(wins) else 0
+        avg_loss = float(losses.mean()) if len(losses) else 0
+        # 손실 거래가 없으면 정의되지 않음 (inf는 JSON 직렬화 불가)
+        profit_factor = abs(avg_win / avg_loss) if avg_loss != 0 else None
+
+        return {
+            "performance": {
+                "total_trades": total_trades,
+                "initial_capital": initial_capital,
+                "final_capital": final_capital,
+                "total_return_pct": total_return_pct,
+                "max_drawdown_pct": max_drawdown * 100,
+                "win_rate": win_rate,
+                "avg_win": avg_win,
+                "avg_loss": avg_loss,
+                "profit_factor": profit_factor,
+                "winning_trades": len(wins),
+                "losing_trades": len(losses),
+            },
+            "actual_returns": actual_returns,
+            "trade_amounts": trade_amounts,
+            "profit_loss": profit_loss,
+            "equity_curve": equity_curve,
+        }
+
+    def sweep_strategy_parameters(
+        self,
+        signal_types: List[str],
+        position_sizes: List[float],
+        stop_losses: List[Optional[float]],
+        take_profits: List[Optional[float]],
+        initial_capital: float = 10000.0,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        sort_by: str = "total_return_pct",
+        top_n: Optional[int] = 50,
+        chunk_size: int = 512,
+        frame: Optional[pd.DataFrame] = None,
+    ) -> Dict[str, Any]:
+        """
+        매매 전략 파라미터 그리드 탐색
+
+        신호/결과 데이터를 한 번만 조회한 뒤 position_size × stop_loss ×
+        take_profit 의 모든 조합을 파라미터 축으로 벡터화하여 평가합니다.
+        조합은 chunk_size 단위로 나누어 (조합 수 × 거래 수) 메모리를 제한합니다.
+
+        Args:
+            signal_types: 사용할 신호 타입 리스트
+            position_sizes: 포지션 크기 후보 리스트
+            stop_losses: 손절매 비율 후보 리스트 (None은 손절매 없음)
+            take_profits: 익절매 비율 후보 리스트 (None은 익절매 없음)
+            initial_capital: 초기 자본금
+            start_date: 시뮬레이션 시작 날짜
+            end_date: 시뮬레이션 종료 날짜
+            sort_by: 순위 기준 지표 (max_drawdown_pct 는 오름차순, 나머지는 내림차순)
+            top_n: 반환할 상위 조합 개수 (None이면 전체)
+            chunk_size: 한 번에 평가할 조합 개수
+            frame: load_backtest_frame 결과 (지정 시 DB 조회 생략)
+
+        Returns:
+            순위가 매겨진 파라미터 조합별 성과 테이블
+        """
+        try:
+            started = datetime.utcnow()
+            if frame is None:
+                frame = self.load_backtest_frame(signal_types, start_date, end_date)
+            start_date = frame.attrs.get("start_date", start_date)
+            end_date = frame.attrs.get("end_date", end_date)
+
+            # 파라미터 그리드 (None/0 은 기존 시뮬레이션과 같이 미적용)
+            grid = np.array(
+                [
+                    (
+                        size,
+                        stop if stop else -np.inf,
+                        take if take else np.inf,
+                    )
+                    for size in position_sizes
+                    for stop in stop_losses
+                    for take in take_profits
+                ],
+                dtype=np.float64,
+            ).reshape(-1, 3)
+
+            signal_returns = frame["signal_return"].to_numpy(dtype=np.float64)
+            metrics = [
+                self._simulate_parameter_chunk(
+                    signal_returns, grid[start : start + chunk_size], initial_capital
+                )
+                for start in range(0, len(grid), max(1, chunk_size))
+            ]
+
+            table = pd.DataFrame(
+                grid, columns=["position_size", "stop_loss", "take_profit"]
+            )
+            if metrics:
+                table = table.join(pd.concat(metrics, ignore_index=True))
+                table["stop_loss"] = table["stop_loss"].astype(object)
+                table["take_profit"] = table["take_profit"].astype(object)
+                table.loc[np.isinf(grid[:, 1]), "stop_loss"] = None
+                table.loc[np.isinf(grid[:, 2]), "take_profit"] = None
+                table = table.sort_values(
+                    sort_by,
+                    ascending=(sort_by == "max_drawdown_pct"),
+                    kind="stable",
+                ).reset_index(drop=True)
+                # 손실 없는 조합은 inf로 정렬한 뒤 None으로 변환 (inf는 JSON 직렬화 불가)
+                no_loss = np.isinf(table["profit_factor"].to_numpy())
+                table["profit_factor"] = table["profit_factor"].astype(object)
+                table.loc[no_loss, "profit_factor"] = None
+                table.insert(0, "rank", np.arange(1, len(table) + 1))
+
+            ranked = table if top_n is None else table.head(top_n)
+
+            return {
+                "sweep_config": {
+                    "signal_types": signal_types,
                     "initial_capital": initial_capital,
-                    "final_capital": current_capital,
-                    "total_return_pct": total_return_pct,
-                    "max_drawdown_pct": max_drawdown * 100,
-                    "win_rate": win_rate,
-                    "avg_win": avg_win,
-                    "avg_loss": avg_loss,
-                    "profit_factor": profit_factor,
-                    "winning_trades": len(winning_trades),
-                    "losing_trades": len(losing_trades),
+                    "position_sizes": position_sizes,
+                    "stop_losses": stop_losses,
+                    "take_profits": take_profits,
+                    "sort_by": sort_by,
+                    "period": {
+                        "start": start_date.isoformat(),
+                        "end": end_date.isoformat(),
+                    },
                 },
-                "trades": trades[-20:],  # 최근 20개 거래만 반환
+                "total_trades": len(frame),
+                "total_combinations": len(grid),
+                "results": ranked.to_dict(orient="records"),
+                "duration_seconds": (datetime.utcnow() - started).total_seconds(),
                 "analysis_timestamp": datetime.utcnow().isoformat(),
             }
 
         except Exception as e:
-            print(f"❌ 매매 전략 시뮬레이션 실패: {e}")
+            print(f"❌ 파라미터 그리드 탐색 실패: {e}")
             return {"error": str(e)}
-        finally:
-            session.close()
+
+    def _simulate_parameter_chunk(
+        self, signal_returns: np.ndarray, params: np.ndarray, initial_capital: float
+    ) -> pd.DataFrame:
+        """
+        파라미터 조합 묶음에 대한 벡터화 시뮬레이션 (_simulate_on_frame 과 동일한 규칙)
+
+        Args:
+            signal_returns: 거래별 1일 수익률 (소수)
+            params: (조합 수, 3) 배열 - position_size, stop_loss, take_profit
+            initial_capital: 초기 자본금
+
+        Returns:
+            조합별 성과 지표 DataFrame
+        """
+        sizes = params[:, 0:1]
+        stops = params[:, 1:2]
+        takes = params[:, 2:3]
+        returns = signal_returns[None, :]
+
+        # Stop loss / Take profit 적용 (손절매 우선)
+        actual = np.where(
+            returns < stops, stops, np.where(returns > takes, takes, returns)
+        )
+
+        equity = initial_capital * np.cumprod(1.0 + sizes * actual, axis=1)
+        capital_before = np.concatenate(
+            [np.full((len(params), 1), initial_capital), equity[:, :-1]], axis=1
+        )
+        profit_loss = capital_before * sizes * actual
+
+        running_max = np.maximum.accumulate(
+            np.maximum(equity, initial_capital), axis=1
+        )
+        n_trades = signal_returns.shape[0]
+        max_drawdown = (
+            ((running_max - equity) / running_max).max(axis=1)
+            if n_trades
+            else np.zeros(len(params))
+        )
+        final_capital = (
+            equity[:, -1] if n_trades else np.full(len(params), initial_capital)
+        )
+
+        win_mask = profit_loss > 0
+        loss_mask = profit_loss < 0
+        wins = win_mask.sum(axis=1)
+        losses = loss_mask.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            avg_win = np.where(
+                wins > 0, (profit_loss * win_mask).sum(axis=1) / wins, 0.0
+            )
+            avg_loss = np.where(
+                losses > 0, (profit_loss * loss_mask).sum(axis=1) / losses, 0.0
+            )
+            profit_factor = np.where(
+                avg_loss != 0, np.abs(avg_win / avg_loss), np.inf
+            )
+
+        return pd.DataFrame(
+            {
+                "total_trades": n_trades,
+                "final_capital": final_capital,
+                "total_return_pct": (final_capital - initial_capital)
+                / initial_capital
+                * 100,
+                "max_drawdown_pct": max_drawdown * 100,
+                "win_rate": wins / n_trades if n_trades else 0.0,
+                "avg_win": avg_win,
+                "avg_loss": avg_loss,
+                "profit_factor": profit_factor,
+                "winning_trades": wins,
+                "losing_trades": losses,
+            }
+        )
 
     # =================================================================
     # 신호 품질 평가
@@ -23,6 +23,11 @@ from app.technical_analysis.service.pattern_analysis_service import (
 from app.technical_analysis.service.async_technical_indicator_service import (
     AsyncTechnicalIndicatorService,
 )
+from app.technical_analysis.service.indicator_panel_service import (
+    IndicatorPanel,
+    IndicatorPanelService,
+    load_nasdaq_symbols,
+)
 from app.market_price.service.async_price_service import AsyncPriceService
 from app.common.utils.logging_config import get_logger
 from app.common.utils.memory_optimizer import memory_monitor, optimize_dataframe_memory
@@ -46,6 +51,9 @@ class BatchAnalysisService:
         self.async_technical_service = AsyncTechnicalIndicatorService(max_workers=4)
         self.async_price_service = AsyncPriceService(max_workers=5, max_concurrency=10)
 
+        # 다중 심볼 패널 지표 서비스
+        self.panel_service = IndicatorPanelService()
+
     @memory_monitor
     def analyze_symbol_batch(
         self, symbol: str, analysis_types: List[str] = None, period: str = "1mo"
@@ -533,6 +541,60 @@ class BatchAnalysisService:
                 "completed_at": datetime.now().isoformat(),
             }
 
+    async def analyze_indicator_panel_async(
+        self,
+        symbols: List[str] = None,
+        period: str = "1y",
+        interval: str = "1d",
+    ) -> Dict[str, Any]:
+        """
+        여러 심볼의 기술적 지표를 (날짜 x 심볼) 패널로 한 번에 계산
+
+        심볼별 DataFrame과 지표 서비스 호출 대신, 가격 히스토리를 하나의 패널로
+        정렬해 모든 심볼의 지표와 신호를 벡터 연산으로 계산합니다.
+
+        Args:
+            symbols: 분석할 심볼 리스트 (None이면 나스닥 전체 티커)
+            period: 가격 히스토리 조회 기간
+            interval: 데이터 간격
+
+        Returns:
+            패널 분석 결과 (심볼별 최신 지표와 신호)
+        """
+        if symbols is None:
+            symbols = load_nasdaq_symbols()
+
+        logger.info(
+            "indicator_panel_analysis_started", symbol_count=len(symbols), period=period
+        )
+
+        try:
+            async with self.async_price_service:
+                histories = await self.async_price_service.fetch_multiple_histories_async(
+                    symbols, period=period, interval=interval
+                )
+
+            panel = IndicatorPanel.from_histories(histories)
+            results = self.panel_service.analyze_panel(panel)
+
+            return {
+                "total_symbols": len(symbols),
+                "successful_count": len(results),
+                "failed_count": len(symbols) - len(results),
+                "period": period,
+                "panel_dates": int(panel.shape[0]),
+                "results": results,
+                "completed_at": datetime.now().isoformat(),
+            }
+
+        except Exception as e:
+            logger.error("indicator_panel_analysis_failed", error=str(e))
+            return {
+                "status": "failed",
+                "error": str(e),
+                "completed_at": datetime.now().isoformat(),
+            }
+
     @cache_result(cache_name="technical_analysis", ttl=1800)  # 30분 캐싱
     @memory_monitor
     def get_batch_analysis_stats(self, symbols: List[str] = None) -> Dict[str, Any]:
@@ -636,6 +698,45 @@ async def analyze_symbols_batch_background(
         }
 
 
+@task(priority=TaskPriority.LOW, max_retries=1, timeout=1800.0)
+@memory_monitor
+async def analyze_indicator_panel_background(
+    symbols: List[str] = None, period: str = "1y"
+) -> Dict[str, Any]:
+    """
+    나스닥 전체(또는 지정 심볼)의 일일 지표를 패널 계산으로 처리하는 백그라운드 작업
+    """
+    logger.info(
+        "background_panel_analysis_started",
+        symbol_count=len(symbols) if symbols else "nasdaq_full",
+    )
+
+    try:
+        service = BatchAnalysisService()
+        result = await service.analyze_indicator_panel_async(symbols, period=period)
+
+        logger.info(
+            "background_panel_analysis_completed",
+            successful_count=result.get("successful_count"),
+        )
+
+        return {
+            "task": "indicator_panel_analysis",
+            "status": "completed",
+            "result": result,
+            "completed_at": datetime.now().isoformat(),
+        }
+
+    except Exception as e:
+        logger.error("background_panel_analysis_failed", error=str(e))
+        return {
+            "task": "indicator_panel_analysis",
+            "status": "failed",
+            "error": str(e),
+            "completed_at": datetime.now().isoformat(),
+        }
+
+
 @task(priority=TaskPriority.HIGH, max_retries=1, timeout=300.0)
 @memory_monitor
 async def analyze_priority_symbols_background(
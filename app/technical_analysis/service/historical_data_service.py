@@ -23,6 +23,7 @@ from app.technical_analysis.infra.model.repository.daily_price_repository import
     DailyPriceRepository,
 )
 from app.common.utils.logging_config import get_logger
+from app.common.utils.market_calendar import filter_trading_days
 
 # 메모리 최적화 임포트
 from app.common.utils.memory_cache import cache_result
@@ -34,6 +35,9 @@ from app.common.utils.memory_optimizer import (
 
 logger = get_logger(__name__)
 
+# 누락 구간 직전 저장 종가를 찾을 때 거슬러 올라가는 일수 (주말 + 연휴 여유)
+PREVIOUS_CLOSE_LOOKBACK_DAYS = 10
+
 
 class HistoricalDataService:
     """과거 데이터 수집 서비스"""
@@ -142,10 +146,10 @@ class HistoricalDataService:
         session, repository = self._get_session_and_repository()
 
         try:
-            # 1. 야후 파이낸스에서 데이터 가져오기
+            # 1. 야후 파이낸스에서 데이터 가져오기 (연도별 구간 병렬 수집)
             print(f"   📡 {symbol} 야후 파이낸스 데이터 요청...")
-            df = self.yahoo_client.get_daily_data(
-                symbol=symbol, period="max"  # 최대한 많은 데이터
+            df = self.yahoo_client.get_daily_data_concurrent(
+                symbol=symbol, start_year=start_date.year, end_year=end_date.year
             )
 
             if df is None or df.empty:
@@ -160,33 +164,7 @@ class HistoricalDataService:
             print(f"   📊 {symbol} 수집된 데이터: {len(df)}개")
 
             # 3. DailyPrice 엔티티로 변환
-            daily_prices = []
-            for date_index, row in df.iterrows():
-                # 전일 종가 계산 (가격 변화 계산용)
-                prev_close = None
-                if len(daily_prices) > 0:
-                    prev_close = float(daily_prices[-1].close_price)
-
-                daily_price = DailyPrice(
-                    symbol=symbol,
-                    date=date_index.date(),
-                    open_price=float(row["Open"]),
-                    high_price=float(row["High"]),
-                    low_price=float(row["Low"]),
-                    close_price=float(row["Close"]),
-                    volume=int(row["Volume"]) if pd.notna(row["Volume"]) else None,
-                )
-
-                # 가격 변화 계산
-                if prev_close:
-                    daily_price.price_change = (
-                        float(daily_price.close_price) - prev_close
-                    )
-                    daily_price.price_change_percent = (
-                        daily_price.price_change / prev_close
-                    ) * 100
-
-                daily_prices.append(daily_price)
+            daily_prices = self._build_daily_prices(symbol, df)
 
             # 4. 데이터베이스에 저장 (중복 자동 처리)
             print(f"   💾 {symbol} 데이터베이스 저장 중...")
@@ -198,6 +176,79 @@ class HistoricalDataService:
             print(f"❌ {symbol} 데이터 수집 실패: {e}")
             return {"error": str(e)}
 
+    def _build_daily_prices(
+        self,
+        symbol: str,
+        df: pd.DataFrame,
+        stored_closes: Optional[Dict[date, float]] = None,
+    ) -> List[DailyPrice]:
+        """
+        야후 일봉 데이터프레임을 DailyPrice 엔티티 리스트로 변환
+
+        Args:
+            symbol: 심볼
+            df: get_daily_data 형식의 데이터프레임 (Open/High/Low/Close/Volume)
+            stored_closes: DB에 이미 있는 {날짜: 종가} (떨어진 누락 구간의 전일 종가 계산용)
+
+        Returns:
+            전일 대비 변화가 계산된 DailyPrice 리스트
+        """
+        previous_closes = self.compute_previous_closes(df, stored_closes)
+
+        daily_prices = []
+        for date_index, row in df.iterrows():
+            daily_price = DailyPrice(
+                symbol=symbol,
+                date=date_index.date(),
+                open_price=float(row["Open"]),
+                high_price=float(row["High"]),
+                low_price=float(row["Low"]),
+                close_price=float(row["Close"]),
+                volume=int(row["Volume"]) if pd.notna(row["Volume"]) else None,
+            )
+
+            # 가격 변화 계산
+            prev_close = previous_closes.get(daily_price.date)
+            if prev_close:
+                daily_price.price_change = float(daily_price.close_price) - prev_close
+                daily_price.price_change_percent = (
+                    daily_price.price_change / prev_close
+                ) * 100
+
+            daily_prices.append(daily_price)
+
+        return daily_prices
+
+    @staticmethod
+    def compute_previous_closes(
+        df: pd.DataFrame, stored_closes: Optional[Dict[date, float]] = None
+    ) -> Dict[date, Optional[float]]:
+        """
+        수집한 각 날짜의 전일(직전 거래일) 종가 계산
+
+        수집 데이터와 DB 종가를 날짜순으로 합친 뒤 바로 앞 날짜의 종가를 사용하므로,
+        여러 누락 구간을 이어 붙인 데이터도 구간 경계에서 DB의 직전 종가와 비교합니다.
+
+        Args:
+            df: get_daily_data 형식의 데이터프레임 (Close 컬럼)
+            stored_closes: DB에 이미 있는 {날짜: 종가}
+
+        Returns:
+            {날짜: 전일 종가 (없으면 None)}
+        """
+        fetched = {
+            date_index.date(): float(close) for date_index, close in df["Close"].items()
+        }
+        combined = {**(stored_closes or {}), **fetched}
+
+        previous_closes: Dict[date, Optional[float]] = {}
+        prev_close = None
+        for close_date in sorted(combined):
+            if close_date in fetched:
+                previous_closes[close_date] = prev_close
+            prev_close = combined[close_date]
+        return previous_closes
+
     # =================================================================
     # 누락 데이터 보완
     # =================================================================
@@ -226,8 +277,10 @@ class HistoricalDataService:
         try:
             print(f"🔍 {symbol} 누락 데이터 확인 중...")
 
-            # 1. 누락된 날짜 찾기
-            missing_dates = repository.get_missing_dates(symbol, start_date, end_date)
+            # 1. 누락된 날짜 찾기 (휴장일은 데이터가 없으므로 제외)
+            missing_dates = filter_trading_days(
+                repository.get_missing_dates(symbol, start_date, end_date)
+            )
 
             if not missing_dates:
                 print(f"✅ {symbol} 누락된 데이터 없음")
@@ -235,12 +288,30 @@ class HistoricalDataService:
 
             print(f"⚠️ {symbol} 누락된 날짜: {len(missing_dates)}개")
 
-            # 2. 누락된 기간의 데이터 다시 수집
-            fill_result = self.collect_symbol_data(symbol, start_date, end_date)
+            # 2. 누락 날짜를 구간으로 묶어 해당 구간만 병렬 수집
+            missing_ranges = self.yahoo_client.group_missing_dates_into_ranges(
+                missing_dates
+            )
+            print(f"   📡 {symbol} 누락 구간 {len(missing_ranges)}개 수집 중...")
+            df = self.yahoo_client.get_daily_data_for_ranges(symbol, missing_ranges)
+
+            if df is None or df.empty:
+                fill_result = {"error": f"{symbol} 누락 구간 데이터를 가져올 수 없습니다"}
+            else:
+                # 구간마다 직전 저장 종가와 비교하도록 주변 DB 종가를 함께 전달
+                stored_closes = repository.find_closes_by_date_range(
+                    symbol,
+                    missing_ranges[0][0] - timedelta(days=PREVIOUS_CLOSE_LOOKBACK_DAYS),
+                    missing_ranges[-1][1],
+                )
+                fill_result = repository.save_bulk(
+                    self._build_daily_prices(symbol, df, stored_closes)
+                )
 
             return {
                 "symbol": symbol,
                 "missing_count": len(missing_dates),
+                "missing_ranges": len(missing_ranges),
                 "fill_result": fill_result,
             }
 
@@ -0,0 +1,615 @@
+"""
+증분 기술적 지표 계산 서비스
+
+TechnicalIndicatorService 는 매번 1년치 일봉 전체로 모든 지표 시리즈를 다시 계산합니다.
+이 서비스는 심볼별 실행 상태(EMA 값, RSI 상승/하락 윈도우, 롤링 윈도우 등)를 유지하여
+새 일봉이 들어올 때 과거 데이터 길이와 무관하게 상수 시간으로 지표를 갱신합니다.
+
+계산 규칙은 TechnicalIndicatorService 와 동일합니다:
+- SMA / 볼린저 / 거래량 SMA: 고정 길이 롤링 평균 (볼린저 표준편차는 ddof=1)
+- EMA(MA_PERIODS): ewm(adjust=False)
+- RSI: 상승/하락분의 단순 롤링 평균
+- MACD: ewm(span, adjust=True)
+- 스토캐스틱: 최고가/최저가 롤링 윈도우 + %K 롤링 평균
+- VWAP: 최근 VWAP_WINDOW_BARS 개 일봉의 거래량가중가격 (시드 기간 1년과 같은 길이)
+
+장중에는 같은 날짜의 일봉이 계속 갱신되므로, 마지막 일봉 적용 직전 상태를 함께 보관하여
+같은 날짜가 다시 들어오면 직전 상태에서 다시 계산합니다.
+시드 시에는 지표 상태만 쌓고 신호 감지는 마지막 일봉에서만 수행합니다.
+상태는 JSON 으로 체크포인트/복원할 수 있습니다 (임시 파일에 쓴 뒤 원자적으로 교체).
+"""
+
+import copy
+import json
+import math
+import os
+from collections import deque
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+
+import pandas as pd
+
+from app.common.constants.technical_settings import (
+    MA_PERIODS,
+    RSI_SETTINGS,
+    BOLLINGER_SETTINGS,
+    MACD_SETTINGS,
+    STOCHASTIC_SETTINGS,
+    VOLUME_SETTINGS,
+)
+from app.technical_analysis.service.technical_indicator_service import (
+    TechnicalIndicatorService,
+)
+
+# VWAP 누적 구간 (일봉 수) - 누적값이 끝없이 커지지 않도록 1년 단위로 제한
+VWAP_WINDOW_BARS = 252
+
+
+class RollingWindow:
+    """
+    고정 길이 롤링 윈도우
+
+    합계를 누적 관리하여 평균을 상수 시간에 계산합니다.
+    NaN 이 윈도우에 있으면 pandas rolling 과 같이 평균도 NaN 입니다.
+    """
+
+    def __init__(self, size: int, values: Optional[List[float]] = None):
+        self.size = size
+        self.values = deque(maxlen=size)
+        self._sum = 0.0
+        self._nan_count = 0
+        self._pushes = 0
+        for value in values or []:
+            self.push(value)
+
+    def push(self, value: float) -> None:
+        """값 추가 (가득 찬 경우 가장 오래된 값 제거)"""
+        if len(self.values) == self.size:
+            removed = self.values[0]
+            if math.isnan(removed):
+                self._nan_count -= 1
+            else:
+                self._sum -= removed
+
+        self.values.append(value)
+        if math.isnan(value):
+            self._nan_count += 1
+        else:
+            self._sum += value
+
+        # 누적 오차 방지를 위해 주기적으로 합계 재계산
+        self._pushes += 1
+        if self._pushes % self.size == 0:
+            self._sum = math.fsum(v for v in self.values if not math.isnan(v))
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.size
+
+    def mean(self) -> float:
+        if not self.full or self._nan_count:
+            return math.nan
+        return self._sum / self.size
+
+    def std(self) -> float:
+        """표본 표준편차 (ddof=1, 윈도우 크기는 고정이므로 상수 시간)"""
+        if not self.full or self._nan_count or self.size < 2:
+            return math.nan
+        mean = self._sum / self.size
+        return math.sqrt(
+            math.fsum((v - mean) ** 2 for v in self.values) / (self.size - 1)
+        )
+
+    def total(self) -> float:
+        """윈도우가 가득 차지 않아도 현재 값들의 합계 반환"""
+        return self._sum
+
+    def max(self) -> float:
+        return max(self.values) if self.full else math.nan
+
+    def min(self) -> float:
+        return min(self.values) if self.full else math.nan
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"size": self.size, "values": list(self.values)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RollingWindow":
+        return cls(data["size"], data["values"])
+
+
+class AdjustedEWM:
+    """pandas ewm(span, adjust=True).mean() 의 증분 계산"""
+
+    def __init__(self, span: int, numerator: float = 0.0, denominator: float = 0.0):
+        self.span = span
+        self.decay = 1.0 - 2.0 / (span + 1.0)
+        self.numerator = numerator
+        self.denominator = denominator
+
+    def push(self, value: float) -> float:
+        self.numerator = value + self.decay * self.numerator
+        self.denominator = 1.0 + self.decay * self.denominator
+        return self.numerator / self.denominator
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "span": self.span,
+            "numerator": self.numerator,
+            "denominator": self.denominator,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AdjustedEWM":
+        return cls(data["span"], data["numerator"], data["denominator"])
+
+
+class IndicatorState:
+    """심볼 하나의 증분 지표 계산 상태"""
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.last_bar_date: Optional[str] = None
+        self.bar_count = 0
+        self.prev_close: Optional[float] = None
+        self.last_values: Dict[str, float] = {}
+
+        # 이동평균 (SMA 윈도우 / EMA 값) 및 VWAP 구간 합계
+        self.sma_windows = {
+            key: RollingWindow(config["period"])
+            for key, config in MA_PERIODS.items()
+            if config.get("type", "SMA") == "SMA"
+        }
+        self.ema_values: Dict[str, Optional[float]] = {
+            key: None
+            for key, config in MA_PERIODS.items()
+            if config.get("type") == "EMA"
+        }
+        self.vwap_price_volume = RollingWindow(VWAP_WINDOW_BARS)
+        self.vwap_volume = RollingWindow(VWAP_WINDOW_BARS)
+
+        # RSI 상승/하락분 윈도우
+        self.rsi_gains = RollingWindow(RSI_SETTINGS["period"])
+        self.rsi_losses = RollingWindow(RSI_SETTINGS["period"])
+
+        # MACD
+        self.macd_fast = AdjustedEWM(MACD_SETTINGS["fast_period"])
+        self.macd_slow = AdjustedEWM(MACD_SETTINGS["slow_period"])
+        self.macd_signal = AdjustedEWM(MACD_SETTINGS["signal_period"])
+
+        # 볼린저 밴드
+        self.bollinger = RollingWindow(BOLLINGER_SETTINGS["period"])
+
+        # 스토캐스틱
+        self.stoch_highs = RollingWindow(STOCHASTIC_SETTINGS["k_period"])
+        self.stoch_lows = RollingWindow(STOCHASTIC_SETTINGS["k_period"])
+        self.stoch_k = RollingWindow(STOCHASTIC_SETTINGS["d_period"])
+
+        # 거래량
+        self.volume = RollingWindow(VOLUME_SETTINGS["sma_period"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """체크포인트용 직렬화"""
+        return {
+            "symbol": self.symbol,
+            "last_bar_date": self.last_bar_date,
+            "bar_count": self.bar_count,
+            "prev_close": self.prev_close,
+            "last_values": self.last_values,
+            "sma_windows": {k: w.to_dict() for k, w in self.sma_windows.items()},
+            "ema_values": self.ema_values,
+            "vwap_price_volume": self.vwap_price_volume.to_dict(),
+            "vwap_volume": self.vwap_volume.to_dict(),
+            "rsi_gains": self.rsi_gains.to_dict(),
+            "rsi_losses": self.rsi_losses.to_dict(),
+            "macd_fast": self.macd_fast.to_dict(),
+            "macd_slow": self.macd_slow.to_dict(),
+            "macd_signal": self.macd_signal.to_dict(),
+            "bollinger": self.bollinger.to_dict(),
+            "stoch_highs": self.stoch_highs.to_dict(),
+            "stoch_lows": self.stoch_lows.to_dict(),
+            "stoch_k": self.stoch_k.to_dict(),
+            "volume": self.volume.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IndicatorState":
+        """체크포인트에서 복원"""
+        state = cls(data["symbol"])
+        state.last_bar_date = data["last_bar_date"]
+        state.bar_count = data["bar_count"]
+        state.prev_close = data["prev_close"]
+        state.last_values = data["last_values"]
+        state.sma_windows = {
+            k: RollingWindow.from_dict(w) for k, w in data["sma_windows"].items()
+        }
+        state.ema_values = data["ema_values"]
+        for name in (
+            "vwap_price_volume",
+            "vwap_volume",
+            "rsi_gains",
+            "rsi_losses",
+            "bollinger",
+            "stoch_highs",
+            "stoch_lows",
+            "stoch_k",
+            "volume",
+        ):
+            setattr(state, name, RollingWindow.from_dict(data[name]))
+        for name in ("macd_fast", "macd_slow", "macd_signal"):
+            setattr(state, name, AdjustedEWM.from_dict(data[name]))
+        return state
+
+
+class IncrementalIndicatorService:
+    """
+    심볼별 상태를 유지하며 새 일봉만으로 지표와 신호를 갱신하는 서비스
+
+    analyze_comprehensive_signals 와 같은 형식의 결과를 반환하되,
+    이동평균은 전체 시리즈 대신 최신 값만 담습니다.
+    """
+
+    def __init__(self, checkpoint_dir: Optional[str] = None):
+        """
+        Args:
+            checkpoint_dir: 상태 체크포인트를 저장할 디렉토리 (None이면 메모리에만 유지)
+        """
+        self.checkpoint_dir = checkpoint_dir
+        self.indicator_service = TechnicalIndicatorService()
+        self._states: Dict[str, IndicatorState] = {}
+        # 마지막 일봉 적용 직전 상태 (장중 같은 날짜 일봉 재계산용)
+        self._before_last: Dict[str, IndicatorState] = {}
+
+    # =========================================================================
+    # 상태 관리
+    # =========================================================================
+
+    def has_state(self, symbol: str) -> bool:
+        """심볼 상태 존재 여부 (메모리에 없으면 체크포인트에서 복원 시도)"""
+        if symbol in self._states:
+            return True
+        return self.load_checkpoint(symbol)
+
+    def covers(self, symbol: str, df: pd.DataFrame) -> bool:
+        """데이터프레임이 마지막 처리 일봉부터 이어지는지 (누락 일봉 없음) 확인"""
+        state = self._states.get(symbol)
+        if state is None or state.last_bar_date is None or df.empty:
+            return False
+        first_bar_date = pd.Timestamp(df.index[0]).strftime("%Y-%m-%d")
+        return first_bar_date <= state.last_bar_date
+
+    def reset(self, symbol: str) -> None:
+        """심볼 상태 초기화"""
+        self._states.pop(symbol, None)
+        self._before_last.pop(symbol, None)
+
+    def checkpoint(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """심볼 상태를 직렬화 가능한 딕셔너리로 반환"""
+        if symbol not in self._states:
+            return None
+        before_last = self._before_last.get(symbol)
+        return {
+            "state": self._states[symbol].to_dict(),
+            "before_last": before_last.to_dict() if before_last else None,
+            "saved_at": datetime.utcnow().isoformat(),
+        }
+
+    def restore(self, symbol: str, data: Dict[str, Any]) -> None:
+        """checkpoint 결과로 심볼 상태 복원"""
+        self._states[symbol] = IndicatorState.from_dict(data["state"])
+        if data.get("before_last"):
+            self._before_last[symbol] = IndicatorState.from_dict(data["before_last"])
+        else:
+            self._before_last.pop(symbol, None)
+
+    def save_checkpoint(self, symbol: str) -> bool:
+        """심볼 상태를 checkpoint_dir 에 JSON 으로 저장"""
+        data = self.checkpoint(symbol)
+        if not self.checkpoint_dir or data is None:
+            return False
+
+        try:
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+            path = self._checkpoint_path(symbol)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            # 쓰는 도중 중단되어도 기존 체크포인트가 남도록 원자적으로 교체
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            print(f"⚠️ {symbol} 지표 상태 저장 실패: {e}")
+            return False
+
+    def load_checkpoint(self, symbol: str) -> bool:
+        """checkpoint_dir 에서 심볼 상태 복원"""
+        if not self.checkpoint_dir:
+            return False
+
+        path = self._checkpoint_path(symbol)
+        if not os.path.exists(path):
+            return False
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.restore(symbol, json.load(f))
+            print(f"♻️ {symbol} 지표 상태 복원: {self._states[symbol].last_bar_date}")
+            return True
+        except Exception as e:
+            print(f"⚠️ {symbol} 지표 상태 복원 실패: {e}")
+            return False
+
+    def _checkpoint_path(self, symbol: str) -> str:
+        safe_symbol = "".join(c if c.isalnum() else "_" for c in symbol)
+        return os.path.join(self.checkpoint_dir, f"{safe_symbol}.json")
+
+    # =========================================================================
+    # 일봉 적용
+    # =========================================================================
+
+    def seed(self, symbol: str, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        과거 일봉 전체로 상태 초기화
+
+        지표 상태만 쌓고 신호 감지는 마지막 일봉에서만 수행합니다
+        (과거 일봉의 신호는 이미 처리된 것으로 간주).
+
+        Args:
+            symbol: 심볼
+            df: 소문자 OHLCV 컬럼과 datetime 인덱스를 가진 일봉 데이터프레임
+
+        Returns:
+            마지막 일봉 기준 분석 결과
+        """
+        self.reset(symbol)
+        self._states[symbol] = IndicatorState(symbol)
+        result = self.update_from_frame(symbol, df)
+        print(f"🌱 {symbol} 증분 지표 상태 초기화: {len(df)}개 일봉")
+        return result
+
+    def update_from_frame(self, symbol: str, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        데이터프레임에서 마지막 처리 일봉 이후(같은 날짜 포함)의 일봉만 적용
+
+        중간 일봉은 상태만 갱신하고, 신호 감지와 결과 생성은 마지막 일봉에서만 수행합니다.
+
+        Args:
+            symbol: 심볼
+            df: 소문자 OHLCV 컬럼과 datetime 인덱스를 가진 일봉 데이터프레임
+
+        Returns:
+            마지막으로 적용된 일봉 기준 분석 결과 (새 일봉이 없으면 빈 딕셔너리)
+        """
+        last_bar_date = self._states[symbol].last_bar_date
+
+        bars = []
+        for bar_time, row in zip(df.index, df.itertuples(index=False)):
+            bar_date = pd.Timestamp(bar_time).strftime("%Y-%m-%d")
+            if last_bar_date and bar_date < last_bar_date:
+                continue
+            bars.append((bar_date, row))
+            last_bar_date = bar_date
+
+        result: Dict[str, Any] = {}
+        for position, (bar_date, row) in enumerate(bars):
+            result = self.update(
+                symbol,
+                bar_date,
+                high=float(row.high),
+                low=float(row.low),
+                close=float(row.close),
+                volume=float(row.volume),
+                detect=position == len(bars) - 1,
+            )
+
+        return result
+
+    def update(
+        self,
+        symbol: str,
+        bar_date: str,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        detect: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        일봉 하나 적용 (상수 시간)
+
+        같은 날짜의 일봉이 다시 들어오면 직전 상태에서 다시 계산합니다.
+
+        Args:
+            symbol: 심볼
+            bar_date: 일봉 날짜 (YYYY-MM-DD)
+            high, low, close, volume: 일봉 값
+            detect: 신호 감지 및 결과 생성 여부 (False면 상태만 갱신)
+
+        Returns:
+            분석 결과 (오래된 일봉이거나 detect=False면 빈 딕셔너리)
+        """
+        state = self._states.setdefault(symbol, IndicatorState(symbol))
+
+        if state.last_bar_date and bar_date < state.last_bar_date:
+            return {}
+        if bar_date == state.last_bar_date and symbol in self._before_last:
+            state = copy.deepcopy(self._before_last[symbol])
+        else:
+            self._before_last[symbol] = copy.deepcopy(state)
+
+        values = self._apply_bar(state, high, low, close, volume)
+        result = self._build_result(state, values, close, volume) if detect else {}
+
+        state.last_values = values
+        state.prev_close = close
+        state.last_bar_date = bar_date
+        state.bar_count += 1
+        self._states[symbol] = state
+        return result
+
+    def _apply_bar(
+        self,
+        state: IndicatorState,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> Dict[str, float]:
+        """상태에 일봉을 반영하고 현재 지표 값 반환"""
+        values: Dict[str, float] = {}
+
+        # 1. 이동평균
+        for key, window in state.sma_windows.items():
+            window.push(close)
+            values[key] = window.mean()
+        for key, previous in state.ema_values.items():
+            alpha = 2.0 / (MA_PERIODS[key]["period"] + 1.0)
+            current = (
+                close if previous is None else alpha * close + (1 - alpha) * previous
+            )
+            state.ema_values[key] = current
+            values[key] = current
+
+        state.vwap_price_volume.push((high + low + close) / 3 * volume)
+        state.vwap_volume.push(volume)
+        vwap_volume = state.vwap_volume.total()
+        for key, config in MA_PERIODS.items():
+            if config.get("type") == "VWAP":
+                values[key] = (
+                    state.vwap_price_volume.total() / vwap_volume
+                    if vwap_volume
+                    else math.nan
+                )
+
+        # 2. RSI (첫 일봉의 변화량은 0으로 처리 - pandas where 와 동일)
+        delta = 0.0 if state.prev_close is None else close - state.prev_close
+        state.rsi_gains.push(delta if delta > 0 else 0.0)
+        state.rsi_losses.push(-delta if delta < 0 else 0.0)
+        gain, loss = state.rsi_gains.mean(), state.rsi_losses.mean()
+        if math.isnan(gain) or math.isnan(loss):
+            values["rsi"] = math.nan
+        elif loss == 0:
+            values["rsi"] = 100.0 if gain > 0 else math.nan
+        else:
+            values["rsi"] = 100 - (100 / (1 + gain / loss))
+
+        # 3. MACD
+        macd = state.macd_fast.push(close) - state.macd_slow.push(close)
+        signal = state.macd_signal.push(macd)
+        values["macd"] = macd
+        values["macd_signal"] = signal
+        values["macd_histogram"] = macd - signal
+
+        # 4. 볼린저 밴드
+        state.bollinger.push(close)
+        middle = state.bollinger.mean()
+        std = state.bollinger.std()
+        std_dev = BOLLINGER_SETTINGS["std_dev"]
+        values["bb_upper"] = middle + std * std_dev
+        values["bb_middle"] = middle
+        values["bb_lower"] = middle - std * std_dev
+
+        # 5. 스토캐스틱
+        state.stoch_highs.push(high)
+        state.stoch_lows.push(low)
+        highest, lowest = state.stoch_highs.max(), state.stoch_lows.min()
+        price_range = highest - lowest
+        k_percent = (
+            (close - lowest) / price_range * 100
+            if price_range and not math.isnan(price_range)
+            else math.nan
+        )
+        state.stoch_k.push(k_percent)
+        values["stoch_k"] = k_percent
+        values["stoch_d"] = state.stoch_k.mean()
+
+        # 6. 거래량
+        state.volume.push(volume)
+        values["volume_sma"] = state.volume.mean()
+
+        return values
+
+    def _build_result(
+        self,
+        state: IndicatorState,
+        values: Dict[str, float],
+        close: float,
+        volume: float,
+    ) -> Dict[str, Any]:
+        """analyze_comprehensive_signals 와 같은 형식의 결과 생성"""
+        previous = state.last_values
+        detector = self.indicator_service
+        price_change_pct = (
+            (close - state.prev_close) / state.prev_close * 100
+            if state.prev_close
+            else math.nan
+        )
+
+        results: Dict[str, Any] = {
+            "timestamp": datetime.now(),
+            "current_price": close,
+            "price_change_pct": price_change_pct,
+            "signals": {},
+            "indicators": {
+                "moving_averages": {key: values[key] for key in MA_PERIODS},
+            },
+        }
+
+        # 이전 일봉이 없으면 교차 신호를 판단할 수 없음
+        if not previous:
+            return results
+
+        indicators = results["indicators"]
+        signals = results["signals"]
+
+        indicators["rsi"] = {"current": values["rsi"], "previous": previous["rsi"]}
+        rsi_signal = detector.detect_rsi_signals(values["rsi"], previous["rsi"])
+        if rsi_signal:
+            signals["rsi"] = rsi_signal
+
+        indicators["macd"] = {
+            "current_macd": values["macd"],
+            "current_signal": values["macd_signal"],
+            "current_histogram": values["macd_histogram"],
+        }
+        macd_signal = detector.detect_macd_signals(
+            values["macd"],
+            values["macd_signal"],
+            previous["macd"],
+            previous["macd_signal"],
+        )
+        if macd_signal:
+            signals["macd"] = macd_signal
+
+        indicators["bollinger"] = {
+            "upper": values["bb_upper"],
+            "middle": values["bb_middle"],
+            "lower": values["bb_lower"],
+        }
+
+        indicators["stochastic"] = {
+            "k_percent": values["stoch_k"],
+            "d_percent": values["stoch_d"],
+        }
+        stoch_signal = detector.detect_stochastic_signals(
+            values["stoch_k"],
+            values["stoch_d"],
+            previous["stoch_k"],
+            previous["stoch_d"],
+        )
+        if stoch_signal:
+            signals["stochastic"] = stoch_signal
+
+        volume_sma = values["volume_sma"]
+        indicators["volume"] = {
+            "current": volume,
+            "sma_20": volume_sma,
+            "ratio": volume / volume_sma if volume_sma > 0 else 0,
+        }
+        volume_signal = detector.detect_volume_signals(
+            volume, volume_sma, price_change_pct
+        )
+        if volume_signal:
+            signals["volume"] = volume_signal
+
+        return results
@@ -0,0 +1,593 @@
+"""
+다중 심볼 지표 패널 계산 서비스
+
+이 파일은 (날짜 x 심볼) 2차원 배열로 정렬한 가격 패널에서
+여러 심볼의 기술적 지표를 한 번의 벡터 연산으로 계산하는 서비스를 제공합니다.
+심볼마다 DataFrame을 만들어 TechnicalIndicatorService를 반복 호출하는 대신,
+나스닥 전체 티커 같은 대량 일일 분석을 배열 연산 몇 번으로 처리합니다.
+
+주요 기능:
+- 가격 히스토리/DataFrame을 (날짜 x 심볼) 패널로 정렬
+- SMA/EMA/VWAP/RSI/MACD/볼린저 밴드/스토캐스틱/거래량 SMA 일괄 계산
+- 최근 두 행 기준 RSI/MACD/스토캐스틱/거래량 신호 벡터화 감지
+- 심볼별 최신 지표 요약 (analyze_comprehensive_signals와 같은 구조)
+
+계산식은 TechnicalIndicatorService와 동일합니다.
+(SMA/볼린저/RSI는 rolling 평균, 이동평균 EMA는 adjust=False, MACD는 adjust=True)
+"""
+
+import json
+import warnings
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.common.constants.technical_settings import MA_PERIODS
+from app.common.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+NASDAQ_TICKERS_PATH = "app/common/infra/data/nasdaq_full_tickers.json"
+
+SECONDS_PER_DAY = 86400
+
+
+def load_nasdaq_symbols(file_path: str = NASDAQ_TICKERS_PATH) -> List[str]:
+    """
+    나스닥 전체 티커 목록 로드
+
+    Args:
+        file_path: nasdaq_full_tickers.json 경로
+
+    Returns:
+        심볼 리스트
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        tickers = json.load(f)
+
+    return [item["symbol"].strip() for item in tickers if item.get("symbol")]
+
+
+@dataclass
+class IndicatorPanel:
+    """
+    (날짜 x 심볼) 가격 패널
+
+    모든 배열은 (len(dates), len(symbols)) 모양의 float64이며 값이 없으면 NaN입니다.
+    """
+
+    symbols: List[str]
+    dates: np.ndarray  # datetime64[D]
+    close: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    volume: np.ndarray
+
+    @property
+    def shape(self):
+        return self.close.shape
+
+    def column_of(self, symbol: str) -> int:
+        """심볼의 열 인덱스"""
+        return self.symbols.index(symbol)
+
+    @classmethod
+    def from_histories(
+        cls, histories: Dict[str, Optional[Dict[str, Any]]], fill_gaps: bool = True
+    ) -> "IndicatorPanel":
+        """
+        AsyncPriceService.fetch_multiple_histories_async 결과로 패널 생성
+
+        Args:
+            histories: 심볼 -> {"timestamps", "high", "low", "close", "volume"}
+            fill_gaps: 중간에 빠진 거래일의 가격을 직전 값으로 채움 (거래량은 0)
+
+        Returns:
+            IndicatorPanel
+        """
+        columns = {}
+        for symbol, history in histories.items():
+            if not history or not history.get("timestamps"):
+                continue
+
+            days = (
+                np.asarray(history["timestamps"], dtype=np.int64) // SECONDS_PER_DAY
+            ).astype("datetime64[D]")
+            values = {
+                field: np.asarray(history.get(field) or [], dtype=np.float64)
+                for field in ("close", "high", "low", "volume")
+            }
+            if any(len(v) != len(days) for v in values.values()):
+                logger.warning("panel_history_length_mismatch", symbol=symbol)
+                continue
+
+            columns[symbol] = (days, values)
+
+        return cls._from_columns(columns, fill_gaps)
+
+    @classmethod
+    def from_frames(
+        cls,
+        frames: Dict[str, pd.DataFrame],
+        date_column: str = "timestamp",
+        fill_gaps: bool = True,
+    ) -> "IndicatorPanel":
+        """
+        심볼별 OHLCV DataFrame으로 패널 생성
+
+        Args:
+            frames: 심볼 -> DataFrame (date_column 또는 DatetimeIndex 필요)
+            date_column: 날짜 컬럼명
+            fill_gaps: 중간에 빠진 거래일의 가격을 직전 값으로 채움 (거래량은 0)
+
+        Returns:
+            IndicatorPanel
+        """
+        columns = {}
+        for symbol, df in frames.items():
+            if df is None or df.empty:
+                continue
+
+            index = df[date_column] if date_column in df.columns else df.index
+            days = pd.to_datetime(index).values.astype("datetime64[D]")
+            values = {
+                field: df[field].to_numpy(dtype=np.float64)
+                for field in ("close", "high", "low", "volume")
+            }
+            columns[symbol] = (days, values)
+
+        return cls._from_columns(columns, fill_gaps)
+
+    @classmethod
+    def _from_columns(cls, columns: Dict[str, Any], fill_gaps: bool) -> "IndicatorPanel":
+        """심볼별 (날짜, 값) 배열을 공통 날짜 축으로 정렬"""
+        symbols = list(columns.keys())
+        if not symbols:
+            empty = np.empty((0, 0), dtype=np.float64)
+            return cls([], np.empty(0, dtype="datetime64[D]"), empty, empty, empty, empty)
+
+        dates = np.unique(np.concatenate([days for days, _ in columns.values()]))
+        shape = (len(dates), len(symbols))
+        arrays = {
+            field: np.full(shape, np.nan, dtype=np.float64)
+            for field in ("close", "high", "low", "volume")
+        }
+
+        for col, symbol in enumerate(symbols):
+            days, values = columns[symbol]
+            # 같은 날짜가 여러 번 있으면 마지막 값 사용
+            unique_days, last_pos = np.unique(days[::-1], return_index=True)
+            last_pos = len(days) - 1 - last_pos
+            rows = np.searchsorted(dates, unique_days)
+            for field, array in arrays.items():
+                array[rows, col] = values[field][last_pos]
+
+        if fill_gaps:
+            missing = np.isnan(arrays["close"])
+            for field in ("close", "high", "low"):
+                arrays[field] = _forward_fill(arrays[field])
+            # 거래가 없던 날(직전 값으로 채운 날)의 거래량은 0
+            filled = missing & ~np.isnan(arrays["close"])
+            arrays["volume"][filled] = 0.0
+
+        return cls(symbols=symbols, dates=dates, **arrays)
+
+
+# ====================
+# 벡터화 기본 연산 (axis 0 = 날짜)
+# ====================
+
+
+def _forward_fill(values: np.ndarray) -> np.ndarray:
+    """열별 NaN을 직전 유효값으로 채움 (첫 유효값 이전은 NaN 유지)"""
+    valid = ~np.isnan(values)
+    index = np.where(valid, np.arange(values.shape[0])[:, None], 0)
+    np.maximum.accumulate(index, axis=0, out=index)
+    filled = values[index, np.arange(values.shape[1])]
+    started = np.maximum.accumulate(valid, axis=0)
+    return np.where(started, filled, np.nan)
+
+
+def _shift(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """열별로 periods만큼 아래로 이동 (앞부분은 NaN)"""
+    shifted = np.full_like(values, np.nan)
+    if periods < values.shape[0]:
+        shifted[periods:] = values[:-periods]
+    return shifted
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    열별 이동 평균 (pandas rolling(window).mean()과 같이 창 안에 NaN이 있으면 NaN)
+
+    누적합 차분으로 계산하므로 창 크기와 무관하게 O(날짜 x 심볼)입니다.
+    """
+    result = np.full_like(values, np.nan)
+    if values.shape[0] < window:
+        return result
+
+    valid = ~np.isnan(values)
+    sums = np.cumsum(np.where(valid, values, 0.0), axis=0)
+    counts = np.cumsum(valid, axis=0)
+
+    window_sums = sums[window - 1 :].copy()
+    window_sums[1:] -= sums[:-window]
+    window_counts = counts[window - 1 :].copy()
+    window_counts[1:] -= counts[:-window]
+
+    result[window - 1 :] = np.where(
+        window_counts == window, window_sums / window, np.nan
+    )
+    return result
+
+
+def rolling_std(values: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    """열별 이동 표준편차 (pandas rolling(window).std()와 같은 표본 표준편차)"""
+    # 열 평균을 빼서 제곱합 차분의 자릿수 손실 감소 (값이 없는 열은 NaN 유지)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        centered = values - np.nanmean(values, axis=0)
+    mean = rolling_mean(centered, window)
+    mean_sq = rolling_mean(centered * centered, window)
+    variance = (mean_sq - mean * mean) * window / (window - ddof)
+    return np.sqrt(np.clip(variance, 0.0, None))
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """열별 이동 최댓값"""
+    result = np.full_like(values, np.nan)
+    if values.shape[0] >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+        result[window - 1 :] = windows.max(axis=-1)
+    return result
+
+
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """열별 이동 최솟값"""
+    result = np.full_like(values, np.nan)
+    if values.shape[0] >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+        result[window - 1 :] = windows.min(axis=-1)
+    return result
+
+
+def ewm_mean(values: np.ndarray, span: int, adjust: bool = False) -> np.ndarray:
+    """
+    열별 지수이동평균 (pandas ewm(span, adjust).mean())
+
+    날짜 방향 점화식을 모든 심볼에 대해 한 번에 진행합니다.
+    첫 유효값 이전은 NaN이며, 중간 NaN은 건너뛰고 직전 값을 유지합니다.
+    """
+    alpha = 2.0 / (span + 1.0)
+    decay = 1.0 - alpha
+    result = np.empty_like(values)
+
+    if adjust:
+        numerator = np.zeros(values.shape[1])
+        denominator = np.zeros(values.shape[1])
+        for t in range(values.shape[0]):
+            row = values[t]
+            valid = ~np.isnan(row)
+            numerator = np.where(valid, row + decay * numerator, numerator)
+            denominator = np.where(valid, 1.0 + decay * denominator, denominator)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                result[t] = numerator / denominator
+        return result
+
+    state = np.full(values.shape[1], np.nan)
+    for t in range(values.shape[0]):
+        row = values[t]
+        valid = ~np.isnan(row)
+        state = np.where(
+            valid, np.where(np.isnan(state), row, decay * state + alpha * row), state
+        )
+        result[t] = state
+    return result
+
+
+# ====================
+# 패널 지표 서비스
+# ====================
+
+
+class IndicatorPanelService:
+    """(날짜 x 심볼) 패널 기반 기술적 지표 일괄 계산 서비스"""
+
+    # =========================================================================
+    # 지표 계산
+    # =========================================================================
+
+    def calculate_moving_averages(self, panel: IndicatorPanel) -> Dict[str, np.ndarray]:
+        """MA_PERIODS의 모든 이동평균선 (SMA/EMA/VWAP)"""
+        results = {}
+        for ma_key, ma_config in MA_PERIODS.items():
+            ma_type = ma_config.get("type", "SMA")
+            period = ma_config.get("period")
+
+            if ma_type == "VWAP":
+                results[ma_key] = self.calculate_vwap(panel)
+            elif ma_type == "EMA":
+                results[ma_key] = ewm_mean(panel.close, period, adjust=False)
+            elif period:
+                results[ma_key] = rolling_mean(panel.close, period)
+
+        return results
+
+    def calculate_vwap(self, panel: IndicatorPanel) -> np.ndarray:
+        """누적 거래량가중평균가격"""
+        typical_price = (panel.high + panel.low + panel.close) / 3
+        volume_price = np.nancumsum(typical_price * panel.volume, axis=0)
+        cumulative_volume = np.nancumsum(panel.volume, axis=0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            vwap = volume_price / np.where(cumulative_volume == 0, np.nan, cumulative_volume)
+        return np.where(np.isnan(typical_price), np.nan, vwap)
+
+    def calculate_rsi(self, close: np.ndarray, period: int = 14) -> np.ndarray:
+        """RSI (상승/하락분의 단순 이동평균 기준)"""
+        delta = close - _shift(close)
+        gain = rolling_mean(np.where(delta > 0, delta, 0.0), period)
+        loss = rolling_mean(np.where(delta < 0, -delta, 0.0), period)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rs = gain / loss
+            return 100 - (100 / (1 + rs))
+
+    def calculate_macd(
+        self,
+        close: np.ndarray,
+        fast_period: int = 12,
+        slow_period: int = 26,
+        signal_period: int = 9,
+    ) -> Dict[str, np.ndarray]:
+        """MACD, 시그널, 히스토그램"""
+        macd_line = ewm_mean(close, fast_period, adjust=True) - ewm_mean(
+            close, slow_period, adjust=True
+        )
+        signal_line = ewm_mean(macd_line, signal_period, adjust=True)
+
+        return {
+            "macd": macd_line,
+            "signal": signal_line,
+            "histogram": macd_line - signal_line,
+        }
+
+    def calculate_bollinger_bands(
+        self, close: np.ndarray, period: int = 20, std_dev: float = 2
+    ) -> Dict[str, np.ndarray]:
+        """볼린저 밴드 (상단, 중간, 하단)"""
+        middle_band = rolling_mean(close, period)
+        std = rolling_std(close, period)
+
+        return {
+            "upper": middle_band + std * std_dev,
+            "middle": middle_band,
+            "lower": middle_band - std * std_dev,
+        }
+
+    def calculate_stochastic(
+        self, panel: IndicatorPanel, k_period: int = 14, d_period: int = 3
+    ) -> Dict[str, np.ndarray]:
+        """스토캐스틱 %K, %D"""
+        highest_high = rolling_max(panel.high, k_period)
+        lowest_low = rolling_min(panel.low, k_period)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            k_percent = (panel.close - lowest_low) / (highest_high - lowest_low) * 100
+
+        return {
+            "k_percent": k_percent,
+            "d_percent": rolling_mean(k_percent, d_period),
+        }
+
+    def calculate_all(self, panel: IndicatorPanel) -> Dict[str, Any]:
+        """
+        패널 전체 지표 계산
+
+        Returns:
+            지표명 -> (날짜 x 심볼) 배열 (MACD/볼린저/스토캐스틱은 하위 딕셔너리)
+        """
+        return {
+            "moving_averages": self.calculate_moving_averages(panel),
+            "rsi": self.calculate_rsi(panel.close),
+            "macd": self.calculate_macd(panel.close),
+            "bollinger": self.calculate_bollinger_bands(panel.close),
+            "stochastic": self.calculate_stochastic(panel),
+            "volume_sma": rolling_mean(panel.volume, 20),
+        }
+
+    # =========================================================================
+    # 신호 감지 (최근 두 행)
+    # =========================================================================
+
+    def detect_signals(
+        self, panel: IndicatorPanel, indicators: Dict[str, Any]
+    ) -> Dict[str, np.ndarray]:
+        """
+        심볼별 최신 신호 감지 (TechnicalIndicatorService.detect_*_signals와 같은 규칙)
+
+        Returns:
+            신호명 -> 심볼별 신호 문자열 배열 (신호 없으면 None)
+        """
+        if panel.shape[0] < 2:
+            return {}
+
+        rsi_now, rsi_prev = indicators["rsi"][-1], indicators["rsi"][-2]
+        macd = indicators["macd"]
+        macd_now, macd_prev = macd["macd"][-1], macd["macd"][-2]
+        signal_now, signal_prev = macd["signal"][-1], macd["signal"][-2]
+        stoch = indicators["stochastic"]
+        k_now, k_prev = stoch["k_percent"][-1], stoch["k_percent"][-2]
+        d_now, d_prev = stoch["d_percent"][-1], stoch["d_percent"][-2]
+
+        price_change_pct = self._price_change_pct(panel)
+        volume_ratio = self._volume_ratio(panel, indicators)
+
+        return {
+            "rsi": _select(
+                [
+                    (rsi_prev < 70) & (rsi_now >= 70),
+                    (rsi_prev > 30) & (rsi_now <= 30),
+                    (rsi_prev < 50) & (rsi_now >= 50),
+                    (rsi_prev > 50) & (rsi_now <= 50),
+                ],
+                ["overbought", "oversold", "bullish", "bearish"],
+            ),
+            "macd": _select(
+                [
+                    (macd_prev <= signal_prev) & (macd_now > signal_now),
+                    (macd_prev >= signal_prev) & (macd_now < signal_now),
+                    (macd_prev <= 0) & (macd_now > 0),
+                    (macd_prev >= 0) & (macd_now < 0),
+                ],
+                ["bullish_cross", "bearish_cross", "zero_cross_up", "zero_cross_down"],
+            ),
+            "stochastic": _select(
+                [
+                    (k_now >= 80) & (d_now >= 80),
+                    (k_now <= 20) & (d_now <= 20),
+                    (k_prev <= d_prev) & (k_now > d_now),
+                    (k_prev >= d_prev) & (k_now < d_now),
+                ],
+                ["overbought", "oversold", "bullish_cross", "bearish_cross"],
+            ),
+            "volume": _select(
+                [
+                    (volume_ratio >= 2.0) & (price_change_pct > 1.0),
+                    (volume_ratio >= 2.0) & (price_change_pct < -1.0),
+                    volume_ratio <= 0.5,
+                ],
+                ["volume_breakout_up", "volume_breakout_down", "low_volume"],
+            ),
+        }
+
+    # =========================================================================
+    # 종합 분석
+    # =========================================================================
+
+    def analyze_panel(self, panel: IndicatorPanel) -> Dict[str, Dict[str, Any]]:
+        """
+        패널 전체 종합 분석 (심볼별 최신 지표 + 신호)
+
+        Returns:
+            심볼 -> analyze_comprehensive_signals와 같은 구조의 결과
+        """
+        start_time = datetime.now()
+        if panel.shape[0] < 2 or not panel.symbols:
+            return {}
+
+        indicators = self.calculate_all(panel)
+        signals = self.detect_signals(panel, indicators)
+        latest = self._latest_values(indicators)
+        price_change_pct = self._price_change_pct(panel)
+        current_prices = panel.close[-1]
+        volume_ratio = self._volume_ratio(panel, indicators)
+
+        timestamp = datetime.now()
+        results = {}
+        for col, symbol in enumerate(panel.symbols):
+            if np.isnan(current_prices[col]):
+                continue
+
+            results[symbol] = {
+                "timestamp": timestamp,
+                "current_price": float(current_prices[col]),
+                "price_change_pct": _to_float(price_change_pct[col]),
+                "signals": {
+                    name: values[col]
+                    for name, values in signals.items()
+                    if values[col] is not None
+                },
+                "indicators": {
+                    "moving_averages": {
+                        key: _to_float(values[col])
+                        for key, values in latest["moving_averages"].items()
+                    },
+                    "rsi": {
+                        "current": _to_float(latest["rsi"]["current"][col]),
+                        "previous": _to_float(latest["rsi"]["previous"][col]),
+                    },
+                    "macd": {
+                        key: _to_float(values[col])
+                        for key, values in latest["macd"].items()
+                    },
+                    "bollinger": {
+                        key: _to_float(values[col])
+                        for key, values in latest["bollinger"].items()
+                    },
+                    "stochastic": {
+                        key: _to_float(values[col])
+                        for key, values in latest["stochastic"].items()
+                    },
+                    "volume": {
+                        "current": _to_float(panel.volume[-1, col]),
+                        "sma_20": _to_float(latest["volume_sma"][col]),
+                        "ratio": _to_float(volume_ratio[col]),
+                    },
+                },
+            }
+
+        logger.info(
+            "indicator_panel_analysis_completed",
+            symbols=len(panel.symbols),
+            analyzed=len(results),
+            dates=panel.shape[0],
+            signals=sum(len(r["signals"]) for r in results.values()),
+            elapsed_seconds=round((datetime.now() - start_time).total_seconds(), 3),
+        )
+        return results
+
+    # =========================================================================
+    # 내부 헬퍼
+    # =========================================================================
+
+    @staticmethod
+    def _price_change_pct(panel: IndicatorPanel) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (panel.close[-1] - panel.close[-2]) / panel.close[-2] * 100
+
+    @staticmethod
+    def _volume_ratio(panel: IndicatorPanel, indicators: Dict[str, Any]) -> np.ndarray:
+        volume_sma = indicators["volume_sma"][-1]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(volume_sma > 0, panel.volume[-1] / volume_sma, 0.0)
+
+    @staticmethod
+    def _latest_values(indicators: Dict[str, Any]) -> Dict[str, Any]:
+        """지표 배열의 마지막 행만 추출"""
+        return {
+            "moving_averages": {
+                key: values[-1] for key, values in indicators["moving_averages"].items()
+            },
+            "rsi": {
+                "current": indicators["rsi"][-1],
+                "previous": indicators["rsi"][-2],
+            },
+            "macd": {
+                "current_macd": indicators["macd"]["macd"][-1],
+                "current_signal": indicators["macd"]["signal"][-1],
+                "current_histogram": indicators["macd"]["histogram"][-1],
+            },
+            "bollinger": {
+                key: values[-1] for key, values in indicators["bollinger"].items()
+            },
+            "stochastic": {
+                key: values[-1] for key, values in indicators["stochastic"].items()
+            },
+            "volume_sma": indicators["volume_sma"][-1],
+        }
+
+
+def _select(conditions: List[np.ndarray], choices: List[str]) -> np.ndarray:
+    """조건 순서대로 첫 번째로 맞는 신호 선택 (if/elif 규칙과 동일)"""
+    selected = np.select(conditions, choices, default="").astype(object)
+    selected[selected == ""] = None
+    return selected
+
+
+def _to_float(value) -> Optional[float]:
+    """NaN은 None으로 변환"""
+    return None if value is None or np.isnan(value) else float(value)
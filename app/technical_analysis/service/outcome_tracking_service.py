@@ -32,6 +32,7 @@
 
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from sqlalchemy.orm import Session
 from app.common.infra.database.config.database_config import SessionLocal
 from app.common.infra.client.yahoo_price_client import YahooPriceClient
@@ -52,6 +53,15 @@ class OutcomeTrackingService:
     기술적 신호가 발생한 후의 결과를 추적하여 성과를 측정합니다.
     """
 
+    # 시간대별 가격 수집 기준 (시간대, 최소 경과 시간)
+    PRICE_HORIZONS = [
+        ("1h", 1),
+        ("4h", 4),
+        ("1d", 24),
+        ("1w", 7 * 24),
+        ("1m", 30 * 24),
+    ]
+
     def __init__(self):
         """서비스 초기화"""
         self.session: Optional[Session] = None
@@ -307,6 +317,157 @@ class OutcomeTrackingService:
 
         return False
 
+    def update_outcomes_batch(
+        self, hours_old: int = 1, max_workers: int = 4
+    ) -> Dict[str, Any]:
+        """
+        미완료 결과들을 배치 방식으로 업데이트
+
+        update_outcomes와 같은 규칙으로 가격/수익률을 채우지만,
+        결과 개수와 무관하게 일정한 횟수의 DB/HTTP 호출로 끝납니다.
+        1. 미완료 결과와 원본 신호를 조인 쿼리 한 번으로 조회
+        2. 심볼별로 현재가를 한 번씩만 조회 (스레드 풀 병렬)
+        3. 모든 시간대 가격과 수익률을 메모리에서 계산 후 일괄 업데이트
+
+        Args:
+            hours_old: 몇 시간 이상 된 것만 업데이트 (기본: 1시간)
+            max_workers: 현재가 조회 동시 실행 수
+
+        Returns:
+            업데이트 결과 통계 (update_outcomes와 동일한 키 + 배치 정보)
+        """
+        session, outcome_repo, signal_repo = self._get_session_and_repositories()
+        start_time = datetime.utcnow()
+
+        try:
+            # 1. 미완료 결과 + 원본 신호 일괄 조회
+            rows = outcome_repo.find_incomplete_outcomes_with_signals(hours_old)
+            if not rows:
+                print("ℹ️ 업데이트할 미완료 결과 없음")
+                return {"updated": 0, "errors": 0, "completed": 0, "total_processed": 0}
+
+            print(f"🔄 {len(rows)}개의 미완료 결과 배치 업데이트 시작")
+
+            now = datetime.utcnow()
+            stale_outcome_ids = []
+            active_rows = []
+            for outcome, signal in rows:
+                elapsed_hours = (now - signal.triggered_at).total_seconds() / 3600
+                # 너무 오래된 신호는 강제 완료 처리 (60일 = 2개월)
+                if elapsed_hours >= 60 * 24:
+                    stale_outcome_ids.append(outcome.id)
+                else:
+                    active_rows.append((outcome, signal, elapsed_hours))
+
+            # 2. 심볼별 현재가 한 번씩 조회
+            symbols = sorted({signal.symbol for _, signal, _ in active_rows})
+            latest_prices = self._fetch_latest_prices(symbols, max_workers)
+
+            # 3. 가격/수익률 계산
+            update_mappings = []
+            error_count = 0
+            completed_count = len(stale_outcome_ids)
+
+            for outcome, signal, elapsed_hours in active_rows:
+                current_price = latest_prices.get(signal.symbol)
+                if current_price is None:
+                    error_count += 1
+                    continue
+
+                prices = {
+                    timeframe: getattr(outcome, f"price_{timeframe}_after")
+                    for timeframe, _ in self.PRICE_HORIZONS
+                }
+                price_fields = {}
+                for timeframe, horizon_hours in self.PRICE_HORIZONS:
+                    if elapsed_hours >= horizon_hours and prices[timeframe] is None:
+                        prices[timeframe] = current_price
+                        price_fields[f"price_{timeframe}_after"] = current_price
+
+                if not price_fields:
+                    continue
+
+                mapping = {"id": outcome.id, "last_updated_at": now}
+                mapping.update(price_fields)
+                mapping.update(
+                    SignalOutcomeRepository.build_return_fields(
+                        original_price=float(signal.current_price),
+                        signal_type=signal.signal_type,
+                        prices=prices,
+                    )
+                )
+                update_mappings.append(mapping)
+
+                if elapsed_hours >= 30 * 24:
+                    completed_count += 1
+
+            # 4. 일괄 업데이트 (단일 트랜잭션)
+            updated_count = outcome_repo.bulk_update_outcomes(update_mappings)
+            outcome_repo.mark_as_complete_bulk(stale_outcome_ids)
+            session.commit()
+
+            duration = (datetime.utcnow() - start_time).total_seconds()
+
+            print(f"✅ 결과 배치 업데이트 완료:")
+            print(f"   - 업데이트: {updated_count}개")
+            print(f"   - 완료: {completed_count}개")
+            print(f"   - 오류: {error_count}개")
+            print(f"   - 총 처리: {len(rows)}개 (심볼 {len(symbols)}개)")
+            print(f"   - 소요 시간: {duration:.2f}초")
+
+            return {
+                "updated": updated_count,
+                "errors": error_count,
+                "completed": completed_count,
+                "total_processed": len(rows),
+                "symbols_fetched": len(symbols),
+                "duration": duration,
+            }
+
+        except Exception as e:
+            session.rollback()
+            print(f"❌ 결과 배치 업데이트 실패: {e}")
+            return {"error": str(e)}
+        finally:
+            session.close()
+
+    def _fetch_latest_prices(
+        self, symbols: List[str], max_workers: int = 4
+    ) -> Dict[str, Optional[float]]:
+        """
+        심볼별 현재가를 병렬로 조회
+
+        Args:
+            symbols: 중복 없는 심볼 리스트
+            max_workers: 동시 실행 수
+
+        Returns:
+            {심볼: 현재가 또는 None}
+        """
+        if not symbols:
+            return {}
+
+        prices: Dict[str, Optional[float]] = {}
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            future_to_symbol = {
+                executor.submit(
+                    self.yahoo_client.get_latest_minute_price, symbol, True
+                ): symbol
+                for symbol in symbols
+            }
+            for future in as_completed(future_to_symbol):
+                symbol = future_to_symbol[future]
+                try:
+                    prices[symbol] = future.result()
+                except Exception as e:
+                    print(f"⚠️ 현재 가격 조회 실패: {symbol} - {e}")
+                    prices[symbol] = None
+
+                if prices[symbol] is None:
+                    print(f"⚠️ 현재 가격 조회 실패: {symbol}")
+
+        return prices
+
     # =================================================================
     # 결과 조회 및 분석
     # =================================================================
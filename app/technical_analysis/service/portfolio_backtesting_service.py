@@ -19,6 +19,7 @@ Phase 3의 고급 기능으로, 여러 전략을 조합한 포트폴리오의 
 
 import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
@@ -28,6 +29,39 @@ from app.technical_analysis.infra.model.repository.technical_signal_repository i
 from app.technical_analysis.infra.model.repository.signal_outcome_repository import SignalOutcomeRepository
 
 
+
+def _simulate_monte_carlo_chunk(
+    seed: np.random.SeedSequence,
+    n_paths: int,
+    simulation_days: int,
+    mean_returns: np.ndarray,
+    volatilities: np.ndarray,
+    weights: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    몬테카를로 경로 블록 하나 생성 (프로세스 풀에서 호출할 수 있도록 모듈 수준 함수)
+
+    Returns:
+        (경로별 누적 수익률, 경로별 최대 손실폭)
+    """
+    rng = np.random.default_rng(seed)
+
+    # 전략별 수익률이 서로 독립인 정규분포이므로 가중합도 정규분포
+    # (평균 = Σwμ, 표준편차 = sqrt(Σw²σ²)) → 포트폴리오 일일 수익률을 직접 샘플링
+    portfolio_mean = float(weights @ mean_returns)
+    portfolio_volatility = float(np.sqrt((weights**2) @ (volatilities**2)))
+    portfolio_returns = rng.normal(
+        portfolio_mean, portfolio_volatility, size=(n_paths, simulation_days)
+    )
+
+    # 누적 자산 곡선과 최대 손실폭
+    equity = np.cumprod(1.0 + portfolio_returns, axis=1)
+    running_max = np.maximum.accumulate(np.maximum(equity, 1.0), axis=1)
+    max_drawdowns = (1.0 - equity / running_max).max(axis=1)
+
+    return equity[:, -1] - 1.0, max_drawdowns
+
+
 class PortfolioBacktestingService:
     """
     포트폴리오 백테스팅을 담당하는 서비스
@@ -539,80 +573,112 @@ class PortfolioBacktestingService:
         strategies: List[Dict[str, Any]],
         n_simulations: int = 1000,
         simulation_days: int = 252,  # 1년
-        confidence_levels: List[float] = [0.05, 0.95]
+        confidence_levels: List[float] = [0.05, 0.95],
+        var_levels: List[float] = [0.95, 0.99],
+        random_seed: Optional[int] = None,
+        chunk_size: int = 10000,
+        n_workers: int = 1,
     ) -> Dict[str, Any]:
         """
         몬테카를로 시뮬레이션을 통한 포트폴리오 성과 예측
-        
+
+        전략별 수익률을 따로 만들지 않고 포트폴리오 일일 수익률을 (경로 수 × 일수)
+        2차원 NumPy 배열로 직접 샘플링하며, chunk_size 경로 단위 블록으로 나누어
+        메모리를 제한합니다. 블록별 난수 시드는 SeedSequence 에서
+        파생되므로 random_seed 가 같으면 n_workers 와 무관하게 같은 결과가 나옵니다.
+
         Args:
-            strategies: 전략 리스트
+            strategies: 전략 리스트 (mean_return / volatility 미지정 시 기본값 사용)
             n_simulations: 시뮬레이션 횟수
             simulation_days: 시뮬레이션 기간 (일)
             confidence_levels: 신뢰구간 수준
-            
+            var_levels: VaR/CVaR 신뢰수준
+            random_seed: 재현 가능한 결과를 위한 시드 (None이면 매번 다름)
+            chunk_size: 한 블록에서 생성할 경로 수
+            n_workers: 블록을 나눠 처리할 프로세스 수 (1이면 현재 프로세스에서 처리)
+
         Returns:
             몬테카를로 시뮬레이션 결과
         """
         try:
             print(f"🎲 몬테카를로 시뮬레이션 시작: {n_simulations}회 반복")
-            
-            # 각 전략의 과거 성과 데이터 수집
-            strategy_stats = []
-            for strategy in strategies:
-                # 간단한 구현: 기본 통계값 사용
-                stats = {
-                    "mean_return": 0.001,  # 일평균 0.1% 수익률
-                    "volatility": 0.02,    # 일변동성 2%
-                    "name": strategy["name"]
-                }
-                strategy_stats.append(stats)
-            
-            # 시뮬레이션 실행
-            simulation_results = []
-            
-            for sim in range(n_simulations):
-                portfolio_returns = []
-                
-                for day in range(simulation_days):
-                    # 각 전략의 일일 수익률 생성 (정규분포 가정)
-                    daily_portfolio_return = 0
-                    
-                    for i, stats in enumerate(strategy_stats):
-                        # 정규분포에서 수익률 샘플링
-                        daily_return = np.random.normal(
-                            stats["mean_return"], 
-                            stats["volatility"]
-                        )
-                        daily_portfolio_return += daily_return / len(strategy_stats)  # 동일 비중
-                    
-                    portfolio_returns.append(daily_portfolio_return)
-                
-                # 누적 수익률 계산
-                cumulative_return = (1 + np.array(portfolio_returns)).prod() - 1
-                simulation_results.append(cumulative_return)
-            
-            # 결과 분석
-            simulation_results = np.array(simulation_results)
-            
+            started = datetime.utcnow()
+
+            # 각 전략의 과거 성과 데이터 수집 (간단한 구현: 기본 통계값 사용)
+            mean_returns = np.array(
+                [s.get("mean_return", 0.001) for s in strategies]  # 일평균 0.1%
+            )
+            volatilities = np.array(
+                [s.get("volatility", 0.02) for s in strategies]  # 일변동성 2%
+            )
+            weights = np.full(len(strategies), 1.0 / len(strategies))  # 동일 비중
+
+            # 블록 단위 시뮬레이션 실행
+            chunk_size = max(1, int(chunk_size))
+            chunk_sizes = [
+                min(chunk_size, n_simulations - start)
+                for start in range(0, n_simulations, chunk_size)
+            ]
+            seeds = np.random.SeedSequence(random_seed).spawn(len(chunk_sizes))
+            tasks = [
+                (seed, size, simulation_days, mean_returns, volatilities, weights)
+                for seed, size in zip(seeds, chunk_sizes)
+            ]
+
+            if n_workers > 1 and len(tasks) > 1:
+                with ProcessPoolExecutor(
+                    max_workers=min(n_workers, len(tasks))
+                ) as executor:
+                    chunks = list(
+                        executor.map(_simulate_monte_carlo_chunk, *zip(*tasks))
+                    )
+            else:
+                chunks = [_simulate_monte_carlo_chunk(*task) for task in tasks]
+
+            simulation_results = np.concatenate([c[0] for c in chunks])
+            max_drawdowns = np.concatenate([c[1] for c in chunks])
+
             # 신뢰구간 계산
-            confidence_intervals = {}
-            for level in confidence_levels:
-                confidence_intervals[f"{level:.0%}"] = np.percentile(simulation_results, level * 100)
-            
+            confidence_intervals = dict(
+                zip(
+                    [f"{level:.0%}" for level in confidence_levels],
+                    np.percentile(
+                        simulation_results, [level * 100 for level in confidence_levels]
+                    ),
+                )
+            )
+
+            # VaR / CVaR (손실을 양수로 표현)
+            sorted_results = np.sort(simulation_results)
+            value_at_risk = {}
+            conditional_var = {}
+            for level in var_levels:
+                tail_count = max(1, int(np.ceil(len(sorted_results) * (1 - level))))
+                var = -np.percentile(sorted_results, (1 - level) * 100)
+                value_at_risk[f"{level:.0%}"] = round(var * 100, 2)
+                conditional_var[f"{level:.0%}"] = round(
+                    -sorted_results[:tail_count].mean() * 100, 2
+                )
+
             # 통계 계산
             mean_return = np.mean(simulation_results)
             std_return = np.std(simulation_results)
             min_return = np.min(simulation_results)
             max_return = np.max(simulation_results)
-            
+
             # 손실 확률 계산
             loss_probability = np.mean(simulation_results < 0)
-            
+
+            drawdown_percentiles = np.percentile(max_drawdowns, [50, 95, 99])
+
             return {
                 "simulation_config": {
                     "n_simulations": n_simulations,
                     "simulation_days": simulation_days,
-                    "strategies": [s["name"] for s in strategies]
+                    "strategies": [s["name"] for s in strategies],
+                    "random_seed": random_seed,
+                    "chunk_size": chunk_size,
+                    "n_workers": n_workers,
                 },
                 "results": {
                     "mean_return_pct": round(mean_return * 100, 2),
@@ -622,17 +688,27 @@ class PortfolioBacktestingService:
                     "loss_probability": round(loss_probability, 3),
                     "confidence_intervals": {
                         k: round(v * 100, 2) for k, v in confidence_intervals.items()
-                    }
+                    },
+                    "value_at_risk_pct": value_at_risk,
+                    "conditional_var_pct": conditional_var,
+                    "max_drawdown_pct": {
+                        "mean": round(float(max_drawdowns.mean()) * 100, 2),
+                        "median": round(drawdown_percentiles[0] * 100, 2),
+                        "p95": round(drawdown_percentiles[1] * 100, 2),
+                        "p99": round(drawdown_percentiles[2] * 100, 2),
+                        "worst": round(float(max_drawdowns.max()) * 100, 2),
+                    },
                 },
                 "interpretation": {
                     "expected_return": f"{mean_return * 100:.1f}% 수익률 예상",
                     "risk_level": "High" if std_return > 0.3 else "Medium" if std_return > 0.15 else "Low",
                     "loss_risk": f"{loss_probability:.1%} 확률로 손실 가능성",
-                    "confidence_range": f"95% 신뢰구간: {confidence_intervals.get('5%', 0):.1f}% ~ {confidence_intervals.get('95%', 0):.1f}%"
+                    "confidence_range": f"95% 신뢰구간: {confidence_intervals.get('5%', 0) * 100:.1f}% ~ {confidence_intervals.get('95%', 0) * 100:.1f}%"
                 },
+                "duration_seconds": (datetime.utcnow() - started).total_seconds(),
                 "analysis_timestamp": datetime.utcnow().isoformat()
             }
-            
+
         except Exception as e:
             print(f"❌ 몬테카를로 시뮬레이션 실패: {e}")
             return {"error": str(e)}
@@ -14,6 +14,7 @@ from sqlalchemy import func
 from app.common.infra.database.config.database_config import SessionLocal
 from app.common.infra.client.yahoo_price_client import YahooPriceClient
 from app.common.utils.logging_config import get_logger
+from app.common.utils.market_calendar import filter_trading_days
 
 # 엔티티 imports
 from app.technical_analysis.infra.model.entity.daily_prices import DailyPrice
@@ -37,6 +38,10 @@ from app.technical_analysis.infra.model.repository.signal_outcome_repository imp
 )
 
 # 서비스 imports
+from app.technical_analysis.service.historical_data_service import (
+    PREVIOUS_CLOSE_LOOKBACK_DAYS,
+    HistoricalDataService,
+)
 from app.technical_analysis.service.technical_indicator_service import (
     TechnicalIndicatorService,
 )
@@ -114,8 +119,9 @@ class RecoveryService:
                     end_date = datetime.now().date()
                     start_date = end_date - timedelta(days=years * 365)
 
-                    missing_dates = repository.get_missing_dates(
-                        symbol, start_date, end_date
+                    # 휴장일은 데이터가 없으므로 누락으로 보지 않음
+                    missing_dates = filter_trading_days(
+                        repository.get_missing_dates(symbol, start_date, end_date)
                     )
 
                     if not missing_dates:
@@ -136,8 +142,27 @@ class RecoveryService:
                 # 2. Yahoo Finance에서 데이터 수집
                 logger.info("yahoo_data_fetch_started", symbol=symbol)
 
-                # 최대 데이터 수집 (25년치)
-                df = self.yahoo_client.get_daily_data(symbol, period="max")
+                stored_closes = None
+                if existing_count > 0 and not force_update:
+                    # 누락 구간만 병렬 수집
+                    missing_ranges = self.yahoo_client.group_missing_dates_into_ranges(
+                        missing_dates
+                    )
+                    df = self.yahoo_client.get_daily_data_for_ranges(
+                        symbol, missing_ranges
+                    )
+                    # 구간마다 직전 저장 종가와 비교하도록 주변 DB 종가 조회
+                    stored_closes = repository.find_closes_by_date_range(
+                        symbol,
+                        missing_ranges[0][0]
+                        - timedelta(days=PREVIOUS_CLOSE_LOOKBACK_DAYS),
+                        missing_ranges[-1][1],
+                    )
+                else:
+                    # 최대 데이터 수집 (25년치, 연도별 병렬)
+                    df = self.yahoo_client.get_daily_data(
+                        symbol, period="max", concurrent=True
+                    )
 
                 if df is None or df.empty:
                     results[symbol] = {
@@ -153,6 +178,10 @@ class RecoveryService:
 
                 logger.info("data_filtered", symbol=symbol, filtered_count=len(df))
 
+                previous_closes = HistoricalDataService.compute_previous_closes(
+                    df, stored_closes
+                )
+
                 # 4. 데이터베이스에 저장
                 saved_count = 0
                 duplicate_count = 0
@@ -174,10 +203,8 @@ class RecoveryService:
                         )
 
                         # 전일 대비 변화 계산 (선택사항)
-                        if saved_count > 0:
-                            prev_close = float(
-                                df.iloc[df.index.get_loc(idx) - 1]["Close"]
-                            )
+                        prev_close = previous_closes.get(idx.date())
+                        if prev_close:
                             daily_price.price_change = (
                                 daily_price.close_price - prev_close
                             )
@@ -899,51 +899,40 @@ class SignalGeneratorService:
     # =================================================================
 
     @memory_monitor
-    def _save_signals_batch(
-        self, signals: List[Dict[str, Any]], batch_size: int = 100
-    ) -> int:
-        """신호를 배치로 저장하여 메모리 효율성 향상"""
-        saved_count = 0
+    def _save_signals_batch(self, signals: List[Dict[str, Any]]) -> int:
+        """
+        생성된 신호를 한 트랜잭션에서 일괄 저장
 
+        중복 조회 1회, 신호/결과 추적 레코드 일괄 INSERT, commit 1회로 처리합니다.
+        같은 기간을 다시 생성해도 이미 저장된 신호(같은 날 같은 신호)는 건너뜁니다.
+        """
         try:
-            # 배치 단위로 신호 저장
-            for i in range(0, len(signals), batch_size):
-                batch = signals[i : i + batch_size]
-
-                for signal_data in batch:
-                    saved_signal = self.signal_storage_service.save_signal(
-                        symbol=signal_data["symbol"],
-                        signal_type=signal_data["signal_type"],
-                        timeframe="1day",
-                        current_price=signal_data["current_price"],
-                        indicator_value=signal_data.get("indicator_value"),
-                        signal_strength=signal_data.get("signal_strength"),
-                        volume=signal_data.get("volume"),
-                        triggered_at=signal_data["triggered_at"],
-                        check_duplicate=False,  # 과거 데이터는 중복 체크 안함
-                    )
-
-                    if saved_signal:
-                        saved_count += 1
+            for signal_data in signals:
+                self.signal_storage_service.buffer_signal(
+                    symbol=signal_data["symbol"],
+                    signal_type=signal_data["signal_type"],
+                    timeframe="1day",
+                    current_price=signal_data["current_price"],
+                    indicator_value=signal_data.get("indicator_value"),
+                    signal_strength=signal_data.get("signal_strength"),
+                    volume=signal_data.get("volume"),
+                    triggered_at=signal_data["triggered_at"],
+                )
 
-                # 배치 처리 후 메모리 정리
-                del batch
+            result = self.signal_storage_service.flush_signals()
 
-                logger.info(
-                    "signal_batch_saved",
-                    batch_start=i,
-                    batch_end=min(i + batch_size, len(signals)),
-                    saved_in_batch=(
-                        saved_count - (i // batch_size) * batch_size
-                        if i > 0
-                        else saved_count
-                    ),
-                )
+            logger.info(
+                "signal_batch_saved",
+                total=result["total"],
+                saved=result["saved"],
+                duplicates=result["duplicates"],
+                errors=result["errors"],
+            )
+            return result["saved"]
 
         except Exception as e:
             logger.error("batch_signal_save_failed", error=str(e))
-
-        return saved_count
+            return 0
 
     def _convert_to_dataframe(self, daily_data: List) -> pd.DataFrame:
         """DailyPrice 엔티티 리스트를 pandas DataFrame으로 변환"""
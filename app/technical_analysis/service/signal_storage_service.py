@@ -9,6 +9,7 @@
 2. 중복 체크 - 동일한 신호의 반복 저장 방지
 3. 컨텍스트 추가 - 시장 상황, 추가 정보 등을 함께 저장
 4. 알림 상태 관리 - 텔레그램 알림 발송 여부 추적
+5. 일괄 저장 - 작업 단위로 모은 신호를 한 트랜잭션에서 저장 (결과 추적 레코드 포함)
 
 저장되는 신호 타입들:
 - 이동평균선 돌파/이탈 (MA20, MA50, MA200)
@@ -23,14 +24,18 @@
 - 알림 최적화: 효과적인 신호만 알림 발송
 """
 
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime, timedelta
+from bisect import bisect_left, insort
 from sqlalchemy.orm import Session
 from app.common.infra.database.config.database_config import SessionLocal
 from app.technical_analysis.infra.model.entity.technical_signals import TechnicalSignal
 from app.technical_analysis.infra.model.repository.technical_signal_repository import (
     TechnicalSignalRepository,
 )
+from app.technical_analysis.infra.model.repository.signal_outcome_repository import (
+    SignalOutcomeRepository,
+)
 from app.technical_analysis.service.outcome_tracking_service import (
     OutcomeTrackingService,
 )
@@ -48,6 +53,7 @@ class SignalStorageService:
         """서비스 초기화"""
         self.session: Optional[Session] = None
         self.repository: Optional[TechnicalSignalRepository] = None
+        self._pending_signals: List[Dict[str, Any]] = []  # 일괄 저장 대기 신호
 
     def _get_session_and_repository(self):
         """세션과 리포지토리 초기화 (지연 초기화)"""
@@ -123,19 +129,18 @@ class SignalStorageService:
 
             # 2. 신호 엔티티 생성
             signal = TechnicalSignal(
-                symbol=symbol,
-                signal_type=signal_type,
-                timeframe=timeframe,
-                triggered_at=triggered_at if triggered_at else datetime.utcnow(),
-                current_price=current_price,
-                indicator_value=indicator_value,
-                signal_strength=signal_strength,
-                volume=volume,
-                market_condition=market_condition,
-                additional_context=(
-                    str(additional_context) if additional_context else None
-                ),
-                alert_sent=False,  # 초기값은 False, 알림 발송 후 업데이트
+                **self._build_signal_values(
+                    symbol=symbol,
+                    signal_type=signal_type,
+                    timeframe=timeframe,
+                    current_price=current_price,
+                    indicator_value=indicator_value,
+                    signal_strength=signal_strength,
+                    volume=volume,
+                    market_condition=market_condition,
+                    additional_context=additional_context,
+                    triggered_at=triggered_at,
+                )
             )
 
             # 3. 데이터베이스에 저장
@@ -362,6 +367,234 @@ class SignalStorageService:
             },
         )
 
+    # =================================================================
+    # 신호 일괄 저장
+    # =================================================================
+
+    def buffer_signal(
+        self,
+        symbol: str,
+        signal_type: str,
+        timeframe: str,
+        current_price: float,
+        indicator_value: Optional[float] = None,
+        signal_strength: Optional[float] = None,
+        volume: Optional[int] = None,
+        market_condition: Optional[str] = None,
+        additional_context: Optional[Dict[str, Any]] = None,
+        triggered_at: Optional[datetime] = None,
+    ) -> int:
+        """
+        신호를 일괄 저장 대기열에 추가 (flush_signals() 호출 시 저장)
+
+        Args:
+            save_signal()과 동일
+
+        Returns:
+            대기 중인 신호 개수
+        """
+        self._pending_signals.append(
+            {
+                "symbol": symbol,
+                "signal_type": signal_type,
+                "timeframe": timeframe,
+                "current_price": current_price,
+                "indicator_value": indicator_value,
+                "signal_strength": signal_strength,
+                "volume": volume,
+                "market_condition": market_condition,
+                "additional_context": additional_context,
+                "triggered_at": triggered_at or datetime.utcnow(),
+            }
+        )
+        return len(self._pending_signals)
+
+    def pending_signal_count(self) -> int:
+        """일괄 저장 대기 중인 신호 개수"""
+        return len(self._pending_signals)
+
+    def flush_signals(
+        self, check_duplicate: bool = True, duplicate_window_minutes: int = 60
+    ) -> Dict[str, int]:
+        """
+        대기열의 신호를 모두 일괄 저장
+
+        Args:
+            check_duplicate: 중복 체크 여부
+            duplicate_window_minutes: 중복 체크 시간 범위 (분)
+
+        Returns:
+            save_signals_bulk()의 결과
+        """
+        pending, self._pending_signals = self._pending_signals, []
+        return self.save_signals_bulk(
+            pending,
+            check_duplicate=check_duplicate,
+            duplicate_window_minutes=duplicate_window_minutes,
+        )
+
+    def save_signals_bulk(
+        self,
+        signals: List[Dict[str, Any]],
+        check_duplicate: bool = True,
+        duplicate_window_minutes: int = 60,
+        track_outcomes: bool = True,
+    ) -> Dict[str, int]:
+        """
+        여러 신호를 한 트랜잭션에서 일괄 저장
+
+        save_signal()을 신호마다 호출하면 신호 1개당 중복 조회, INSERT, commit,
+        결과 추적 초기화(별도 세션)가 반복됩니다. 이 함수는 중복 조회 1회,
+        신호/결과 추적 레코드 다중 행 INSERT 후 한 번만 commit합니다.
+
+        중복 기준은 save_signal()과 같습니다. 같은 심볼/신호 타입이 발생 시점 기준
+        duplicate_window_minutes분 이내에 이미 있으면 (DB 또는 같은 배치 내) 건너뜁니다.
+
+        Args:
+            signals: 신호 딕셔너리 목록 (키는 save_signal()의 인자와 동일,
+                timeframe 기본값 "1day", triggered_at 기본값 현재 시각)
+            check_duplicate: 중복 체크 여부
+            duplicate_window_minutes: 중복 체크 시간 범위 (분)
+            track_outcomes: 결과 추적 레코드 함께 생성 여부
+
+        Returns:
+            {'saved': 신규 저장, 'duplicates': 건너뛴 신호, 'errors': 실패, 'total': 입력 신호 수}
+        """
+        summary = {"saved": 0, "duplicates": 0, "errors": 0, "total": len(signals)}
+        if not signals:
+            return summary
+
+        now = datetime.utcnow()
+        signals = sorted(
+            (
+                {
+                    **signal_data,
+                    "timeframe": signal_data.get("timeframe") or "1day",
+                    "triggered_at": signal_data.get("triggered_at") or now,
+                }
+                for signal_data in signals
+            ),
+            key=lambda signal_data: signal_data["triggered_at"],
+        )
+
+        session, repository = self._get_session_and_repository()
+
+        try:
+            # 1. 중복 체크 (조회 1회 + 메모리 비교)
+            if check_duplicate:
+                new_signals = self._filter_duplicate_signals(
+                    repository, signals, timedelta(minutes=duplicate_window_minutes)
+                )
+            else:
+                new_signals = signals
+            summary["duplicates"] = len(signals) - len(new_signals)
+
+            if not new_signals:
+                print(f"⚠️ 일괄 저장할 신규 신호 없음 (중복 {summary['duplicates']}개)")
+                return summary
+
+            # 2. 신호 다중 행 INSERT
+            signal_ids = repository.bulk_insert(
+                [self._build_signal_values(**signal_data) for signal_data in new_signals]
+            )
+
+            # 3. 결과 추적 레코드 다중 행 INSERT
+            outcome_count = 0
+            if track_outcomes:
+                outcome_count = SignalOutcomeRepository(
+                    session
+                ).bulk_create_outcome_records(signal_ids)
+
+            # 4. 한 번만 commit
+            session.commit()
+            summary["saved"] = len(signal_ids)
+
+            print(
+                f"✅ 기술적 신호 일괄 저장 완료: {summary['saved']}개 저장, "
+                f"{summary['duplicates']}개 중복, 결과 추적 {outcome_count}개 시작"
+            )
+            return summary
+
+        except Exception as e:
+            session.rollback()
+            summary["errors"] = len(signals) - summary["duplicates"]
+            print(f"❌ 신호 일괄 저장 실패: {e}")
+            return summary
+        finally:
+            session.close()
+
+    def _filter_duplicate_signals(
+        self,
+        repository: TechnicalSignalRepository,
+        signals: List[Dict[str, Any]],
+        window: timedelta,
+    ) -> List[Dict[str, Any]]:
+        """
+        DB와 배치 내 중복 신호 제거 (signals는 발생 시점 오름차순)
+
+        Returns:
+            저장할 신호 목록
+        """
+        existing_times = repository.find_signal_times(
+            symbols=sorted({signal_data["symbol"] for signal_data in signals}),
+            signal_types=sorted({signal_data["signal_type"] for signal_data in signals}),
+            start_time=signals[0]["triggered_at"] - window,
+            end_time=signals[-1]["triggered_at"],
+        )
+
+        # (심볼, 신호 타입)별 발생 시점 정렬 목록
+        times_by_key: Dict[Tuple[str, str], List[datetime]] = {}
+        for symbol, signal_type, triggered_at in existing_times:
+            times_by_key.setdefault((symbol, signal_type), []).append(triggered_at)
+        for times in times_by_key.values():
+            times.sort()
+
+        new_signals = []
+        for signal_data in signals:
+            key = (signal_data["symbol"], signal_data["signal_type"])
+            triggered_at = signal_data["triggered_at"]
+            times = times_by_key.setdefault(key, [])
+
+            # [발생 시점 - window, 발생 시점] 구간에 기존 신호가 있으면 중복
+            index = bisect_left(times, triggered_at - window)
+            if index < len(times) and times[index] <= triggered_at:
+                continue
+
+            insort(times, triggered_at)
+            new_signals.append(signal_data)
+
+        return new_signals
+
+    @staticmethod
+    def _build_signal_values(
+        symbol: str,
+        signal_type: str,
+        timeframe: str,
+        current_price: float,
+        indicator_value: Optional[float] = None,
+        signal_strength: Optional[float] = None,
+        volume: Optional[int] = None,
+        market_condition: Optional[str] = None,
+        additional_context: Optional[Dict[str, Any]] = None,
+        triggered_at: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """신호 엔티티 컬럼 값 생성 (save_signal, save_signals_bulk 공용)"""
+        return {
+            "symbol": symbol,
+            "signal_type": signal_type,
+            "timeframe": timeframe,
+            "triggered_at": triggered_at if triggered_at else datetime.utcnow(),
+            "current_price": current_price,
+            "indicator_value": indicator_value,
+            "signal_strength": signal_strength,
+            "volume": volume,
+            "market_condition": market_condition,
+            "additional_context": (
+                str(additional_context) if additional_context else None
+            ),
+            "alert_sent": False,  # 초기값은 False, 알림 발송 후 업데이트
+        }
+
     # =================================================================
     # 알림 상태 관리
     # =================================================================
@@ -7,6 +7,8 @@
 - 신호 감지시 텔레그램 알림 자동 전송
 """
 
+import math
+import os
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 import pandas as pd
@@ -15,6 +17,9 @@ from app.technical_analysis.service.technical_indicator_service import (
     TechnicalIndicatorService,
 )
 from app.technical_analysis.service.signal_storage_service import SignalStorageService
+from app.technical_analysis.service.incremental_indicator_service import (
+    IncrementalIndicatorService,
+)
 from app.market_price.service.price_alert_log_service import PriceAlertLogService
 from app.common.constants.technical_settings import (
     TECHNICAL_SYMBOLS,
@@ -43,6 +48,10 @@ class TechnicalMonitorService:
         self.indicator_service = TechnicalIndicatorService()
         self.alert_log_service = PriceAlertLogService()
         self.signal_storage_service = SignalStorageService()
+        # 종합 분석용 증분 지표 상태 (재시작 시 체크포인트에서 복원)
+        self.incremental_indicators = IncrementalIndicatorService(
+            checkpoint_dir=os.path.join("data", "indicator_state")
+        )
 
     def monitor_comprehensive_signals(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
@@ -63,17 +72,33 @@ class TechnicalMonitorService:
         try:
             print(f"🔍 {symbol} 종합 기술적 분석 시작 (기존 + 신규 전략)")
 
-            # 데이터 가져오기 (1년치)
-            df = self.yahoo_client.get_daily_data(symbol, period="1y")
-            if df is None or len(df) < 200:
-                print(f"❌ {symbol} 데이터 부족")
-                return None
+            analysis_result = None
+            if self.incremental_indicators.has_state(symbol):
+                # 최근 일봉만 가져와 마지막 처리 일봉 이후만 반영
+                df = self.yahoo_client.get_daily_data(symbol, period="5d")
+                if df is None or df.empty:
+                    print(f"❌ {symbol} 최신 일봉 없음")
+                    return None
+                df.columns = df.columns.str.lower()
+
+                # 최근 데이터가 마지막 처리 일봉과 이어지지 않으면 전체 재초기화
+                if self.incremental_indicators.covers(symbol, df):
+                    analysis_result = self.incremental_indicators.update_from_frame(
+                        symbol, df
+                    )
 
-            # 컬럼명을 소문자로 변환
-            df.columns = df.columns.str.lower()
+            if analysis_result is None:
+                # 최초 실행 또는 일봉 누락 시: 1년치 데이터로 지표 상태 초기화
+                df = self.yahoo_client.get_daily_data(symbol, period="1y")
+                if df is None or len(df) < 200:
+                    print(f"❌ {symbol} 데이터 부족")
+                    return None
+
+                # 컬럼명을 소문자로 변환
+                df.columns = df.columns.str.lower()
+                analysis_result = self.incremental_indicators.seed(symbol, df)
 
-            # 종합 분석 수행 (모든 전략 포함)
-            analysis_result = self.indicator_service.analyze_comprehensive_signals(df)
+            self.incremental_indicators.save_checkpoint(symbol)
 
             if analysis_result:
                 current_price = analysis_result["current_price"]
@@ -471,6 +496,25 @@ class TechnicalMonitorService:
             print(f"❌ {symbol} RSI 모니터링 실패: {e}")
             return []
 
+    @staticmethod
+    def _latest_value(value: Any) -> Optional[float]:
+        """
+        지표 값의 최신 값 반환
+
+        전체 계산 결과는 시리즈, 증분 계산 결과는 최신 값(스칼라)을 담으므로 둘 다 허용합니다.
+
+        Returns:
+            최신 값 (없거나 NaN이면 None)
+        """
+        if value is None:
+            return None
+        if isinstance(value, pd.Series):
+            if value.empty:
+                return None
+            value = value.iloc[-1]
+        value = float(value)
+        return None if math.isnan(value) else value
+
     def generate_market_status_report(
         self, symbol: str, comprehensive_result: Dict, sentiment_result: Dict
     ) -> str:
@@ -532,8 +576,8 @@ class TechnicalMonitorService:
                 ]
 
                 for ma_key, display_name in ma_lines:
-                    if ma_key in ma_data and not ma_data[ma_key].empty:
-                        ma_value = ma_data[ma_key].iloc[-1]
+                    ma_value = self._latest_value(ma_data.get(ma_key))
+                    if ma_value is not None:
                         ma_diff_pct = ((current_price - ma_value) / ma_value) * 100
 
                         if ma_diff_pct >= 0:
@@ -716,12 +760,13 @@ class TechnicalMonitorService:
                 sma200 = indicators["moving_averages"].get("SMA200")
                 sma50 = indicators["moving_averages"].get("SMA50")
 
-                if sma200 is not None and not sma200.empty:
-                    sma200_val = sma200.iloc[-1]
+                sma200_val = self._latest_value(sma200)
+                sma50_val = self._latest_value(sma50)
+
+                if sma200_val is not None:
                     sma200_diff = ((current_price - sma200_val) / sma200_val) * 100
 
-                    if sma50 is not None and not sma50.empty:
-                        sma50_val = sma50.iloc[-1]
+                    if sma50_val is not None:
                         if current_price > sma50_val > sma200_val:
                             long_term = f"상승 (200일선 +{sma200_diff:.1f}%)"
                         elif current_price > sma200_val:
@@ -762,8 +807,8 @@ class TechnicalMonitorService:
                 ]
 
                 for ma_key, ma_name, caution_pct, safe_pct in ma_lines:
-                    if ma_key in ma_data and not ma_data[ma_key].empty:
-                        ma_value = ma_data[ma_key].iloc[-1]
+                    ma_value = self._latest_value(ma_data.get(ma_key))
+                    if ma_value is not None:
                         ma_diff_pct = ((current_price - ma_value) / ma_value) * 100
 
                         if ma_diff_pct >= safe_pct:
@@ -791,8 +836,8 @@ class TechnicalMonitorService:
                 ]
 
                 for ema_key, ema_name, caution_pct, safe_pct in ema_lines:
-                    if ema_key in ma_data and not ma_data[ema_key].empty:
-                        ema_value = ma_data[ema_key].iloc[-1]
+                    ema_value = self._latest_value(ma_data.get(ema_key))
+                    if ema_value is not None:
                         ema_diff_pct = ((current_price - ema_value) / ema_value) * 100
 
                         if ema_diff_pct >= safe_pct:
@@ -819,8 +864,8 @@ class TechnicalMonitorService:
                         report += f"{ema_status}\n"
 
                 # VWAP도 추가
-                if "VWAP" in ma_data and not ma_data["VWAP"].empty:
-                    vwap_value = ma_data["VWAP"].iloc[-1]
+                vwap_value = self._latest_value(ma_data.get("VWAP"))
+                if vwap_value is not None:
                     vwap_diff_pct = ((current_price - vwap_value) / vwap_value) * 100
 
                     if vwap_diff_pct >= 2.0:
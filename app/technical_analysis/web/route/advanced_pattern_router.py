@@ -76,18 +76,30 @@ advanced_pattern_service = AdvancedPatternService()
 async def get_pattern_similarity_matrix(
     symbol: str = Path(..., example="AAPL", description="분석할 주식 심볼"),
     pattern_type: str = Query(default="sequential", description="패턴 타입"),
+    top_k: Optional[int] = Query(
+        default=None,
+        ge=1,
+        le=100,
+        description="패턴별 최근접 이웃 개수 (지정 시 전체 매트릭스 대신 반환)",
+    ),
+    block_size: int = Query(default=512, ge=16, le=4096, description="행 블록 계산 크기"),
 ) -> ApiResponse:
     """
     패턴 간 유사도 매트릭스 분석
 
     - **symbol**: 분석할 심볼 (예: AAPL, TSLA)
     - **pattern_type**: 패턴 타입 (기본값: sequential)
+    - **top_k**: 패턴별 최근접 이웃 개수 (패턴 수가 많을 때 권장)
+    - **block_size**: 행 블록 계산 크기 (메모리 사용량 조절)
 
     코사인 유사도와 유클리드 거리를 기반으로 패턴 간 유사도를 계산합니다.
     """
     try:
         result = advanced_pattern_service.calculate_pattern_similarity_matrix(
-            symbol=symbol, pattern_type=pattern_type
+            symbol=symbol,
+            pattern_type=pattern_type,
+            top_k=top_k,
+            block_size=block_size,
         )
 
         if "error" in result:
@@ -107,6 +119,9 @@ async def cluster_patterns(
     symbol: str,
     n_clusters: int = Query(default=5, ge=2, le=20, description="클러스터 개수"),
     min_patterns: int = Query(default=10, ge=5, description="최소 패턴 개수"),
+    full_refit: bool = Query(
+        default=False, description="저장된 클러스터를 무시하고 전체 재학습"
+    ),
 ) -> ApiResponse:
     """
     패턴 클러스터링을 통한 그룹화
@@ -114,12 +129,16 @@ async def cluster_patterns(
     - **symbol**: 분석할 심볼
     - **n_clusters**: 생성할 클러스터 개수 (2-20)
     - **min_patterns**: 클러스터링에 필요한 최소 패턴 개수
+    - **full_refit**: 전체 재학습 여부 (기본값은 새 패턴만 기존 클러스터에 할당)
 
     K-means 클러스터링을 사용하여 유사한 패턴들을 자동으로 그룹화합니다.
     """
     try:
         result = advanced_pattern_service.cluster_patterns(
-            symbol=symbol, n_clusters=n_clusters, min_patterns=min_patterns
+            symbol=symbol,
+            n_clusters=n_clusters,
+            min_patterns=min_patterns,
+            full_refit=full_refit,
         )
 
         if "error" in result:
@@ -635,6 +635,76 @@ async def backtest_trading_strategy(
         raise HTTPException(status_code=500, detail=f"백테스팅 실패: {str(e)}")
 
 
+@router.post(
+    "/backtest/sweep",
+    summary="매매 전략 파라미터 그리드 탐색",
+    description="포지션 크기, 손절매, 익절매 조합 전체를 한 번에 백테스팅하여 순위를 매깁니다.",
+    tags=["Technical Analysis"],
+)
+async def sweep_trading_strategy_parameters(
+    signal_types: List[str] = Query(..., description="사용할 신호 타입들"),
+    position_sizes: List[float] = Query(
+        [0.05, 0.1, 0.2], description="포지션 크기 후보들 (자본금 대비 비율)"
+    ),
+    stop_losses: List[float] = Query(
+        [], description="손절매 비율 후보들 (예: -0.03, -0.05), 손절매 없음은 항상 포함"
+    ),
+    take_profits: List[float] = Query(
+        [], description="익절매 비율 후보들 (예: 0.05, 0.10), 익절매 없음은 항상 포함"
+    ),
+    initial_capital: float = Query(10000.0, description="초기 자본금 ($)", ge=1000),
+    days: int = Query(90, description="백테스팅 기간 (일)", ge=7, le=365),
+    sort_by: str = Query("total_return_pct", description="순위 기준 지표"),
+    top_n: int = Query(50, description="반환할 상위 조합 개수", ge=1, le=1000),
+) -> Dict[str, Any]:
+    """
+    매매 전략 파라미터 조합을 한 번에 백테스팅합니다.
+
+    신호/결과 데이터는 한 번만 조회하고 모든 조합을 벡터화하여 계산하므로
+    수천 개 조합도 수 초 안에 평가할 수 있습니다.
+
+    Args:
+        signal_types: 전략에 사용할 신호 타입들
+        position_sizes: 포지션 크기 후보들
+        stop_losses: 손절매 기준 후보들 (미적용 조합은 자동 포함)
+        take_profits: 익절매 기준 후보들 (미적용 조합은 자동 포함)
+        initial_capital: 시뮬레이션 시작 자본금
+        days: 백테스팅할 기간 (일수)
+        sort_by: 순위 기준 (total_return_pct, win_rate, profit_factor, max_drawdown_pct 등)
+        top_n: 반환할 상위 조합 개수
+
+    Returns:
+        파라미터 조합별 성과 순위 테이블
+    """
+    try:
+        end_date = datetime.utcnow()
+        start_date = end_date - timedelta(days=days)
+
+        result = backtesting_service.sweep_strategy_parameters(
+            signal_types=signal_types,
+            position_sizes=position_sizes,
+            stop_losses=[None] + stop_losses,
+            take_profits=[None] + take_profits,
+            initial_capital=initial_capital,
+            start_date=start_date,
+            end_date=end_date,
+            sort_by=sort_by,
+            top_n=top_n,
+        )
+
+        if "error" in result:
+            raise HTTPException(status_code=500, detail=result["error"])
+
+        return result
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"파라미터 그리드 탐색 실패: {str(e)}"
+        )
+
+
 @router.get("/quality/{signal_type}", summary="신호 품질 평가")
 async def evaluate_signal_quality(
     signal_type: str = Path(..., description="평가할 신호 타입"),
@@ -717,6 +787,9 @@ async def start_outcome_tracking(
 @router.put("/outcomes/update", summary="결과 추적 업데이트")
 async def update_outcomes(
     hours_old: int = Query(1, description="몇 시간 이상 된 것만 업데이트", ge=1, le=24),
+    batch_mode: bool = Query(
+        True, description="배치 모드 (심볼별 1회 가격 조회 + 일괄 업데이트)"
+    ),
 ) -> Dict[str, Any]:
     """
     미완료된 결과 추적들을 업데이트합니다.
@@ -726,12 +799,18 @@ async def update_outcomes(
 
     Args:
         hours_old: 몇 시간 이상 된 신호만 업데이트할지 설정
+        batch_mode: True면 배치 업데이트, False면 기존 건별 업데이트
 
     Returns:
         업데이트 결과 통계
     """
     try:
-        result = outcome_tracking_service.update_outcomes(hours_old=hours_old)
+        if batch_mode:
+            result = outcome_tracking_service.update_outcomes_batch(
+                hours_old=hours_old
+            )
+        else:
+            result = outcome_tracking_service.update_outcomes(hours_old=hours_old)
 
         if "error" in result:
             raise HTTPException(status_code=500, detail=result["error"])
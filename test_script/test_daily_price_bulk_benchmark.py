@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+일봉 데이터 대량 저장 벤치마크
+
+DailyPriceRepository의 기존 행 단위 저장(save_bulk_row_by_row)과
+청크 단위 upsert(upsert_bulk)의 처리 시간을 비교합니다.
+기본은 로컬 SQLite 파일 DB를 사용하며, --db-url로 MySQL 등을 지정할 수 있습니다.
+
+사용법:
+    python test_script/test_daily_price_bulk_benchmark.py --rows 5000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from datetime import date, timedelta
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.technical_analysis.infra.model.entity.daily_prices import DailyPrice
+from app.technical_analysis.infra.model.repository.daily_price_repository import (
+    DailyPriceRepository,
+)
+
+
+def generate_rows(symbol: str, count: int, price_shift: float = 0.0):
+    """가상의 일봉 데이터 생성 (평일만)"""
+    rows = []
+    current_date = date(2000, 1, 3)
+    price = 100.0
+    while len(rows) < count:
+        if current_date.weekday() < 5:
+            price = max(1.0, price * (1 + random.uniform(-0.02, 0.02)))
+            rows.append(
+                {
+                    "symbol": symbol,
+                    "date": current_date,
+                    "open_price": round(price + price_shift, 4),
+                    "high_price": round(price * 1.01 + price_shift, 4),
+                    "low_price": round(price * 0.99 + price_shift, 4),
+                    "close_price": round(price + price_shift, 4),
+                    "volume": random.randint(1_000_000, 5_000_000),
+                }
+            )
+        current_date += timedelta(days=1)
+    return rows
+
+
+def run_benchmark(db_url: str, rows: int, chunk_size: int):
+    engine = create_engine(db_url)
+    DailyPrice.__table__.drop(engine, checkfirst=True)
+    DailyPrice.__table__.create(engine)
+    Session = sessionmaker(bind=engine)
+
+    print("=" * 60)
+    print(f"📊 일봉 대량 저장 벤치마크 ({rows:,}행, chunk={chunk_size})")
+    print("=" * 60)
+
+    # 1. 기존 방식: 행 단위 저장
+    session = Session()
+    repository = DailyPriceRepository(session)
+    entities = [DailyPrice(**row) for row in generate_rows("ROWBYROW", rows)]
+    start = time.time()
+    legacy_result = repository.save_bulk_row_by_row(entities)
+    legacy_time = time.time() - start
+    session.close()
+    print(f"🐢 행 단위 저장: {legacy_time:.2f}초 - {legacy_result}")
+
+    # 2. 신규 방식: 청크 upsert (신규 저장)
+    session = Session()
+    repository = DailyPriceRepository(session)
+    start = time.time()
+    bulk_result = repository.upsert_bulk(
+        generate_rows("BULK", rows), chunk_size=chunk_size
+    )
+    bulk_time = time.time() - start
+    print(f"🚀 청크 upsert (신규): {bulk_time:.2f}초 - {bulk_result}")
+
+    # 3. 신규 방식: 같은 데이터 재적재 (전부 업데이트)
+    start = time.time()
+    update_result = repository.upsert_bulk(
+        generate_rows("BULK", rows, price_shift=1.0), chunk_size=chunk_size
+    )
+    update_time = time.time() - start
+    session.close()
+    print(f"🔁 청크 upsert (재적재): {update_time:.2f}초 - {update_result}")
+
+    if bulk_time > 0:
+        print(f"\n⚡ 신규 저장 기준 속도 향상: {legacy_time / bulk_time:.1f}배")
+
+    return {
+        "row_by_row_seconds": legacy_time,
+        "bulk_insert_seconds": bulk_time,
+        "bulk_update_seconds": update_time,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일봉 대량 저장 벤치마크")
+    parser.add_argument("--rows", type=int, default=5000, help="심볼당 행 수")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="upsert 청크 크기")
+    parser.add_argument("--db-url", type=str, default=None, help="벤치마크 DB URL")
+    args = parser.parse_args()
+
+    db_url = args.db_url
+    if db_url is None:
+        db_path = os.path.join(tempfile.mkdtemp(), "daily_price_benchmark.db")
+        db_url = f"sqlite:///{db_path}"
+
+    run_benchmark(db_url, args.rows, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+증분 지표 서비스 테스트
+
+합성 일봉으로 IncrementalIndicatorService 를 시드/갱신한 결과가
+시장 상태 리포트 생성까지 이어지는지, 체크포인트가 원자적으로 저장/복원되는지 확인합니다.
+(외부 API / DB 불필요)
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.technical_analysis.service.incremental_indicator_service import (
+    IncrementalIndicatorService,
+    VWAP_WINDOW_BARS,
+)
+from app.technical_analysis.service.technical_monitor_service import (
+    TechnicalMonitorService,
+)
+
+
+def make_daily_frame(days: int = 260, seed: int = 7) -> pd.DataFrame:
+    """소문자 OHLCV 컬럼의 합성 일봉"""
+    rng = np.random.default_rng(seed)
+    close = 15000 * np.cumprod(1 + rng.normal(0.0005, 0.01, days))
+    return pd.DataFrame(
+        {
+            "open": close * 0.999,
+            "high": close * 1.005,
+            "low": close * 0.995,
+            "close": close,
+            "volume": rng.integers(1_000_000, 5_000_000, days).astype(float),
+        },
+        index=pd.bdate_range("2024-01-02", periods=days),
+    )
+
+
+def test_status_report_from_incremental_result():
+    df = make_daily_frame()
+    service = IncrementalIndicatorService()
+    result = service.seed("^IXIC", df.iloc[:-1])
+    result = service.update_from_frame("^IXIC", df.iloc[-5:])
+
+    moving_averages = result["indicators"]["moving_averages"]
+    assert all(isinstance(value, float) for value in moving_averages.values())
+
+    monitor = TechnicalMonitorService.__new__(TechnicalMonitorService)
+    report = monitor.generate_market_status_report("^IXIC", result, {})
+
+    assert not report.startswith("❌"), report
+    # 증분 결과의 스칼라 이동평균이 리포트에 반영
+    assert "• VWAP:" in report
+    assert "• EMA12:" in report
+
+
+def test_seed_detects_signals_on_last_bar_only():
+    df = make_daily_frame()
+    service = IncrementalIndicatorService()
+    calls = []
+    detector = service.indicator_service
+    original = detector.detect_rsi_signals
+    detector.detect_rsi_signals = lambda *args: calls.append(args) or original(*args)
+
+    result = service.seed("^GSPC", df)
+
+    assert len(calls) == 1
+    assert result["current_price"] == df["close"].iloc[-1]
+    assert service._states["^GSPC"].bar_count == len(df)
+    # 지표 상태 길이는 데이터 길이와 무관하게 제한
+    assert len(service._states["^GSPC"].vwap_volume.values) == VWAP_WINDOW_BARS
+
+
+def test_checkpoint_roundtrip_is_atomic(tmp_path):
+    df = make_daily_frame()
+    service = IncrementalIndicatorService(checkpoint_dir=str(tmp_path))
+    expected = service.seed("^GSPC", df)
+    assert service.save_checkpoint("^GSPC")
+
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+    with open(os.path.join(tmp_path, "_GSPC.json"), encoding="utf-8") as f:
+        json.load(f)
+
+    restored = IncrementalIndicatorService(checkpoint_dir=str(tmp_path))
+    assert restored.has_state("^GSPC")
+    last = df.iloc[-1]
+    again = restored.update(
+        "^GSPC",
+        df.index[-1].strftime("%Y-%m-%d"),
+        high=float(last["high"]),
+        low=float(last["low"]),
+        close=float(last["close"]),
+        volume=float(last["volume"]),
+    )
+    np.testing.assert_allclose(
+        list(again["indicators"]["moving_averages"].values()),
+        list(expected["indicators"]["moving_averages"].values()),
+        rtol=1e-12,
+    )
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+병렬 훈련 오케스트레이터 테스트
+
+스텁 전처리기와 가벼운 작업자 함수로 ParallelTrainingOrchestrator를
+작업자 2개 이상의 프로세스 풀에서 실행해, 특성 저장소 준비와
+심볼별 결과 수집이 제대로 되는지 확인합니다. (TensorFlow 불필요)
+"""
+
+import os
+import sys
+from datetime import date
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ml_prediction.ml.model.training_orchestrator import (
+    ParallelTrainingOrchestrator,
+)
+
+
+class StubPreprocessor:
+    """warm_feature_store 호출만 기록하는 전처리기 스텁"""
+
+    def __init__(self, cache_dir: str, failing_symbols=()):
+        self.cache_dir = cache_dir
+        self.feature_store = object()  # 저장소 활성화 상태
+        self.failing_symbols = set(failing_symbols)
+        self.warmed = []
+
+    def warm_feature_store(
+        self, symbol, start_date, end_date, use_sentiment=False, force_refresh=False
+    ):
+        if symbol in self.failing_symbols:
+            raise ValueError(f"no data for {symbol}")
+        self.warmed.append(symbol)
+        return 100
+
+
+def stub_train_worker(task):
+    """작업자 프로세스에서 실행되는 가짜 훈련 (모듈 수준 함수여야 spawn 전달 가능)"""
+    return task["symbol"], {
+        "status": "completed",
+        "worker_pid": os.getpid(),
+        "reuse_stored": task["reuse_stored"],
+        "cache_dir": task["cache_dir"],
+    }
+
+
+def test_orchestrator_trains_all_symbols_in_parallel(tmp_path):
+    symbols = ["^GSPC", "^IXIC", "^DJI", "^RUT"]
+    preprocessor = StubPreprocessor(str(tmp_path))
+    progress = []
+
+    orchestrator = ParallelTrainingOrchestrator(
+        preprocessor=preprocessor,
+        max_workers=2,
+        threads_per_worker=1,
+        worker_fn=stub_train_worker,
+        worker_initializer=None,
+    )
+    results = orchestrator.run(
+        symbols,
+        date(2020, 1, 1),
+        date(2024, 1, 1),
+        progress_callback=lambda symbol, result, completed, total: progress.append(
+            (symbol, completed, total)
+        ),
+    )
+
+    assert orchestrator.max_workers == 2
+    assert preprocessor.warmed == symbols
+    assert list(results) == symbols
+    assert all(r["status"] == "completed" for r in results.values())
+    assert all(r["reuse_stored"] and r["cache_dir"] == str(tmp_path) for r in results.values())
+    # 작업자 프로세스에서 실행되었는지 확인
+    assert all(r["worker_pid"] != os.getpid() for r in results.values())
+    assert sorted(completed for _, completed, _ in progress) == [1, 2, 3, 4]
+
+
+def test_orchestrator_records_feature_preparation_failures(tmp_path):
+    preprocessor = StubPreprocessor(str(tmp_path), failing_symbols=["^DJI"])
+
+    orchestrator = ParallelTrainingOrchestrator(
+        preprocessor=preprocessor,
+        max_workers=2,
+        threads_per_worker=1,
+        worker_fn=stub_train_worker,
+        worker_initializer=None,
+    )
+    results = orchestrator.run(
+        ["^GSPC", "^DJI", "^IXIC"], date(2020, 1, 1), date(2024, 1, 1)
+    )
+
+    assert results["^DJI"]["status"] == "failed"
+    assert results["^GSPC"]["status"] == "completed"
+    assert results["^IXIC"]["status"] == "completed"